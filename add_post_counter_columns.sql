@@ -0,0 +1,9 @@
+-- posts 테이블에 좋아요/댓글 수 비정규화 컬럼 추가
+ALTER TABLE posts
+ADD COLUMN like_count INT NOT NULL DEFAULT 0 AFTER view_count,
+ADD COLUMN comment_count INT NOT NULL DEFAULT 0 AFTER like_count;
+
+-- 기존 데이터 채우기 (이후 드리프트는 python reconcile_post_counters.py 로 복구)
+UPDATE posts p
+SET like_count = (SELECT COUNT(*) FROM post_likes l WHERE l.post_id = p.id),
+    comment_count = (SELECT COUNT(*) FROM comments c WHERE c.post_id = p.id);
@@ -4,6 +4,7 @@ from app.core.validators import validate_email, validate_password_pair, validate
 from app.core.exceptions import bad_request, conflict
 from app.core.error_codes import ErrorCode
 from app.core.security import create_access_token
+from app.core.identity import invalidate_identity
 from app.models.db import User, Couple, Gender, VendorApprovalStatus, CoupleStatus
 from app.core.user_roles import UserRole
 from werkzeug.security import check_password_hash, generate_password_hash
@@ -140,6 +141,8 @@ def signup_controller(req: SignupReq, db: Session):
             partner_user.partner_couple_key = couple_key
             auto_connected = True
             db.commit()
+            # 파트너의 캐시된 신원(couple_id 없음)이 남아 있지 않도록 무효화
+            invalidate_identity(partner_user.id, user.id)
             db.refresh(user)
             db.refresh(partner_couple)
             db.refresh(partner_user)
@@ -1,37 +1,18 @@
 """
-예산서 컨트롤러
+예산서 컨트롤러 - DB 기반
 """
-from typing import Dict, List
-from datetime import datetime
-from app.models.memory import BUDGET_ITEMS, BudgetItem, COUNTERS, USER_TOTAL_BUDGETS
+import asyncio
+from typing import Dict
+from sqlalchemy.orm import Session
 from app.schemas import BudgetItemCreateReq, BudgetItemUpdateReq, TotalBudgetSetReq
-from app.services import budget_service
+from app.services import budget_service, budget_repository
+from app.core.exceptions import not_found
+from app.core.error_codes import ErrorCode
 
 
-def create_budget_item(user_id: int, request: BudgetItemCreateReq) -> Dict:
+def create_budget_item(user_id: int, request: BudgetItemCreateReq, db: Session) -> Dict:
     """예산 항목 생성"""
-    item_id = COUNTERS["budget"]
-    COUNTERS["budget"] += 1
-    
-    now = datetime.now().strftime("%Y-%m-%d")
-    
-    item = BudgetItem(
-        id=item_id,
-        user_id=user_id,
-        item_name=request.item_name,
-        category=request.category,
-        estimated_budget=request.estimated_budget,
-        actual_expense=request.actual_expense,
-        unit=request.unit,
-        quantity=request.quantity,
-        notes=request.notes,
-        payer=request.payer,
-        payment_schedule=request.payment_schedule,
-        created_at=now,
-        updated_at=now
-    )
-    
-    BUDGET_ITEMS[item_id] = item
+    item = budget_repository.create_item(db, user_id, request.model_dump())
     
     return {
         "message": "budget_item_created",
@@ -42,32 +23,13 @@ def create_budget_item(user_id: int, request: BudgetItemCreateReq) -> Dict:
     }
 
 
-def update_budget_item(item_id: int, user_id: int, request: BudgetItemUpdateReq) -> Dict:
+def update_budget_item(item_id: int, user_id: int, request: BudgetItemUpdateReq, db: Session) -> Dict:
     """예산 항목 수정"""
-    item = BUDGET_ITEMS.get(item_id)
-    if not item or item.user_id != user_id:
-        return {"message": "error", "data": {"error": "예산 항목을 찾을 수 없습니다."}}
-    
-    if request.item_name is not None:
-        item.item_name = request.item_name
-    if request.category is not None:
-        item.category = request.category
-    if request.estimated_budget is not None:
-        item.estimated_budget = request.estimated_budget
-    if request.actual_expense is not None:
-        item.actual_expense = request.actual_expense
-    if request.unit is not None:
-        item.unit = request.unit
-    if request.quantity is not None:
-        item.quantity = request.quantity
-    if request.notes is not None:
-        item.notes = request.notes
-    if request.payer is not None:
-        item.payer = request.payer
-    if request.payment_schedule is not None:
-        item.payment_schedule = request.payment_schedule
+    item = budget_repository.get_item(db, item_id, user_id)
+    if not item:
+        raise not_found("budget_item_not_found", ErrorCode.BUDGET_ITEM_NOT_FOUND)
     
-    item.updated_at = datetime.now().strftime("%Y-%m-%d")
+    item = budget_repository.update_item(db, item, request.model_dump(exclude_none=True))
     
     return {
         "message": "budget_item_updated",
@@ -78,48 +40,32 @@ def update_budget_item(item_id: int, user_id: int, request: BudgetItemUpdateReq)
     }
 
 
-def delete_budget_item(item_id: int, user_id: int) -> Dict:
+def delete_budget_item(item_id: int, user_id: int, db: Session) -> Dict:
     """예산 항목 삭제"""
-    item = BUDGET_ITEMS.get(item_id)
-    if not item or item.user_id != user_id:
-        return {"message": "error", "data": {"error": "예산 항목을 찾을 수 없습니다."}}
+    item = budget_repository.get_item(db, item_id, user_id)
+    if not item:
+        raise not_found("budget_item_not_found", ErrorCode.BUDGET_ITEM_NOT_FOUND)
     
-    del BUDGET_ITEMS[item_id]
+    budget_repository.delete_item(db, item)
     return {"message": "budget_item_deleted", "data": {"id": item_id}}
 
 
-def get_budget_items(user_id: int) -> Dict:
+def get_budget_items(user_id: int, db: Session) -> Dict:
     """예산 항목 조회"""
-    items = [item for item in BUDGET_ITEMS.values() if item.user_id == user_id]
+    items = budget_repository.list_items(db, user_id)
     
     return {
         "message": "budget_items_retrieved",
         "data": {
-            "items": [
-                {
-                    "id": item.id,
-                    "item_name": item.item_name,
-                    "category": item.category,
-                    "estimated_budget": item.estimated_budget,
-                    "actual_expense": item.actual_expense,
-                    "unit": item.unit,
-                    "quantity": item.quantity,
-                    "notes": item.notes,
-                    "payer": item.payer,
-                    "payment_schedule": item.payment_schedule,
-                    "created_at": item.created_at,
-                    "updated_at": item.updated_at
-                }
-                for item in items
-            ]
+            "items": [budget_repository.item_to_dict(item) for item in items]
         }
     }
 
 
-def get_budget_summary(user_id: int) -> Dict:
+def get_budget_summary(user_id: int, db: Session) -> Dict:
     """예산 요약 (카테고리별 합계)"""
-    summary = budget_service.get_category_summary(user_id)
-    total_budget = USER_TOTAL_BUDGETS.get(user_id, 0.0)
+    summary = budget_service.get_category_summary(user_id, db)
+    total_budget = budget_repository.get_total_budget(db, user_id)
     
     return {
         "message": "budget_summary_retrieved",
@@ -131,12 +77,12 @@ def get_budget_summary(user_id: int) -> Dict:
     }
 
 
-def set_total_budget(user_id: int, request: TotalBudgetSetReq) -> Dict:
+def set_total_budget(user_id: int, request: TotalBudgetSetReq, db: Session) -> Dict:
     """총 예산 설정"""
-    USER_TOTAL_BUDGETS[user_id] = request.total_budget
+    total_budget = budget_repository.set_total_budget(db, user_id, request.total_budget)
     return {
         "message": "total_budget_set",
-        "data": {"total_budget": request.total_budget}
+        "data": {"total_budget": total_budget}
     }
 
 
@@ -144,6 +90,7 @@ async def process_receipt_document(
     user_id: int,
     file_data: bytes,
     filename: str,
+    db: Session,
     content_type: str | None = None
 ) -> Dict:
     """영수증/견적서 문서 처리 (이미지/엑셀/텍스트)"""
@@ -153,30 +100,20 @@ async def process_receipt_document(
         content_type=content_type
     )
     
-    created_items = []
-    for item_data in structured_items:
-        item_id = COUNTERS["budget"]
-        COUNTERS["budget"] += 1
-        
-        now = datetime.now().strftime("%Y-%m-%d")
-        
-        item = BudgetItem(
-            id=item_id,
-            user_id=user_id,
-            item_name=item_data.get("item_name", "항목"),
-            category=item_data.get("category", "etc"),
-            estimated_budget=float(item_data.get("estimated_budget", 0)),
-            actual_expense=float(item_data.get("estimated_budget", 0)),  # OCR에서 추출한 금액은 실제 지출로 간주
-            quantity=float(item_data.get("quantity", 1)),
-            unit=item_data.get("unit"),
-            notes=item_data.get("notes"),
-            created_at=now,
-            updated_at=now,
-            metadata={"source": "ocr", "original_text": ""}  # 원본 텍스트는 메타데이터에 저장 가능
-        )
-        
-        BUDGET_ITEMS[item_id] = item
-        created_items.append(item)
+    rows = [
+        {
+            "item_name": item_data.get("item_name", "항목"),
+            "category": item_data.get("category", "etc"),
+            "estimated_budget": float(item_data.get("estimated_budget", 0)),
+            "actual_expense": float(item_data.get("estimated_budget", 0)),  # OCR에서 추출한 금액은 실제 지출로 간주
+            "quantity": float(item_data.get("quantity", 1)),
+            "unit": item_data.get("unit"),
+            "notes": item_data.get("notes"),
+            "metadata": {"source": "ocr", "original_text": ""}  # 원본 텍스트는 메타데이터에 저장 가능
+        }
+        for item_data in structured_items
+    ]
+    created_items = await asyncio.to_thread(budget_repository.bulk_create_items, db, user_id, rows)
     
     return {
         "message": "receipt_processed",
@@ -184,19 +121,12 @@ async def process_receipt_document(
             "items_created": len(created_items),
             "items": [
                 {
-                    "id": item.id,
-                    "item_name": item.item_name,
-                    "category": item.category,
-                    "estimated_budget": item.estimated_budget
+                    "id": item["id"],
+                    "item_name": item["item_name"],
+                    "category": item["category"],
+                    "estimated_budget": item["estimated_budget"]
                 }
                 for item in created_items
             ]
         }
     }
-
-
-
-
-
-
-
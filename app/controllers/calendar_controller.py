@@ -2,8 +2,8 @@
 캘린더 컨트롤러 - DB 기반
 """
 from typing import Dict, List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, and_, or_, select
 from datetime import datetime, timedelta
 from app.models.db import CalendarEvent, WeddingDate, User
 from app.schemas import (
@@ -13,10 +13,10 @@ from app.schemas import (
 from app.core.exceptions import not_found, forbidden, bad_request
 from app.core.error_codes import ErrorCode
 from app.services import calendar_service
-from app.core.couple_helpers import get_user_couple_id, get_couple_filter_with_user
+from app.core.couple_helpers import get_user_couple_id_async, get_couple_filter_with_user_async
 
 
-def set_wedding_date(user_id: int, wedding_date: str, db: Session) -> Dict:
+async def set_wedding_date(user_id: int, wedding_date: str, db: AsyncSession) -> Dict:
     """예식일 설정"""
     try:
         # String을 Date로 변환
@@ -24,7 +24,7 @@ def set_wedding_date(user_id: int, wedding_date: str, db: Session) -> Dict:
         wedding_date_obj_db = dt.strptime(wedding_date, "%Y-%m-%d").date()
         
         # 기존 예식일이 있으면 업데이트, 없으면 생성
-        wedding_date_obj = db.query(WeddingDate).filter(WeddingDate.user_id == user_id).first()
+        wedding_date_obj = (await db.execute(select(WeddingDate).where(WeddingDate.user_id == user_id))).scalar_one_or_none()
         
         if wedding_date_obj:
             # 기존 예식일 업데이트
@@ -40,8 +40,8 @@ def set_wedding_date(user_id: int, wedding_date: str, db: Session) -> Dict:
             db.add(wedding_date_obj)
             print(f"예식일 생성: user_id={user_id}, wedding_date={wedding_date}")
         
-        db.commit()
-        db.refresh(wedding_date_obj)
+        await db.commit()
+        await db.refresh(wedding_date_obj)
         
         # Date를 String으로 변환하여 반환
         wedding_date_str = wedding_date_obj.wedding_date.strftime("%Y-%m-%d") if wedding_date_obj.wedding_date else None
@@ -51,17 +51,17 @@ def set_wedding_date(user_id: int, wedding_date: str, db: Session) -> Dict:
             "data": {"wedding_date": wedding_date_str}
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"예식일 설정 실패: user_id={user_id}, error={str(e)}")
         import traceback
         traceback.print_exc()
         raise
 
 
-def get_wedding_date(user_id: int, db: Session) -> Dict:
+async def get_wedding_date(user_id: int, db: AsyncSession) -> Dict:
     """예식일 조회"""
     try:
-        wedding_date_obj = db.query(WeddingDate).filter(WeddingDate.user_id == user_id).first()
+        wedding_date_obj = (await db.execute(select(WeddingDate).where(WeddingDate.user_id == user_id))).scalar_one_or_none()
         
         # Date를 String으로 변환
         if wedding_date_obj and wedding_date_obj.wedding_date:
@@ -85,7 +85,7 @@ def get_wedding_date(user_id: int, db: Session) -> Dict:
 async def generate_timeline(
     user_id: int,
     request: TimelineGenerateReq,
-    db: Session
+    db: AsyncSession
 ) -> Dict:
     """타임라인 자동 생성"""
     from datetime import datetime as dt
@@ -109,7 +109,7 @@ async def generate_timeline(
         end_time = dt.strptime(e.get("end_time"), "%H:%M").time() if e.get("end_time") else None
         
         # 커플 ID 가져오기
-        couple_id = get_user_couple_id(e["user_id"], db)
+        couple_id = await get_user_couple_id_async(e["user_id"], db)
         
         event = CalendarEvent(
             user_id=e["user_id"],
@@ -129,11 +129,11 @@ async def generate_timeline(
         db.add(event)
         created_events.append(event)
     
-    db.commit()
+    await db.commit()
     
     # 생성된 이벤트 ID 반환
     for i, event in enumerate(created_events):
-        db.refresh(event)
+        await db.refresh(event)
         created_events[i] = event
     
     return {
@@ -155,7 +155,7 @@ async def generate_timeline(
     }
 
 
-def create_event(user_id: int, request: CalendarEventCreateReq, db: Session) -> Dict:
+async def create_event(user_id: int, request: CalendarEventCreateReq, db: AsyncSession) -> Dict:
     """일정 생성"""
     from datetime import datetime as dt
     from app.models.db.calendar import PriorityEnum, AssigneeEnum
@@ -182,7 +182,7 @@ def create_event(user_id: int, request: CalendarEventCreateReq, db: Session) ->
             assignee = request.assignee
     
     # 커플 ID 가져오기
-    couple_id = get_user_couple_id(user_id, db)
+    couple_id = await get_user_couple_id_async(user_id, db)
     
     event = CalendarEvent(
         user_id=user_id,
@@ -202,10 +202,10 @@ def create_event(user_id: int, request: CalendarEventCreateReq, db: Session) ->
     
     try:
         db.add(event)
-        db.commit()
-        db.refresh(event)
+        await db.commit()
+        await db.refresh(event)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"일정 생성 실패: {e}")
         import traceback
         traceback.print_exc()
@@ -221,11 +221,11 @@ def create_event(user_id: int, request: CalendarEventCreateReq, db: Session) ->
     }
 
 
-def update_event(event_id: int, user_id: int, request: CalendarEventUpdateReq, db: Session) -> Dict:
+async def update_event(event_id: int, user_id: int, request: CalendarEventUpdateReq, db: AsyncSession) -> Dict:
     """일정 수정"""
     from datetime import datetime as dt
     
-    event = db.query(CalendarEvent).filter(CalendarEvent.id == event_id).first()
+    event = await db.get(CalendarEvent, event_id)
     if not event:
         raise not_found("event_not_found", ErrorCode.EVENT_NOT_FOUND)
     
@@ -258,8 +258,8 @@ def update_event(event_id: int, user_id: int, request: CalendarEventUpdateReq, d
         event.is_completed = request.is_completed
     # reminder_days는 DB에 없으므로 제거
     
-    db.commit()
-    db.refresh(event)
+    await db.commit()
+    await db.refresh(event)
     
     return {
         "message": "event_updated",
@@ -270,37 +270,37 @@ def update_event(event_id: int, user_id: int, request: CalendarEventUpdateReq, d
     }
 
 
-def delete_event(event_id: int, user_id: int, db: Session) -> Dict:
+async def delete_event(event_id: int, user_id: int, db: AsyncSession) -> Dict:
     """일정 삭제"""
-    event = db.query(CalendarEvent).filter(CalendarEvent.id == event_id).first()
+    event = await db.get(CalendarEvent, event_id)
     if not event:
         raise not_found("event_not_found", ErrorCode.EVENT_NOT_FOUND)
     
     if event.user_id != user_id:
         raise forbidden("forbidden", ErrorCode.FORBIDDEN)
     
-    db.delete(event)
-    db.commit()
+    await db.delete(event)
+    await db.commit()
     
     return {"message": "event_deleted", "data": {"id": event_id}}
 
 
-def get_events(user_id: int, start_date: str | None = None, end_date: str | None = None, db: Session = None) -> Dict:
+async def get_events(user_id: int, start_date: str | None = None, end_date: str | None = None, db: AsyncSession = None) -> Dict:
     """일정 조회 (커플 데이터 공유)"""
     from datetime import datetime as dt
     
     # 커플 필터 생성
-    couple_filter = get_couple_filter_with_user(user_id, db, CalendarEvent)
-    query = db.query(CalendarEvent).filter(couple_filter)
+    couple_filter = await get_couple_filter_with_user_async(user_id, db, CalendarEvent)
+    query = select(CalendarEvent).where(couple_filter)
     
     if start_date:
         start_date_obj = dt.strptime(start_date, "%Y-%m-%d").date()
-        query = query.filter(CalendarEvent.start_date >= start_date_obj)
+        query = query.where(CalendarEvent.start_date >= start_date_obj)
     if end_date:
         end_date_obj = dt.strptime(end_date, "%Y-%m-%d").date()
-        query = query.filter(CalendarEvent.start_date <= end_date_obj)
+        query = query.where(CalendarEvent.start_date <= end_date_obj)
     
-    events = query.order_by(CalendarEvent.start_date, CalendarEvent.start_time).all()
+    events = (await db.execute(query.order_by(CalendarEvent.start_date, CalendarEvent.start_time))).scalars().all()
     
     return {
         "message": "events_retrieved",
@@ -328,19 +328,19 @@ def get_events(user_id: int, start_date: str | None = None, end_date: str | None
     }
 
 
-def get_upcoming_events(user_id: int, days: int = 7, db: Session = None) -> Dict:
+async def get_upcoming_events(user_id: int, days: int = 7, db: AsyncSession = None) -> Dict:
     """다가오는 일정 조회 (커플 데이터 공유)"""
     today = datetime.now().date()
     end_date = today + timedelta(days=days)
     
     # 커플 필터 생성
-    couple_filter = get_couple_filter_with_user(user_id, db, CalendarEvent)
+    couple_filter = await get_couple_filter_with_user_async(user_id, db, CalendarEvent)
     
-    events = db.query(CalendarEvent).filter(
+    events = (await db.execute(select(CalendarEvent).where(
         couple_filter,
         CalendarEvent.start_date >= today,
         CalendarEvent.start_date <= end_date
-    ).order_by(CalendarEvent.start_date, CalendarEvent.start_time).all()
+    ).order_by(CalendarEvent.start_date, CalendarEvent.start_time))).scalars().all()
     
     return {
         "message": "upcoming_events_retrieved",
@@ -360,12 +360,12 @@ def get_upcoming_events(user_id: int, days: int = 7, db: Session = None) -> Dict
     }
 
 
-def get_completed_reservations_for_review(user_id: int, db: Session = None) -> Dict:
+async def get_completed_reservations_for_review(user_id: int, db: AsyncSession = None) -> Dict:
     """완료된 예약 중 하루 이상 지난 것 조회 (리뷰 작성용)"""
     from datetime import date, timedelta
     
     # 커플 필터 생성
-    couple_filter = get_couple_filter_with_user(user_id, db, CalendarEvent)
+    couple_filter = await get_couple_filter_with_user_async(user_id, db, CalendarEvent)
     
     # 오늘 날짜
     today = date.today()
@@ -374,7 +374,7 @@ def get_completed_reservations_for_review(user_id: int, db: Session = None) -> D
     
     # 완료된 예약 중 하루 이상 지난 것 조회
     # category가 'reservation'이거나 description에 업체 정보가 있는 것
-    query = db.query(CalendarEvent).filter(
+    query = select(CalendarEvent).where(
         couple_filter,
         CalendarEvent.is_completed == True,
         CalendarEvent.start_date <= one_day_ago,
@@ -384,7 +384,7 @@ def get_completed_reservations_for_review(user_id: int, db: Session = None) -> D
         )
     )
     
-    events = query.order_by(CalendarEvent.start_date.desc()).all()
+    events = (await db.execute(query.order_by(CalendarEvent.start_date.desc()))).scalars().all()
     
     return {
         "message": "completed_reservations_retrieved",
@@ -405,25 +405,25 @@ def get_completed_reservations_for_review(user_id: int, db: Session = None) -> D
     }
 
 
-def get_week_summary(user_id: int, db: Session) -> Dict:
+async def get_week_summary(user_id: int, db: AsyncSession) -> Dict:
     """이번 주 요약 (챗봇 연동용)"""
     today = datetime.now().date()
     week_end = today + timedelta(days=7)
     
     # 일정 조회 (category != 'todo')
-    events = db.query(CalendarEvent).filter(
+    events = (await db.execute(select(CalendarEvent).where(
         CalendarEvent.user_id == user_id,
         CalendarEvent.start_date >= today,
         CalendarEvent.start_date <= week_end,
         CalendarEvent.category != 'todo'  # 할일 제외
-    ).all()
+    ))).scalars().all()
     
     # 할일 조회 (category == 'todo')
-    todos = db.query(CalendarEvent).filter(
+    todos = (await db.execute(select(CalendarEvent).where(
         CalendarEvent.user_id == user_id,
         CalendarEvent.category == 'todo',
         CalendarEvent.is_completed == False
-    ).all()
+    ))).scalars().all()
     
     return {
         "message": "week_summary_retrieved",
@@ -436,7 +436,7 @@ def get_week_summary(user_id: int, db: Session) -> Dict:
     }
 
 
-def create_todo(user_id: int, request: TodoCreateReq, db: Session) -> Dict:
+async def create_todo(user_id: int, request: TodoCreateReq, db: AsyncSession) -> Dict:
     """일정/할일 생성 (calendar_events 테이블 사용, 통합 API)"""
     from datetime import datetime as dt
     from app.models.db.calendar import PriorityEnum, AssigneeEnum
@@ -482,10 +482,10 @@ def create_todo(user_id: int, request: TodoCreateReq, db: Session) -> Dict:
     
     try:
         db.add(event)
-        db.commit()
-        db.refresh(event)
+        await db.commit()
+        await db.refresh(event)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"일정/할일 생성 실패: {e}")
         import traceback
         traceback.print_exc()
@@ -502,12 +502,12 @@ def create_todo(user_id: int, request: TodoCreateReq, db: Session) -> Dict:
     }
 
 
-def update_todo(todo_id: int, user_id: int, request: TodoUpdateReq, db: Session) -> Dict:
+async def update_todo(todo_id: int, user_id: int, request: TodoUpdateReq, db: AsyncSession) -> Dict:
     """일정/할일 수정 (calendar_events 테이블 사용, 통합 API)"""
     from datetime import datetime as dt
     from app.models.db.calendar import PriorityEnum, AssigneeEnum
     
-    event = db.query(CalendarEvent).filter(CalendarEvent.id == todo_id).first()
+    event = await db.get(CalendarEvent, todo_id)
     if not event:
         raise not_found("todo_not_found", ErrorCode.EVENT_NOT_FOUND)
     
@@ -547,8 +547,8 @@ def update_todo(todo_id: int, user_id: int, request: TodoUpdateReq, db: Session)
     if request.progress is not None:
         event.progress = request.progress
     
-    db.commit()
-    db.refresh(event)
+    await db.commit()
+    await db.refresh(event)
     
     return {
         "message": "todo_updated",
@@ -559,43 +559,43 @@ def update_todo(todo_id: int, user_id: int, request: TodoUpdateReq, db: Session)
     }
 
 
-def delete_todo(todo_id: int, user_id: int, db: Session) -> Dict:
+async def delete_todo(todo_id: int, user_id: int, db: AsyncSession) -> Dict:
     """일정/할일 삭제 (calendar_events 테이블 사용, 통합 API)"""
-    event = db.query(CalendarEvent).filter(CalendarEvent.id == todo_id).first()
+    event = await db.get(CalendarEvent, todo_id)
     if not event:
         raise not_found("todo_not_found", ErrorCode.TODO_NOT_FOUND)
     
     if event.user_id != user_id:
         raise forbidden("forbidden", ErrorCode.FORBIDDEN)
     
-    db.delete(event)
-    db.commit()
+    await db.delete(event)
+    await db.commit()
     
     return {"message": "todo_deleted", "data": {"id": todo_id}}
 
 
-def get_todos(user_id: int, completed: bool | None = None, start_date: str | None = None, end_date: str | None = None, category: str | None = None, db: Session = None) -> Dict:
+async def get_todos(user_id: int, completed: bool | None = None, start_date: str | None = None, end_date: str | None = None, category: str | None = None, db: AsyncSession = None) -> Dict:
     """일정/할일 조회 (calendar_events 테이블 사용, 통합 API)"""
     from datetime import datetime as dt
     
     # 모든 일정 조회 (category 필터는 선택적)
-    query = db.query(CalendarEvent).filter(CalendarEvent.user_id == user_id)
+    query = select(CalendarEvent).where(CalendarEvent.user_id == user_id)
     
     # category 필터 (지정된 경우만)
     if category:
-        query = query.filter(CalendarEvent.category == category)
+        query = query.where(CalendarEvent.category == category)
     
     if completed is not None:
-        query = query.filter(CalendarEvent.is_completed == completed)
+        query = query.where(CalendarEvent.is_completed == completed)
     
     if start_date:
         start_date_obj = dt.strptime(start_date, "%Y-%m-%d").date()
-        query = query.filter(CalendarEvent.start_date >= start_date_obj)
+        query = query.where(CalendarEvent.start_date >= start_date_obj)
     if end_date:
         end_date_obj = dt.strptime(end_date, "%Y-%m-%d").date()
-        query = query.filter(CalendarEvent.start_date <= end_date_obj)
+        query = query.where(CalendarEvent.start_date <= end_date_obj)
     
-    events = query.order_by(CalendarEvent.start_date, CalendarEvent.start_time).all()
+    events = (await db.execute(query.order_by(CalendarEvent.start_date, CalendarEvent.start_time))).scalars().all()
     
     return {
         "message": "todos_retrieved",
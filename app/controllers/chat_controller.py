@@ -12,8 +12,8 @@ async def chat_stream(
     include_context: bool = True,
     db: Session = None,
     model: str | None = None
-) -> AsyncGenerator[str, None]:
-    """챗봇 스트리밍 응답"""
+) -> AsyncGenerator[bytes, None]:
+    """챗봇 스트리밍 응답 (NDJSON 바이트 청크)"""
     async for chunk in chat_service.chat_stream(message, user_id, include_context, db, model):
         yield chunk
 
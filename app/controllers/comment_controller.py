@@ -1,20 +1,37 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from app.core.exceptions import not_found, forbidden, bad_request, unauthorized, unprocessable
 from app.core.error_codes import ErrorCode
+from app.core.pagination import keyset_filter, keyset_order, split_page
 from app.models.db import Post, Comment, User
 from app.schemas import CommentCreateReq, CommentUpdateReq
 from app.services.model_client import analyze_sentiment
+from app.services import post_counter_service
 
 
-async def create_comment_controller(post_id: int, req: CommentCreateReq, user_id: int, db: Session):
+async def _ensure_post_exists(post_id: int, db: AsyncSession) -> None:
+    post_exists = await db.scalar(select(Post.id).where(Post.id == post_id))
+    if not post_exists:
+        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+
+
+async def _get_comment_or_404(post_id: int, comment_id: int, db: AsyncSession) -> Comment:
+    comment = (await db.execute(
+        select(Comment).where(Comment.id == comment_id, Comment.post_id == post_id)
+    )).scalar_one_or_none()
+    if not comment:
+        raise not_found("comment_not_found", ErrorCode.COMMENT_NOT_FOUND)
+    return comment
+
+
+async def create_comment_controller(post_id: int, req: CommentCreateReq, user_id: int, db: AsyncSession):
     """댓글 작성 컨트롤러 + 감성 분석"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise unauthorized("unauthorized_user", ErrorCode.UNAUTHORIZED)
 
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+    await _ensure_post_exists(post_id, db)
     
     if not req.content or not req.content.strip():
         raise unprocessable("missing_required_field", ErrorCode.MISSING_REQUIRED_FIELD, {"message": "댓글 내용을 입력해주세요."})
@@ -26,8 +43,8 @@ async def create_comment_controller(post_id: int, req: CommentCreateReq, user_id
     )
     
     db.add(comment)
-    db.commit()
-    db.refresh(comment)
+    await post_counter_service.adjust_comment_count(db, post_id, 1)
+    await db.commit()
     
     # 🎯 Model API 호출 (감성 분석) - 비동기로 처리
     sentiment_result = None
@@ -56,13 +73,18 @@ async def create_comment_controller(post_id: int, req: CommentCreateReq, user_id
     return result
 
 
-def get_comments_controller(post_id: int, db: Session):
-    """댓글 목록 조회 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+async def get_comments_controller(post_id: int, db: AsyncSession, limit: int = 100, cursor: str = None):
+    """댓글 목록 조회 컨트롤러 (작성순, (created_at, id) 커서 페이지네이션)"""
+    await _ensure_post_exists(post_id, db)
+    
+    query = select(Comment).options(selectinload(Comment.user))\
+        .where(Comment.post_id == post_id)\
+        .order_by(*keyset_order(Comment.created_at, Comment.id, descending=False))
+    if cursor:
+        query = query.where(keyset_filter(Comment.created_at, Comment.id, cursor, descending=False))
     
-    comments = db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.created_at.asc()).all()
+    rows = (await db.execute(query.limit(limit + 1))).scalars().all()
+    comments, next_cursor = split_page(rows, limit)
     
     comments_data = []
     for comment in comments:
@@ -73,18 +95,18 @@ def get_comments_controller(post_id: int, db: Session):
             "content": comment.content
         })
     
-    return {"comments": comments_data}
+    return {
+        "comments": comments_data,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
+    }
 
 
-def update_comment_controller(post_id: int, comment_id: int, req: CommentUpdateReq, user_id: int, db: Session):
+async def update_comment_controller(post_id: int, comment_id: int, req: CommentUpdateReq, user_id: int, db: AsyncSession):
     """댓글 수정 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+    await _ensure_post_exists(post_id, db)
     
-    comment = db.query(Comment).filter(Comment.id == comment_id, Comment.post_id == post_id).first()
-    if not comment:
-        raise not_found("comment_not_found", ErrorCode.COMMENT_NOT_FOUND)
+    comment = await _get_comment_or_404(post_id, comment_id, db)
     
     if comment.user_id != user_id:
         raise forbidden("forbidden", ErrorCode.FORBIDDEN)
@@ -93,26 +115,22 @@ def update_comment_controller(post_id: int, comment_id: int, req: CommentUpdateR
         raise unprocessable("missing_required_field", ErrorCode.MISSING_REQUIRED_FIELD, {"message": "댓글 내용을 입력해주세요."})
     
     comment.content = req.content
-    db.commit()
-    db.refresh(comment)
+    await db.commit()
     
     return {"comment_id": comment_id}
 
 
-def delete_comment_controller(post_id: int, comment_id: int, user_id: int, db: Session):
+async def delete_comment_controller(post_id: int, comment_id: int, user_id: int, db: AsyncSession):
     """댓글 삭제 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+    await _ensure_post_exists(post_id, db)
     
-    comment = db.query(Comment).filter(Comment.id == comment_id, Comment.post_id == post_id).first()
-    if not comment:
-        raise not_found("comment_not_found", ErrorCode.COMMENT_NOT_FOUND)
+    comment = await _get_comment_or_404(post_id, comment_id, db)
     
     if comment.user_id != user_id:
         raise forbidden("forbidden", ErrorCode.FORBIDDEN)
     
-    db.delete(comment)
-    db.commit()
+    await db.delete(comment)
+    await post_counter_service.adjust_comment_count(db, post_id, -1)
+    await db.commit()
     
     return {"comment_id": comment_id}
@@ -9,6 +9,7 @@ from app.models.db import User, Couple, Gender, CoupleStatus
 from app.schemas import CoupleConnectReq
 from app.core.exceptions import bad_request, not_found, conflict
 from app.core.error_codes import ErrorCode
+from app.core.identity import invalidate_identity
 
 
 def get_my_couple_key(user_id: int, db: Session) -> Dict:
@@ -136,6 +137,7 @@ def connect_couple(user_id: int, request: CoupleConnectReq, db: Session) -> Dict
             
             db.commit()
             db.refresh(partner_couple)
+            invalidate_identity(user.id, partner_user.id)
             return {
                 "message": "couple_connected",
                 "data": {
@@ -179,6 +181,7 @@ def connect_couple(user_id: int, request: CoupleConnectReq, db: Session) -> Dict
         
         db.commit()
         db.refresh(partner_couple)
+        invalidate_identity(user.id, partner_user.id)
         return {
             "message": "couple_connected",
             "data": {
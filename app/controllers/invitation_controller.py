@@ -19,6 +19,7 @@ from app.services.invitation_service import (
     generate_qr_code, generate_qr_code_image, recommend_invitation_text,
     generate_invitation_pdf
 )
+import asyncio
 import os
 import uuid
 from datetime import datetime
@@ -422,33 +423,32 @@ def get_orders(user_id: int, db: Session) -> Dict:
 
 async def generate_tones(request) -> Dict:
     """5가지 톤의 청첩장 문구 생성 (Gemini 2.5 Flash 사용)"""
-    import httpx
-    from app.services.model_client import get_model_api_base_url
+    from app.services.model_client import get_model_api_base_url, get_http_client, get_model_api_timeout
     
     # 모델 서버의 톤 제안 API 호출
     base_url = get_model_api_base_url()
     url = f"{base_url}/invitation/tone-recommend"
     
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                url,
-                json={
-                    "groom_name": request.groom_name,
-                    "bride_name": request.bride_name,
-                    "groom_father_name": request.groom_father_name,
-                    "groom_mother_name": request.groom_mother_name,
-                    "bride_father_name": request.bride_father_name,
-                    "bride_mother_name": request.bride_mother_name,
-                    "wedding_date": request.wedding_date,
-                    "wedding_time": request.wedding_time,
-                    "wedding_location": request.wedding_location,
-                    "additional_message": request.additional_message
-                },
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await get_http_client().post(
+            url,
+            json={
+                "groom_name": request.groom_name,
+                "bride_name": request.bride_name,
+                "groom_father_name": request.groom_father_name,
+                "groom_mother_name": request.groom_mother_name,
+                "bride_father_name": request.bride_father_name,
+                "bride_mother_name": request.bride_mother_name,
+                "wedding_date": request.wedding_date,
+                "wedding_time": request.wedding_time,
+                "wedding_location": request.wedding_location,
+                "additional_message": request.additional_message
+            },
+            headers={"Content-Type": "application/json"},
+            timeout=get_model_api_timeout("invitation_text")
+        )
+        response.raise_for_status()
+        return response.json()
             
     except Exception as e:
         print(f"⚠️ 톤 제안 API 호출 실패: {e}")
@@ -511,16 +511,16 @@ def generate_default_tones(request) -> Dict:
 
 async def generate_image(request, user_id: int, db: Session) -> Dict:
     """청첩장 이미지 생성"""
-    import httpx
     from datetime import date, datetime
-    from app.services.model_client import get_model_api_base_url
+    from app.services.model_client import get_model_api_base_url, get_http_client, get_model_api_timeout
     from app.models.db.gemini_usage import GeminiImageUsage
     
+    # 동기 세션 조회/커밋은 스레드에서 실행 (이미지 API를 기다리는 동안 이벤트 루프를 막지 않음)
     # 디자인 확인
-    design = db.query(InvitationDesign).filter(
+    design = await asyncio.to_thread(db.query(InvitationDesign).filter(
         InvitationDesign.id == request.design_id,
         InvitationDesign.user_id == user_id
-    ).first()
+    ).first)
     
     if not design:
         raise not_found("design_not_found", ErrorCode.DESIGN_NOT_FOUND)
@@ -535,10 +535,10 @@ async def generate_image(request, user_id: int, db: Session) -> Dict:
         
         # 일일 사용 횟수 확인
         today = date.today()
-        usage = db.query(GeminiImageUsage).filter(
+        usage = await asyncio.to_thread(db.query(GeminiImageUsage).filter(
             GeminiImageUsage.user_id == user_id,
             GeminiImageUsage.usage_date == today
-        ).first()
+        ).first)
         
         if usage:
             if usage.usage_count >= 5:
@@ -551,42 +551,42 @@ async def generate_image(request, user_id: int, db: Session) -> Dict:
                 usage_count=0
             )
             db.add(usage)
-            db.flush()
+            await asyncio.to_thread(db.flush)
     
     # 모델 서버의 이미지 생성 API 호출
     base_url = get_model_api_base_url()
     url = f"{base_url}/image/generate"
     
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                url,
-                json={
-                    "prompt": request.prompt,
-                    "model": model,
-                    "base_image_b64": request.base_image_url
-                },
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            # 디자인에 이미지 정보 저장
-            if "data" in result and "image_b64" in result["data"]:
-                design.generated_image_url = result["data"]["image_b64"]
-                design.generated_image_model = model
-                design.selected_tone = request.selected_tone
-                design.selected_text = request.selected_text
-                
-                # Gemini 모델 사용 시 횟수 증가
-                if model == "gemini" and usage:
-                    usage.usage_count += 1
-                    usage.last_used_at = datetime.now()
-                
-                db.commit()
+        response = await get_http_client().post(
+            url,
+            json={
+                "prompt": request.prompt,
+                "model": model,
+                "base_image_b64": request.base_image_url
+            },
+            headers={"Content-Type": "application/json"},
+            timeout=get_model_api_timeout("image")
+        )
+        response.raise_for_status()
+        result = response.json()
+        
+        # 디자인에 이미지 정보 저장
+        if "data" in result and "image_b64" in result["data"]:
+            design.generated_image_url = result["data"]["image_b64"]
+            design.generated_image_model = model
+            design.selected_tone = request.selected_tone
+            design.selected_text = request.selected_text
             
-            return result
+            # Gemini 모델 사용 시 횟수 증가
+            if model == "gemini" and usage:
+                usage.usage_count += 1
+                usage.last_used_at = datetime.now()
             
+            await asyncio.to_thread(db.commit)
+        
+        return result
+        
     except Exception as e:
         print(f"⚠️ 이미지 생성 API 호출 실패: {e}")
         raise bad_request("image_generation_failed", ErrorCode.EXTERNAL_API_ERROR)
@@ -594,16 +594,15 @@ async def generate_image(request, user_id: int, db: Session) -> Dict:
 
 async def modify_image(request, user_id: int, db: Session) -> Dict:
     """청첩장 이미지 수정"""
-    import httpx
     from datetime import date, datetime
-    from app.services.model_client import get_model_api_base_url
+    from app.services.model_client import get_model_api_base_url, get_http_client, get_model_api_timeout
     from app.models.db.gemini_usage import GeminiImageUsage
     
     # 디자인 확인
-    design = db.query(InvitationDesign).filter(
+    design = await asyncio.to_thread(db.query(InvitationDesign).filter(
         InvitationDesign.id == request.design_id,
         InvitationDesign.user_id == user_id
-    ).first()
+    ).first)
     
     if not design:
         raise not_found("design_not_found", ErrorCode.DESIGN_NOT_FOUND)
@@ -618,10 +617,10 @@ async def modify_image(request, user_id: int, db: Session) -> Dict:
         
         # 일일 사용 횟수 확인
         today = date.today()
-        usage = db.query(GeminiImageUsage).filter(
+        usage = await asyncio.to_thread(db.query(GeminiImageUsage).filter(
             GeminiImageUsage.user_id == user_id,
             GeminiImageUsage.usage_date == today
-        ).first()
+        ).first)
         
         if usage:
             if usage.usage_count >= 5:
@@ -634,40 +633,40 @@ async def modify_image(request, user_id: int, db: Session) -> Dict:
                 usage_count=0
             )
             db.add(usage)
-            db.flush()
+            await asyncio.to_thread(db.flush)
     
     # 모델 서버의 이미지 수정 API 호출
     base_url = get_model_api_base_url()
     url = f"{base_url}/image/modify"
     
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                url,
-                json={
-                    "base_image_b64": request.base_image_url,
-                    "modification_prompt": request.modification_prompt,
-                    "model": model
-                },
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            # 디자인에 수정된 이미지 정보 저장
-            if "data" in result and "image_b64" in result["data"]:
-                design.generated_image_url = result["data"]["image_b64"]
-                design.generated_image_model = model
-                
-                # Gemini 모델 사용 시 횟수 증가
-                if model == "gemini" and usage:
-                    usage.usage_count += 1
-                    usage.last_used_at = datetime.now()
-                
-                db.commit()
+        response = await get_http_client().post(
+            url,
+            json={
+                "base_image_b64": request.base_image_url,
+                "modification_prompt": request.modification_prompt,
+                "model": model
+            },
+            headers={"Content-Type": "application/json"},
+            timeout=get_model_api_timeout("image")
+        )
+        response.raise_for_status()
+        result = response.json()
+        
+        # 디자인에 수정된 이미지 정보 저장
+        if "data" in result and "image_b64" in result["data"]:
+            design.generated_image_url = result["data"]["image_b64"]
+            design.generated_image_model = model
             
-            return result
+            # Gemini 모델 사용 시 횟수 증가
+            if model == "gemini" and usage:
+                usage.usage_count += 1
+                usage.last_used_at = datetime.now()
             
+            await asyncio.to_thread(db.commit)
+        
+        return result
+        
     except Exception as e:
         print(f"⚠️ 이미지 수정 API 호출 실패: {e}")
         raise bad_request("image_modification_failed", ErrorCode.EXTERNAL_API_ERROR)
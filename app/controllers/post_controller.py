@@ -1,16 +1,20 @@
+import asyncio
 import os
 import uuid
 from pathlib import Path
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import func, or_, select
 from app.core.validators import validate_title
 from app.core.exceptions import bad_request, not_found, forbidden, unprocessable, unauthorized, payload_too_large
 from app.core.error_codes import ErrorCode
 from app.models.db import Post, PostLike, Tag, User, Comment
 from app.schemas import PostCreateReq, PostUpdateReq
-from app.services.model_client import predict_image, summarize_text, auto_tag_text, analyze_sentiment
-from app.services import post_vector_service, ocr_service
-from app.core.couple_helpers import get_user_couple_id, get_couple_filter_with_user
+from app.services.model_client import predict_image
+from app.services import post_vector_service, ocr_service, ai_job_queue, post_counter_service, keyword_index
+from app.services.enrichment_service import enrich_text
+from app.core.couple_helpers import get_user_couple_id_async
+from app.core.pagination import keyset_filter, keyset_order, split_page, approximate_count
 
 UPLOAD_DIR = os.path.abspath("./uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
@@ -30,9 +34,45 @@ def _build_upload_url(filename: str) -> str:
     return f"{UPLOAD_BASE_URL}/uploads/{filename}"
 
 
-async def create_post_controller(req: PostCreateReq, user_id: int, db: Session):
+async def _get_or_create_tag(name: str, db: AsyncSession) -> Tag:
+    tag = (await db.execute(select(Tag).where(Tag.name == name))).scalar_one_or_none()
+    if not tag:
+        tag = Tag(name=name)
+        db.add(tag)
+        await db.flush()  # Get ID
+    return tag
+
+
+async def _get_post_or_404(post_id: int, db: AsyncSession, *options) -> Post:
+    result = await db.execute(select(Post).options(*options).where(Post.id == post_id))
+    post = result.scalar_one_or_none()
+    if not post:
+        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+    return post
+
+
+async def _is_liked_by(post_id: int, user_id: int | None, db: AsyncSession) -> bool:
+    if not user_id:
+        return False
+    like_id = await db.scalar(
+        select(PostLike.id).where(PostLike.post_id == post_id, PostLike.user_id == user_id)
+    )
+    return like_id is not None
+
+
+async def _get_liked_post_ids(post_ids: list[int], user_id: int | None, db: AsyncSession) -> set[int]:
+    """목록 페이지 게시글 중 사용자가 좋아요한 게시글 id를 한 번의 쿼리로 조회"""
+    if not user_id or not post_ids:
+        return set()
+    rows = await db.execute(
+        select(PostLike.post_id).where(PostLike.user_id == user_id, PostLike.post_id.in_(post_ids))
+    )
+    return set(rows.scalars().all())
+
+
+async def create_post_controller(req: PostCreateReq, user_id: int, db: AsyncSession):
     """게시글 작성 컨트롤러"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise unauthorized("unauthorized_user", ErrorCode.UNAUTHORIZED)
 
@@ -42,54 +82,30 @@ async def create_post_controller(req: PostCreateReq, user_id: int, db: Session):
     validate_title(req.title)
     
     # AI 서비스 호출 (실패해도 게시글 작성은 성공)
+    # 작업 큐 사용 시 저장 후 워커가 처리하고, 아니면 요청 안에서 병렬 호출
     tags_list = []
     summary = None
     sentiment_score = None
     sentiment_label = None
     
-    try:
-        tags_list = await auto_tag_text(req.content)
-        if not tags_list:
-            tags_list = []
-        print(f"✅ 자동 태그 생성 성공: {tags_list}")
-    except Exception as e:
-        print(f"⚠️ 자동 태그 생성 실패 (게시글 작성은 계속 진행): {e}")
-        tags_list = []
-    
-    try:
-        summary_res = await summarize_text(req.content)
-        summary = summary_res.get("summary") if summary_res else None
-        if summary:
-            print(f"✅ 요약 생성 성공: {summary[:50]}...")
-    except Exception as e:
-        print(f"⚠️ 요약 생성 실패 (게시글 작성은 계속 진행): {e}")
-        summary = None
-    
-    try:
-        sentiment_res = await analyze_sentiment(req.content)
-        if sentiment_res:
-            sentiment_score = sentiment_res.get("confidence")
-            sentiment_label = sentiment_res.get("label")
-            print(f"✅ 감성 분석 성공: {sentiment_label} (신뢰도: {sentiment_score})")
-    except Exception as e:
-        print(f"⚠️ 감성 분석 실패 (게시글 작성은 계속 진행): {e}")
-        sentiment_score = None
-        sentiment_label = None
+    if not ai_job_queue.AI_JOBS_ENABLED:
+        enrichment = await enrich_text(req.content)
+        tags_list = enrichment["tags"]
+        summary = enrichment["summary"]
+        sentiment = enrichment["sentiment"]
+        sentiment_score = sentiment["confidence"] if sentiment else None
+        sentiment_label = sentiment["label"] if sentiment else None
+        print(f"✅ AI 보강 완료: tags={tags_list}, sentiment={sentiment_label}")
 
     # Handle Tags
     db_tags = []
     if tags_list:  # tags_list가 None이 아니고 비어있지 않을 때만 처리
         for tag_name in tags_list:
             if tag_name and tag_name.strip():  # 빈 문자열 체크
-                tag = db.query(Tag).filter(Tag.name == tag_name).first()
-                if not tag:
-                    tag = Tag(name=tag_name)
-                    db.add(tag)
-                    db.flush()  # Get ID
-                db_tags.append(tag)
+                db_tags.append(await _get_or_create_tag(tag_name, db))
 
     # 커플 ID 가져오기
-    couple_id = get_user_couple_id(user_id, db)
+    couple_id = await get_user_couple_id_async(user_id, db)
     
     # 카테고리 검증
     from app.core.categories import is_valid_category
@@ -99,7 +115,7 @@ async def create_post_controller(req: PostCreateReq, user_id: int, db: Session):
     vendor_id = None
     if req.vendor_id:
         from app.models.db.vendor import Vendor
-        vendor = db.query(Vendor).filter(Vendor.id == req.vendor_id).first()
+        vendor = await db.get(Vendor, req.vendor_id)
         if vendor:
             vendor_id = req.vendor_id
     
@@ -120,12 +136,23 @@ async def create_post_controller(req: PostCreateReq, user_id: int, db: Session):
     )
     
     db.add(post)
-    db.commit()
-    db.refresh(post)
     
-    # 게시글 벡터화 (비동기, 실패해도 게시글 작성은 성공)
+    if ai_job_queue.AI_JOBS_ENABLED:
+        # 게시글과 AI 작업을 같은 트랜잭션으로 저장
+        await db.flush()
+        ai_job = await ai_job_queue.enqueue_post_job(db, post, ai_job_queue.POST_CREATE_TASKS)
+        await db.commit()
+        keyword_index.index_post(post)
+        return {"post_id": post.id, "ai_job_id": ai_job.id}
+    
+    await db.commit()
+    keyword_index.index_post(post)
+    # 서버 기본값과 태그 관계를 미리 로드 (AsyncSession은 lazy load 불가)
+    await db.refresh(post, attribute_names=["created_at", "updated_at", "tags"])
+    
+    # 게시글 벡터화 (임베딩 계산은 스레드에서 실행, 실패해도 게시글 작성은 성공)
     try:
-        post_vector_service.vectorize_post(post)
+        await asyncio.to_thread(post_vector_service.vectorize_post, post)
         print(f"✅ 게시글 벡터화 완료: post_id={post.id}")
     except Exception as e:
         print(f"⚠️ 게시글 벡터화 실패 (게시글 작성은 계속 진행): {e}")
@@ -133,93 +160,92 @@ async def create_post_controller(req: PostCreateReq, user_id: int, db: Session):
     return {"post_id": post.id}
 
 
-def get_posts_controller(page: int = 1, limit: int = 10, user_id: int = None, board_type: str = "couple", category: str = None, vendor_type: str = None, db: Session = None):
-    """게시글 목록 조회 컨트롤러 (커플 데이터 공유)"""
+async def get_posts_controller(page: int = 1, limit: int = 10, user_id: int = None, board_type: str = "couple", category: str = None, vendor_type: str = None, db: AsyncSession = None, cursor: str = None, include_total: bool = False):
+    """
+    게시글 목록 조회 컨트롤러 (커플 데이터 공유)
+
+    cursor가 있으면 (created_at, id) 기준 커서 페이지네이션을 사용합니다.
+    이때 전체 개수는 include_total=True인 경우에만 대략값(최대 APPROX_TOTAL_CAP)으로 계산합니다.
+    cursor가 없으면 기존 page/offset 방식 + 정확한 total을 반환합니다.
+    """
     if page < 1:
         page = 1
     if limit < 1 or limit > 100:
         limit = 10
     
-    offset = (page - 1) * limit
+    empty_result = {
+        "posts": [],
+        "total": 0,
+        "page": page,
+        "limit": limit,
+        "next_cursor": None,
+        "has_more": False
+    }
     
     # "커플 전용 공간" (private)과 "문서 보관함" (vault)은 커플이 연결된 사용자만 조회 가능
     if board_type == "private" or board_type == "vault":
         if not user_id:
             # 로그인하지 않은 경우 빈 결과 반환
-            return {
-                "posts": [],
-                "total": 0,
-                "page": page,
-                "limit": limit
-            }
+            return empty_result
         
         # 커플이 연결되어 있는지 확인
-        couple_id = get_user_couple_id(user_id, db)
+        couple_id = await get_user_couple_id_async(user_id, db)
         if not couple_id:
             # 커플이 연결되어 있지 않은 경우 빈 결과 반환
-            return {
-                "posts": [],
-                "total": 0,
-                "page": page,
-                "limit": limit
-            }
+            return empty_result
         
         # 커플 전용 공간/문서 보관함은 해당 couple_id의 게시글만 조회
-        total = db.query(func.count(Post.id)).filter(
-            Post.board_type == board_type,
-            Post.couple_id == couple_id
-        ).scalar()
-        
-        posts = db.query(Post).filter(
+        base_query = select(Post).where(
             Post.board_type == board_type,
             Post.couple_id == couple_id
-        ).order_by(Post.created_at.desc())\
-        .offset(offset).limit(limit).all()
+        )
     else:
         # 공개 게시판 타입 (couple, planner, venue_review) - 모든 사용자가 볼 수 있음
         # 로그인 여부와 관계없이 전체 게시글 조회
         from app.models.db.vendor import Vendor, VendorType
-        from sqlalchemy.orm import joinedload
         from app.core.categories import is_valid_category
         
-        query = db.query(Post).options(joinedload(Post.vendor)).filter(Post.board_type == board_type)
-        count_query = db.query(func.count(Post.id)).filter(Post.board_type == board_type)
+        base_query = select(Post).where(Post.board_type == board_type)
         
         # category 필터 적용
         if category and is_valid_category(category):
-            query = query.filter(Post.category == category)
-            count_query = count_query.filter(Post.category == category)
+            base_query = base_query.where(Post.category == category)
         
         # vendor_type 필터 적용
         if vendor_type:
             try:
                 vendor_type_enum = VendorType(vendor_type)
                 # Post.vendor_id를 통해 Vendor를 join
-                query = query.join(Vendor, Post.vendor_id == Vendor.id).filter(Vendor.vendor_type == vendor_type_enum)
-                count_query = count_query.join(Vendor, Post.vendor_id == Vendor.id).filter(Vendor.vendor_type == vendor_type_enum)
+                base_query = base_query.join(Vendor, Post.vendor_id == Vendor.id).where(Vendor.vendor_type == vendor_type_enum)
             except ValueError:
                 # 잘못된 vendor_type인 경우 필터링하지 않음
                 pass
-        
-        total = count_query.scalar()
-        posts = query.order_by(Post.created_at.desc()).offset(offset).limit(limit).all()
+    
+    query = base_query.options(
+        selectinload(Post.user), selectinload(Post.tags), joinedload(Post.vendor)
+    ).order_by(*keyset_order(Post.created_at, Post.id))
+    
+    total_data = {}
+    if cursor:
+        query = query.where(keyset_filter(Post.created_at, Post.id, cursor))
+        if include_total:
+            total_data = await approximate_count(db, base_query)
+    else:
+        query = query.offset((page - 1) * limit)
+        total_data = {
+            "total": await db.scalar(
+                select(func.count()).select_from(base_query.with_only_columns(Post.id).subquery())
+            )
+        }
+    
+    rows = (await db.execute(query.limit(limit + 1))).scalars().all()
+    posts, next_cursor = split_page(rows, limit)
+    
+    # 좋아요/댓글 수는 posts 카운터 컬럼 사용, 좋아요 여부는 페이지 단위로 한 번에 조회
+    liked_post_ids = await _get_liked_post_ids([post.id for post in posts], user_id, db)
     
     posts_data = []
     for post in posts:
-        comment_count = db.query(func.count(Comment.id)).filter(Comment.post_id == post.id).scalar()
-        
-        # 좋아요 개수 계산
-        like_count = db.query(func.count(PostLike.id)).filter(PostLike.post_id == post.id).scalar()
-        
-        liked = False
-        if user_id:
-            like_exists = db.query(PostLike).filter(
-                PostLike.post_id == post.id, 
-                PostLike.user_id == user_id
-            ).first()
-            if like_exists:
-                liked = True
-        
         # vendor 정보 추가
         vendor_data = None
         if post.vendor:
@@ -241,26 +267,33 @@ def get_posts_controller(page: int = 1, limit: int = 10, user_id: int = None, bo
             "tags": [t.name for t in post.tags],
             "summary": post.summary,
             "sentiment_label": post.sentiment_label,
-            "like_count": like_count,
-            "view_count": post.view_count,
-            "comment_count": comment_count,
-            "liked": liked,
+            "like_count": post.like_count or 0,
+            "view_count": (post.view_count or 0) + post_counter_service.get_pending_views(post.id),
+            "comment_count": post.comment_count or 0,
+            "liked": post.id in liked_post_ids,
             "vendor": vendor_data
         })
     
-    return {
+    result = {
         "posts": posts_data,
-        "total": total,
+        "total": None,
         "page": page,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
     }
+    result.update(total_data)
+    return result
 
 
-def get_post_controller(post_id: int, user_id: int = None, db: Session = None):
+async def get_post_controller(post_id: int, user_id: int = None, db: AsyncSession = None):
     """게시글 상세 조회 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+    post = await _get_post_or_404(
+        post_id, db,
+        selectinload(Post.user),
+        selectinload(Post.tags),
+        selectinload(Post.comments).selectinload(Comment.user),
+    )
     
     # "커플 전용 공간" (private)과 "문서 보관함" (vault)은 커플이 연결된 사용자만 조회 가능
     if post.board_type == "private" or post.board_type == "vault":
@@ -268,7 +301,7 @@ def get_post_controller(post_id: int, user_id: int = None, db: Session = None):
             raise forbidden("forbidden", ErrorCode.FORBIDDEN)
         
         # 커플이 연결되어 있는지 확인
-        couple_id = get_user_couple_id(user_id, db)
+        couple_id = await get_user_couple_id_async(user_id, db)
         if not couple_id or post.couple_id != couple_id:
             # 커플이 연결되어 있지 않거나 다른 커플의 게시글인 경우 접근 불가
             raise forbidden("forbidden", ErrorCode.FORBIDDEN)
@@ -278,18 +311,10 @@ def get_post_controller(post_id: int, user_id: int = None, db: Session = None):
         if not user_id:
             raise forbidden("forbidden", ErrorCode.FORBIDDEN, {"error": "로그인이 필요한 기능입니다."})
     
-    liked = False
-    if user_id:
-        like_exists = db.query(PostLike).filter(
-            PostLike.post_id == post_id, 
-            PostLike.user_id == user_id
-        ).first()
-        if like_exists:
-            liked = True
+    liked = await _is_liked_by(post_id, user_id, db)
     
-    # 조회수 증가
-    post.view_count += 1
-    db.commit()
+    # 조회수 증가 (메모리 버퍼에 기록 후 일괄 반영 - 인기 게시글 행 잠금 경합 방지)
+    pending_views = post_counter_service.record_view(post.id)
     
     comments_data = []
     for comment in post.comments:
@@ -300,8 +325,6 @@ def get_post_controller(post_id: int, user_id: int = None, db: Session = None):
             "content": comment.content
         })
     
-    like_count = db.query(func.count(PostLike.id)).filter(PostLike.post_id == post_id).scalar()
-    
     return {
         "post_id": post.id,
         "user_id": post.user_id,
@@ -314,23 +337,21 @@ def get_post_controller(post_id: int, user_id: int = None, db: Session = None):
         "tags": [t.name for t in post.tags],
         "summary": post.summary,
         "sentiment_label": post.sentiment_label,
-        "like_count": like_count,
-        "view_count": post.view_count,
+        "like_count": post.like_count or 0,
+        "view_count": (post.view_count or 0) + pending_views,
         "liked": liked,
         "comments": comments_data
     }
 
 
-def update_post_controller(post_id: int, req: PostUpdateReq, user_id: int, db: Session):
+async def update_post_controller(post_id: int, req: PostUpdateReq, user_id: int, db: AsyncSession):
     """게시글 수정 컨트롤러"""
     if not req or all(
         field is None for field in (req.title, req.content, req.image_url, req.category)
     ):
         raise bad_request("invalid_request", ErrorCode.INVALID_REQUEST)
 
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+    post = await _get_post_or_404(post_id, db)
     
     if post.user_id != user_id:
         raise forbidden("forbidden", ErrorCode.FORBIDDEN)
@@ -353,51 +374,72 @@ def update_post_controller(post_id: int, req: PostUpdateReq, user_id: int, db: S
         elif req.category == "":  # 빈 문자열이면 NULL로 설정
             post.category = None
     
-    db.commit()
-    db.refresh(post)
+    # 제목/내용이 바뀌면 벡터도 교체
+    text_changed = req.title is not None or req.content is not None
+    if text_changed and ai_job_queue.AI_JOBS_ENABLED:
+        await db.flush()
+        await ai_job_queue.enqueue_post_job(db, post, ("vectorize",), requeue_completed=True)
+    
+    await db.commit()
+    
+    if text_changed:
+        keyword_index.index_post(post)
+    if text_changed and not ai_job_queue.AI_JOBS_ENABLED:
+        await db.refresh(post, attribute_names=["created_at", "updated_at", "tags"])
+        try:
+            await asyncio.to_thread(post_vector_service.vectorize_post, post)
+        except Exception as e:
+            print(f"⚠️ 게시글 재벡터화 실패 (post_id={post_id}): {e}")
     
     return {"post_id": post_id}
 
 
-def delete_post_controller(post_id: int, user_id: int, db: Session):
+async def delete_post_controller(post_id: int, user_id: int, db: AsyncSession):
     """게시글 삭제 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+    # ORM cascade 대상(댓글, 좋아요)을 함께 로드 (AsyncSession은 lazy load 불가)
+    post = await _get_post_or_404(post_id, db, selectinload(Post.comments), selectinload(Post.likes))
     
     if post.user_id != user_id:
         raise forbidden("forbidden", ErrorCode.FORBIDDEN)
     
     # CASCADE로 인해 관련 댓글과 좋아요는 자동 삭제됨
-    db.delete(post)
-    db.commit()
+    await db.delete(post)
+    await db.commit()
+    keyword_index.remove_post(post_id)
+    
+    # 벡터 삭제 실패 시 남은 청크는 reconcile_post_vectors.py가 정리
+    try:
+        post_vector_service.delete_post_vectors(post_id)
+    except Exception as e:
+        print(f"⚠️ 게시글 벡터 삭제 실패 (post_id={post_id}): {e}")
     
     return {"post_id": post_id}
 
 
-def toggle_like_controller(post_id: int, user_id: int, db: Session):
+async def toggle_like_controller(post_id: int, user_id: int, db: AsyncSession):
     """좋아요 토글 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+    await _get_post_or_404(post_id, db)
     
-    existing_like = db.query(PostLike).filter(
-        PostLike.post_id == post_id,
-        PostLike.user_id == user_id
-    ).first()
+    existing_like = (await db.execute(
+        select(PostLike).where(
+            PostLike.post_id == post_id,
+            PostLike.user_id == user_id
+        )
+    )).scalar_one_or_none()
     
     if existing_like:
-        db.delete(existing_like)
+        await db.delete(existing_like)
+        await post_counter_service.adjust_like_count(db, post_id, -1)
         liked = False
     else:
         new_like = PostLike(post_id=post_id, user_id=user_id)
         db.add(new_like)
+        await post_counter_service.adjust_like_count(db, post_id, 1)
         liked = True
     
-    db.commit()
+    await db.commit()
     
-    # 좋아요 개수 계산
-    like_count = db.query(func.count(PostLike.id)).filter(PostLike.post_id == post_id).scalar()
+    like_count = await db.scalar(select(Post.like_count).where(Post.id == post_id))
     
     return {
         "post_id": post_id,
@@ -406,19 +448,15 @@ def toggle_like_controller(post_id: int, user_id: int, db: Session):
     }
 
 
-def increment_view_controller(post_id: int, db: Session):
+async def increment_view_controller(post_id: int, db: AsyncSession):
     """조회수 증가 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+    post = await _get_post_or_404(post_id, db)
     
-    post.view_count += 1
-    db.commit()
-    db.refresh(post)
+    pending_views = post_counter_service.record_view(post_id)
     
     return {
         "post_id": post_id,
-        "view_count": post.view_count
+        "view_count": (post.view_count or 0) + pending_views
     }
 
 
@@ -477,7 +515,7 @@ async def upload_document_with_ocr_controller(
     filename: str,
     document_title: str,
     user_id: int,
-    db: Session
+    db: AsyncSession
 ):
     """문서 업로드 + OCR 처리 컨트롤러 (문서 보관함)"""
     if not file_data:
@@ -490,11 +528,11 @@ async def upload_document_with_ocr_controller(
             {"max_size": "10MB"}
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise unauthorized("unauthorized_user", ErrorCode.UNAUTHORIZED)
     
-    couple_id = get_user_couple_id(user_id, db)
+    couple_id = await get_user_couple_id_async(user_id, db)
     if not couple_id:
         raise forbidden("couple_required", ErrorCode.FORBIDDEN)
     
@@ -529,18 +567,11 @@ async def upload_document_with_ocr_controller(
     content_with_source = f"[원본 파일] {file_url}\n\n{content}" if file_url else content
     
     summary = None
-    try:
-        summary_res = await summarize_text(content)
-        summary = summary_res.get("summary") if summary_res else None
-    except Exception as exc:
-        print(f"⚠️ 문서 요약 실패: {exc}")
-    
     tags_list = []
-    try:
-        tags_list = await auto_tag_text(content)
-    except Exception as exc:
-        print(f"⚠️ 문서 자동 태그 생성 실패: {exc}")
-        tags_list = []
+    if not ai_job_queue.AI_JOBS_ENABLED:
+        enrichment = await enrich_text(content, tasks=("summary", "tags"))
+        summary = enrichment["summary"]
+        tags_list = enrichment["tags"]
     
     db_tags = []
     if tags_list:
@@ -548,12 +579,7 @@ async def upload_document_with_ocr_controller(
             cleaned = (tag_name or "").strip()
             if not cleaned:
                 continue
-            tag = db.query(Tag).filter(Tag.name == cleaned).first()
-            if not tag:
-                tag = Tag(name=cleaned)
-                db.add(tag)
-                db.flush()
-            db_tags.append(tag)
+            db_tags.append(await _get_or_create_tag(cleaned, db))
     
     post = Post(
         user_id=user_id,
@@ -571,15 +597,23 @@ async def upload_document_with_ocr_controller(
     )
     
     db.add(post)
-    db.commit()
-    db.refresh(post)
     
-    try:
-        post_vector_service.vectorize_post(post)
-    except Exception as exc:
-        print(f"⚠️ 문서 벡터화 실패 (post_id={post.id}): {exc}")
+    ai_job = None
+    if ai_job_queue.AI_JOBS_ENABLED:
+        await db.flush()
+        ai_job = await ai_job_queue.enqueue_post_job(db, post, ai_job_queue.DOCUMENT_UPLOAD_TASKS)
+        await db.commit()
+    else:
+        await db.commit()
+        await db.refresh(post, attribute_names=["created_at", "updated_at", "tags"])
+        
+        try:
+            await asyncio.to_thread(post_vector_service.vectorize_post, post)
+        except Exception as exc:
+            print(f"⚠️ 문서 벡터화 실패 (post_id={post.id}): {exc}")
+    keyword_index.index_post(post)
     
-    return {
+    result = {
         "post_id": post.id,
         "title": post.title,
         "ocr_text": content,
@@ -588,3 +622,6 @@ async def upload_document_with_ocr_controller(
         "ocr_error": None,
         "tags": [tag.name for tag in db_tags]
     }
+    if ai_job:
+        result["ai_job_id"] = ai_job.id  # 요약/태그는 워커 처리 후 게시글에 반영
+    return result
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from app.core.validators import validate_nickname
 from app.core.exceptions import bad_request, conflict, unauthorized, payload_too_large
 from app.core.error_codes import ErrorCode
+from app.core.identity import get_identity, invalidate_identity
 from app.models.db import User, Post, Comment, PostLike
 from app.schemas import NicknamePatchReq, PasswordUpdateReq
 
@@ -69,9 +70,11 @@ def delete_user_controller(user_id: int, db: Session):
     
     # CASCADE로 인해 관련 데이터 자동 삭제됨
     # (posts, comments, post_likes는 외래키 CASCADE 설정됨)
+    identity = get_identity(user_id, db)
     
     db.delete(user)
     db.commit()
+    invalidate_identity(user_id, *(identity.couple_user_ids if identity else ()))
     
     return None
 
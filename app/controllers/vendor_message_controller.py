@@ -1,7 +1,8 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
+from sqlalchemy import and_, or_, not_, desc, func, select, update
 from datetime import datetime, date, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
 from decimal import Decimal
 
 from app.models.db.vendor_message import (
@@ -18,24 +19,26 @@ from app.schemas import (
     VendorPaymentScheduleCreateReq, VendorPaymentScheduleUpdateReq,
     VendorCompareReq
 )
-from app.core.couple_helpers import get_user_couple_id, get_couple_user_ids
+from app.core.couple_helpers import get_couple_user_ids_async
+from app.core.identity import get_identity_async
+from app.core.pagination import keyset_filter, keyset_order, split_page
 
 
-def create_thread(user_id: int, request: VendorThreadCreateReq, db: Session) -> Dict:
+async def create_thread(user_id: int, request: VendorThreadCreateReq, db: AsyncSession) -> Dict:
     """제휴 업체 메시지 쓰레드 생성"""
     # 제휴 업체 존재 확인
-    vendor = db.query(Vendor).filter(Vendor.id == request.vendor_id).first()
+    vendor = (await db.execute(select(Vendor).where(Vendor.id == request.vendor_id))).scalars().first()
     if not vendor:
         return {"message": "error", "data": {"error": "제휴 업체를 찾을 수 없습니다."}}
     
     # 이미 쓰레드가 있는지 확인
-    existing_thread = db.query(VendorThread).filter(
+    existing_thread = (await db.execute(select(VendorThread).where(
         and_(
             VendorThread.user_id == user_id,
             VendorThread.vendor_id == request.vendor_id,
             VendorThread.is_active == True
         )
-    ).first()
+    ))).scalars().first()
     
     if existing_thread:
         return {
@@ -50,8 +53,9 @@ def create_thread(user_id: int, request: VendorThreadCreateReq, db: Session) ->
     # 제목이 없으면 제휴 업체 이름으로 자동 생성
     title = request.title or f"{vendor.name}와의 대화"
     
-    # 커플 ID 가져오기
-    couple_id = get_user_couple_id(user_id, db)
+    # 커플 정보 가져오기
+    identity = await get_identity_async(user_id, db)
+    couple_id = identity.couple_id if identity else None
     
     # thread_type 확인 (문자열로 처리)
     thread_type_str = getattr(request, 'thread_type', None) or 'one_on_one'
@@ -68,7 +72,7 @@ def create_thread(user_id: int, request: VendorThreadCreateReq, db: Session) ->
             return {"message": "error", "data": {"error": "단체톡방은 커플이 연결되어 있어야 합니다."}}
         
         # 커플의 두 사용자 ID 가져오기
-        couple_user_ids = get_couple_user_ids(couple_id, db)
+        couple_user_ids = list(identity.couple_user_ids)
         if len(couple_user_ids) < 2:
             return {"message": "error", "data": {"error": "커플이 완전히 연결되지 않았습니다."}}
         
@@ -92,8 +96,8 @@ def create_thread(user_id: int, request: VendorThreadCreateReq, db: Session) ->
     
     try:
         db.add(thread)
-        db.commit()
-        db.refresh(thread)
+        await db.commit()
+        await db.refresh(thread)
         
         return {
             "message": "thread_created",
@@ -106,40 +110,41 @@ def create_thread(user_id: int, request: VendorThreadCreateReq, db: Session) ->
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"쓰레드 생성 실패: {e}")
         import traceback
         traceback.print_exc()
         return {"message": "error", "data": {"error": "쓰레드 생성에 실패했습니다."}}
 
 
-def get_threads(user_id: int, db: Session, is_vendor: bool = False) -> Dict:
+async def get_threads(user_id: int, db: AsyncSession, is_vendor: bool = False) -> Dict:
     """사용자 또는 제휴 업체의 쓰레드 목록 조회"""
     from app.models.db.user import User
     
     if is_vendor:
         # 제휴 업체 계정인 경우: 자신의 vendor_id와 연결된 쓰레드 조회
-        vendor = db.query(Vendor).filter(Vendor.user_id == user_id).first()
+        vendor = (await db.execute(select(Vendor).where(Vendor.user_id == user_id))).scalars().first()
         if not vendor:
             return {"message": "threads_retrieved", "data": {"threads": []}}
         
-        threads = db.query(VendorThread).filter(
+        threads = (await db.execute(select(VendorThread).where(
             and_(
                 VendorThread.vendor_id == vendor.id,
                 VendorThread.is_active == True
             )
-        ).order_by(desc(VendorThread.last_message_at), desc(VendorThread.created_at)).all()
+        ).order_by(desc(VendorThread.last_message_at), desc(VendorThread.created_at)))).scalars().all()
     else:
         # 일반 사용자 계정인 경우: 자신의 user_id와 연결된 쓰레드 조회 (커플 공유 포함)
         # 커플이 연결되어 있고 is_shared_with_partner가 True인 쓰레드도 포함
-        couple_id = get_user_couple_id(user_id, db)
+        identity = await get_identity_async(user_id, db)
+        couple_id = identity.couple_id if identity else None
         
         if couple_id:
             # 커플이 연결되어 있으면 couple_id로 필터링 (공유된 쓰레드 및 단체톡방 포함)
-            couple_user_ids = get_couple_user_ids(couple_id, db)
+            couple_user_ids = list(identity.couple_user_ids)
             
             # 모든 가능한 쓰레드 조회 (is_active == True인 것만)
-            all_threads = db.query(VendorThread).filter(
+            all_threads = (await db.execute(select(VendorThread).where(
                 and_(
                     or_(
                         VendorThread.user_id == user_id,  # 자신의 쓰레드
@@ -147,7 +152,7 @@ def get_threads(user_id: int, db: Session, is_vendor: bool = False) -> Dict:
                     ),
                     VendorThread.is_active == True
                 )
-            ).order_by(desc(VendorThread.last_message_at), desc(VendorThread.created_at)).all()
+            ).order_by(desc(VendorThread.last_message_at), desc(VendorThread.created_at)))).scalars().all()
             
             # 필터링: 접근 가능한 쓰레드만
             filtered_threads = []
@@ -167,39 +172,39 @@ def get_threads(user_id: int, db: Session, is_vendor: bool = False) -> Dict:
             threads = filtered_threads
         else:
             # 커플이 연결되어 있지 않으면 자신의 쓰레드만 (is_active == True인 것만)
-            threads = db.query(VendorThread).filter(
+            threads = (await db.execute(select(VendorThread).where(
                 and_(
                     VendorThread.user_id == user_id,
                     VendorThread.is_active == True
                 )
-            ).order_by(desc(VendorThread.last_message_at), desc(VendorThread.created_at)).all()
+            ).order_by(desc(VendorThread.last_message_at), desc(VendorThread.created_at)))).scalars().all()
     
     result = []
     for thread in threads:
-        vendor = db.query(Vendor).filter(Vendor.id == thread.vendor_id).first()
+        vendor = (await db.execute(select(Vendor).where(Vendor.id == thread.vendor_id))).scalars().first()
         # 읽지 않은 메시지 수 계산
         if is_vendor:
             # 제휴 업체 계정: 사용자가 보낸 메시지 중 읽지 않은 것
-            unread_count = db.query(VendorMessage).filter(
+            unread_count = await db.scalar(select(func.count()).select_from(VendorMessage).where(
                 and_(
                     VendorMessage.thread_id == thread.id,
                     VendorMessage.sender_type == MessageSenderType.USER,
                     VendorMessage.is_read == False
                 )
-            ).count()
+            ))
         else:
             # 일반 사용자 계정: 제휴 업체가 보낸 메시지 중 읽지 않은 것
-            unread_count = db.query(VendorMessage).filter(
+            unread_count = await db.scalar(select(func.count()).select_from(VendorMessage).where(
                 and_(
                     VendorMessage.thread_id == thread.id,
                     VendorMessage.sender_type == MessageSenderType.VENDOR,
                     VendorMessage.is_read == False
                 )
-            ).count()
+            ))
         
-        last_message = db.query(VendorMessage).filter(
+        last_message = (await db.execute(select(VendorMessage).where(
             VendorMessage.thread_id == thread.id
-        ).order_by(desc(VendorMessage.created_at)).first()
+        ).order_by(desc(VendorMessage.created_at)))).scalars().first()
         
         result.append({
             "id": thread.id,
@@ -226,14 +231,19 @@ def get_threads(user_id: int, db: Session, is_vendor: bool = False) -> Dict:
     }
 
 
-def get_thread(thread_id: int, user_id: int, db: Session, is_vendor: bool = False) -> Dict:
-    """제휴 업체 쓰레드 상세 조회 (메시지 포함) - 사용자 또는 제휴 업체"""
+async def get_thread(thread_id: int, user_id: int, db: AsyncSession, is_vendor: bool = False, limit: int = 100, cursor: Optional[str] = None) -> Dict:
+    """
+    제휴 업체 쓰레드 상세 조회 (메시지 포함) - 사용자 또는 제휴 업체
+
+    메시지는 최신 limit개를 시간순으로 반환하고, 더 오래된 메시지는
+    next_cursor로 이어서 조회합니다 ((created_at, id) 커서 페이지네이션).
+    """
     from app.models.db.user import User
     
     # 쓰레드 조회
-    thread = db.query(VendorThread).filter(
+    thread = (await db.execute(select(VendorThread).where(
         VendorThread.id == thread_id
-    ).first()
+    ))).scalars().first()
     
     if not thread:
         return {"message": "error", "data": {"error": "쓰레드를 찾을 수 없습니다."}}
@@ -241,7 +251,7 @@ def get_thread(thread_id: int, user_id: int, db: Session, is_vendor: bool = Fals
     # 권한 확인
     if is_vendor:
         # 제휴 업체 계정인 경우: 자신의 vendor_id와 쓰레드의 vendor_id가 일치해야 함
-        vendor = db.query(Vendor).filter(Vendor.user_id == user_id).first()
+        vendor = (await db.execute(select(Vendor).where(Vendor.user_id == user_id))).scalars().first()
         if not vendor or vendor.id != thread.vendor_id:
             return {"message": "error", "data": {"error": "이 쓰레드에 접근할 권한이 없습니다."}}
     else:
@@ -257,57 +267,77 @@ def get_thread(thread_id: int, user_id: int, db: Session, is_vendor: bool = Fals
                 has_access = True
         # 3. 1대1 채팅이고 커플 공유가 활성화된 경우: 파트너인지 확인
         elif thread.thread_type == 'one_on_one' and thread.is_shared_with_partner and thread.couple_id:
-            couple_user_ids = get_couple_user_ids(thread.couple_id, db)
+            couple_user_ids = await get_couple_user_ids_async(thread.couple_id, db)
             if user_id in couple_user_ids:
                 has_access = True
         
         if not has_access:
             return {"message": "error", "data": {"error": "이 쓰레드에 접근할 권한이 없습니다."}}
     
-    vendor = db.query(Vendor).filter(Vendor.id == thread.vendor_id).first()
+    vendor = (await db.execute(select(Vendor).where(Vendor.id == thread.vendor_id))).scalars().first()
     
-    # 메시지 목록 조회
-    messages = db.query(VendorMessage).filter(
+    # 메시지 목록 조회 (최신 메시지부터 limit개)
+    message_query = select(VendorMessage).where(
         VendorMessage.thread_id == thread_id
-    ).order_by(VendorMessage.created_at).all()
+    )
+    # 1대1 채팅이고 파트너인 경우: 쓰레드 생성자가 보낸 비공개 메시지는 숨김
+    if (
+        thread.thread_type == 'one_on_one'
+        and thread.is_shared_with_partner
+        and thread.user_id != user_id
+    ):
+        message_query = message_query.where(
+            not_(and_(
+                VendorMessage.sender_type == MessageSenderType.USER,
+                VendorMessage.sender_id == thread.user_id,
+                VendorMessage.is_visible_to_partner == False
+            ))
+        )
+    if cursor:
+        message_query = message_query.where(keyset_filter(VendorMessage.created_at, VendorMessage.id, cursor))
+    rows = (await db.execute(
+        message_query.order_by(*keyset_order(VendorMessage.created_at, VendorMessage.id)).limit(limit + 1)
+    )).scalars().all()
+    messages, next_cursor = split_page(rows, limit)
+    messages.reverse()  # 화면 표시는 시간순
     
     # 읽지 않은 메시지를 읽음으로 표시
     if is_vendor:
         # 제휴 업체 계정: 사용자가 보낸 메시지를 읽음으로 표시
-        db.query(VendorMessage).filter(
+        await db.execute(update(VendorMessage).where(
             and_(
                 VendorMessage.thread_id == thread_id,
                 VendorMessage.sender_type == MessageSenderType.USER,
                 VendorMessage.is_read == False
             )
-        ).update({"is_read": True})
+        ).values({"is_read": True}))
     else:
         # 일반 사용자 계정: 제휴 업체가 보낸 메시지를 읽음으로 표시
-        db.query(VendorMessage).filter(
+        await db.execute(update(VendorMessage).where(
             and_(
                 VendorMessage.thread_id == thread_id,
                 VendorMessage.sender_type == MessageSenderType.VENDOR,
                 VendorMessage.is_read == False
             )
-        ).update({"is_read": True})
-    db.commit()
+        ).values({"is_read": True}))
+    await db.commit()
     
     # 계약 정보 조회
-    contract = db.query(VendorContract).filter(
+    contract = (await db.execute(select(VendorContract).where(
         VendorContract.thread_id == thread_id
-    ).first()
+    ))).scalars().first()
     
     contract_data = None
     if contract:
         # 결제 일정 조회
-        payment_schedules = db.query(VendorPaymentSchedule).filter(
+        payment_schedules = (await db.execute(select(VendorPaymentSchedule).where(
             VendorPaymentSchedule.contract_id == contract.id
-        ).order_by(VendorPaymentSchedule.due_date).all()
+        ).order_by(VendorPaymentSchedule.due_date))).scalars().all()
         
         # 문서 조회
-        documents = db.query(VendorDocument).filter(
+        documents = (await db.execute(select(VendorDocument).where(
             VendorDocument.contract_id == contract.id
-        ).order_by(desc(VendorDocument.version)).all()
+        ).order_by(desc(VendorDocument.version)))).scalars().all()
         
         contract_data = {
             "id": contract.id,
@@ -379,31 +409,23 @@ def get_thread(thread_id: int, user_id: int, db: Session, is_vendor: bool = Fals
                     "created_at": msg.created_at.isoformat() if msg.created_at else None
                 }
                 for msg in messages
-                # 1대1 채팅이고 파트너인 경우: is_visible_to_partner가 True인 메시지만 표시
-                # (쓰레드 생성자가 보낸 메시지 중 비공개 메시지는 파트너에게 숨김)
-                if not (
-                    thread.thread_type == 'one_on_one' 
-                    and thread.is_shared_with_partner 
-                    and thread.user_id != user_id  # 파트너인 경우
-                    and msg.sender_type == MessageSenderType.USER  # 사용자가 보낸 메시지
-                    and msg.sender_id == thread.user_id  # 쓰레드 생성자가 보낸 메시지
-                    and not msg.is_visible_to_partner  # 비공개 메시지
-                )
             ],
+            "next_cursor": next_cursor,  # 더 오래된 메시지 조회용
+            "has_more": next_cursor is not None,
             "contract": contract_data,
             "created_at": thread.created_at.isoformat() if thread.created_at else None
         }
     }
 
 
-def update_thread(thread_id: int, user_id: int, request: VendorThreadUpdateReq, db: Session) -> Dict:
+async def update_thread(thread_id: int, user_id: int, request: VendorThreadUpdateReq, db: AsyncSession) -> Dict:
     """제휴 업체 쓰레드 수정"""
-    thread = db.query(VendorThread).filter(
+    thread = (await db.execute(select(VendorThread).where(
         and_(
             VendorThread.id == thread_id,
             VendorThread.user_id == user_id
         )
-    ).first()
+    ))).scalars().first()
     
     if not thread:
         return {"message": "error", "data": {"error": "쓰레드를 찾을 수 없습니다."}}
@@ -416,8 +438,8 @@ def update_thread(thread_id: int, user_id: int, request: VendorThreadUpdateReq,
         thread.is_shared_with_partner = request.is_shared_with_partner
     
     try:
-        db.commit()
-        db.refresh(thread)
+        await db.commit()
+        await db.refresh(thread)
         
         return {
             "message": "thread_updated",
@@ -428,19 +450,19 @@ def update_thread(thread_id: int, user_id: int, request: VendorThreadUpdateReq,
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"쓰레드 수정 실패: {e}")
         return {"message": "error", "data": {"error": "쓰레드 수정에 실패했습니다."}}
 
 
-def delete_thread(thread_id: int, user_id: int, db: Session) -> Dict:
+async def delete_thread(thread_id: int, user_id: int, db: AsyncSession) -> Dict:
     """제휴 업체 쓰레드 삭제 (소프트 삭제: is_active = False)"""
-    thread = db.query(VendorThread).filter(
+    thread = (await db.execute(select(VendorThread).where(
         and_(
             VendorThread.id == thread_id,
             VendorThread.user_id == user_id
         )
-    ).first()
+    ))).scalars().first()
     
     if not thread:
         return {"message": "error", "data": {"error": "쓰레드를 찾을 수 없습니다."}}
@@ -448,7 +470,7 @@ def delete_thread(thread_id: int, user_id: int, db: Session) -> Dict:
     try:
         # 소프트 삭제: is_active를 False로 설정
         thread.is_active = False
-        db.commit()
+        await db.commit()
         
         return {
             "message": "thread_deleted",
@@ -458,18 +480,18 @@ def delete_thread(thread_id: int, user_id: int, db: Session) -> Dict:
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"쓰레드 삭제 실패: {e}")
         return {"message": "error", "data": {"error": "쓰레드 삭제에 실패했습니다."}}
 
 
-def invite_participant(thread_id: int, user_id: int, request: VendorThreadInviteReq, db: Session) -> Dict:
+async def invite_participant(thread_id: int, user_id: int, request: VendorThreadInviteReq, db: AsyncSession) -> Dict:
     """쓰레드에 참여자 초대 (1대1 → 단체톡방 전환 또는 단체톡방에 참여자 추가)"""
     from app.models.db.user import User
     
-    thread = db.query(VendorThread).filter(
+    thread = (await db.execute(select(VendorThread).where(
         VendorThread.id == thread_id
-    ).first()
+    ))).scalars().first()
     
     if not thread:
         return {"message": "error", "data": {"error": "쓰레드를 찾을 수 없습니다."}}
@@ -479,12 +501,11 @@ def invite_participant(thread_id: int, user_id: int, request: VendorThreadInvite
         return {"message": "error", "data": {"error": "쓰레드 생성자만 참여자를 초대할 수 있습니다."}}
     
     # 커플 파트너 자동 포함
-    couple_id = get_user_couple_id(user_id, db)
+    identity = await get_identity_async(user_id, db)
     participant_ids = set(request.user_ids)
     
-    if couple_id:
-        couple_user_ids = get_couple_user_ids(couple_id, db)
-        participant_ids.update(couple_user_ids)
+    if identity and identity.couple_id:
+        participant_ids.update(identity.couple_user_ids)
     
     # 현재 참여자 목록 가져오기
     current_participants = set(thread.participant_user_ids or [])
@@ -502,11 +523,11 @@ def invite_participant(thread_id: int, user_id: int, request: VendorThreadInvite
         # 참여자 목록 업데이트
         thread.participant_user_ids = new_participants
         
-        db.commit()
-        db.refresh(thread)
+        await db.commit()
+        await db.refresh(thread)
         
         # 초대된 사용자 정보 조회
-        invited_users = db.query(User).filter(User.id.in_(request.user_ids)).all()
+        invited_users = (await db.execute(select(User).where(User.id.in_(request.user_ids)))).scalars().all()
         
         return {
             "message": "participants_invited",
@@ -525,21 +546,21 @@ def invite_participant(thread_id: int, user_id: int, request: VendorThreadInvite
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"참여자 초대 실패: {e}")
         import traceback
         traceback.print_exc()
         return {"message": "error", "data": {"error": "참여자 초대에 실패했습니다."}}
 
 
-def send_message(user_id: int, request: VendorMessageCreateReq, db: Session, is_vendor: bool = False) -> Dict:
+async def send_message(user_id: int, request: VendorMessageCreateReq, db: AsyncSession, is_vendor: bool = False) -> Dict:
     """메시지 전송 (사용자 또는 제휴 업체)"""
     from app.models.db.user import User
     
     # 쓰레드 조회
-    thread = db.query(VendorThread).filter(
+    thread = (await db.execute(select(VendorThread).where(
         VendorThread.id == request.thread_id
-    ).first()
+    ))).scalars().first()
     
     if not thread:
         return {"message": "error", "data": {"error": "쓰레드를 찾을 수 없습니다."}}
@@ -547,11 +568,11 @@ def send_message(user_id: int, request: VendorMessageCreateReq, db: Session, is_
     # 권한 확인
     if is_vendor:
         # 제휴 업체 계정인 경우: 자신의 vendor_id와 쓰레드의 vendor_id가 일치해야 함
-        user = db.query(User).filter(User.id == user_id).first()
+        user = (await db.execute(select(User).where(User.id == user_id))).scalars().first()
         if not user:
             return {"message": "error", "data": {"error": "사용자를 찾을 수 없습니다."}}
         
-        vendor = db.query(Vendor).filter(Vendor.user_id == user_id).first()
+        vendor = (await db.execute(select(Vendor).where(Vendor.user_id == user_id))).scalars().first()
         if not vendor or vendor.id != thread.vendor_id:
             return {"message": "error", "data": {"error": "이 쓰레드에 메시지를 보낼 권한이 없습니다."}}
         
@@ -570,7 +591,7 @@ def send_message(user_id: int, request: VendorMessageCreateReq, db: Session, is_
                 has_permission = True
         # 3. 1대1 채팅이고 커플 공유가 활성화된 경우: 파트너인지 확인
         elif thread.thread_type == 'one_on_one' and thread.is_shared_with_partner and thread.couple_id:
-            couple_user_ids = get_couple_user_ids(thread.couple_id, db)
+            couple_user_ids = await get_couple_user_ids_async(thread.couple_id, db)
             if user_id in couple_user_ids:
                 has_permission = True
         
@@ -599,8 +620,8 @@ def send_message(user_id: int, request: VendorMessageCreateReq, db: Session, is_
         db.add(message)
         # 쓰레드의 last_message_at 업데이트
         thread.last_message_at = datetime.now()
-        db.commit()
-        db.refresh(message)
+        await db.commit()
+        await db.refresh(message)
         
         return {
             "message": "message_sent",
@@ -613,29 +634,29 @@ def send_message(user_id: int, request: VendorMessageCreateReq, db: Session, is_
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"메시지 전송 실패: {e}")
         import traceback
         traceback.print_exc()
         return {"message": "error", "data": {"error": "메시지 전송에 실패했습니다."}}
 
 
-def create_contract(user_id: int, request: VendorContractCreateReq, db: Session) -> Dict:
+async def create_contract(user_id: int, request: VendorContractCreateReq, db: AsyncSession) -> Dict:
     """계약 정보 생성"""
-    thread = db.query(VendorThread).filter(
+    thread = (await db.execute(select(VendorThread).where(
         and_(
             VendorThread.id == request.thread_id,
             VendorThread.user_id == user_id
         )
-    ).first()
+    ))).scalars().first()
     
     if not thread:
         return {"message": "error", "data": {"error": "쓰레드를 찾을 수 없습니다."}}
     
     # 이미 계약이 있는지 확인
-    existing_contract = db.query(VendorContract).filter(
+    existing_contract = (await db.execute(select(VendorContract).where(
         VendorContract.thread_id == request.thread_id
-    ).first()
+    ))).scalars().first()
     
     if existing_contract:
         return {"message": "error", "data": {"error": "이미 계약 정보가 존재합니다."}}
@@ -664,8 +685,8 @@ def create_contract(user_id: int, request: VendorContractCreateReq, db: Session)
     
     try:
         db.add(contract)
-        db.commit()
-        db.refresh(contract)
+        await db.commit()
+        await db.refresh(contract)
         
         return {
             "message": "contract_created",
@@ -677,21 +698,21 @@ def create_contract(user_id: int, request: VendorContractCreateReq, db: Session)
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"계약 생성 실패: {e}")
         import traceback
         traceback.print_exc()
         return {"message": "error", "data": {"error": "계약 생성에 실패했습니다."}}
 
 
-def update_contract(contract_id: int, user_id: int, request: VendorContractUpdateReq, db: Session) -> Dict:
+async def update_contract(contract_id: int, user_id: int, request: VendorContractUpdateReq, db: AsyncSession) -> Dict:
     """계약 정보 수정"""
-    contract = db.query(VendorContract).filter(
+    contract = (await db.execute(select(VendorContract).where(
         and_(
             VendorContract.id == contract_id,
             VendorContract.user_id == user_id
         )
-    ).first()
+    ))).scalars().first()
     
     if not contract:
         return {"message": "error", "data": {"error": "계약을 찾을 수 없습니다."}}
@@ -714,8 +735,8 @@ def update_contract(contract_id: int, user_id: int, request: VendorContractUpdat
         contract.is_active = request.is_active
     
     try:
-        db.commit()
-        db.refresh(contract)
+        await db.commit()
+        await db.refresh(contract)
         
         return {
             "message": "contract_updated",
@@ -725,30 +746,30 @@ def update_contract(contract_id: int, user_id: int, request: VendorContractUpdat
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"계약 수정 실패: {e}")
         return {"message": "error", "data": {"error": "계약 수정에 실패했습니다."}}
 
 
-def create_document(user_id: int, request: VendorDocumentCreateReq, db: Session) -> Dict:
+async def create_document(user_id: int, request: VendorDocumentCreateReq, db: AsyncSession) -> Dict:
     """문서 업로드"""
-    contract = db.query(VendorContract).filter(
+    contract = (await db.execute(select(VendorContract).where(
         and_(
             VendorContract.id == request.contract_id,
             VendorContract.user_id == user_id
         )
-    ).first()
+    ))).scalars().first()
     
     if not contract:
         return {"message": "error", "data": {"error": "계약을 찾을 수 없습니다."}}
     
     # 같은 타입의 최신 버전 찾기
-    latest_doc = db.query(VendorDocument).filter(
+    latest_doc = (await db.execute(select(VendorDocument).where(
         and_(
             VendorDocument.contract_id == request.contract_id,
             VendorDocument.document_type == DocumentType(request.document_type)
         )
-    ).order_by(desc(VendorDocument.version)).first()
+    ).order_by(desc(VendorDocument.version)))).scalars().first()
     
     new_version = (latest_doc.version + 1) if latest_doc else 1
     
@@ -765,8 +786,8 @@ def create_document(user_id: int, request: VendorDocumentCreateReq, db: Session)
     
     try:
         db.add(document)
-        db.commit()
-        db.refresh(document)
+        await db.commit()
+        await db.refresh(document)
         
         return {
             "message": "document_created",
@@ -779,21 +800,21 @@ def create_document(user_id: int, request: VendorDocumentCreateReq, db: Session)
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"문서 생성 실패: {e}")
         import traceback
         traceback.print_exc()
         return {"message": "error", "data": {"error": "문서 생성에 실패했습니다."}}
 
 
-def update_document(document_id: int, user_id: int, request: VendorDocumentUpdateReq, db: Session) -> Dict:
+async def update_document(document_id: int, user_id: int, request: VendorDocumentUpdateReq, db: AsyncSession) -> Dict:
     """문서 상태 수정 (서명 등)"""
-    document = db.query(VendorDocument).join(VendorContract).filter(
+    document = (await db.execute(select(VendorDocument).join(VendorContract).where(
         and_(
             VendorDocument.id == document_id,
             VendorContract.user_id == user_id
         )
-    ).first()
+    ))).scalars().first()
     
     if not document:
         return {"message": "error", "data": {"error": "문서를 찾을 수 없습니다."}}
@@ -808,8 +829,8 @@ def update_document(document_id: int, user_id: int, request: VendorDocumentUpdat
         document.document_metadata = request.metadata
     
     try:
-        db.commit()
-        db.refresh(document)
+        await db.commit()
+        await db.refresh(document)
         
         return {
             "message": "document_updated",
@@ -820,19 +841,19 @@ def update_document(document_id: int, user_id: int, request: VendorDocumentUpdat
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"문서 수정 실패: {e}")
         return {"message": "error", "data": {"error": "문서 수정에 실패했습니다."}}
 
 
-def create_payment_schedule(user_id: int, request: VendorPaymentScheduleCreateReq, db: Session) -> Dict:
+async def create_payment_schedule(user_id: int, request: VendorPaymentScheduleCreateReq, db: AsyncSession) -> Dict:
     """결제 일정 생성"""
-    contract = db.query(VendorContract).filter(
+    contract = (await db.execute(select(VendorContract).where(
         and_(
             VendorContract.id == request.contract_id,
             VendorContract.user_id == user_id
         )
-    ).first()
+    ))).scalars().first()
     
     if not contract:
         return {"message": "error", "data": {"error": "계약을 찾을 수 없습니다."}}
@@ -851,11 +872,11 @@ def create_payment_schedule(user_id: int, request: VendorPaymentScheduleCreateRe
     
     try:
         db.add(payment_schedule)
-        db.commit()
-        db.refresh(payment_schedule)
+        await db.commit()
+        await db.refresh(payment_schedule)
         
         # 결제 일정을 캘린더에 자동 등록
-        _create_calendar_event_for_payment(user_id, contract, payment_schedule, db)
+        await _create_calendar_event_for_payment(user_id, contract, payment_schedule, db)
         
         return {
             "message": "payment_schedule_created",
@@ -867,17 +888,17 @@ def create_payment_schedule(user_id: int, request: VendorPaymentScheduleCreateRe
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"결제 일정 생성 실패: {e}")
         import traceback
         traceback.print_exc()
         return {"message": "error", "data": {"error": "결제 일정 생성에 실패했습니다."}}
 
 
-def _create_calendar_event_for_payment(user_id: int, contract: VendorContract, payment_schedule: VendorPaymentSchedule, db: Session):
+async def _create_calendar_event_for_payment(user_id: int, contract: VendorContract, payment_schedule: VendorPaymentSchedule, db: AsyncSession):
     """결제 일정을 캘린더에 자동 등록"""
     try:
-        vendor = db.query(Vendor).filter(Vendor.id == contract.vendor_id).first()
+        vendor = (await db.execute(select(Vendor).where(Vendor.id == contract.vendor_id))).scalars().first()
         vendor_name = vendor.name if vendor else "제휴 업체"
         
         payment_type_names = {
@@ -901,20 +922,20 @@ def _create_calendar_event_for_payment(user_id: int, contract: VendorContract, p
         )
         
         db.add(event)
-        db.commit()
+        await db.commit()
     except Exception as e:
         print(f"캘린더 이벤트 생성 실패: {e}")
         # 캘린더 이벤트 생성 실패해도 결제 일정은 저장되도록 함
 
 
-def update_payment_schedule(schedule_id: int, user_id: int, request: VendorPaymentScheduleUpdateReq, db: Session) -> Dict:
+async def update_payment_schedule(schedule_id: int, user_id: int, request: VendorPaymentScheduleUpdateReq, db: AsyncSession) -> Dict:
     """결제 일정 수정"""
-    payment_schedule = db.query(VendorPaymentSchedule).join(VendorContract).filter(
+    payment_schedule = (await db.execute(select(VendorPaymentSchedule).join(VendorContract).where(
         and_(
             VendorPaymentSchedule.id == schedule_id,
             VendorContract.user_id == user_id
         )
-    ).first()
+    ))).scalars().first()
     
     if not payment_schedule:
         return {"message": "error", "data": {"error": "결제 일정을 찾을 수 없습니다."}}
@@ -936,8 +957,8 @@ def update_payment_schedule(schedule_id: int, user_id: int, request: VendorPayme
         payment_schedule.notes = request.notes
     
     try:
-        db.commit()
-        db.refresh(payment_schedule)
+        await db.commit()
+        await db.refresh(payment_schedule)
         
         return {
             "message": "payment_schedule_updated",
@@ -948,29 +969,31 @@ def update_payment_schedule(schedule_id: int, user_id: int, request: VendorPayme
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"결제 일정 수정 실패: {e}")
         return {"message": "error", "data": {"error": "결제 일정 수정에 실패했습니다."}}
 
 
-def get_payment_reminders(user_id: int, days: int = 7, db: Session = None) -> Dict:
+async def get_payment_reminders(user_id: int, days: int = 7, db: AsyncSession = None) -> Dict:
     """결제 리마인더 조회 (N일 이내 결제 예정)"""
     today = date.today()
     reminder_date = today + timedelta(days=days)
     
-    payment_schedules = db.query(VendorPaymentSchedule).join(VendorContract).filter(
+    payment_schedules = (await db.execute(select(VendorPaymentSchedule).join(VendorContract).where(
         and_(
             VendorContract.user_id == user_id,
             VendorPaymentSchedule.status == PaymentStatus.PENDING,
             VendorPaymentSchedule.due_date >= today,
             VendorPaymentSchedule.due_date <= reminder_date
         )
-    ).order_by(VendorPaymentSchedule.due_date).all()
+    ).options(
+        contains_eager(VendorPaymentSchedule.contract)  # AsyncSession은 lazy load 불가
+    ).order_by(VendorPaymentSchedule.due_date))).scalars().all()
     
     result = []
     for ps in payment_schedules:
         contract = ps.contract
-        vendor = db.query(Vendor).filter(Vendor.id == contract.vendor_id).first()
+        vendor = (await db.execute(select(Vendor).where(Vendor.id == contract.vendor_id))).scalars().first()
         
         result.append({
             "id": ps.id,
@@ -993,12 +1016,12 @@ def get_payment_reminders(user_id: int, days: int = 7, db: Session = None) -> Di
     }
 
 
-def compare_vendors(user_id: int, request: VendorCompareReq, db: Session) -> Dict:
+async def compare_vendors(user_id: int, request: VendorCompareReq, db: AsyncSession) -> Dict:
     """제휴 업체 비교"""
     if len(request.vendor_ids) > 5:
         return {"message": "error", "data": {"error": "최대 5개까지 비교할 수 있습니다."}}
     
-    vendors = db.query(Vendor).filter(Vendor.id.in_(request.vendor_ids)).all()
+    vendors = (await db.execute(select(Vendor).where(Vendor.id.in_(request.vendor_ids)))).scalars().all()
     
     if len(vendors) != len(request.vendor_ids):
         return {"message": "error", "data": {"error": "일부 제휴 업체를 찾을 수 없습니다."}}
@@ -1006,20 +1029,20 @@ def compare_vendors(user_id: int, request: VendorCompareReq, db: Session) -> Dic
     result = []
     for vendor in vendors:
         # 각 제휴 업체의 계약 정보 조회
-        contracts = db.query(VendorContract).filter(
+        contracts = (await db.execute(select(VendorContract).where(
             and_(
                 VendorContract.vendor_id == vendor.id,
                 VendorContract.user_id == user_id,
                 VendorContract.is_active == True
             )
-        ).all()
+        ))).scalars().all()
         
         # 결제 일정 조회
         payment_schedules = []
         for contract in contracts:
-            schedules = db.query(VendorPaymentSchedule).filter(
+            schedules = (await db.execute(select(VendorPaymentSchedule).where(
                 VendorPaymentSchedule.contract_id == contract.id
-            ).all()
+            ))).scalars().all()
             payment_schedules.extend(schedules)
         
         result.append({
@@ -3,12 +3,14 @@
 """
 from typing import Dict
 import base64
+from sqlalchemy.orm import Session
 from app.schemas import VoiceProcessReq
 from app.services import voice_service, stt_service
 
 
 async def process_voice(
-    request: VoiceProcessReq
+    request: VoiceProcessReq,
+    db: Session
 ) -> Dict:
     """음성 처리 (STT + 자동 정리)"""
     # 1. STT: 음성 → 텍스트
@@ -37,7 +39,7 @@ async def process_voice(
     # 2. 자동 정리 파이프라인 실행
     if request.auto_organize:
         organized = await voice_service.analyze_intent_and_organize(
-            text, request.user_id
+            text, request.user_id, db
         )
         
         return {
@@ -60,10 +62,11 @@ async def process_voice(
 
 async def generate_response(
     query: str,
-    user_id: int
+    user_id: int,
+    db: Session
 ) -> Dict:
     """음성 질문에 대한 답변 생성"""
-    response_text = await voice_service.generate_voice_response(query, user_id)
+    response_text = await voice_service.generate_voice_response(query, user_id, db)
     
     return {
         "message": "voice_response_generated",
@@ -2,26 +2,21 @@
 커플 공유 헬퍼 함수
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from app.models.db import User, Couple, CoupleStatus
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.db import Couple, CoupleStatus
+from app.core.identity import get_identity, get_identity_async
 
 
 def get_user_couple_id(user_id: int, db: Session) -> int | None:
-    """사용자의 couple_id 조회"""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        return None
-    
-    # 커플이 연결되어 있는지 확인
-    if user.couple_id:
-        couple = db.query(Couple).filter(
-            Couple.id == user.couple_id,
-            Couple.status == CoupleStatus.CONNECTED
-        ).first()
-        if couple:
-            return couple.id
-    
-    return None
+    """사용자의 couple_id 조회 (연결 완료된 커플만, 신원 캐시 사용)"""
+    identity = get_identity(user_id, db)
+    return identity.couple_id if identity else None
+
+
+async def get_user_couple_id_async(user_id: int, db: AsyncSession) -> int | None:
+    """사용자의 couple_id 조회 (AsyncSession용)"""
+    identity = await get_identity_async(user_id, db)
+    return identity.couple_id if identity else None
 
 
 def get_couple_user_ids(couple_id: int, db: Session) -> list[int]:
@@ -37,6 +32,19 @@ def get_couple_user_ids(couple_id: int, db: Session) -> list[int]:
     return user_ids
 
 
+async def get_couple_user_ids_async(couple_id: int, db: AsyncSession) -> list[int]:
+    """get_couple_user_ids의 AsyncSession용"""
+    couple = await db.get(Couple, couple_id)
+    if not couple or couple.status != CoupleStatus.CONNECTED:
+        return []
+    
+    user_ids = [couple.user1_id]
+    if couple.user2_id:
+        user_ids.append(couple.user2_id)
+    
+    return user_ids
+
+
 def get_couple_filter(user_id: int, db: Session, model_class):
     """커플 데이터 조회를 위한 필터 생성 (자신 + 파트너 데이터)"""
     couple_id = get_user_couple_id(user_id, db)
@@ -60,3 +68,12 @@ def get_couple_filter_with_user(user_id: int, db: Session, model_class):
         # 커플이 연결되어 있지 않으면 자신의 데이터만
         return model_class.user_id == user_id
 
+
+async def get_couple_filter_with_user_async(user_id: int, db: AsyncSession, model_class):
+    """get_couple_filter_with_user의 AsyncSession용"""
+    couple_id = await get_user_couple_id_async(user_id, db)
+    
+    if couple_id:
+        return model_class.couple_id == couple_id
+    else:
+        return model_class.user_id == user_id
@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -42,5 +44,77 @@ def get_db():
         db.close()
 
 
+# 비동기 DB 연결 설정 (aiomysql)
+# 동기 드라이버(pymysql)는 쿼리마다 이벤트 루프를 블로킹하므로
+# async 라우터에서는 AsyncSession을 사용해야 요청이 동시에 처리됩니다.
+_ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
 
 
+def _build_async_database_url(sync_url: str) -> str:
+    """동기 DATABASE_URL을 비동기 드라이버 URL로 변환"""
+    url = make_url(sync_url)
+    backend = url.get_backend_name()
+    async_driver = _ASYNC_DRIVERS.get(backend)
+    if not async_driver:
+        raise ValueError(f"비동기 드라이버를 지원하지 않는 데이터베이스입니다: {backend}")
+    return url.set(drivername=async_driver).render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _build_async_database_url(SQLALCHEMY_DATABASE_URL)
+
+# 비동기 엔진은 처음 사용할 때 생성 (드라이버가 없는 환경에서도 동기 엔진만 쓰는 스크립트는 임포트 가능)
+_async_engine = None
+_async_sessionmaker = None
+
+
+def get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        options = {"pool_pre_ping": True, "pool_recycle": 3600}
+        if make_url(ASYNC_DATABASE_URL).get_backend_name() != "sqlite":
+            options.update(
+                pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+                max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "30")),
+            )
+        _async_engine = create_async_engine(ASYNC_DATABASE_URL, **options)
+        if SQL_CAPTURE_FILE:
+            from app.core.query_explain import install_query_capture
+            install_query_capture(_async_engine.sync_engine, SQL_CAPTURE_FILE)
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        _async_sessionmaker = async_sessionmaker(
+            bind=get_async_engine(),
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_sessionmaker
+
+
+def __getattr__(name: str):
+    # 기존 코드의 `from app.core.database import async_engine, AsyncSessionLocal` 호환
+    if name == "async_engine":
+        return get_async_engine()
+    if name == "AsyncSessionLocal":
+        return get_async_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+# 쿼리 캡처 (인덱스 점검용, explain_queries.py 참고)
+SQL_CAPTURE_FILE = os.getenv("SQL_CAPTURE_FILE")
+if SQL_CAPTURE_FILE:
+    from app.core.query_explain import install_query_capture
+    install_query_capture(engine, SQL_CAPTURE_FILE)
@@ -0,0 +1,157 @@
+"""
+사용자 신원(Identity) 컨텍스트 - user / couple_id / 파트너 / 역할 캐시
+
+요청마다 여러 번 반복되던 User → Couple 조회를 한 번의 JOIN 쿼리로 묶고,
+결과를 두 단계로 캐시합니다.
+
+1) 요청 범위 캐시: 같은 요청 안에서는 항상 같은 값을 사용 (main.py 미들웨어에서 범위 설정)
+2) 프로세스 캐시: 짧은 TTL(IDENTITY_CACHE_TTL, 기본 30초)로 요청 간 재사용
+
+커플 연결/해제, 역할 변경 시 invalidate_identity()로 해당 사용자 캐시를 비웁니다.
+다른 워커 프로세스의 캐시는 TTL이 지나면 갱신됩니다.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.security import get_current_user_id
+from app.core.user_roles import UserRole
+from app.models.db import User, Couple, CoupleStatus
+
+IDENTITY_CACHE_TTL = float(os.getenv("IDENTITY_CACHE_TTL", "30"))
+IDENTITY_CACHE_MAX_SIZE = int(os.getenv("IDENTITY_CACHE_MAX_SIZE", "10000"))
+
+
+@dataclass(frozen=True)
+class Identity:
+    user_id: int
+    role: UserRole
+    couple_id: Optional[int] = None  # 연결 완료(CONNECTED)된 커플만
+    partner_id: Optional[int] = None
+    couple_user_ids: tuple = ()      # 커플 두 사용자 (연결 안 됐으면 빈 튜플)
+
+    @property
+    def is_vendor(self) -> bool:
+        return self.role == UserRole.PARTNER_VENDOR
+
+
+_cache: "OrderedDict[int, tuple]" = OrderedDict()  # user_id -> (만료 시각, Identity)
+_cache_lock = threading.Lock()
+_request_scope: ContextVar[Optional[Dict[int, Identity]]] = ContextVar("identity_request_scope", default=None)
+
+
+@contextmanager
+def identity_scope():
+    """요청 범위 캐시 시작 (요청 하나당 한 번)"""
+    token = _request_scope.set({})
+    try:
+        yield
+    finally:
+        _request_scope.reset(token)
+
+
+def _identity_query(user_id: int):
+    return select(
+        User.id, User.role, Couple.id, Couple.status, Couple.user1_id, Couple.user2_id
+    ).outerjoin(Couple, Couple.id == User.couple_id).where(User.id == user_id)
+
+
+def _build_identity(row) -> Identity:
+    user_id, role, couple_id, couple_status, user1_id, user2_id = row
+    role = UserRole(role) if role else UserRole.USER
+    if not couple_id or couple_status != CoupleStatus.CONNECTED:
+        return Identity(user_id=user_id, role=role)
+    couple_user_ids = tuple(uid for uid in (user1_id, user2_id) if uid)
+    partner_id = next((uid for uid in couple_user_ids if uid != user_id), None)
+    return Identity(
+        user_id=user_id,
+        role=role,
+        couple_id=couple_id,
+        partner_id=partner_id,
+        couple_user_ids=couple_user_ids
+    )
+
+
+def _get_cached(user_id: int) -> Optional[Identity]:
+    scope = _request_scope.get()
+    if scope is not None and user_id in scope:
+        return scope[user_id]
+    with _cache_lock:
+        entry = _cache.get(user_id)
+        if entry and entry[0] > time.monotonic():
+            _cache.move_to_end(user_id)
+            identity = entry[1]
+        else:
+            identity = None
+    if identity and scope is not None:
+        scope[user_id] = identity
+    return identity
+
+
+def _store(identity: Identity) -> None:
+    scope = _request_scope.get()
+    if scope is not None:
+        scope[identity.user_id] = identity
+    with _cache_lock:
+        _cache[identity.user_id] = (time.monotonic() + IDENTITY_CACHE_TTL, identity)
+        _cache.move_to_end(identity.user_id)
+        while len(_cache) > IDENTITY_CACHE_MAX_SIZE:
+            _cache.popitem(last=False)
+
+
+def get_identity(user_id: int, db: Session) -> Optional[Identity]:
+    """사용자 신원 조회 (캐시 우선, 없으면 JOIN 쿼리 1회)"""
+    identity = _get_cached(user_id)
+    if identity:
+        return identity
+    row = db.execute(_identity_query(user_id)).first()
+    if not row:
+        return None
+    identity = _build_identity(row)
+    _store(identity)
+    return identity
+
+
+async def get_identity_async(user_id: int, db: AsyncSession) -> Optional[Identity]:
+    """사용자 신원 조회 (AsyncSession용)"""
+    identity = _get_cached(user_id)
+    if identity:
+        return identity
+    row = (await db.execute(_identity_query(user_id))).first()
+    if not row:
+        return None
+    identity = _build_identity(row)
+    _store(identity)
+    return identity
+
+
+def invalidate_identity(*user_ids: int) -> None:
+    """캐시 무효화 (커플 연결/해제, 역할 변경, 탈퇴 시 호출)"""
+    scope = _request_scope.get()
+    with _cache_lock:
+        for user_id in user_ids:
+            _cache.pop(user_id, None)
+            if scope is not None:
+                scope.pop(user_id, None)
+
+
+def get_current_identity(
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+) -> Identity:
+    """JWT에서 추출한 사용자의 신원 (라우터 의존성)"""
+    identity = get_identity(user_id, db)
+    if not identity:
+        return Identity(user_id=user_id, role=UserRole.USER)
+    return identity
@@ -0,0 +1,86 @@
+"""
+커서(keyset) 페이지네이션 헬퍼 - (created_at, id) 기준
+
+OFFSET 방식은 뒤쪽 페이지로 갈수록 건너뛸 행을 모두 읽어야 하지만,
+커서 방식은 마지막으로 본 (created_at, id) 다음부터 인덱스로 바로 찾아가므로
+몇 번째 페이지든 첫 페이지와 비용이 같습니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, or_, select
+
+from app.core.error_codes import ErrorCode
+from app.core.exceptions import bad_request
+
+# 대략적인 전체 개수 계산 시 최대로 세는 행 수
+APPROX_TOTAL_CAP = 1000
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    """(created_at, id)를 URL-safe 커서 문자열로 인코딩"""
+    payload = {"t": created_at.isoformat() if created_at else None, "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """커서 문자열을 (created_at, id)로 디코딩 (형식이 잘못되면 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(payload, dict):
+            raise ValueError("cursor payload is not an object")
+        created_at = datetime.fromisoformat(payload["t"]) if payload.get("t") else None
+        return created_at, int(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise bad_request("invalid_cursor", ErrorCode.INVALID_REQUEST)
+
+
+def keyset_filter(created_col, id_col, cursor: str, descending: bool = True):
+    """
+    커서 이후 행만 남기는 WHERE 조건
+
+    descending=True  : (created_at, id)가 커서보다 작은 행 (최신순 목록의 다음 페이지)
+    descending=False : (created_at, id)가 커서보다 큰 행 (오래된순 목록의 다음 페이지)
+    """
+    created_at, row_id = decode_cursor(cursor)
+    if created_at is None:
+        return id_col < row_id if descending else id_col > row_id
+    if descending:
+        return or_(created_col < created_at, and_(created_col == created_at, id_col < row_id))
+    return or_(created_col > created_at, and_(created_col == created_at, id_col > row_id))
+
+
+def keyset_order(created_col, id_col, descending: bool = True) -> tuple:
+    """커서 조건과 짝이 맞는 ORDER BY (id로 동점 정렬)"""
+    if descending:
+        return created_col.desc(), id_col.desc()
+    return created_col.asc(), id_col.asc()
+
+
+def split_page(rows: Sequence[Any], limit: int) -> Tuple[list, Optional[str]]:
+    """
+    limit + 1개로 조회한 결과를 (현재 페이지, 다음 커서)로 분리
+    다음 페이지가 없으면 커서는 None입니다.
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(last.created_at, last.id)
+
+
+async def approximate_count(db, stmt, cap: int = APPROX_TOTAL_CAP) -> dict:
+    """
+    조건에 맞는 행 수를 최대 cap개까지만 세어 반환 (AsyncSession)
+    전체 COUNT(*)는 게시글이 많을수록 느려지므로 "1000+" 형태의 대략값을 제공합니다.
+
+    Returns:
+        {"total": int, "total_is_approximate": bool}
+    """
+    limited = stmt.with_only_columns(stmt.selected_columns[0]).order_by(None).limit(cap + 1).subquery()
+    count = await db.scalar(select(func.count()).select_from(limited))
+    return {"total": min(count, cap), "total_is_approximate": count > cap}
@@ -0,0 +1,117 @@
+"""
+쿼리 캡처 & EXPLAIN 분석 (MySQL / SQLite)
+
+1) 캡처: SQL_CAPTURE_FILE 환경 변수를 지정하고 서버를 실행하면
+   실행된 SELECT 문과 파라미터가 JSONL 파일에 기록됩니다.
+2) 분석: python explain_queries.py <캡처 파일> 로 같은 DB에서 EXPLAIN을 재실행해
+   인덱스 없이 테이블 전체를 읽는 쿼리(full scan)를 찾아냅니다.
+"""
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Connection, Engine
+
+_capture_lock = threading.Lock()
+
+
+def install_query_capture(engine: Engine, path: str) -> None:
+    """engine에서 실행되는 SELECT 문을 path(JSONL)에 기록"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if executemany or not statement.lstrip().upper().startswith("SELECT"):
+            return
+        line = json.dumps(
+            {"dialect": conn.dialect.name, "sql": statement, "params": parameters},
+            ensure_ascii=False,
+            default=str
+        )
+        with _capture_lock, open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def load_captured_queries(path: str) -> Iterator[Dict[str, Any]]:
+    """캡처 파일에서 중복을 제거한 쿼리를 순서대로 반환"""
+    seen = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record["sql"] in seen:
+                continue
+            seen.add(record["sql"])
+            yield record
+
+
+@dataclass
+class ExplainResult:
+    sql: str
+    plan: List[Dict[str, Any]] = field(default_factory=list)
+    full_scans: List[str] = field(default_factory=list)  # 인덱스 없이 전체를 읽는 테이블
+    warnings: List[str] = field(default_factory=list)     # filesort, 전체 인덱스 스캔 등
+    error: Optional[str] = None
+
+
+def _params_for_driver(params):
+    if params is None:
+        return ()
+    if isinstance(params, list):
+        return tuple(params)
+    return params
+
+
+def _analyze_mysql(conn: Connection, sql: str, params, result: ExplainResult) -> None:
+    rows = conn.exec_driver_sql(f"EXPLAIN {sql}", _params_for_driver(params)).mappings().all()
+    for row in rows:
+        row = dict(row)
+        result.plan.append(row)
+        table = row.get("table") or ""
+        extra = row.get("Extra") or ""
+        if table.startswith("<"):
+            continue  # 파생 테이블/서브쿼리 결과
+        if row.get("type") == "ALL":
+            result.full_scans.append(f"{table} (rows≈{row.get('rows')})")
+        elif row.get("type") == "index":
+            result.warnings.append(f"{table}: 전체 인덱스 스캔 ({row.get('key')})")
+        if "Using filesort" in extra:
+            result.warnings.append(f"{table}: filesort")
+        if "Using temporary" in extra:
+            result.warnings.append(f"{table}: 임시 테이블")
+
+
+def _analyze_sqlite(conn: Connection, sql: str, params, result: ExplainResult) -> None:
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", _params_for_driver(params)).all()
+    table_names = set(inspect(conn).get_table_names())
+    for row in rows:
+        detail = row[-1]
+        result.plan.append({"detail": detail})
+        if detail.startswith("SCAN "):
+            target = detail[len("SCAN "):]
+            if target.split(" ")[0] not in table_names:
+                continue  # 서브쿼리 결과 / 상수 행
+            if " USING " in target:
+                result.warnings.append(f"전체 인덱스 스캔: {target}")
+            else:
+                result.full_scans.append(target)
+        elif "USE TEMP B-TREE" in detail:
+            result.warnings.append(detail.lower())
+
+
+def explain_query(conn: Connection, sql: str, params=None) -> ExplainResult:
+    """쿼리 하나에 대해 EXPLAIN 실행 후 full scan 여부 분석"""
+    result = ExplainResult(sql=sql)
+    try:
+        if conn.dialect.name == "mysql":
+            _analyze_mysql(conn, sql, params, result)
+        elif conn.dialect.name == "sqlite":
+            _analyze_sqlite(conn, sql, params, result)
+        else:
+            result.error = f"지원하지 않는 DB: {conn.dialect.name}"
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
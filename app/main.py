@@ -4,12 +4,33 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
-from app.routers import auth_routes, user_routes, post_routes, comment_routes, chat_routes, calendar_routes, budget_routes, voice_routes, vendor_routes, vendor_message_routes, vector_routes, sql_terminal_routes, admin_dashboard_routes, admin_docs_routes, admin_user_auth_routes, admin_vendor_management_routes, admin_vendor_approval_routes, admin_admin_approval_routes, couple_routes, invitation_routes, digital_invitation_routes, chat_memory_routes, model_routes, review_summary_routes, category_routes, ai_analysis_routes
+from contextlib import asynccontextmanager
+from app.routers import auth_routes, user_routes, post_routes, comment_routes, chat_routes, calendar_routes, budget_routes, voice_routes, vendor_routes, vendor_message_routes, vector_routes, sql_terminal_routes, admin_dashboard_routes, admin_docs_routes, admin_user_auth_routes, admin_vendor_management_routes, admin_vendor_approval_routes, admin_admin_approval_routes, couple_routes, invitation_routes, digital_invitation_routes, chat_memory_routes, model_routes, review_summary_routes, category_routes, ai_analysis_routes, ai_job_routes, health_routes
 from app.core.exceptions import APIError
 from app.core.formatter import create_json_response
 from app.core.admin import setup_admin
+from app.core.identity import identity_scope
+from app.services import model_client, post_counter_service, keyword_index, vector_warmup
 
-app = FastAPI(title="Wedding OS API")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """워커 시작/종료 시 공유 리소스 관리"""
+    await model_client.init_http_client()
+    await model_client.start_health_monitor()
+    post_counter_service.start_view_flusher()
+    keyword_index.start_keyword_index()
+    # 컬렉션/임베딩 모델을 미리 로드해 첫 채팅 지연 제거 (최대 VECTOR_WARMUP_STARTUP_WAIT초 대기)
+    await vector_warmup.start_vector_warmup()
+    yield
+    await vector_warmup.stop_vector_warmup()
+    await keyword_index.stop_keyword_index()
+    await post_counter_service.stop_view_flusher()
+    await model_client.stop_health_monitor()
+    await model_client.close_http_client()
+
+
+app = FastAPI(title="Wedding OS API", lifespan=lifespan)
 
 # CORS 설정 - 프론트엔드에서 API 호출을 위해 필요
 app.add_middleware(
@@ -29,6 +50,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def identity_scope_middleware(request: Request, call_next):
+    """요청마다 사용자 신원(couple_id, 역할 등) 캐시 범위를 새로 시작"""
+    with identity_scope():
+        return await call_next(request)
+
 # 루트 경로 - API 정보
 @app.get("/")
 async def root():
@@ -40,6 +68,9 @@ async def root():
         "api_prefix": "/api"
     }
 
+# 헬스 체크 (로드밸런서용, /api 접두사 없음)
+app.include_router(health_routes.router)
+
 # 라우터 등록
 app.include_router(auth_routes.router, prefix="/api")
 app.include_router(user_routes.router, prefix="/api")
@@ -60,6 +91,7 @@ app.include_router(vector_routes.router, prefix="/api")
 app.include_router(review_summary_routes.router, prefix="/api")
 app.include_router(category_routes.router, prefix="/api")
 app.include_router(ai_analysis_routes.router, prefix="/api")
+app.include_router(ai_job_routes.router, prefix="/api")
 
 # Admin Dashboard & SQL Terminal (Admin 전용)
 app.include_router(admin_dashboard_routes.router, prefix="/secret_admin")
@@ -0,0 +1,20 @@
+"""
+스키마 마이그레이션 - schema_migrations 테이블로 적용 이력을 관리합니다.
+
+마이그레이션 추가: app/migrations/versions/ 에 `v0002_설명.py` 형식으로 파일을 만들고
+VERSION, DESCRIPTION, upgrade(conn) 를 정의하면 됩니다.
+실행: python migrate.py
+"""
+from app.migrations.runner import (
+    Migration,
+    load_migrations,
+    get_applied_versions,
+    apply_migrations,
+    create_index_if_missing,
+    create_table_if_missing,
+)
+
+__all__ = [
+    "Migration", "load_migrations", "get_applied_versions", "apply_migrations",
+    "create_index_if_missing", "create_table_if_missing",
+]
@@ -0,0 +1,131 @@
+"""
+마이그레이션 실행기 (MySQL / SQLite 공용)
+
+인덱스 생성은 SQLAlchemy inspector로 존재 여부를 먼저 확인하므로
+기존 SQL 파일로 이미 인덱스를 만든 DB에서도 안전하게 다시 실행할 수 있습니다.
+"""
+import importlib
+import pkgutil
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Sequence, Set
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateIndex, CreateTable, Index
+
+_meta = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _meta,
+    Column("version", String(32), primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+@dataclass
+class Migration:
+    version: str
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+def load_migrations() -> List[Migration]:
+    """app/migrations/versions 의 마이그레이션을 버전순으로 로드"""
+    from app.migrations import versions
+
+    migrations = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        module = importlib.import_module(f"{versions.__name__}.{module_info.name}")
+        migrations.append(Migration(module.VERSION, module.DESCRIPTION, module.upgrade))
+    migrations.sort(key=lambda m: m.version)
+    return migrations
+
+
+def get_applied_versions(engine: Engine) -> Set[str]:
+    _meta.create_all(engine, tables=[schema_migrations])
+    with engine.connect() as conn:
+        return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def apply_migrations(engine: Engine, dry_run: bool = False) -> List[Migration]:
+    """
+    미적용 마이그레이션을 순서대로 실행 (마이그레이션마다 별도 트랜잭션)
+
+    Args:
+        dry_run: True면 실행할 SQL만 출력하고 DB는 변경하지 않음
+
+    Returns:
+        적용한(또는 dry_run에서 적용할) 마이그레이션 목록
+    """
+    applied = get_applied_versions(engine)
+    pending = [m for m in load_migrations() if m.version not in applied]
+
+    for migration in pending:
+        print(f"📝 [{migration.version}] {migration.description}")
+        if dry_run:
+            with engine.connect() as conn:
+                conn.info["dry_run"] = True
+                try:
+                    migration.upgrade(conn)
+                finally:
+                    conn.info.pop("dry_run", None)  # 풀에 반환되는 커넥션에 남지 않도록
+                    conn.rollback()
+            continue
+        with engine.begin() as conn:
+            migration.upgrade(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=migration.version,
+                description=migration.description,
+                applied_at=datetime.now()
+            ))
+        print(f"✅ [{migration.version}] 적용 완료")
+
+    return pending
+
+
+def create_index_if_missing(conn: Connection, table_name: str, index_name: str, columns: Sequence[str]) -> bool:
+    """
+    인덱스가 없을 때만 생성 (MySQL은 CREATE INDEX IF NOT EXISTS를 지원하지 않음)
+
+    Returns:
+        새로 생성했으면 True
+    """
+    inspector = inspect(conn)
+    if not inspector.has_table(table_name):
+        print(f"  ⚠️ {table_name} 테이블이 없어 {index_name} 생성을 건너뜁니다.")
+        return False
+    if any(index["name"] == index_name for index in inspector.get_indexes(table_name)):
+        print(f"  ℹ️ {index_name} 이미 존재")
+        return False
+
+    table = Table(table_name, MetaData(), autoload_with=conn)
+    index = Index(index_name, *[table.c[name] for name in columns])
+    if conn.info.get("dry_run"):
+        print(f"  {CreateIndex(index).compile(conn)};")
+        return True
+    index.create(conn)
+    print(f"  ➕ {index_name} ({table_name}: {', '.join(columns)})")
+    return True
+
+
+def create_table_if_missing(conn: Connection, table: Table) -> bool:
+    """
+    테이블이 없을 때만 생성 (모델의 인덱스/제약 조건 포함, 기존 SQL 파일로 이미 만든 DB에서도 안전)
+
+    Returns:
+        새로 생성했으면 True
+    """
+    if inspect(conn).has_table(table.name):
+        print(f"  ℹ️ {table.name} 이미 존재")
+        return False
+    if conn.info.get("dry_run"):
+        print(f"  {CreateTable(table).compile(conn)};")
+        for index in table.indexes:
+            print(f"  {CreateIndex(index).compile(conn)};")
+        return True
+    table.create(conn)
+    print(f"  ➕ {table.name}")
+    return True
@@ -0,0 +1,30 @@
+"""
+자주 쓰는 조회 조건에 맞춘 복합 인덱스
+
+- 게시판 목록: board_type (+ category) 필터 후 created_at, id 최신순 (커서 페이지네이션 포함)
+- 커플 전용 공간/문서 보관함: couple_id + board_type 필터 후 최신순
+- 댓글 / 업체 쓰레드 메시지: 부모 id 필터 후 created_at, id 순
+- 읽지 않은 업체 메시지: thread_id + sender_type + is_read
+- 캘린더: couple_id + start_date 범위
+- RSVP 통계: invitation_id + status
+"""
+from app.migrations.runner import create_index_if_missing
+
+VERSION = "0001"
+DESCRIPTION = "query pattern composite indexes"
+
+INDEXES = [
+    ("posts", "idx_posts_board_created", ["board_type", "created_at", "id"]),
+    ("posts", "idx_posts_board_category_created", ["board_type", "category", "created_at"]),
+    ("posts", "idx_posts_couple_board_created", ["couple_id", "board_type", "created_at"]),
+    ("comments", "idx_comments_post_created", ["post_id", "created_at", "id"]),
+    ("vendor_messages", "idx_vendor_messages_thread_created", ["thread_id", "created_at", "id"]),
+    ("vendor_messages", "idx_vendor_messages_thread_unread", ["thread_id", "sender_type", "is_read"]),
+    ("calendar_events", "idx_calendar_events_couple_start", ["couple_id", "start_date"]),
+    ("rsvps", "idx_rsvps_invitation_status", ["invitation_id", "status"]),
+]
+
+
+def upgrade(conn):
+    for table_name, index_name, columns in INDEXES:
+        create_index_if_missing(conn, table_name, index_name, columns)
@@ -0,0 +1,19 @@
+"""
+예산 항목 조회용 인덱스
+
+- 예산 목록/요약/Export: user_id 또는 couple_id 필터 후 category별 GROUP BY
+"""
+from app.migrations.runner import create_index_if_missing
+
+VERSION = "0002"
+DESCRIPTION = "budget item user/couple indexes"
+
+INDEXES = [
+    ("budget_items", "idx_budget_items_user_category", ["user_id", "category"]),
+    ("budget_items", "idx_budget_items_couple_category", ["couple_id", "category"]),
+]
+
+
+def upgrade(conn):
+    for table_name, index_name, columns in INDEXES:
+        create_index_if_missing(conn, table_name, index_name, columns)
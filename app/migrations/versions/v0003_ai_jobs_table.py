@@ -0,0 +1,16 @@
+"""
+AI 백그라운드 작업 큐 테이블 (ai_jobs)
+
+create_ai_jobs_table.sql과 같은 구조 (app/models/db/ai_job.py의 AIJob 모델 기준)
+- 멱등성 키 unique, 워커 조회용 (status, run_after), 게시글별 조회용 post_id 인덱스
+"""
+from app.migrations.runner import create_table_if_missing
+
+VERSION = "0003"
+DESCRIPTION = "ai_jobs background job table"
+
+
+def upgrade(conn):
+    from app.models.db import AIJob
+
+    create_table_if_missing(conn, AIJob.__table__)
@@ -20,6 +20,7 @@ from app.models.db.digital_invitation import (
 )
 from app.models.db.chat_memory import ChatMemory
 from app.models.db.gemini_usage import GeminiImageUsage
+from app.models.db.ai_job import AIJob, AIJobStatus
 
 __all__ = [
     "User", "Gender", "VendorApprovalStatus", "Post", "PostLike", "Tag", "Comment", "post_tags",
@@ -35,7 +36,8 @@ __all__ = [
     "DigitalInvitation", "Payment", "RSVP", "GuestMessage",
     "InvitationTheme", "RSVPStatus", "PaymentStatus", "PaymentMethod",
     "ChatMemory",
-    "GeminiImageUsage"
+    "GeminiImageUsage",
+    "AIJob", "AIJobStatus"
 ]
 
 
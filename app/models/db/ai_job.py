@@ -0,0 +1,43 @@
+"""
+AI 백그라운드 작업 큐 모델 - 게시글 저장 후 벡터화/요약/태그/감성 분석을 워커가 처리
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, BigInteger, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+import enum
+
+
+class AIJobStatus(str, enum.Enum):
+    PENDING = "PENDING"  # 처리 대기
+    RUNNING = "RUNNING"  # 워커가 처리 중
+    DONE = "DONE"  # 완료
+    FAILED = "FAILED"  # 재시도 횟수 초과
+
+
+class AIJob(Base):
+    """AI 후처리 작업"""
+    __tablename__ = "ai_jobs"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_type = Column(String(50), nullable=False)  # 예: "post_enrichment"
+    post_id = Column(BigInteger, ForeignKey("posts.id", ondelete="CASCADE"), nullable=True)
+    idempotency_key = Column(String(128), unique=True, nullable=False)  # post_id + 콘텐츠 해시
+    tasks = Column(String(255), nullable=False)  # 쉼표 구분 작업 목록 (예: "tags,summary,sentiment,vectorize")
+    status = Column(SQLEnum(AIJobStatus), default=AIJobStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=5, nullable=False)
+    last_error = Column(Text, nullable=True)
+    run_after = Column(DateTime, default=func.now(), nullable=False)  # 재시도 백오프용 실행 가능 시각
+    locked_by = Column(String(100), nullable=True)  # 처리 중인 워커 ID
+    locked_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_ai_jobs_status_run_after", "status", "run_after"),
+        Index("idx_ai_jobs_post_id", "post_id"),
+    )
+
+    def __str__(self):
+        return f"AIJob {self.id} ({self.job_type}, post_id={self.post_id}, {self.status})"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Numeric, BigInteger, Enum, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Numeric, BigInteger, Enum, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -41,6 +41,11 @@ class BudgetItem(Base):
     # Relationships
     user = relationship("User", backref="budget_items")
 
+    __table_args__ = (
+        Index("idx_budget_items_user_category", "user_id", "category"),
+        Index("idx_budget_items_couple_category", "couple_id", "category"),
+    )
+
 
 class UserTotalBudget(Base):
     __tablename__ = "user_total_budgets"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, BigInteger, Boolean, JSON, Date, Time, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, BigInteger, Boolean, JSON, Date, Time, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -43,6 +43,10 @@ class CalendarEvent(Base):
     # Relationships
     user = relationship("User", backref="calendar_events")
 
+    __table_args__ = (
+        Index("idx_calendar_events_couple_start", "couple_id", "start_date"),
+    )
+
 # Todo 모델 제거됨 - calendar_events 테이블의 category='todo'로 통합됨
 # 기존 todos 테이블 데이터는 migrate_todos_to_events.py 스크립트로 마이그레이션 필요
 
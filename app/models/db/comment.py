@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, BigInteger
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, BigInteger, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -16,6 +16,11 @@ class Comment(Base):
     # Relationships
     user = relationship("User", backref="comments")
 
+    __table_args__ = (
+        # 게시글별 댓글 목록 + (created_at, id) 커서 페이지네이션
+        Index("idx_comments_post_created", "post_id", "created_at", "id"),
+    )
+
 
 
 
@@ -1,7 +1,7 @@
 """
 디지털 초대장 및 축의금 결제 시스템 모델
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, BigInteger, Enum as SQLEnum, ForeignKey, Boolean, JSON, Numeric
+from sqlalchemy import Column, Integer, String, Text, DateTime, BigInteger, Enum as SQLEnum, ForeignKey, Boolean, JSON, Numeric, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -133,6 +133,10 @@ class RSVP(Base):
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
 
+    __table_args__ = (
+        Index("idx_rsvps_invitation_status", "invitation_id", "status"),
+    )
+
 
 class GuestMessage(Base):
     """하객 메시지 및 사진"""
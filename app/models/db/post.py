@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, BigInteger, Table, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, BigInteger, Table, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -27,6 +27,8 @@ class Post(Base):
     sentiment_score = Column(Float, nullable=True)
     sentiment_label = Column(String(50), nullable=True)
     view_count = Column(Integer, default=0)
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")  # 비정규화 카운터 (post_counter_service)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
@@ -37,6 +39,14 @@ class Post(Base):
     tags = relationship("Tag", secondary=post_tags, backref="posts")
     vendor = relationship("Vendor", backref="posts")
 
+    __table_args__ = (
+        # 게시판별 최신순 목록 + (created_at, id) 커서 페이지네이션
+        Index("idx_posts_board_created", "board_type", "created_at", "id"),
+        Index("idx_posts_board_category_created", "board_type", "category", "created_at"),
+        # 커플 전용 공간/문서 보관함 목록
+        Index("idx_posts_couple_board_created", "couple_id", "board_type", "created_at"),
+    )
+
 class PostLike(Base):
     __tablename__ = "post_likes"
 
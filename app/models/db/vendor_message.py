@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, BigInteger, Boolean, JSON, Enum, Numeric, Date
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, BigInteger, Boolean, JSON, Enum, Numeric, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -84,6 +84,13 @@ class VendorMessage(Base):
     # Relationships
     # thread relationship은 VendorThread에서 정의됨
 
+    __table_args__ = (
+        # 쓰레드별 메시지 목록 + (created_at, id) 커서 페이지네이션
+        Index("idx_vendor_messages_thread_created", "thread_id", "created_at", "id"),
+        # 읽지 않은 메시지 수 / 읽음 처리
+        Index("idx_vendor_messages_thread_unread", "thread_id", "sender_type", "is_read"),
+    )
+
 
 class VendorContract(Base):
     """벤더 계약 정보"""
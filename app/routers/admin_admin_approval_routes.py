@@ -8,6 +8,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user_id
 from app.core.user_roles import UserRole
 from app.models.db.user import User, AdminApprovalStatus
+from app.core.identity import invalidate_identity
 
 router = APIRouter()
 
@@ -314,7 +315,7 @@ async def admin_approval_page(request: Request):
 
 
 @router.get("/api/admin/admins/pending")
-async def get_pending_admins(
+def get_pending_admins(
     db: Session = Depends(get_db),
     _: User = Depends(require_system_admin)
 ):
@@ -341,7 +342,7 @@ async def get_pending_admins(
 
 
 @router.put("/api/admin/admins/{user_id}/approve")
-async def approve_admin(
+def approve_admin(
     user_id: int,
     db: Session = Depends(get_db),
     _: User = Depends(require_system_admin)
@@ -377,7 +378,7 @@ async def approve_admin(
 
 
 @router.put("/api/admin/admins/{user_id}/reject")
-async def reject_admin(
+def reject_admin(
     user_id: int,
     db: Session = Depends(get_db),
     _: User = Depends(require_system_admin)
@@ -405,6 +406,7 @@ async def reject_admin(
     
     db.commit()
     db.refresh(user)
+    invalidate_identity(user.id)
     
     return {
         "message": "admin_rejected",
@@ -10,6 +10,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user_id
 from app.core.user_roles import UserRole, can_manage_users
 from app.models.db.user import User, AdminApprovalStatus, VendorApprovalStatus
+from app.core.identity import invalidate_identity
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -758,7 +759,7 @@ async def user_auth_setting_page(request: Request):
 
 
 @router.get("/api/admin/users")
-async def get_users(
+def get_users(
     search: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     _: User = Depends(require_system_admin)
@@ -799,7 +800,7 @@ async def get_users(
 
 
 @router.put("/api/admin/users/role")
-async def update_user_role(
+def update_user_role(
     request: UserRoleUpdateReq,
     db: Session = Depends(get_db),
     _: User = Depends(require_system_admin)
@@ -841,6 +842,7 @@ async def update_user_role(
         
         db.commit()
         db.refresh(user)
+        invalidate_identity(user.id)
         
         return {
             "message": "user_role_updated",
@@ -9,6 +9,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user_id
 from app.core.user_roles import UserRole
 from app.models.db.user import User, VendorApprovalStatus
+from app.core.identity import invalidate_identity
 from app.core.exceptions import bad_request, not_found
 from app.core.error_codes import ErrorCode
 
@@ -371,7 +372,7 @@ async def vendor_approval_page(request: Request):
 
 
 @router.get("/api/admin/vendors/pending")
-async def get_pending_vendors(
+def get_pending_vendors(
     db: Session = Depends(get_db),
     _: User = Depends(require_system_admin)
 ):
@@ -397,7 +398,7 @@ async def get_pending_vendors(
 
 
 @router.put("/api/admin/vendors/{user_id}/approve")
-async def approve_vendor(
+def approve_vendor(
     user_id: int,
     db: Session = Depends(get_db),
     _: User = Depends(require_system_admin)
@@ -424,6 +425,7 @@ async def approve_vendor(
     
     db.commit()
     db.refresh(user)
+    invalidate_identity(user.id)
     
     return {
         "message": "vendor_approved",
@@ -436,7 +438,7 @@ async def approve_vendor(
 
 
 @router.put("/api/admin/vendors/{user_id}/reject")
-async def reject_vendor(
+def reject_vendor(
     user_id: int,
     db: Session = Depends(get_db),
     _: User = Depends(require_system_admin)
@@ -736,7 +736,7 @@ async def vendor_management_page(request: Request):
 
 
 @router.get("/api/admin/vendors")
-async def get_vendors(
+def get_vendors(
     vendor_type: Optional[str] = Query(None),
     location: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
@@ -787,7 +787,7 @@ async def get_vendors(
 
 
 @router.post("/api/admin/vendors")
-async def create_vendor(
+def create_vendor(
     request: VendorCreateReq,
     db: Session = Depends(get_db),
     _: User = Depends(require_system_admin)
@@ -854,7 +854,7 @@ async def create_vendor(
 
 
 @router.put("/api/admin/vendors/{vendor_id}")
-async def update_vendor(
+def update_vendor(
     vendor_id: int,
     request: VendorUpdateReq,
     db: Session = Depends(get_db),
@@ -914,7 +914,7 @@ async def update_vendor(
 
 
 @router.delete("/api/admin/vendors/{vendor_id}")
-async def delete_vendor(
+def delete_vendor(
     vendor_id: int,
     db: Session = Depends(get_db),
     _: User = Depends(require_system_admin)
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from app.core.security import get_current_user_id_optional
 from app.services.model_client import analyze_sentiment, summarize_text, auto_tag_text
+from app.services.enrichment_service import enrich_text
 from typing import Optional
 
 router = APIRouter(tags=["AI Analysis"])
@@ -34,41 +35,12 @@ async def analyze_text_endpoint(
     
     try:
         # 병렬로 모든 분석 수행
-        sentiment_result = None
-        summary_result = None
-        tags_result = None
-        
-        # 감성 분석
-        try:
-            sentiment_res = await analyze_sentiment(request.text)
-            if sentiment_res:
-                sentiment_result = {
-                    "label": sentiment_res.get("label", "neutral"),
-                    "confidence": sentiment_res.get("confidence", 0.5)
-                }
-        except Exception as e:
-            print(f"⚠️ 감성 분석 실패: {e}")
-        
-        # 요약
-        try:
-            summary_res = await summarize_text(request.text)
-            if summary_res:
-                summary_result = summary_res.get("summary")
-        except Exception as e:
-            print(f"⚠️ 요약 실패: {e}")
-        
-        # 태그 생성
-        try:
-            tags_list = await auto_tag_text(request.text)
-            if tags_list:
-                tags_result = tags_list
-        except Exception as e:
-            print(f"⚠️ 태그 생성 실패: {e}")
+        enrichment = await enrich_text(request.text)
         
         return AnalyzeTextResponse(
-            sentiment=sentiment_result,
-            summary=summary_result,
-            tags=tags_result
+            sentiment=enrichment["sentiment"],
+            summary=enrichment["summary"],
+            tags=enrichment["tags"] or None
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI 분석 실패: {str(e)}")
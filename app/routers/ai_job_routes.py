@@ -0,0 +1,68 @@
+"""
+AI 백그라운드 작업 상태 조회 API
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
+from app.core.security import get_current_user_id
+from app.core.exceptions import not_found
+from app.core.error_codes import ErrorCode
+from app.core.couple_helpers import get_user_couple_id_async
+from app.models.db import AIJob, Post
+from app.services.ai_job_queue import serialize_job
+
+router = APIRouter(tags=["AI Jobs"])
+
+
+async def _can_view_post_jobs(post_id: int, user_id: int, db: AsyncSession) -> bool:
+    """
+    작업 정보(작업 목록, 오류 내용)는 게시글 작성자와 그 커플만 조회 가능
+    커플 전용 공간/문서 보관함은 게시글 상세 조회와 같이 해당 커플만 허용
+    """
+    post = await db.get(Post, post_id) if post_id else None
+    if not post:
+        return False
+    couple_id = await get_user_couple_id_async(user_id, db)
+    if post.board_type in ("private", "vault"):
+        return bool(couple_id) and post.couple_id == couple_id
+    if post.user_id == user_id:
+        return True
+    if not couple_id:
+        return False
+    return post.couple_id == couple_id or await get_user_couple_id_async(post.user_id, db) == couple_id
+
+
+@router.get("/ai-jobs/{job_id}")
+async def get_ai_job(
+    job_id: int,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """AI 작업 상태 조회"""
+    job = await db.get(AIJob, job_id)
+    # 권한이 없으면 작업 존재 여부도 알리지 않음
+    if not job or not await _can_view_post_jobs(job.post_id, user_id, db):
+        raise not_found("ai_job_not_found")
+    return {"message": "ai_job_retrieved", "data": serialize_job(job)}
+
+
+@router.get("/posts/{post_id}/ai-jobs")
+async def get_post_ai_jobs(
+    post_id: int,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """게시글의 AI 작업 이력 조회 (최신순)"""
+    if not await _can_view_post_jobs(post_id, user_id, db):
+        raise not_found("post_not_found", ErrorCode.POST_NOT_FOUND)
+    jobs = (await db.execute(
+        select(AIJob).where(AIJob.post_id == post_id).order_by(AIJob.id.desc())
+    )).scalars().all()
+    return {
+        "message": "ai_jobs_retrieved",
+        "data": {
+            "post_id": post_id,
+            "jobs": [serialize_job(job) for job in jobs]
+        }
+    }
@@ -8,14 +8,14 @@ router = APIRouter(tags=["auth"])
 
 
 @router.post("/auth/login")
-async def login(req: LoginReq, db: Session = Depends(get_db)):
+def login(req: LoginReq, db: Session = Depends(get_db)):
     """로그인 API"""
     data = auth_controller.login_controller(req, db)
     return {"message": "login_success", "data": data}
 
 
 @router.post("/auth/signup", status_code=status.HTTP_201_CREATED)
-async def signup(req: SignupReq, db: Session = Depends(get_db)):
+def signup(req: SignupReq, db: Session = Depends(get_db)):
     """회원가입 API"""
     data = auth_controller.signup_controller(req, db)
     return {"message": "register_success", "data": data}
@@ -1,54 +1,58 @@
-from fastapi import APIRouter, UploadFile, File, Query
+from fastapi import APIRouter, UploadFile, File, Query, Depends
 from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.orm import Session
 from app.schemas import BudgetItemCreateReq, BudgetItemUpdateReq, TotalBudgetSetReq
 from app.controllers import budget_controller
 from app.services import budget_service
+from app.core.database import get_db
+import asyncio
 import io
 
 router = APIRouter(tags=["budget"])
 
 # 예산 항목 관리
 @router.post("/budget/items")
-async def create_budget_item(request: BudgetItemCreateReq, user_id: int = Query(...)):
+def create_budget_item(request: BudgetItemCreateReq, user_id: int = Query(...), db: Session = Depends(get_db)):
     """예산 항목 생성"""
-    return budget_controller.create_budget_item(user_id, request)
+    return budget_controller.create_budget_item(user_id, request, db)
 
 @router.get("/budget/items")
-async def get_budget_items(user_id: int = Query(...)):
+def get_budget_items(user_id: int = Query(...), db: Session = Depends(get_db)):
     """예산 항목 조회"""
-    return budget_controller.get_budget_items(user_id)
+    return budget_controller.get_budget_items(user_id, db)
 
 @router.put("/budget/items/{item_id}")
-async def update_budget_item(
+def update_budget_item(
     item_id: int,
     request: BudgetItemUpdateReq,
-    user_id: int = Query(...)
+    user_id: int = Query(...),
+    db: Session = Depends(get_db)
 ):
     """예산 항목 수정"""
-    return budget_controller.update_budget_item(item_id, user_id, request)
+    return budget_controller.update_budget_item(item_id, user_id, request, db)
 
 @router.delete("/budget/items/{item_id}")
-async def delete_budget_item(item_id: int, user_id: int = Query(...)):
+def delete_budget_item(item_id: int, user_id: int = Query(...), db: Session = Depends(get_db)):
     """예산 항목 삭제"""
-    return budget_controller.delete_budget_item(item_id, user_id)
+    return budget_controller.delete_budget_item(item_id, user_id, db)
 
 # 예산 요약
 @router.get("/budget/summary")
-async def get_budget_summary(user_id: int = Query(...)):
+def get_budget_summary(user_id: int = Query(...), db: Session = Depends(get_db)):
     """예산 요약 (카테고리별 합계)"""
-    return budget_controller.get_budget_summary(user_id)
+    return budget_controller.get_budget_summary(user_id, db)
 
 # 총 예산 설정
 @router.post("/budget/total")
-async def set_total_budget(request: TotalBudgetSetReq, user_id: int = Query(...)):
+def set_total_budget(request: TotalBudgetSetReq, user_id: int = Query(...), db: Session = Depends(get_db)):
     """총 예산 설정"""
-    return budget_controller.set_total_budget(user_id, request)
+    return budget_controller.set_total_budget(user_id, request, db)
 
 # Excel/CSV Export
 @router.get("/budget/export/excel")
-async def export_to_excel(user_id: int = Query(...)):
+def export_to_excel(user_id: int = Query(...), db: Session = Depends(get_db)):
     """예산 데이터를 Excel 파일로 Export"""
-    excel_data = budget_service.export_to_excel(user_id)
+    excel_data = budget_service.export_to_excel(user_id, db)
     return StreamingResponse(
         io.BytesIO(excel_data),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
@@ -56,9 +60,9 @@ async def export_to_excel(user_id: int = Query(...)):
     )
 
 @router.get("/budget/export/csv")
-async def export_to_csv(user_id: int = Query(...)):
+def export_to_csv(user_id: int = Query(...), db: Session = Depends(get_db)):
     """예산 데이터를 CSV로 Export"""
-    csv_data = budget_service.export_to_csv(user_id)
+    csv_data = budget_service.export_to_csv(user_id, db)
     return Response(
         content=csv_data,
         media_type="text/csv",
@@ -69,11 +73,13 @@ async def export_to_csv(user_id: int = Query(...)):
 @router.post("/budget/import/excel")
 async def import_from_excel(
     file: UploadFile = File(...),
-    user_id: int = Query(...)
+    user_id: int = Query(...),
+    db: Session = Depends(get_db)
 ):
     """Excel 파일에서 예산 데이터 Import"""
     file_data = await file.read()
-    items = budget_service.import_from_excel(user_id, file_data)
+    # 파일 파싱과 일괄 저장은 동기 작업이므로 스레드에서 실행
+    items = await asyncio.to_thread(budget_service.import_from_excel, user_id, file_data, db)
     
     return {
         "message": "budget_imported",
@@ -81,9 +87,9 @@ async def import_from_excel(
             "items_imported": len(items),
             "items": [
                 {
-                    "id": item.id,
-                    "item_name": item.item_name,
-                    "category": item.category
+                    "id": item["id"],
+                    "item_name": item["item_name"],
+                    "category": item["category"]
                 }
                 for item in items
             ]
@@ -93,11 +99,12 @@ async def import_from_excel(
 @router.post("/budget/import/csv")
 async def import_from_csv(
     file: UploadFile = File(...),
-    user_id: int = Query(...)
+    user_id: int = Query(...),
+    db: Session = Depends(get_db)
 ):
     """CSV 파일에서 예산 데이터 Import"""
     csv_data = (await file.read()).decode('utf-8-sig')
-    items = budget_service.import_from_csv(user_id, csv_data)
+    items = await asyncio.to_thread(budget_service.import_from_csv, user_id, csv_data, db)
     
     return {
         "message": "budget_imported",
@@ -105,9 +112,9 @@ async def import_from_csv(
             "items_imported": len(items),
             "items": [
                 {
-                    "id": item.id,
-                    "item_name": item.item_name,
-                    "category": item.category
+                    "id": item["id"],
+                    "item_name": item["item_name"],
+                    "category": item["category"]
                 }
                 for item in items
             ]
@@ -118,7 +125,8 @@ async def import_from_csv(
 @router.post("/budget/process-receipt")
 async def process_receipt_image(
     file: UploadFile = File(...),
-    user_id: int = Query(...)
+    user_id: int = Query(...),
+    db: Session = Depends(get_db)
 ):
     """영수증/견적서 문서 처리 (OCR + LLM 구조화)"""
     file_data = await file.read()
@@ -127,6 +135,7 @@ async def process_receipt_image(
         user_id=user_id,
         file_data=file_data,
         filename=filename,
+        db=db,
         content_type=file.content_type
     )
 
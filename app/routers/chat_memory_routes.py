@@ -12,7 +12,7 @@ router = APIRouter(tags=["Chat Memory"])
 
 
 @router.post("/chat-memories")
-async def create_chat_memory(
+def create_chat_memory(
     request: ChatMemoryCreateReq,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -31,7 +31,7 @@ async def create_chat_memory(
 
 
 @router.get("/chat-memories")
-async def get_chat_memories(
+def get_chat_memories(
     include_shared: bool = True,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -45,7 +45,7 @@ async def get_chat_memories(
 
 
 @router.get("/chat-memories/{memory_id}")
-async def get_chat_memory(
+def get_chat_memory(
     memory_id: int,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -61,7 +61,7 @@ async def get_chat_memory(
 
 
 @router.patch("/chat-memories/{memory_id}")
-async def update_chat_memory(
+def update_chat_memory(
     memory_id: int,
     request: ChatMemoryUpdateReq,
     user_id: int = Depends(get_current_user_id),
@@ -78,7 +78,7 @@ async def update_chat_memory(
 
 
 @router.delete("/chat-memories/{memory_id}")
-async def delete_chat_memory(
+def delete_chat_memory(
     memory_id: int,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -72,11 +72,13 @@ async def chat_websocket(
                     db=db,
                     model=model
                 ):
-                    # NDJSON 형식의 chunk를 파싱하여 WebSocket으로 전송
-                    if chunk.strip():
+                    # NDJSON 청크(여러 줄일 수 있음)를 줄 단위 WebSocket 메시지로 전송
+                    # 줄은 이미 JSON 객체로 확인되어 있으므로 파싱하지 않고 그대로 전송
+                    for line in chunk.split(b"\n"):
+                        if not line:
+                            continue
                         try:
-                            # chunk는 이미 JSON 문자열이므로 그대로 전송
-                            await websocket.send_text(chunk.strip())
+                            await websocket.send_text(line.decode("utf-8"))
                         except Exception as e:
                             # 전송 실패 시 에러 메시지
                             await websocket.send_text(json.dumps({
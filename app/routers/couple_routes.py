@@ -12,7 +12,7 @@ router = APIRouter(tags=["couple"])
 
 
 @router.get("/couple/my-key")
-async def get_my_couple_key(
+def get_my_couple_key(
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
@@ -21,7 +21,7 @@ async def get_my_couple_key(
 
 
 @router.post("/couple/connect")
-async def connect_couple(
+def connect_couple(
     request: CoupleConnectReq,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -31,7 +31,7 @@ async def connect_couple(
 
 
 @router.get("/couple/info")
-async def get_couple_info(
+def get_couple_info(
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
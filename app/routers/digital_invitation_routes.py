@@ -15,7 +15,7 @@ router = APIRouter(prefix="/digital-invitations", tags=["Digital Invitation"])
 
 
 @router.post("")
-async def create_digital_invitation(
+def create_digital_invitation(
     request: DigitalInvitationCreateReq,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -25,7 +25,7 @@ async def create_digital_invitation(
 
 
 @router.get("/my")
-async def get_my_digital_invitations(
+def get_my_digital_invitations(
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
@@ -34,7 +34,7 @@ async def get_my_digital_invitations(
 
 
 @router.get("/{invitation_url}")
-async def get_digital_invitation(
+def get_digital_invitation(
     invitation_url: str,
     db: Session = Depends(get_db)
 ):
@@ -43,7 +43,7 @@ async def get_digital_invitation(
 
 
 @router.put("/{invitation_id}")
-async def update_digital_invitation(
+def update_digital_invitation(
     invitation_id: int,
     request: DigitalInvitationUpdateReq,
     user_id: int = Depends(get_current_user_id),
@@ -54,7 +54,7 @@ async def update_digital_invitation(
 
 
 @router.get("/{invitation_id}/statistics")
-async def get_invitation_statistics(
+def get_invitation_statistics(
     invitation_id: int,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -64,7 +64,7 @@ async def get_invitation_statistics(
 
 
 @router.post("/{invitation_id}/payments")
-async def create_payment(
+def create_payment(
     invitation_id: int,
     request: PaymentCreateReq,
     db: Session = Depends(get_db)
@@ -74,7 +74,7 @@ async def create_payment(
 
 
 @router.get("/{invitation_id}/payments")
-async def get_invitation_payments(
+def get_invitation_payments(
     invitation_id: int,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -84,7 +84,7 @@ async def get_invitation_payments(
 
 
 @router.post("/{invitation_id}/rsvps")
-async def create_rsvp(
+def create_rsvp(
     invitation_id: int,
     request: RSVPCreateReq,
     db: Session = Depends(get_db)
@@ -94,7 +94,7 @@ async def create_rsvp(
 
 
 @router.get("/{invitation_id}/rsvps")
-async def get_invitation_rsvps(
+def get_invitation_rsvps(
     invitation_id: int,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -104,7 +104,7 @@ async def get_invitation_rsvps(
 
 
 @router.post("/{invitation_id}/guest-messages")
-async def create_guest_message(
+def create_guest_message(
     invitation_id: int,
     request: GuestMessageCreateReq,
     db: Session = Depends(get_db)
@@ -114,7 +114,7 @@ async def create_guest_message(
 
 
 @router.get("/{invitation_id}/guest-messages")
-async def get_invitation_guest_messages(
+def get_invitation_guest_messages(
     invitation_id: int,
     db: Session = Depends(get_db)
 ):
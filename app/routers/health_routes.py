@@ -0,0 +1,30 @@
+"""
+헬스 체크 API (로드밸런서 / 오케스트레이터용)
+"""
+from fastapi import APIRouter
+from app.core.formatter import create_json_response
+from app.services import vector_warmup, keyword_index
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/health")
+async def health():
+    """프로세스 생존 확인"""
+    return {"message": "ok"}
+
+
+@router.get("/health/ready")
+async def health_ready():
+    """
+    트래픽 수신 가능 여부 - Vector Store 워밍업이 끝나기 전에는 503
+    (워밍업이 실패해도 벡터 검색 없이 동작할 수 있으므로 200, status="degraded")
+    """
+    warmup = vector_warmup.get_status()
+    data = {
+        "vector_store": warmup,
+        "keyword_index": {"enabled": keyword_index.KEYWORD_INDEX_ENABLED, "ready": keyword_index.is_ready()}
+    }
+    if not warmup["ready"]:
+        return create_json_response(503, "not_ready", data)
+    return {"message": "ready", "data": data}
@@ -20,7 +20,7 @@ router = APIRouter(tags=["invitation"])
 
 # 템플릿
 @router.get("/invitation-templates")
-async def get_templates(
+def get_templates(
     style: str = Query(None, description="템플릿 스타일 필터 (CLASSIC, MODERN, VINTAGE 등)"),
     db: Session = Depends(get_db)
 ):
@@ -29,7 +29,7 @@ async def get_templates(
 
 
 @router.get("/invitation-templates/{template_id}")
-async def get_template(
+def get_template(
     template_id: int,
     db: Session = Depends(get_db)
 ):
@@ -39,7 +39,7 @@ async def get_template(
 
 # 디자인
 @router.post("/invitation-designs")
-async def create_design(
+def create_design(
     request: InvitationDesignCreateReq,
     user_id: int | None = Depends(get_current_user_id_optional),
     db: Session = Depends(get_db)
@@ -49,7 +49,7 @@ async def create_design(
 
 
 @router.get("/invitation-designs")
-async def get_designs(
+def get_designs(
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
@@ -58,7 +58,7 @@ async def get_designs(
 
 
 @router.get("/invitation-designs/{design_id}")
-async def get_design(
+def get_design(
     design_id: int,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -68,7 +68,7 @@ async def get_design(
 
 
 @router.put("/invitation-designs/{design_id}")
-async def update_design(
+def update_design(
     design_id: int,
     request: InvitationDesignUpdateReq,
     user_id: int | None = Depends(get_current_user_id_optional),
@@ -98,7 +98,7 @@ async def generate_qr_code(
 
 # PDF 생성
 @router.post("/invitation-pdf")
-async def generate_pdf(
+def generate_pdf(
     request: InvitationPDFGenerateReq,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -119,7 +119,7 @@ async def generate_pdf(
 
 # 주문
 @router.post("/invitation-orders")
-async def create_order(
+def create_order(
     request: InvitationOrderCreateReq,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -129,7 +129,7 @@ async def create_order(
 
 
 @router.get("/invitation-orders")
-async def get_orders(
+def get_orders(
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
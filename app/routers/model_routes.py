@@ -3,6 +3,9 @@
 """
 from fastapi import APIRouter
 from app.services.model_config import get_all_models, get_models_by_category
+from app.services.model_client import get_http_client_stats, get_model_api_timeout, get_model_api_health, get_batcher_stats, MODEL_API_TIMEOUTS
+from app.services.result_cache import get_result_cache
+from app.services.llm_scheduler import get_scheduler_stats
 
 router = APIRouter(tags=["Model"])
 
@@ -27,3 +30,17 @@ async def get_models_by_category_endpoint(category: str):
     }
 
 
+@router.get("/models/client-stats")
+async def get_model_client_stats():
+    """Model API HTTP 커넥션 풀 메트릭 / 엔드포인트 헬스 / 서킷 브레이커 상태 / 배치·결과 캐시·LLM 스케줄러 통계 조회"""
+    return {
+        "message": "model_client_stats_retrieved",
+        "data": {
+            "pool": get_http_client_stats(),
+            "health": get_model_api_health(),
+            "batching": get_batcher_stats(),
+            "result_cache": get_result_cache().get_stats(),
+            "llm_scheduler": get_scheduler_stats(),
+            "timeouts": {name: get_model_api_timeout(name).read for name in MODEL_API_TIMEOUTS}
+        }
+    }
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, UploadFile, File, Depends, Path, Query, Form, status
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.security import get_current_user_id, get_current_user_id_optional
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.controllers import post_controller
 from app.schemas import PostCreateReq, PostUpdateReq
 
@@ -16,11 +16,13 @@ async def get_posts(
     board_type: str = Query("couple"), 
     category: Optional[str] = Query(None, description="카테고리 필터 (선택적)"),
     vendor_type: Optional[str] = Query(None, description="업체 타입 필터 (선택적)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    include_total: bool = Query(False, description="커서 모드에서 대략적인 전체 개수 포함 여부"),
     user_id: Optional[int] = Depends(get_current_user_id_optional),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """게시글 목록 조회 API (로그인 선택)"""
-    data = post_controller.get_posts_controller(page, limit, user_id, board_type, category, vendor_type, db)
+    data = await post_controller.get_posts_controller(page, limit, user_id, board_type, category, vendor_type, db, cursor, include_total)
     return {"message": "get_posts_success", "data": data}
 
 
@@ -28,45 +30,45 @@ async def get_posts(
 async def get_post(
     post_id: int, 
     user_id: Optional[int] = Depends(get_current_user_id_optional),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """게시글 상세 조회 API (로그인 선택)"""
-    data = post_controller.get_post_controller(post_id, user_id, db)
+    data = await post_controller.get_post_controller(post_id, user_id, db)
     return {"message": "get_post_success", "data": data}
 
 
 @router.post("/posts", status_code=status.HTTP_201_CREATED)
-async def create_post(req: PostCreateReq, user_id: int = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def create_post(req: PostCreateReq, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_async_db)):
     """게시글 작성 API"""
     data = await post_controller.create_post_controller(req, user_id, db)
     return {"message": "create_post_success", "data": data}
 
 
 @router.patch("/posts/{post_id}")
-async def update_post(post_id: int = Path(...), req: PostUpdateReq = None, user_id: int = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def update_post(post_id: int = Path(...), req: PostUpdateReq = None, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_async_db)):
     """게시글 수정 API"""
-    data = post_controller.update_post_controller(post_id, req, user_id, db)
+    data = await post_controller.update_post_controller(post_id, req, user_id, db)
     return {"message": "update_post_success", "data": data}
 
 
 @router.delete("/posts/{post_id}")
-async def delete_post(post_id: int, user_id: int = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def delete_post(post_id: int, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_async_db)):
     """게시글 삭제 API"""
-    data = post_controller.delete_post_controller(post_id, user_id, db)
+    data = await post_controller.delete_post_controller(post_id, user_id, db)
     return {"message": "delete_post_success", "data": data}
 
 
 @router.post("/posts/{post_id}/like")
-async def toggle_like(post_id: int, user_id: int = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def toggle_like(post_id: int, user_id: int = Depends(get_current_user_id), db: AsyncSession = Depends(get_async_db)):
     """좋아요 토글 API"""
-    data = post_controller.toggle_like_controller(post_id, user_id, db)
+    data = await post_controller.toggle_like_controller(post_id, user_id, db)
     return {"message": "like_toggled", "data": data}
 
 
 @router.patch("/posts/{post_id}/view")
-async def inc_view(post_id: int, db: Session = Depends(get_db)):
+async def inc_view(post_id: int, db: AsyncSession = Depends(get_async_db)):
     """조회수 증가 API"""
-    data = post_controller.increment_view_controller(post_id, db)
+    data = await post_controller.increment_view_controller(post_id, db)
     return {"message": "view_incremented", "data": data}
 
 
@@ -84,7 +86,7 @@ async def upload_document_with_ocr(
     file: UploadFile = File(...),
     title: str = Form(..., description="문서 제목"),
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """문서 업로드 + OCR 처리 API (문서 보관함용)"""
     file_data = await file.read()
@@ -1,59 +1,76 @@
 """
 Vector DB 관련 API 라우터
 """
+import asyncio
 from fastapi import APIRouter, Query, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
 from app.core.security import get_current_user_id
-from app.services import post_vector_service, user_memory_service
+from app.core.couple_helpers import get_user_couple_id_async
+from app.services import post_vector_service, user_memory_service, vector_db, keyword_index, post_search_service
 from app.models.db import Post
 
 router = APIRouter(tags=["vector"])
 
+# 커플 전용 게시글을 걸러낸 뒤에도 k개를 채우도록 후보를 더 많이 가져옴
+SEARCH_CANDIDATE_MULTIPLIER = 3
+
 
 @router.get("/vector/posts/search")
 async def search_posts_vector(
     query: str = Query(..., description="검색 쿼리"),
     k: int = Query(5, ge=1, le=20, description="반환할 결과 개수"),
     board_type: str = Query(None, description="게시판 타입 필터"),
+    mode: str = Query("hybrid", pattern="^(hybrid|vector|keyword)$", description="검색 방식 (hybrid: 키워드+벡터 RRF)"),
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    게시글 벡터 검색 (Vector DB 기반)
+    게시글 검색 (키워드 BM25 + Vector DB, RRF 결합)
     """
     try:
-        results = post_vector_service.search_posts(
+        results = await asyncio.to_thread(
+            post_search_service.search_posts,
             query=query,
-            k=k,
+            k=k * SEARCH_CANDIDATE_MULTIPLIER,
             board_type=board_type,
-            user_id=None  # 전체 게시글 검색 (필요시 user_id로 필터링 가능)
+            mode=mode
         )
         
         # DB에서 실제 Post 객체 조회
-        post_ids = [r["metadata"].get("post_id") for r in results if r["metadata"].get("post_id")]
-        posts = db.query(Post).filter(Post.id.in_(post_ids)).all() if post_ids else []
+        post_ids = [r["post_id"] for r in results]
+        posts = (await db.scalars(select(Post).where(Post.id.in_(post_ids)))).all() if post_ids else []
         
-        # 결과 매핑
+        # 결과 매핑 (삭제된 게시글, 다른 커플의 커플 전용 공간/문서 보관함 게시글은 제외)
         post_dict = {p.id: p for p in posts}
+        couple_id = await get_user_couple_id_async(user_id, db)
         formatted_results = []
         for result in results:
-            post_id = result["metadata"].get("post_id")
-            if post_id and post_id in post_dict:
-                post = post_dict[post_id]
+            post = post_dict.get(result["post_id"])
+            if post and post.board_type in ("private", "vault"):
+                if not couple_id or post.couple_id != couple_id:
+                    continue
+            if post:
                 formatted_results.append({
                     "post_id": post.id,
                     "title": post.title,
                     "content": post.content[:200] + "..." if len(post.content) > 200 else post.content,
                     "board_type": post.board_type,
-                    "similarity_score": result.get("score", 0),
+                    "score": result["score"],
+                    "similarity_score": result.get("vector_score"),
+                    "keyword_rank": result.get("keyword_rank"),
+                    "vector_rank": result.get("vector_rank"),
                     "created_at": post.created_at.isoformat() if post.created_at else None
                 })
+                if len(formatted_results) >= k:
+                    break
         
         return {
             "message": "posts_searched",
             "data": {
                 "query": query,
+                "mode": mode,
                 "results": formatted_results,
                 "total": len(formatted_results)
             }
@@ -74,26 +91,66 @@ async def get_posts_vector_stats():
     }
 
 
-@router.post("/vector/posts/batch-vectorize")
+@router.get("/vector/posts/keyword-index/stats")
+async def get_keyword_index_stats():
+    """
+    게시글 키워드 역색인 통계 (문서/용어/포스팅 수)
+    """
+    return {
+        "message": "keyword_index_stats_retrieved",
+        "data": keyword_index.get_stats()
+    }
+
+
+@router.get("/vector/embedding-cache/stats")
+async def get_embedding_cache_stats():
+    """
+    임베딩 캐시 통계 (적중률, 저장된 벡터 수)
+    """
+    return {
+        "message": "embedding_cache_stats_retrieved",
+        "data": vector_db.get_embedding_cache_stats()
+    }
+
+
+@router.post("/vector/posts/batch-vectorize", status_code=202)
 async def batch_vectorize_posts(
     limit: int = Query(100, ge=1, le=1000, description="처리할 최대 게시글 수"),
-    user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    user_id: int = Depends(get_current_user_id)
 ):
     """
     기존 게시글들을 일괄 벡터화 (관리자용)
+    index_posts.py와 같은 체크포인트로 이어서 limit개를 백그라운드에서 색인하고 바로 응답합니다.
+    진행 상황은 /vector/posts/index-status에서 확인합니다.
     """
-    try:
-        count = post_vector_service.batch_vectorize_posts(db, limit)
-        return {
-            "message": "posts_vectorized",
-            "data": {
-                "vectorized_count": count,
-                "limit": limit
-            }
+    if not post_vector_service.VECTOR_DB_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Vector DB를 사용할 수 없습니다")
+    
+    started = post_vector_service.start_bulk_index(max_posts=limit)
+    return {
+        "message": "post_indexing_started" if started else "post_indexing_already_running",
+        "data": {
+            "limit": limit,
+            "status_url": "/api/vector/posts/index-status",
+            "checkpoint": post_vector_service.load_index_checkpoint()
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"일괄 벡터화 실패: {str(e)}")
+    }
+
+
+@router.get("/vector/posts/index-status")
+async def get_post_index_status(
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    게시글 대량 색인(index_posts.py, batch-vectorize) 체크포인트 조회
+    """
+    return {
+        "message": "post_index_status_retrieved",
+        "data": {
+            "running": post_vector_service.is_bulk_index_running(),
+            "checkpoint": post_vector_service.load_index_checkpoint()
+        }
+    }
 
 
 @router.get("/vector/user/memory")
@@ -12,7 +12,7 @@ router = APIRouter(tags=["vendor"])
 
 # 결혼식 프로필
 @router.post("/wedding-profiles")
-async def create_wedding_profile(
+def create_wedding_profile(
     request: WeddingProfileCreateReq,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -21,7 +21,7 @@ async def create_wedding_profile(
     return vendor_controller.create_wedding_profile(user_id, request, db)
 
 @router.get("/wedding-profiles")
-async def get_wedding_profiles(
+def get_wedding_profiles(
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
@@ -29,7 +29,7 @@ async def get_wedding_profiles(
     return vendor_controller.get_wedding_profiles(user_id, db)
 
 @router.get("/wedding-profiles/{profile_id}")
-async def get_wedding_profile(
+def get_wedding_profile(
     profile_id: int,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -38,7 +38,7 @@ async def get_wedding_profile(
     return vendor_controller.get_wedding_profile(profile_id, user_id, db)
 
 @router.put("/wedding-profiles/{profile_id}")
-async def update_wedding_profile(
+def update_wedding_profile(
     profile_id: int,
     request: WeddingProfileUpdateReq,
     user_id: int = Depends(get_current_user_id),
@@ -48,7 +48,7 @@ async def update_wedding_profile(
     return vendor_controller.update_wedding_profile(profile_id, user_id, request, db)
 
 @router.delete("/wedding-profiles/{profile_id}")
-async def delete_wedding_profile(
+def delete_wedding_profile(
     profile_id: int,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -58,7 +58,7 @@ async def delete_wedding_profile(
 
 # 업체 추천
 @router.get("/vendors/recommend")
-async def recommend_vendors(
+def recommend_vendors(
     wedding_profile_id: int = Query(...),
     vendor_type: str | None = Query(None),
     min_price: float | None = Query(None),
@@ -82,7 +82,7 @@ async def recommend_vendors(
     return vendor_controller.recommend_vendors(user_id, request, db)
 
 @router.get("/vendors")
-async def get_vendors(
+def get_vendors(
     vendor_type: str | None = Query(None, description="제휴 업체 타입 필터"),
     category: str | None = Query(None, description="카테고리 필터 (vendor_type보다 우선)"),
     db: Session = Depends(get_db)
@@ -91,7 +91,7 @@ async def get_vendors(
     return vendor_controller.get_vendors(vendor_type, category, db)
 
 @router.get("/vendors/my-vendor")
-async def get_my_vendor(
+def get_my_vendor(
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
@@ -99,7 +99,7 @@ async def get_my_vendor(
     return vendor_controller.get_my_vendor(user_id, db)
 
 @router.get("/vendors/{vendor_id}")
-async def get_vendor(
+def get_vendor(
     vendor_id: int,
     db: Session = Depends(get_db)
 ):
@@ -108,7 +108,7 @@ async def get_vendor(
 
 # 찜 기능
 @router.post("/favorites")
-async def create_favorite(
+def create_favorite(
     request: FavoriteVendorCreateReq,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -117,7 +117,7 @@ async def create_favorite(
     return vendor_controller.create_favorite(user_id, request, db)
 
 @router.get("/favorites")
-async def get_favorites(
+def get_favorites(
     wedding_profile_id: int | None = Query(None),
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -126,7 +126,7 @@ async def get_favorites(
     return vendor_controller.get_favorites(user_id, wedding_profile_id, db)
 
 @router.delete("/favorites/{favorite_id}")
-async def delete_favorite(
+def delete_favorite(
     favorite_id: int,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
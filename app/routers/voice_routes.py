@@ -1,21 +1,24 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Depends
+from sqlalchemy.orm import Session
 from app.schemas import VoiceProcessReq
 from app.controllers import voice_controller
+from app.core.database import get_db
 
 router = APIRouter(tags=["voice"])
 
 @router.post("/voice/process")
-async def process_voice(request: VoiceProcessReq):
+async def process_voice(request: VoiceProcessReq, db: Session = Depends(get_db)):
     """음성 처리 (STT + 자동 정리 파이프라인)"""
-    return await voice_controller.process_voice(request)
+    return await voice_controller.process_voice(request, db)
 
 @router.post("/voice/response")
 async def generate_voice_response(
     query: str = Query(...),
-    user_id: int = Query(...)
+    user_id: int = Query(...),
+    db: Session = Depends(get_db)
 ):
     """음성 질문에 대한 답변 생성"""
-    return await voice_controller.generate_response(query, user_id)
+    return await voice_controller.generate_response(query, user_id, db)
 
 
 
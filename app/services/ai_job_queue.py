@@ -0,0 +1,398 @@
+"""
+AI 백그라운드 작업 큐 서비스 - MySQL(ai_jobs 테이블) 기반
+게시글은 저장 즉시 응답하고, 벡터화/요약/태그/감성 분석은 워커 프로세스가 처리합니다.
+
+사용하려면 (기본값은 꺼짐 - 요청 처리 중에 바로 AI 호출)
+1. python migrate.py (ai_jobs 테이블, 마이그레이션 0003)
+2. 워커 실행: python run_ai_worker.py --workers 4 (Docker: --target worker 이미지)
+3. AI_JOBS_ENABLED=true
+"""
+import asyncio
+import hashlib
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.db import AIJob, AIJobStatus, Post, Tag
+
+# 작업 큐 사용 여부 (false면 요청 안에서 AI 처리)
+# ai_jobs 테이블과 워커 프로세스가 모두 있어야 하므로 기본값은 false
+AI_JOBS_ENABLED = os.getenv("AI_JOBS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+POST_ENRICHMENT_JOB = "post_enrichment"
+
+# 게시글 작성 시 수행할 작업
+POST_CREATE_TASKS = ("tags", "summary", "sentiment", "vectorize")
+# 문서 보관함(OCR) 업로드 시 수행할 작업
+DOCUMENT_UPLOAD_TASKS = ("tags", "summary", "vectorize")
+
+MAX_ATTEMPTS = int(os.getenv("AI_JOB_MAX_ATTEMPTS", "5"))
+RETRY_BASE_SECONDS = float(os.getenv("AI_JOB_RETRY_BASE_SECONDS", "5"))
+RETRY_MAX_SECONDS = float(os.getenv("AI_JOB_RETRY_MAX_SECONDS", "600"))
+LOCK_TIMEOUT_SECONDS = float(os.getenv("AI_JOB_LOCK_TIMEOUT_SECONDS", "300"))
+
+
+class RetryableJobError(Exception):
+    """일시적 실패 (모델 서버/Vector DB 장애 등) - 백오프 후 재시도"""
+
+
+# ============================================
+# 작업 등록 (API 서버)
+# ============================================
+
+def compute_content_hash(title: str, content: str) -> str:
+    """게시글 제목+내용 해시 (멱등성 키에 사용)"""
+    return hashlib.sha256(f"{title}\n{content}".encode("utf-8")).hexdigest()[:32]
+
+
+def build_post_job_key(post_id: int, title: str, content: str) -> str:
+    return f"{POST_ENRICHMENT_JOB}:{post_id}:{compute_content_hash(title, content)}"
+
+
+async def enqueue_post_job(
+    db: AsyncSession,
+    post: Post,
+    tasks: Iterable[str],
+    requeue_completed: bool = False
+) -> AIJob:
+    """
+    게시글 AI 후처리 작업 등록 (커밋은 호출자가 수행)
+
+    같은 게시글 + 같은 내용이면 기존 작업을 재사용합니다.
+    실패(FAILED)한 작업은 다시 대기 상태로 되돌립니다.
+    requeue_completed=True면 완료(DONE)된 작업도 다시 실행합니다
+    (게시글을 수정했다가 이전 내용으로 되돌린 경우 벡터를 다시 맞추기 위함).
+    이전 내용으로 등록된 미완료 작업의 작업 목록도 함께 넘겨받습니다.
+    """
+    key = build_post_job_key(post.id, post.title, post.content)
+    tasks = _merge_tasks(tasks, await _unfinished_tasks(db, post.id, key))
+    job = (await db.execute(select(AIJob).where(AIJob.idempotency_key == key))).scalar_one_or_none()
+    if job:
+        missing_tasks = [task for task in tasks if task not in job.tasks.split(",")]
+        if missing_tasks:
+            job.tasks = ",".join(job.tasks.split(",") + missing_tasks)
+        if job.status == AIJobStatus.FAILED or (
+            (requeue_completed or missing_tasks) and job.status == AIJobStatus.DONE
+        ):
+            job.status = AIJobStatus.PENDING
+            job.attempts = 0
+            job.run_after = datetime.now()
+        return job
+
+    job = AIJob(
+        job_type=POST_ENRICHMENT_JOB,
+        post_id=post.id,
+        idempotency_key=key,
+        tasks=",".join(tasks),
+        status=AIJobStatus.PENDING,
+        attempts=0,
+        max_attempts=MAX_ATTEMPTS,
+        run_after=datetime.now()
+    )
+    try:
+        async with db.begin_nested():
+            db.add(job)
+    except IntegrityError:
+        # 다른 요청이 같은 작업을 동시에 등록한 경우
+        job = (await db.execute(select(AIJob).where(AIJob.idempotency_key == key))).scalar_one()
+    return job
+
+
+def _merge_tasks(tasks: Iterable[str], extra: Iterable[str]) -> List[str]:
+    """작업 목록 합치기 (순서 유지, 중복 제거)"""
+    return list(dict.fromkeys([*tasks, *extra]))
+
+
+async def _unfinished_tasks(db: AsyncSession, post_id: int, key: str) -> List[str]:
+    """
+    같은 게시글의 이전 내용으로 등록된 미완료(PENDING/RUNNING) 작업의 작업 목록
+
+    수정으로 등록되는 작업은 vectorize뿐이라, 아직 처리되지 않은 작성 작업(tags/summary/sentiment)을
+    새 작업으로 옮기지 않으면 이전 작업이 "superseded"로 끝나면서 태그/요약/감성 분석이 영영 채워지지 않음
+    """
+    rows = (await db.execute(
+        select(AIJob.tasks).where(
+            AIJob.post_id == post_id,
+            AIJob.idempotency_key != key,
+            AIJob.status.in_((AIJobStatus.PENDING, AIJobStatus.RUNNING))
+        )
+    )).scalars().all()
+    return [task for tasks in rows if tasks for task in tasks.split(",")]
+
+
+def _carry_over_tasks(db: Session, job: AIJob, current_key: str) -> None:
+    """
+    superseded 처리 시 이 작업의 작업 목록을 현재 내용의 작업으로 옮김
+    (이전 작업이 재시도 대기 중일 때 새 작업이 등록되어 등록 시점에 합쳐지지 않은 경우 대비)
+    """
+    current = db.query(AIJob).filter(AIJob.idempotency_key == current_key).first()
+    if not current:
+        return
+    tasks = current.tasks.split(",") if current.tasks else []
+    missing = [task for task in job.tasks.split(",") if task and task not in tasks]
+    if not missing:
+        return
+    current.tasks = ",".join(tasks + missing)
+    if current.status in (AIJobStatus.DONE, AIJobStatus.FAILED):
+        current.status = AIJobStatus.PENDING
+        current.attempts = 0
+        current.run_after = datetime.now()
+    db.commit()
+
+
+def serialize_job(job: AIJob) -> Dict:
+    """작업 상태 응답 포맷"""
+    return {
+        "job_id": job.id,
+        "job_type": job.job_type,
+        "post_id": job.post_id,
+        "tasks": job.tasks.split(",") if job.tasks else [],
+        "status": job.status.value if hasattr(job.status, "value") else str(job.status),
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "last_error": job.last_error,
+        "run_after": job.run_after.isoformat() if job.run_after else None,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None
+    }
+
+
+# ============================================
+# 작업 처리 (워커 프로세스)
+# ============================================
+
+def claim_next_job(db: Session, worker_id: str) -> Optional[AIJob]:
+    """
+    실행 가능한 작업 하나를 가져와 RUNNING으로 표시
+    MySQL 8의 SKIP LOCKED로 여러 워커가 같은 작업을 가져가지 않도록 합니다.
+    """
+    now = datetime.now()
+    job = db.query(AIJob).filter(
+        AIJob.status == AIJobStatus.PENDING,
+        AIJob.run_after <= now
+    ).order_by(AIJob.run_after, AIJob.id)\
+        .with_for_update(skip_locked=True)\
+        .first()
+
+    if not job:
+        db.rollback()
+        return None
+
+    job.status = AIJobStatus.RUNNING
+    job.locked_by = worker_id
+    job.locked_at = now
+    job.attempts += 1
+    db.commit()
+    return job
+
+
+def requeue_stale_jobs(db: Session) -> int:
+    """
+    워커가 비정상 종료되어 RUNNING에 남은 작업을 다시 대기 상태로 전환
+    시도 횟수를 모두 쓴 작업(매번 워커를 죽이는 작업 등)은 재등록하지 않고 FAILED 처리
+    """
+    now = datetime.now()
+    stale = (
+        AIJob.status == AIJobStatus.RUNNING,
+        AIJob.locked_at < now - timedelta(seconds=LOCK_TIMEOUT_SECONDS)
+    )
+    failed = db.query(AIJob).filter(
+        *stale,
+        AIJob.attempts >= AIJob.max_attempts
+    ).update(
+        {
+            AIJob.status: AIJobStatus.FAILED,
+            AIJob.last_error: "작업 처리 중 워커가 중단되었습니다 (최대 시도 횟수 초과)",
+            AIJob.locked_by: None,
+            AIJob.locked_at: None,
+            AIJob.finished_at: now
+        },
+        synchronize_session=False
+    )
+    count = db.query(AIJob).filter(*stale).update(
+        {AIJob.status: AIJobStatus.PENDING, AIJob.locked_by: None, AIJob.locked_at: None},
+        synchronize_session=False
+    )
+    db.commit()
+    if failed:
+        print(f"❌ 최대 시도 횟수를 넘긴 중단 AI 작업 {failed}개를 실패 처리했습니다.")
+    if count:
+        print(f"♻️ 중단된 AI 작업 {count}개를 재등록했습니다.")
+    return count
+
+
+def _finish_job(db: Session, job: AIJob, error: Optional[str] = None) -> None:
+    job.status = AIJobStatus.DONE
+    job.last_error = error
+    job.locked_by = None
+    job.locked_at = None
+    job.finished_at = datetime.now()
+    db.commit()
+
+
+def _fail_job(db: Session, job: AIJob, error: str) -> None:
+    """실패 기록 후 지수 백오프로 재시도 예약 (최대 횟수 초과 시 FAILED)"""
+    job.last_error = error[:2000]
+    job.locked_by = None
+    job.locked_at = None
+    if job.attempts >= job.max_attempts:
+        job.status = AIJobStatus.FAILED
+        job.finished_at = datetime.now()
+        print(f"❌ AI 작업 최종 실패 (job_id={job.id}, post_id={job.post_id}): {error}")
+    else:
+        delay = min(RETRY_BASE_SECONDS * (2 ** (job.attempts - 1)), RETRY_MAX_SECONDS)
+        job.status = AIJobStatus.PENDING
+        job.run_after = datetime.now() + timedelta(seconds=delay)
+        print(f"⚠️ AI 작업 실패, {delay:.0f}초 후 재시도 (job_id={job.id}, 시도 {job.attempts}/{job.max_attempts}): {error}")
+    db.commit()
+
+
+def _get_or_create_tags(db: Session, names: List[str]) -> List[Tag]:
+    tags = []
+    for name in names:
+        cleaned = (name or "").strip()
+        if not cleaned or any(tag.name == cleaned for tag in tags):
+            continue
+        tag = db.query(Tag).filter(Tag.name == cleaned).first()
+        if not tag:
+            tag = Tag(name=cleaned)
+            db.add(tag)
+            db.flush()
+        tags.append(tag)
+    return tags
+
+
+async def process_post_job(db: Session, job: AIJob) -> Optional[str]:
+    """
+    게시글 AI 후처리 실행
+
+    이미 채워진 필드는 건너뛰므로 재시도해도 안전합니다.
+    Returns:
+        작업을 건너뛴 경우 사유 (정상 처리 시 None)
+    Raises:
+        RetryableJobError: 일부 작업이 일시적으로 실패한 경우
+    """
+    from app.services.enrichment_service import enrich_text, ENRICHMENT_TASKS
+    from app.services import post_vector_service
+
+    post = db.query(Post).filter(Post.id == job.post_id).first()
+    if not post:
+        # 삭제 직전에 다른 작업이 저장한 벡터가 남지 않도록 정리
+        if post_vector_service.VECTOR_DB_AVAILABLE:
+            post_vector_service.delete_post_vectors(job.post_id)
+        return "post_deleted"
+    current_key = build_post_job_key(post.id, post.title, post.content)
+    if current_key != job.idempotency_key:
+        # 게시글이 수정되어 새 작업이 등록된 경우 (남은 작업은 새 작업에서 처리)
+        _carry_over_tasks(db, job, current_key)
+        return "superseded"
+
+    tasks = set(job.tasks.split(","))
+    pending_enrichment = []
+    if "tags" in tasks and not post.tags:
+        pending_enrichment.append("tags")
+    if "summary" in tasks and not post.summary:
+        pending_enrichment.append("summary")
+    if "sentiment" in tasks and not post.sentiment_label:
+        pending_enrichment.append("sentiment")
+
+    failed = []
+    if pending_enrichment:
+        enrichment = await enrich_text(
+            post.content,
+            tasks=[name for name in ENRICHMENT_TASKS if name in pending_enrichment]
+        )
+        if "tags" in pending_enrichment and enrichment["tags"]:
+            post.tags = _get_or_create_tags(db, enrichment["tags"])
+        if "summary" in pending_enrichment:
+            if enrichment["summary"]:
+                post.summary = enrichment["summary"]
+            else:
+                failed.append("summary")
+        if "sentiment" in pending_enrichment:
+            if enrichment["sentiment"]:
+                post.sentiment_label = enrichment["sentiment"]["label"]
+                post.sentiment_score = enrichment["sentiment"]["confidence"]
+            else:
+                failed.append("sentiment")
+        db.commit()
+
+    if "vectorize" in tasks and post_vector_service.VECTOR_DB_AVAILABLE:
+        if not post_vector_service.vectorize_post(post):
+            failed.append("vectorize")
+
+    if failed:
+        raise RetryableJobError(f"failed_tasks={','.join(failed)}")
+    return None
+
+
+async def run_job(job_id: int) -> None:
+    """작업 하나를 처리하고 결과(완료/재시도/실패)를 기록"""
+    db = SessionLocal()
+    try:
+        job = db.query(AIJob).filter(AIJob.id == job_id).first()
+        if not job:
+            return
+        try:
+            skipped = await process_post_job(db, job)
+            _finish_job(db, job, skipped)
+            print(f"✅ AI 작업 완료 (job_id={job.id}, post_id={job.post_id}{', ' + skipped if skipped else ''})")
+        except Exception as e:
+            db.rollback()
+            _fail_job(db, job, f"{type(e).__name__}: {e}")
+    finally:
+        db.close()
+
+
+async def run_worker(worker_id: Optional[str] = None, poll_interval: float = 1.0, max_jobs: Optional[int] = None) -> int:
+    """
+    작업 큐 워커 루프 (워커 프로세스 1개당 1개)
+
+    Args:
+        worker_id: 워커 식별자 (None이면 호스트명:PID)
+        poll_interval: 대기 작업이 없을 때 폴링 간격 (초)
+        max_jobs: 처리할 최대 작업 수 (None이면 무한 실행)
+
+    Returns:
+        처리한 작업 수
+    """
+    from app.services import model_client
+
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    processed = 0
+    last_stale_check = datetime.min
+    print(f"🚀 AI 작업 워커 시작: {worker_id}")
+    await model_client.start_health_monitor()
+
+    try:
+        while max_jobs is None or processed < max_jobs:
+            db = SessionLocal()
+            try:
+                if datetime.now() - last_stale_check > timedelta(seconds=LOCK_TIMEOUT_SECONDS / 2):
+                    requeue_stale_jobs(db)
+                    last_stale_check = datetime.now()
+                job = claim_next_job(db, worker_id)
+                job_id = job.id if job else None
+            finally:
+                db.close()
+
+            if job_id is None:
+                if max_jobs is not None:
+                    break
+                await asyncio.sleep(poll_interval)
+                continue
+
+            await run_job(job_id)
+            processed += 1
+    finally:
+        await model_client.stop_health_monitor()
+        await model_client.close_http_client()
+
+    return processed
@@ -0,0 +1,196 @@
+"""
+예산 저장소 - MySQL(budget_items / user_total_budgets) 기반
+
+워커 프로세스마다 따로 들고 있던 메모리 dict 대신 DB를 사용하므로
+gunicorn 워커가 여러 개여도 같은 예산 데이터를 봅니다.
+
+- 조회 범위: 본인 항목 + 연결된 커플의 공유 항목 (user_id / couple_id 인덱스 사용)
+- 카테고리별 합계는 DB에서 GROUP BY로 계산
+- 파일 Import/OCR 결과는 bulk_create_items로 한 트랜잭션에 일괄 저장
+"""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.couple_helpers import get_user_couple_id
+from app.models.db import BudgetItem, UserTotalBudget, BudgetCategory, PayerEnum
+
+# 요청 필드 중 컬럼에 바로 대응하는 것 (payment_schedule은 metadata에 저장)
+ITEM_FIELDS = ("item_name", "estimated_budget", "actual_expense", "quantity", "unit", "notes")
+
+
+def _to_category(value) -> BudgetCategory:
+    try:
+        return BudgetCategory(str(value).strip().lower())
+    except ValueError:
+        return BudgetCategory.ETC
+
+
+def _to_payer(value) -> PayerEnum:
+    try:
+        return PayerEnum(str(value).strip().lower())
+    except ValueError:
+        return PayerEnum.BOTH
+
+
+def _enum_value(value):
+    return value.value if hasattr(value, "value") else value
+
+
+def _visible_filter(user_id: int, db: Session):
+    """본인 항목 + 커플 공유 항목"""
+    couple_id = get_user_couple_id(user_id, db)
+    if couple_id:
+        return or_(BudgetItem.user_id == user_id, BudgetItem.couple_id == couple_id)
+    return BudgetItem.user_id == user_id
+
+
+def _apply_fields(item: BudgetItem, data: Dict) -> None:
+    for field in ITEM_FIELDS:
+        if field in data and data[field] is not None:
+            setattr(item, field, data[field])
+    if data.get("category") is not None:
+        item.category = _to_category(data["category"])
+    if data.get("payer") is not None:
+        item.payer = _to_payer(data["payer"])
+    if data.get("payment_schedule") is not None:
+        item.metadata_json = {**(item.metadata_json or {}), "payment_schedule": data["payment_schedule"]}
+    if data.get("metadata"):
+        item.metadata_json = {**(item.metadata_json or {}), **data["metadata"]}
+
+
+def _build_item(user_id: int, couple_id: Optional[int], data: Dict) -> BudgetItem:
+    now = datetime.now()
+    item = BudgetItem(
+        user_id=user_id,
+        couple_id=couple_id,
+        item_name=data.get("item_name") or "항목",
+        category=BudgetCategory.ETC,
+        estimated_budget=0,
+        actual_expense=0,
+        quantity=1,
+        payer=PayerEnum.BOTH,
+        created_at=now,
+        updated_at=now
+    )
+    _apply_fields(item, data)
+    return item
+
+
+def item_to_dict(item: BudgetItem) -> Dict:
+    """API 응답 형식으로 변환"""
+    metadata = item.metadata_json or {}
+    return {
+        "id": item.id,
+        "item_name": item.item_name,
+        "category": _enum_value(item.category),
+        "estimated_budget": float(item.estimated_budget or 0),
+        "actual_expense": float(item.actual_expense or 0),
+        "unit": item.unit,
+        "quantity": float(item.quantity or 0),
+        "notes": item.notes,
+        "payer": _enum_value(item.payer),
+        "payment_schedule": metadata.get("payment_schedule", []),
+        "created_at": item.created_at.strftime("%Y-%m-%d") if item.created_at else None,
+        "updated_at": item.updated_at.strftime("%Y-%m-%d") if item.updated_at else None
+    }
+
+
+# ============================================
+# 예산 항목
+# ============================================
+
+def create_item(db: Session, user_id: int, data: Dict) -> BudgetItem:
+    """예산 항목 1개 생성"""
+    item = _build_item(user_id, get_user_couple_id(user_id, db), data)
+    db.add(item)
+    db.commit()
+    db.refresh(item)
+    return item
+
+
+def bulk_create_items(db: Session, user_id: int, rows: Iterable[Dict]) -> List[Dict]:
+    """
+    예산 항목 일괄 생성 (Excel/CSV Import, 영수증 OCR)
+    INSERT를 한 트랜잭션으로 묶고, 생성된 id는 flush 시점에 함께 받아옵니다.
+    커밋 후 항목마다 다시 SELECT하지 않도록 응답용 dict로 반환합니다.
+    """
+    couple_id = get_user_couple_id(user_id, db)
+    items = [_build_item(user_id, couple_id, row) for row in rows]
+    if not items:
+        return []
+    try:
+        db.add_all(items)
+        db.flush()
+        created = [item_to_dict(item) for item in items]
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return created
+
+
+def get_item(db: Session, item_id: int, user_id: int) -> Optional[BudgetItem]:
+    """조회 권한이 있는 예산 항목 (없으면 None)"""
+    return db.scalar(
+        select(BudgetItem).where(BudgetItem.id == item_id, _visible_filter(user_id, db))
+    )
+
+
+def list_items(db: Session, user_id: int) -> List[BudgetItem]:
+    """사용자(커플)의 예산 항목 목록"""
+    return list(db.scalars(
+        select(BudgetItem).where(_visible_filter(user_id, db)).order_by(BudgetItem.id)
+    ))
+
+
+def update_item(db: Session, item: BudgetItem, data: Dict) -> BudgetItem:
+    """예산 항목 수정 (None인 필드는 유지)"""
+    _apply_fields(item, data)
+    db.commit()
+    db.refresh(item)
+    return item
+
+
+def delete_item(db: Session, item: BudgetItem) -> None:
+    db.delete(item)
+    db.commit()
+
+
+def get_category_totals(db: Session, user_id: int) -> Dict[str, Dict]:
+    """카테고리별 예상/실제 합계와 항목 수 (GROUP BY)"""
+    rows = db.execute(
+        select(
+            BudgetItem.category,
+            func.coalesce(func.sum(BudgetItem.estimated_budget), 0),
+            func.coalesce(func.sum(BudgetItem.actual_expense), 0),
+            func.count(BudgetItem.id)
+        )
+        .where(_visible_filter(user_id, db))
+        .group_by(BudgetItem.category)
+    ).all()
+    return {
+        _enum_value(category): {"estimated": float(estimated), "actual": float(actual), "count": count}
+        for category, estimated, actual, count in rows
+    }
+
+
+# ============================================
+# 총 예산
+# ============================================
+
+def get_total_budget(db: Session, user_id: int) -> float:
+    total = db.get(UserTotalBudget, user_id)
+    return float(total.total_budget) if total else 0.0
+
+
+def set_total_budget(db: Session, user_id: int, amount: float) -> float:
+    total = db.get(UserTotalBudget, user_id)
+    if total:
+        total.total_budget = amount
+    else:
+        db.add(UserTotalBudget(user_id=user_id, total_budget=amount))
+    db.commit()
+    return float(amount)
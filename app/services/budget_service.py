@@ -4,10 +4,10 @@
 import json
 import re
 from typing import Dict, List, Optional
-from datetime import datetime
-from app.models.memory import BUDGET_ITEMS, BudgetItem, COUNTERS
+from sqlalchemy.orm import Session
 from app.services.model_client import chat_with_model
-from app.services import ocr_service
+from app.services.llm_scheduler import PRIORITY_BATCH
+from app.services import ocr_service, budget_repository
 import pandas as pd
 import io
 
@@ -45,7 +45,7 @@ async def structure_text_with_llm(extracted_text: str) -> List[Dict]:
 JSON 배열만 응답해주세요."""
 
     try:
-        response = await chat_with_model(prompt, model="gemma3:4b")
+        response = await chat_with_model(prompt, model="gemma3:4b", priority=PRIORITY_BATCH)
         
         if response:
             # JSON 부분만 추출
@@ -77,28 +77,11 @@ async def process_budget_document(file_data: bytes, filename: str, content_type:
     return structured_items
 
 
-def get_category_summary(user_id: int) -> Dict:
-    """카테고리별 합계 계산"""
-    items = [item for item in BUDGET_ITEMS.values() if item.user_id == user_id]
-    
-    category_totals = {}
-    total_estimated = 0.0
-    total_actual = 0.0
-    
-    for item in items:
-        category = item.category
-        if category not in category_totals:
-            category_totals[category] = {
-                "estimated": 0.0,
-                "actual": 0.0,
-                "count": 0
-            }
-        
-        category_totals[category]["estimated"] += item.estimated_budget
-        category_totals[category]["actual"] += item.actual_expense
-        category_totals[category]["count"] += 1
-        total_estimated += item.estimated_budget
-        total_actual += item.actual_expense
+def get_category_summary(user_id: int, db: Session) -> Dict:
+    """카테고리별 합계 계산 (DB GROUP BY)"""
+    category_totals = budget_repository.get_category_totals(db, user_id)
+    total_estimated = sum(totals["estimated"] for totals in category_totals.values())
+    total_actual = sum(totals["actual"] for totals in category_totals.values())
     
     return {
         "category_totals": category_totals,
@@ -108,29 +91,32 @@ def get_category_summary(user_id: int) -> Dict:
     }
 
 
-def export_to_excel(user_id: int) -> bytes:
+def _export_rows(user_id: int, db: Session) -> List[Dict]:
+    return [
+        {
+            "항목명": item["item_name"],
+            "카테고리": item["category"],
+            "예상 예산": item["estimated_budget"],
+            "실제 지출": item["actual_expense"],
+            "수량": item["quantity"],
+            "단위": item["unit"] or "",
+            "담당자": item["payer"],
+            "비고": item["notes"] or ""
+        }
+        for item in map(budget_repository.item_to_dict, budget_repository.list_items(db, user_id))
+    ]
+
+
+def export_to_excel(user_id: int, db: Session) -> bytes:
     """예산 데이터를 Excel 파일로 Export"""
-    items = [item for item in BUDGET_ITEMS.values() if item.user_id == user_id]
+    data = _export_rows(user_id, db)
     
-    if not items:
+    if not data:
         # 빈 데이터프레임 생성
         df = pd.DataFrame(columns=[
             "항목명", "카테고리", "예상 예산", "실제 지출", "수량", "단위", "담당자", "비고"
         ])
     else:
-        data = []
-        for item in items:
-            data.append({
-                "항목명": item.item_name,
-                "카테고리": item.category,
-                "예상 예산": item.estimated_budget,
-                "실제 지출": item.actual_expense,
-                "수량": item.quantity,
-                "단위": item.unit or "",
-                "담당자": item.payer,
-                "비고": item.notes or ""
-            })
-        
         df = pd.DataFrame(data)
     
     # Excel 파일 생성
@@ -139,7 +125,7 @@ def export_to_excel(user_id: int) -> bytes:
         df.to_excel(writer, index=False, sheet_name='예산서')
         
         # 카테고리별 합계 시트 추가
-        summary = get_category_summary(user_id)
+        summary = get_category_summary(user_id, db)
         summary_data = []
         for category, totals in summary["category_totals"].items():
             summary_data.append({
@@ -157,101 +143,49 @@ def export_to_excel(user_id: int) -> bytes:
     return output.read()
 
 
-def export_to_csv(user_id: int) -> str:
+def export_to_csv(user_id: int, db: Session) -> str:
     """예산 데이터를 CSV로 Export"""
-    items = [item for item in BUDGET_ITEMS.values() if item.user_id == user_id]
+    data = _export_rows(user_id, db)
     
-    if not items:
+    if not data:
         return "항목명,카테고리,예상 예산,실제 지출,수량,단위,담당자,비고\n"
     
-    data = []
-    for item in items:
-        data.append({
-            "항목명": item.item_name,
-            "카테고리": item.category,
-            "예상 예산": item.estimated_budget,
-            "실제 지출": item.actual_expense,
-            "수량": item.quantity,
-            "단위": item.unit or "",
-            "담당자": item.payer,
-            "비고": item.notes or ""
-        })
-    
     df = pd.DataFrame(data)
     return df.to_csv(index=False, encoding='utf-8-sig')
 
 
-def import_from_excel(user_id: int, file_data: bytes) -> List[BudgetItem]:
-    """Excel 파일에서 예산 데이터 Import"""
+def _rows_from_dataframe(df: pd.DataFrame) -> List[Dict]:
+    """Export와 같은 한글 컬럼명의 DataFrame을 예산 항목 dict로 변환"""
+    rows = []
+    for _, row in df.iterrows():
+        rows.append({
+            "item_name": str(row.get("항목명", "")),
+            "category": str(row.get("카테고리", "etc")),
+            "estimated_budget": float(row.get("예상 예산", 0)),
+            "actual_expense": float(row.get("실제 지출", 0)),
+            "quantity": float(row.get("수량", 1)),
+            "unit": str(row.get("단위", "")) if pd.notna(row.get("단위")) else None,
+            "payer": str(row.get("담당자", "both")),
+            "notes": str(row.get("비고", "")) if pd.notna(row.get("비고")) else None
+        })
+    return rows
+
+
+def import_from_excel(user_id: int, file_data: bytes, db: Session) -> List[Dict]:
+    """Excel 파일에서 예산 데이터 Import (한 트랜잭션으로 일괄 저장)"""
     try:
         df = pd.read_excel(io.BytesIO(file_data))
-        
-        items = []
-        for _, row in df.iterrows():
-            item_id = COUNTERS["budget"]
-            COUNTERS["budget"] += 1
-            
-            item = BudgetItem(
-                id=item_id,
-                user_id=user_id,
-                item_name=str(row.get("항목명", "")),
-                category=str(row.get("카테고리", "etc")),
-                estimated_budget=float(row.get("예상 예산", 0)),
-                actual_expense=float(row.get("실제 지출", 0)),
-                quantity=float(row.get("수량", 1)),
-                unit=str(row.get("단위", "")) if pd.notna(row.get("단위")) else None,
-                payer=str(row.get("담당자", "both")),
-                notes=str(row.get("비고", "")) if pd.notna(row.get("비고")) else None,
-                created_at=datetime.now().strftime("%Y-%m-%d"),
-                updated_at=datetime.now().strftime("%Y-%m-%d")
-            )
-            
-            BUDGET_ITEMS[item_id] = item
-            items.append(item)
-        
-        return items
+        return budget_repository.bulk_create_items(db, user_id, _rows_from_dataframe(df))
     except Exception as e:
         print(f"⚠️ Excel Import 실패: {e}")
         return []
 
 
-def import_from_csv(user_id: int, csv_data: str) -> List[BudgetItem]:
-    """CSV 파일에서 예산 데이터 Import"""
+def import_from_csv(user_id: int, csv_data: str, db: Session) -> List[Dict]:
+    """CSV 파일에서 예산 데이터 Import (한 트랜잭션으로 일괄 저장)"""
     try:
         df = pd.read_csv(io.StringIO(csv_data))
-        
-        items = []
-        for _, row in df.iterrows():
-            item_id = COUNTERS["budget"]
-            COUNTERS["budget"] += 1
-            
-            item = BudgetItem(
-                id=item_id,
-                user_id=user_id,
-                item_name=str(row.get("항목명", "")),
-                category=str(row.get("카테고리", "etc")),
-                estimated_budget=float(row.get("예상 예산", 0)),
-                actual_expense=float(row.get("실제 지출", 0)),
-                quantity=float(row.get("수량", 1)),
-                unit=str(row.get("단위", "")) if pd.notna(row.get("단위")) else None,
-                payer=str(row.get("담당자", "both")),
-                notes=str(row.get("비고", "")) if pd.notna(row.get("비고")) else None,
-                created_at=datetime.now().strftime("%Y-%m-%d"),
-                updated_at=datetime.now().strftime("%Y-%m-%d")
-            )
-            
-            BUDGET_ITEMS[item_id] = item
-            items.append(item)
-        
-        return items
+        return budget_repository.bulk_create_items(db, user_id, _rows_from_dataframe(df))
     except Exception as e:
         print(f"⚠️ CSV Import 실패: {e}")
         return []
-
-
-
-
-
-
-
-
@@ -3,11 +3,11 @@
 """
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from app.models.memory import (
-    CALENDAR_EVENTS, TODOS, USER_WEDDING_DATES, COUNTERS,
-    CalendarEvent, Todo
-)
+from sqlalchemy.orm import Session
+from app.models.db import CalendarEvent
+from app.core.couple_helpers import get_couple_filter_with_user
 from app.services.model_client import chat_with_model, get_model_api_base_url
+from app.services.llm_scheduler import PRIORITY_BATCH
 import httpx
 import json
 
@@ -82,7 +82,7 @@ async def generate_personalized_timeline(
 
 JSON 배열 형식으로 응답해주세요."""
 
-            response = await chat_with_model(prompt, model="gemma3:4b")
+            response = await chat_with_model(prompt, model="gemma3:4b", priority=PRIORITY_BATCH)
             
             if response:
                 # LLM 응답에서 JSON 추출 시도
@@ -146,47 +146,61 @@ async def create_timeline_from_wedding_date(
     return events
 
 
-def get_user_events(user_id: int, start_date: str | None = None, end_date: str | None = None) -> List[CalendarEvent]:
-    """사용자 일정 조회"""
-    events = [e for e in CALENDAR_EVENTS.values() if e.user_id == user_id]
+def _enum_value(value):
+    return value.value if hasattr(value, "value") else value
+
+
+def _format_date(value) -> str | None:
+    return value.strftime("%Y-%m-%d") if value else None
+
+
+def get_user_events(user_id: int, db: Session, start_date: str | None = None, end_date: str | None = None) -> List[CalendarEvent]:
+    """사용자(커플) 일정 조회 (할일 제외, 날짜순)"""
+    query = db.query(CalendarEvent).filter(
+        get_couple_filter_with_user(user_id, db, CalendarEvent),
+        CalendarEvent.category != "todo"
+    )
     
     if start_date:
-        events = [e for e in events if e.start_date >= start_date]
+        query = query.filter(CalendarEvent.start_date >= datetime.strptime(start_date, "%Y-%m-%d").date())
     if end_date:
-        events = [e for e in events if e.start_date <= end_date]
+        query = query.filter(CalendarEvent.start_date <= datetime.strptime(end_date, "%Y-%m-%d").date())
     
-    # 날짜순 정렬
-    events.sort(key=lambda x: x.start_date)
-    return events
+    return query.order_by(CalendarEvent.start_date, CalendarEvent.id).all()
 
 
-def get_user_todos(user_id: int, completed: bool | None = None) -> List[Todo]:
-    """사용자 할일 조회"""
-    todos = [t for t in TODOS.values() if t.user_id == user_id]
+def get_user_todos(user_id: int, db: Session, completed: bool | None = None) -> List[CalendarEvent]:
+    """사용자(커플) 할일 조회 (calendar_events.category='todo')"""
+    query = db.query(CalendarEvent).filter(
+        get_couple_filter_with_user(user_id, db, CalendarEvent),
+        CalendarEvent.category == "todo"
+    )
     
     if completed is not None:
-        todos = [t for t in todos if t.is_completed == completed]
+        query = query.filter(CalendarEvent.is_completed == completed)
+    
+    todos = query.all()
     
     # 우선순위 및 날짜순 정렬
     priority_order = {"high": 0, "medium": 1, "low": 2}
     todos.sort(key=lambda x: (
-        priority_order.get(x.priority, 1),
-        x.due_date or "9999-12-31"
+        priority_order.get(_enum_value(x.priority), 1),
+        x.start_date.strftime("%Y-%m-%d") if x.start_date else "9999-12-31"
     ))
     
     return todos
 
 
-def get_upcoming_events(user_id: int, days: int = 7) -> List[CalendarEvent]:
+def get_upcoming_events(user_id: int, db: Session, days: int = 7) -> List[CalendarEvent]:
     """다가오는 일정 조회"""
     today = datetime.now().strftime("%Y-%m-%d")
     end_date = (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
     
-    events = get_user_events(user_id, start_date=today, end_date=end_date)
+    events = get_user_events(user_id, db, start_date=today, end_date=end_date)
     return [e for e in events if not e.is_completed]
 
 
-def get_week_summary(user_id: int) -> Dict:
+def get_week_summary(user_id: int, db: Session) -> Dict:
     """이번 주 요약 생성 (챗봇 연동용)"""
     today = datetime.now()
     week_start = today - timedelta(days=today.weekday())
@@ -194,13 +208,13 @@ def get_week_summary(user_id: int) -> Dict:
     
     events = get_user_events(
         user_id,
+        db,
         start_date=week_start.strftime("%Y-%m-%d"),
         end_date=week_end.strftime("%Y-%m-%d")
     )
+    todos = get_user_todos(user_id, db, completed=False)
     
-    todos = get_user_todos(user_id, completed=False)
-    
-    high_priority = [e for e in events if e.priority == "high" and not e.is_completed]
+    high_priority = [e for e in events if _enum_value(e.priority) == "high" and not e.is_completed]
     payments = [e for e in events if e.category == "payment" and not e.is_completed]
     
     return {
@@ -214,8 +228,8 @@ def get_week_summary(user_id: int) -> Dict:
             {
                 "id": e.id,
                 "title": e.title,
-                "date": e.start_date,
-                "priority": e.priority,
+                "date": _format_date(e.start_date),
+                "priority": _enum_value(e.priority),
                 "category": e.category
             }
             for e in events[:10]
@@ -224,10 +238,9 @@ def get_week_summary(user_id: int) -> Dict:
             {
                 "id": t.id,
                 "title": t.title,
-                "priority": t.priority,
-                "due_date": t.due_date
+                "priority": _enum_value(t.priority),
+                "due_date": _format_date(t.start_date)
             }
             for t in todos[:10]
         ]
     }
-
@@ -75,15 +75,52 @@ def vectorize_chat_memory(memory: ChatMemory) -> Optional[str]:
         return None
 
 
+def build_chat_memory_filter(
+    user_id: int,
+    include_shared: bool = True,
+    couple_id: Optional[int] = None
+) -> Dict:
+    """
+    채팅 메모리 접근 권한 필터 (Chroma where 절)
+    본인 메모리 또는 같은 커플이 공유한 메모리
+    """
+    if include_shared and couple_id:
+        return {
+            "$or": [
+                {"user_id": user_id},
+                {"$and": [{"is_shared_with_partner": True}, {"couple_id": couple_id}]}
+            ]
+        }
+    return {"user_id": user_id}
+
+
+def can_access_chat_memory(
+    metadata: Dict,
+    user_id: int,
+    include_shared: bool = True,
+    couple_id: Optional[int] = None
+) -> bool:
+    """메타데이터 기준 접근 권한 확인 (build_chat_memory_filter와 같은 조건)"""
+    if metadata.get("user_id") == user_id:
+        return True
+    return bool(
+        include_shared and couple_id
+        and metadata.get("is_shared_with_partner", False)
+        and metadata.get("couple_id") == couple_id
+    )
+
+
 def search_chat_memories(
     query: str,
     user_id: int,
     k: int = 5,
     include_shared: bool = True,
-    couple_id: Optional[int] = None
+    couple_id: Optional[int] = None,
+    query_embedding: Optional[List[float]] = None
 ) -> List[Dict]:
     """
     채팅 메모리 벡터 검색
+    권한 조건을 Chroma 필터로 넘기므로 접근 가능한 메모리 중에서 정확히 상위 k개를 반환합니다.
     
     Args:
         query: 검색 쿼리
@@ -91,6 +128,7 @@ def search_chat_memories(
         k: 반환할 결과 개수
         include_shared: 파트너와 공유된 메모리 포함 여부
         couple_id: 커플 ID (파트너 메모리 검색용)
+        query_embedding: 미리 계산한 쿼리 임베딩 (선택)
     
     Returns:
         검색 결과 리스트 [{"content": str, "metadata": dict, "score": float}, ...]
@@ -99,38 +137,19 @@ def search_chat_memories(
         return []
     
     try:
-        # 필터 구성
-        filter_dict = {}
-        if include_shared and couple_id:
-            # 본인 메모리 또는 파트너와 공유된 메모리
-            # ChromaDB 필터는 단순하므로, 검색 후 필터링
-            pass
-        else:
-            filter_dict["user_id"] = user_id
-        
-        # 벡터 검색 수행
         results = search_similar_documents(
             collection_name=CHAT_MEMORY_COLLECTION,
             query=query,
-            k=k * 2,  # 필터링을 위해 더 많이 가져옴
-            filter=filter_dict if filter_dict else None
+            k=k,
+            filter=build_chat_memory_filter(user_id, include_shared, couple_id),
+            query_embedding=query_embedding
         )
         
-        # 권한 필터링 (본인 메모리 또는 공유된 메모리만)
-        filtered_results = []
-        for result in results:
-            metadata = result.get("metadata", {})
-            result_user_id = metadata.get("user_id")
-            is_shared = metadata.get("is_shared_with_partner", False)
-            result_couple_id = metadata.get("couple_id")
-            
-            # 본인 메모리이거나, 공유된 메모리인 경우만 포함
-            if result_user_id == user_id:
-                filtered_results.append(result)
-            elif include_shared and is_shared and result_couple_id == couple_id:
-                filtered_results.append(result)
-        
-        return filtered_results[:k]
+        # 필터가 적용되지 않은 결과가 섞이지 않도록 한 번 더 확인
+        return [
+            result for result in results
+            if can_access_chat_memory(result.get("metadata", {}), user_id, include_shared, couple_id)
+        ]
         
     except Exception as e:
         print(f"⚠️ 채팅 메모리 검색 오류: {e}")
@@ -1,13 +1,127 @@
 """
 챗봇 서비스 - RAG + 개인 데이터 통합 + Vector DB 검색
 """
+import asyncio
 import json
-from typing import AsyncGenerator, Dict, List, Optional
-from sqlalchemy.orm import Session
+import os
+from typing import AsyncGenerator, AsyncIterator, Dict, List, Optional
+from sqlalchemy.orm import Session, selectinload
 from app.models.db import User, Post, Comment
-from app.services.model_client import chat_with_model, analyze_sentiment, get_model_api_base_url
-from app.services import post_vector_service, user_memory_service, chat_memory_vector_service
-import httpx
+from app.core.couple_helpers import get_user_couple_id
+from app.services.model_client import (
+    chat_with_model, analyze_sentiment, get_model_api_base_url,
+    get_http_client, get_model_api_timeout
+)
+from app.services.llm_scheduler import llm_slot, LLMQueueFull, PRIORITY_INTERACTIVE
+from app.services import rag_retrieval_service
+
+
+# ============================================
+# 모델 응답 스트림 전달 (NDJSON)
+# ============================================
+# true: Model API가 보낸 바이트를 줄 단위 형식만 확인하고 그대로 전달 (토큰마다 json.loads/dumps 하지 않음)
+# false: 줄마다 파싱 후 다시 직렬화 (이전 방식)
+CHAT_STREAM_PASSTHROUGH = os.getenv("CHAT_STREAM_PASSTHROUGH", "true").lower() in ("1", "true", "yes")
+
+
+def _ndjson(data: Dict) -> bytes:
+    return (json.dumps(data) + "\n").encode("utf-8")
+
+
+def _is_json_object_line(line: bytes) -> bool:
+    line = line.strip()
+    return line[:1] == b"{" and line[-1:] == b"}"
+
+
+def _frame_lines(data: bytes) -> bytes:
+    """
+    줄바꿈으로 끝나는 NDJSON 구간에서 JSON 객체 줄만 남김
+    모든 줄이 '{'로 시작해 '}\n'으로 끝나면(일반적인 경우) 나누지 않고 그대로 반환
+    """
+    lines = data.count(b"\n")
+    if data[:1] == b"{" and data.count(b"}\n") == lines and data.count(b"\n{") == lines - 1:
+        return data
+    return b"".join(line.strip() + b"\n" for line in data.split(b"\n") if _is_json_object_line(line))
+
+
+async def _passthrough_ndjson(chunks: AsyncIterator[bytes]) -> AsyncGenerator[bytes, None]:
+    """
+    업스트림 바이트 청크를 완전한 줄 단위로만 잘라 그대로 전달
+    (줄 중간에서 끊긴 청크는 다음 청크와 이어 붙이고, JSON 객체가 아닌 줄은 버림)
+    """
+    pending = b""
+    async for chunk in chunks:
+        if pending:
+            chunk = pending + chunk
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            pending = chunk
+            continue
+        pending = chunk[end:]
+        framed = _frame_lines(chunk if end == len(chunk) else chunk[:end])
+        if framed:
+            yield framed
+    if _is_json_object_line(pending):
+        yield pending.strip() + b"\n"
+
+
+async def _reencode_ndjson(chunks: AsyncIterator[bytes]) -> AsyncGenerator[bytes, None]:
+    """줄마다 json.loads → json.dumps (CHAT_STREAM_PASSTHROUGH=false)"""
+    pending = b""
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line.strip():
+                try:
+                    yield _ndjson(json.loads(line))
+                except json.JSONDecodeError:
+                    pass
+    if pending.strip():
+        try:
+            yield _ndjson(json.loads(pending))
+        except json.JSONDecodeError:
+            pass
+
+
+def _load_user_context_from_db(user_id: int, db: Session) -> Dict:
+    """get_user_context의 DB 조회 부분 (동기 세션, 스레드에서 실행)"""
+    context = {"user_info": None, "recent_posts": [], "recent_comments": []}
+    
+    # DB에서 사용자 정보 조회
+    user = db.query(User).filter(User.id == user_id).first()
+    if user:
+        context["user_info"] = {
+            "nickname": user.nickname,
+            "email": user.email
+        }
+    
+    # 최근 게시글 (최대 10개)
+    user_posts = db.query(Post).options(selectinload(Post.tags))\
+        .filter(Post.user_id == user_id).order_by(Post.created_at.desc()).limit(10).all()
+    context["recent_posts"] = [
+        {
+            "id": p.id,
+            "title": p.title,
+            "content": p.content[:200] + "..." if len(p.content) > 200 else p.content,
+            "board_type": p.board_type,
+            "tags": [tag.name for tag in p.tags] if p.tags else [],
+            "summary": p.summary
+        }
+        for p in user_posts
+    ]
+    
+    # 최근 댓글 (최대 10개)
+    user_comments = db.query(Comment).filter(Comment.user_id == user_id).order_by(Comment.created_at.desc()).limit(10).all()
+    context["recent_comments"] = [
+        {
+            "id": c.id,
+            "post_id": c.post_id,
+            "content": c.content[:100] + "..." if len(c.content) > 100 else c.content
+        }
+        for c in user_comments
+    ]
+    return context
 
 
 async def get_user_context(user_id: int, db: Session = None) -> Dict:
@@ -25,40 +139,9 @@ async def get_user_context(user_id: int, db: Session = None) -> Dict:
         "summary": ""
     }
     
-    # DB 세션이 있으면 DB에서 조회, 없으면 메모리에서 조회
+    # DB 세션이 있으면 DB에서 조회 (동기 세션이므로 스레드에서 실행), 없으면 메모리에서 조회
     if db:
-        # DB에서 사용자 정보 조회
-        user = db.query(User).filter(User.id == user_id).first()
-        if user:
-            context["user_info"] = {
-                "nickname": user.nickname,
-                "email": user.email
-            }
-        
-        # 최근 게시글 (최대 10개)
-        user_posts = db.query(Post).filter(Post.user_id == user_id).order_by(Post.created_at.desc()).limit(10).all()
-        context["recent_posts"] = [
-            {
-                "id": p.id,
-                "title": p.title,
-                "content": p.content[:200] + "..." if len(p.content) > 200 else p.content,
-                "board_type": p.board_type,
-                "tags": [tag.name for tag in p.tags] if p.tags else [],
-                "summary": p.summary
-            }
-            for p in user_posts
-        ]
-        
-        # 최근 댓글 (최대 10개)
-        user_comments = db.query(Comment).filter(Comment.user_id == user_id).order_by(Comment.created_at.desc()).limit(10).all()
-        context["recent_comments"] = [
-            {
-                "id": c.id,
-                "post_id": c.post_id,
-                "content": c.content[:100] + "..." if len(c.content) > 100 else c.content
-            }
-            for c in user_comments
-        ]
+        context.update(await asyncio.to_thread(_load_user_context_from_db, user_id, db))
     else:
         # 메모리 기반 (기존 방식, 하위 호환성)
         from app.models.memory import POSTS, USERS, COMMENTS
@@ -103,12 +186,33 @@ async def get_user_context(user_id: int, db: Session = None) -> Dict:
     return context
 
 
-def build_rag_prompt(
+def start_rag_retrieval(
+    user_message: str,
+    user_id: Optional[int] = None,
+    db: Session = None
+) -> asyncio.Task:
+    """
+    Vector DB 검색을 백그라운드 태스크로 먼저 시작
+    (감정 분석/개인 데이터 조회와 겹쳐서 실행되어 첫 토큰까지의 시간을 줄임)
+    """
+    couple_id = None
+    if user_id and db:
+        try:
+            couple_id = get_user_couple_id(user_id, db)
+        except Exception as e:
+            print(f"⚠️ 커플 정보 조회 실패: {e}")
+    return asyncio.create_task(
+        rag_retrieval_service.retrieve_context(user_message, user_id=user_id, couple_id=couple_id)
+    )
+
+
+async def build_rag_prompt(
     user_message: str,
     context: Dict,
     include_context: bool = True,
     user_id: Optional[int] = None,
-    db: Session = None
+    db: Session = None,
+    retrieval: Optional[asyncio.Task] = None
 ) -> str:
     """
     RAG 기반 프롬프트 생성 (Vector DB 검색 포함)
@@ -118,6 +222,7 @@ def build_rag_prompt(
         context: 기본 컨텍스트
         include_context: 컨텍스트 포함 여부
         user_id: 사용자 ID (Vector DB 검색용)
+        retrieval: start_rag_retrieval()로 미리 시작한 검색 (없으면 여기서 검색)
     """
     system_prompt = """당신은 AI Wedding Planner OS의 전문 웨딩 플래너 챗봇입니다.
 사용자의 개인 데이터(게시판, 예산, 일정)를 분석하여 맞춤형 조언을 제공합니다.
@@ -142,66 +247,44 @@ def build_rag_prompt(
             context_parts.append(f"""[사용자 정보]
 - 닉네임: {user_info.get('nickname', '알 수 없음')}""")
         
-        # 2. Vector DB 기반 게시판 검색 (질문과 관련된 게시글)
+        # 2~4. Vector DB 검색 결과 (게시글 / 사용자 메모리 / 채팅 메모리 - 병렬 검색, 부분 결과 허용)
+        if retrieval is None:
+            retrieval = start_rag_retrieval(user_message, user_id, db)
         try:
-            relevant_posts = post_vector_service.search_posts(
-                query=user_message,
-                k=3,
-                user_id=user_id
-            )
-            if relevant_posts:
-                context_parts.append(f"""[관련 게시글] (Vector DB 검색 결과)
+            retrieved = await retrieval
+        except Exception as e:
+            print(f"⚠️ Vector DB 검색 실패: {e}")
+            retrieved = {}
+        
+        relevant_posts = retrieved.get("posts", [])
+        if relevant_posts:
+            context_parts.append(f"""[관련 게시글] (Vector DB 검색 결과)
 """)
-                for i, post_result in enumerate(relevant_posts, 1):
-                    metadata = post_result.get("metadata", {})
-                    content = post_result.get("content", "")[:200]
-                    context_parts.append(f"""{i}. [{metadata.get('board_type', 'couple')}] {metadata.get('title', '제목 없음')}
+            for i, post_result in enumerate(relevant_posts, 1):
+                metadata = post_result.get("metadata", {})
+                content = post_result.get("content", "")[:200]
+                context_parts.append(f"""{i}. [{metadata.get('board_type', 'couple')}] {metadata.get('title', '제목 없음')}
    내용: {content}...
    유사도: {post_result.get('score', 0):.3f}""")
-        except Exception as e:
-            print(f"⚠️ Vector DB 게시판 검색 실패: {e}")
         
-        # 3. 사용자 메모리 검색 (사용자 선호도/패턴)
-        if user_id:
-            try:
-                user_memories = user_memory_service.search_user_memory(
-                    user_id=user_id,
-                    query=user_message,
-                    k=3
-                )
-                if user_memories:
-                    context_parts.append(f"""[사용자 선호도/패턴] (User Memory)
+        user_memories = retrieved.get("user_memories", [])
+        if user_memories:
+            context_parts.append(f"""[사용자 선호도/패턴] (User Memory)
 """)
-                    for i, memory in enumerate(user_memories, 1):
-                        pref_type = memory.get("metadata", {}).get("preference_type", "general")
-                        content = memory.get("content", "")[:150]
-                        context_parts.append(f"""{i}. [{pref_type}] {content}...""")
-            except Exception as e:
-                print(f"⚠️ 사용자 메모리 검색 실패: {e}")
+            for i, memory in enumerate(user_memories, 1):
+                pref_type = memory.get("metadata", {}).get("preference_type", "general")
+                content = memory.get("content", "")[:150]
+                context_parts.append(f"""{i}. [{pref_type}] {content}...""")
         
-        # 4. 채팅 메모리 검색 (사용자가 저장한 대화 내용)
-        if user_id and db:
-            try:
-                user = db.query(User).filter(User.id == user_id).first()
-                couple_id = user.couple_id if user else None
-                
-                chat_memories = chat_memory_vector_service.search_chat_memories(
-                    query=user_message,
-                    user_id=user_id,
-                    k=3,
-                    include_shared=True,
-                    couple_id=couple_id
-                )
-                if chat_memories:
-                    context_parts.append(f"""[저장된 대화 메모리] (Chat Memory)
+        chat_memories = retrieved.get("chat_memories", [])
+        if chat_memories:
+            context_parts.append(f"""[저장된 대화 메모리] (Chat Memory)
 """)
-                    for i, memory in enumerate(chat_memories, 1):
-                        metadata = memory.get("metadata", {})
-                        title = metadata.get("title", "제목 없음")
-                        content = memory.get("content", "")[:150]
-                        context_parts.append(f"""{i}. [{title}] {content}...""")
-            except Exception as e:
-                print(f"⚠️ 채팅 메모리 검색 실패: {e}")
+            for i, memory in enumerate(chat_memories, 1):
+                metadata = memory.get("metadata", {})
+                title = metadata.get("title", "제목 없음")
+                content = memory.get("content", "")[:150]
+                context_parts.append(f"""{i}. [{title}] {content}...""")
         
         # 4. 최근 게시글 (기존 방식 유지)
         if context.get("recent_posts"):
@@ -253,18 +336,23 @@ async def chat_stream(
     include_context: bool = True,
     db: Session = None,
     model: str | None = None
-) -> AsyncGenerator[str, None]:
-    """챗봇 스트리밍 응답 생성"""
+) -> AsyncGenerator[bytes, None]:
+    """챗봇 스트리밍 응답 생성 (NDJSON 바이트 청크, 한 청크에 여러 줄이 들어 있을 수 있음)"""
+    retrieval = None
     try:
+        # Vector DB 검색을 먼저 시작 (감정 분석/개인 데이터 조회와 동시에 진행)
+        if include_context:
+            retrieval = start_rag_retrieval(message, user_id, db)
+        
         # 감정 분석 (선택적)
         sentiment_result = None
         if any(keyword in message.lower() for keyword in ['스트레스', '힘들', '갈등', '문제', '걱정']):
             sentiment_result = await analyze_sentiment(message, explain=True)
             if sentiment_result:
-                yield json.dumps({
+                yield _ndjson({
                     "type": "sentiment",
                     "data": sentiment_result
-                }) + "\n"
+                })
         
         # 개인 데이터 수집
         context = {}
@@ -272,11 +360,10 @@ async def chat_stream(
             context = await get_user_context(user_id, db)
         
         # RAG 프롬프트 생성 (Vector DB 검색 포함)
-        prompt = build_rag_prompt(message, context, include_context, user_id, db)
+        prompt = await build_rag_prompt(message, context, include_context, user_id, db, retrieval=retrieval)
         
         # 모델 API 호출 (스트리밍)
         # 선택된 모델 또는 환경 변수에서 모델 선택 (기본값: gemini-2.5-flash)
-        import os
         from app.services.model_config import get_model_by_id, get_default_model_for_category
         
         # 모델 선택: 요청에서 전달된 모델 > 환경 변수 > 기본값
@@ -286,53 +373,57 @@ async def chat_stream(
             chat_model = os.getenv("CHAT_MODEL", "gemini-2.5-flash")
             selected_model = chat_model
         
-        base_url = get_model_api_base_url()
-        
-        # Gemini 모델인 경우 Gemini 엔드포인트 사용
-        if selected_model.startswith("gemini"):
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{base_url}/gemini/chat",
-                    json={"message": prompt, "model": selected_model},
-                    headers={"Content-Type": "application/json"}
-                )
-                response.raise_for_status()
-                
-                async for line in response.aiter_lines():
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            # 모델 응답을 그대로 전달
-                            yield json.dumps(data) + "\n"
-                        except json.JSONDecodeError:
-                            pass
-        else:
-            # Ollama 모델인 경우 기존 엔드포인트 사용
-            # DeepSeek R1은 응답이 매우 느릴 수 있으므로 타임아웃을 늘림
-            timeout = 600.0 if selected_model.startswith("deepseek-r1") else 120.0
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    f"{base_url}/chat",
-                    json={"message": prompt, "model": selected_model},
-                    headers={"Content-Type": "application/json"}
+        # 모델별 실행 슬롯을 얻은 뒤 호출 (대기열이 가득 차면 LLMQueueFull로 즉시 실패)
+        async with llm_slot(selected_model, PRIORITY_INTERACTIVE) as slot:
+            base_url = get_model_api_base_url()
+
+            # Gemini 모델인 경우 Gemini 엔드포인트 사용
+            if selected_model.startswith("gemini"):
+                url = f"{base_url}/gemini/chat"
+                timeout = get_model_api_timeout("chat")
+            else:
+                # Ollama 모델인 경우 기존 엔드포인트 사용
+                # DeepSeek R1은 응답이 매우 느릴 수 있으므로 타임아웃을 늘림
+                url = f"{base_url}/chat"
+                timeout = get_model_api_timeout(
+                    "chat_stream_slow" if selected_model.startswith("deepseek-r1") else "chat_stream"
                 )
+            async with get_http_client().stream(
+                "POST",
+                url,
+                json={"message": prompt, "model": selected_model},
+                headers={"Content-Type": "application/json"},
+                timeout=timeout
+            ) as response:
                 response.raise_for_status()
-                
-                async for line in response.aiter_lines():
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            # 모델 응답을 그대로 전달
-                            yield json.dumps(data) + "\n"
-                        except json.JSONDecodeError:
-                            pass
-        
+
+                # 모델 응답을 그대로 전달
+                forward = _passthrough_ndjson if CHAT_STREAM_PASSTHROUGH else _reencode_ndjson
+                async for chunk in forward(response.aiter_bytes()):
+                    yield chunk
+                    if slot.expired():
+                        yield _ndjson({
+                            "type": "error",
+                            "content": "응답 시간이 너무 길어 생성을 중단했습니다."
+                        })
+                        break
+
+    except LLMQueueFull as e:
+        print(f"⛔ {e}")
+        yield _ndjson({
+            "type": "error",
+            "code": "llm_busy",
+            "content": "요청이 많아 지금은 답변할 수 없습니다. 잠시 후 다시 시도해주세요."
+        })
     except Exception as e:
         error_msg = f"챗봇 응답 생성 중 오류가 발생했습니다: {str(e)}"
-        yield json.dumps({
+        yield _ndjson({
             "type": "error",
             "content": error_msg
-        }) + "\n"
+        })
+    finally:
+        if retrieval and not retrieval.done():
+            retrieval.cancel()
 
 
 async def chat_simple(
@@ -343,13 +434,15 @@ async def chat_simple(
 ) -> Dict:
     """챗봇 단순 응답 (비스트리밍)"""
     try:
-        # 개인 데이터 수집
+        # 개인 데이터 수집 (Vector DB 검색은 먼저 시작해 두고 동시에 진행)
         context = {}
+        retrieval = None
         if include_context:
+            retrieval = start_rag_retrieval(message, user_id, db)
             context = await get_user_context(user_id, db)
         
         # RAG 프롬프트 생성 (Vector DB 검색 포함)
-        prompt = build_rag_prompt(message, context, include_context, user_id, db)
+        prompt = await build_rag_prompt(message, context, include_context, user_id, db, retrieval=retrieval)
         
         # 모델 API 호출
         # 환경 변수에서 모델 선택 (기본값: gemma3:4b, Gemini 사용 시: gemini-2.5-flash)
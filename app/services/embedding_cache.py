@@ -0,0 +1,299 @@
+"""
+임베딩 캐시 - (모델명 + 용도·접두어 + 정규화된 텍스트 해시) → float32 벡터
+
+같은 텍스트를 다시 임베딩하지 않도록 OllamaEmbeddings 앞에 두는 디스크 캐시입니다.
+(게시글 재벡터화, 채팅 메모리 재저장, 한 번의 채팅에서 같은 질문을 여러 컬렉션에 검색하는 경우 등)
+키에는 용도(query/document)와 그 용도의 접두어도 들어갑니다.
+(ONNX 백엔드처럼 embed_query / embed_documents가 서로 다른 접두어를 붙이면 같은 텍스트라도 벡터가 다름)
+
+저장 구조 (EMBEDDING_CACHE_DIR/<모델명>/)
+- vectors.f32 : 슬롯 단위 float32 벡터 (np.memmap, capacity × dim)
+- digests.bin : 슬롯마다 키 해시 16바이트 (읽는 도중 슬롯이 교체됐는지 확인용)
+- index.db    : SQLite 인덱스 (key → slot, last_used) - LRU 교체 및 워커 프로세스 간 공유
+
+capacity(EMBEDDING_CACHE_MAX_ENTRIES)를 넘으면 가장 오래 사용하지 않은 슬롯을 재사용합니다.
+"""
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+EMBEDDING_CACHE_DIR = Path(os.getenv("EMBEDDING_CACHE_DIR", "./vector_db/_embedding_cache"))
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "50000"))
+
+DIGEST_SIZE = 16
+# 캐시 적중 시 last_used 갱신은 모아서 한 번에 기록
+TOUCH_FLUSH_SIZE = 256
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 정규화 (유니코드 NFC + 공백 정리)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+def make_key(model: str, text: str, role: str = "document", prefix: str = "") -> bytes:
+    """캐시 키 = blake2b(모델명, 용도, 접두어, 정규화된 텍스트)"""
+    return hashlib.blake2b(
+        f"{model}\0{role}\0{prefix}\0{normalize_text(text)}".encode("utf-8"), digest_size=DIGEST_SIZE
+    ).digest()
+
+
+def _safe_dirname(model: str) -> str:
+    return re.sub(r"[^0-9A-Za-z._-]+", "_", model)
+
+
+class EmbeddingCache:
+    """모델 하나에 대한 영속 임베딩 캐시 (프로세스 간 공유)"""
+
+    def __init__(self, model: str, directory: Path = None, max_entries: int = None):
+        self.model = model
+        self.directory = Path(directory or EMBEDDING_CACHE_DIR) / _safe_dirname(model)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.capacity = max_entries or EMBEDDING_CACHE_MAX_ENTRIES
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.directory / "index.db"), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key BLOB PRIMARY KEY, slot INTEGER NOT NULL UNIQUE, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries (last_used)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+        self.dim: Optional[int] = None
+        self._vectors: Optional[np.memmap] = None
+        self._digests: Optional[np.memmap] = None
+        self._pending_touches: Dict[bytes, float] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+        self._load_storage()
+
+    # ------------------------------------------------------------
+    # 저장소
+    # ------------------------------------------------------------
+
+    def _open_storage(self, dim: int) -> None:
+        vectors_path = self.directory / "vectors.f32"
+        digests_path = self.directory / "digests.bin"
+        mode = "r+" if vectors_path.exists() and digests_path.exists() else "w+"
+        self._vectors = np.memmap(vectors_path, dtype=np.float32, mode=mode, shape=(self.capacity, dim))
+        self._digests = np.memmap(digests_path, dtype=np.uint8, mode=mode, shape=(self.capacity, DIGEST_SIZE))
+        self.dim = dim
+
+    def _load_storage(self) -> bool:
+        """다른 워커가 이미 만든 벡터 파일이 있으면 연결"""
+        row = self._conn.execute("SELECT value FROM meta WHERE name = 'dim'").fetchone()
+        if not row:
+            return False
+        self._open_storage(int(row[0]))
+        return True
+
+    def _ensure_storage(self, dim: int) -> bool:
+        if self.dim is not None:
+            return self.dim == dim
+        self._conn.execute("INSERT OR IGNORE INTO meta (name, value) VALUES ('dim', ?)", (str(dim),))
+        stored = int(self._conn.execute("SELECT value FROM meta WHERE name = 'dim'").fetchone()[0])
+        self._open_storage(stored)
+        return stored == dim
+
+    # ------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------
+
+    def get_many(
+        self, texts: Sequence[str], role: str = "document", prefix: str = ""
+    ) -> List[Optional[List[float]]]:
+        """텍스트별 캐시된 벡터 (없으면 None)"""
+        keys = [make_key(self.model, text, role, prefix) for text in texts]
+        results: List[Optional[List[float]]] = [None] * len(texts)
+
+        with self._lock:
+            if self.dim is None and not self._load_storage():
+                self.misses += len(texts)
+                return results
+            slots = self._lookup_slots(keys)
+            now = time.time()
+            for i, key in enumerate(keys):
+                slot = slots.get(key)
+                if slot is None:
+                    continue
+                vector = np.array(self._vectors[slot])
+                # 다른 워커가 이 슬롯을 교체하는 중이면 미스로 처리
+                if self._digests[slot].tobytes() != key:
+                    continue
+                results[i] = vector.tolist()
+                self._pending_touches[key] = now
+            if len(self._pending_touches) >= TOUCH_FLUSH_SIZE:
+                self._flush_touches()
+
+        found = sum(1 for r in results if r is not None)
+        self.hits += found
+        self.misses += len(texts) - found
+        return results
+
+    def put_many(
+        self, texts: Sequence[str], vectors: Sequence[Sequence[float]], role: str = "document", prefix: str = ""
+    ) -> None:
+        """벡터 저장 (가득 차면 LRU 슬롯 재사용)"""
+        if not texts:
+            return
+        array = np.asarray(vectors, dtype=np.float32)
+        if array.ndim != 2 or len(array) != len(texts):
+            return
+
+        keys = [make_key(self.model, text, role, prefix) for text in texts]
+        with self._lock:
+            conn = self._conn
+            # BEGIN IMMEDIATE로 다른 워커의 쓰기와 직렬화 (파일 생성 포함)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if not self._ensure_storage(array.shape[1]):
+                    conn.execute("ROLLBACK")
+                    return  # 같은 모델명인데 차원이 다르면 캐시하지 않음
+                self._write_touches()
+                now = time.time()
+                for key, vector in zip(keys, array):
+                    row = conn.execute("SELECT slot FROM entries WHERE key = ?", (key,)).fetchone()
+                    if row:
+                        slot = row[0]
+                        conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+                    else:
+                        slot = self._allocate_slot()
+                        conn.execute(
+                            "INSERT INTO entries (key, slot, last_used) VALUES (?, ?, ?)", (key, slot, now)
+                        )
+                    self._digests[slot] = np.frombuffer(b"\0" * DIGEST_SIZE, dtype=np.uint8)
+                    self._vectors[slot] = vector
+                    self._digests[slot] = np.frombuffer(key, dtype=np.uint8)
+                conn.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+
+    def _allocate_slot(self) -> int:
+        conn = self._conn
+        row = conn.execute("SELECT value FROM meta WHERE name = 'next_slot'").fetchone()
+        next_slot = int(row[0]) if row else 0
+        if next_slot < self.capacity:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('next_slot', ?)", (str(next_slot + 1),)
+            )
+            return next_slot
+        key, slot = conn.execute("SELECT key, slot FROM entries ORDER BY last_used LIMIT 1").fetchone()
+        conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        return slot
+
+    def _lookup_slots(self, keys: Sequence[bytes]) -> Dict[bytes, int]:
+        slots: Dict[bytes, int] = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for key, slot in self._conn.execute(
+                f"SELECT key, slot FROM entries WHERE key IN ({placeholders})", chunk
+            ):
+                slots[bytes(key)] = slot
+        return slots
+
+    def _write_touches(self) -> None:
+        if self._pending_touches:
+            self._conn.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                [(ts, key) for key, ts in self._pending_touches.items()]
+            )
+            self._pending_touches.clear()
+
+    def _flush_touches(self) -> None:
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._write_touches()
+            self._conn.execute("COMMIT")
+        except sqlite3.OperationalError:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+
+    def flush(self) -> None:
+        """대기 중인 LRU 갱신과 벡터 파일을 디스크에 반영"""
+        with self._lock:
+            self._flush_touches()
+            if self._vectors is not None:
+                self._vectors.flush()
+                self._digests.flush()
+
+    def stats(self) -> Dict:
+        size = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "model": self.model,
+            "entries": size,
+            "capacity": self.capacity,
+            "dim": self.dim,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
+
+
+class CachedEmbeddings:
+    """
+    임베딩 모델 래퍼 - 캐시에 없는 텍스트만 한 번에 모아 원본 모델로 임베딩
+    embed_documents / embed_query 인터페이스를 그대로 제공하므로 Chroma에 바로 넘길 수 있습니다.
+    원본 모델에 query_prefix / document_prefix가 있으면 (OnnxEmbeddings) 용도별 접두어를 키에 넣습니다.
+    """
+
+    def __init__(self, base, model: str, cache: EmbeddingCache = None):
+        self.base = base
+        self.model = model
+        self.cache = cache or EmbeddingCache(model)
+
+    def _prefix(self, role: str) -> str:
+        return getattr(self.base, f"{role}_prefix", None) or ""
+
+    def _embed(self, texts: List[str], embed_fn, role: str) -> List[List[float]]:
+        prefix = self._prefix(role)
+        try:
+            cached = self.cache.get_many(texts, role, prefix)
+        except Exception as e:
+            print(f"⚠️ 임베딩 캐시 조회 실패: {e}")
+            return embed_fn(texts)
+
+        missing: Dict[str, List[int]] = {}
+        for i, vector in enumerate(cached):
+            if vector is None:
+                missing.setdefault(texts[i], []).append(i)
+        if not missing:
+            return cached
+
+        missing_texts = list(missing)
+        vectors = embed_fn(missing_texts)
+        for text, vector in zip(missing_texts, vectors):
+            for i in missing[text]:
+                cached[i] = vector
+        try:
+            self.cache.put_many(missing_texts, vectors, role, prefix)
+        except Exception as e:
+            print(f"⚠️ 임베딩 캐시 저장 실패: {e}")
+        return cached
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(list(texts), self.base.embed_documents, "document")
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([text], lambda texts: [self.base.embed_query(texts[0])], "query")[0]
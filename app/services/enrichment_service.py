@@ -0,0 +1,101 @@
+"""
+AI 보강(Enrichment) 서비스 - 태그/요약/감성 분석을 동시에 호출
+세 모델 호출을 병렬로 실행하므로 지연 시간은 가장 느린 단일 호출 수준으로 줄어듭니다.
+"""
+import asyncio
+import os
+from typing import Any, Dict, Iterable, Optional
+
+from app.services.model_client import analyze_sentiment, auto_tag_text, summarize_text
+
+# 전체 보강 단계의 공유 마감 시간 (초)
+ENRICHMENT_DEADLINE = float(os.getenv("AI_ENRICHMENT_DEADLINE", "10"))
+
+ENRICHMENT_TASKS = ("tags", "summary", "sentiment")
+
+# 작업 실패/타임아웃 시 사용할 기본값
+_FALLBACKS: Dict[str, Any] = {
+    "tags": [],
+    "summary": None,
+    "sentiment": None,
+}
+
+_TASK_LABELS = {
+    "tags": "자동 태그 생성",
+    "summary": "요약 생성",
+    "sentiment": "감성 분석",
+}
+
+
+async def _run_tags(text: str):
+    return await auto_tag_text(text) or []
+
+
+async def _run_summary(text: str):
+    summary_res = await summarize_text(text)
+    return summary_res.get("summary") if summary_res else None
+
+
+async def _run_sentiment(text: str):
+    sentiment_res = await analyze_sentiment(text)
+    if not sentiment_res:
+        return None
+    return {
+        "label": sentiment_res.get("label", "neutral"),
+        "confidence": sentiment_res.get("confidence", 0.5)
+    }
+
+
+_RUNNERS = {
+    "tags": _run_tags,
+    "summary": _run_summary,
+    "sentiment": _run_sentiment,
+}
+
+
+async def enrich_text(
+    text: str,
+    tasks: Iterable[str] = ENRICHMENT_TASKS,
+    deadline: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    텍스트에 대한 AI 보강 작업을 동시에 실행
+
+    Args:
+        text: 분석할 텍스트
+        tasks: 실행할 작업 ("tags", "summary", "sentiment")
+        deadline: 모든 작업이 공유하는 마감 시간 (초, None이면 ENRICHMENT_DEADLINE)
+
+    Returns:
+        {"tags": [...], "summary": str | None, "sentiment": {"label", "confidence"} | None}
+        실패하거나 마감 시간을 넘긴 작업은 기본값으로 채워집니다.
+    """
+    names = [name for name in tasks if name in _RUNNERS]
+    result = {name: _FALLBACKS[name] for name in names}
+    if not names:
+        return result
+
+    running = {
+        asyncio.create_task(_RUNNERS[name](text)): name
+        for name in names
+    }
+    done, pending = await asyncio.wait(
+        running.keys(),
+        timeout=deadline if deadline is not None else ENRICHMENT_DEADLINE
+    )
+
+    for task in pending:
+        task.cancel()
+        print(f"⚠️ {_TASK_LABELS[running[task]]} 시간 초과 (기본값 사용)")
+
+    for task in done:
+        name = running[task]
+        try:
+            value = task.result()
+        except Exception as e:
+            print(f"⚠️ {_TASK_LABELS[name]} 실패 (기본값 사용): {e}")
+            continue
+        if value is not None:
+            result[name] = value
+
+    return result
@@ -123,40 +123,39 @@ async def recommend_invitation_text(
     Returns:
         {"options": [option1, option2, ...]} 형식의 딕셔너리 (5개 옵션)
     """
-    from app.services.model_client import get_model_api_base_url
-    import httpx
+    from app.services.model_client import get_model_api_base_url, get_http_client, get_model_api_timeout
     
     base_url = get_model_api_base_url()
     url = f"{base_url}/invitation/text-recommend"
     
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                url,
-                json={
-                    "groom_name": groom_name,
-                    "bride_name": bride_name,
-                    "wedding_date": wedding_date,
-                    "wedding_time": wedding_time,
-                    "wedding_location": wedding_location,
-                    "style": style,
-                    "additional_info": additional_info
-                },
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            # 모델 서버 응답 형식: {"message": "text_recommended", "data": {"options": [...]}}
-            if "data" in result and "options" in result["data"]:
-                return result["data"]
+        response = await get_http_client().post(
+            url,
+            json={
+                "groom_name": groom_name,
+                "bride_name": bride_name,
+                "wedding_date": wedding_date,
+                "wedding_time": wedding_time,
+                "wedding_location": wedding_location,
+                "style": style,
+                "additional_info": additional_info
+            },
+            headers={"Content-Type": "application/json"},
+            timeout=get_model_api_timeout("invitation_text")
+        )
+        response.raise_for_status()
+        result = response.json()
+        
+        # 모델 서버 응답 형식: {"message": "text_recommended", "data": {"options": [...]}}
+        if "data" in result and "options" in result["data"]:
+            return result["data"]
+        else:
+            # 하위 호환성: 직접 options가 있는 경우
+            if "options" in result:
+                return {"options": result["options"]}
             else:
-                # 하위 호환성: 직접 options가 있는 경우
-                if "options" in result:
-                    return {"options": result["options"]}
-                else:
-                    raise ValueError("올바른 응답 형식이 아닙니다")
-                    
+                raise ValueError("올바른 응답 형식이 아닙니다")
+                
     except httpx.TimeoutException:
         print("⚠️ 문구 추천 API 호출 타임아웃 (60초 초과)")
     except httpx.HTTPStatusError as e:
@@ -0,0 +1,460 @@
+"""
+게시글 키워드 검색 - 프로세스 내 역색인 (BM25)
+
+- 토큰화: 한글은 글자 바이그램(웨딩홀 → 웨딩, 딩홀), 영문/숫자는 단어 단위 (금액의 천 단위 쉼표 제거: 3,500,000 → 3500000)
+- 역색인: 용어별 array('I') 문서 번호 + array('B') 빈도 (파이썬 객체 없이 연속 메모리)
+- 삭제/수정: 문서를 비활성(tombstone)으로 표시하고, 비활성 비율이 커지면 한 번에 압축
+- 동기화: 서버 시작 시 DB에서 전체 로드 → 게시글 작성/수정/삭제 시 즉시 반영
+          + KEYWORD_INDEX_SYNC_INTERVAL마다 updated_at 기준으로 다른 워커 프로세스의 변경분 반영
+          + KEYWORD_INDEX_PRUNE_INTERVAL마다 색인된 post_id를 posts와 대조해 다른 워커에서 삭제된 게시글 제거
+            (삭제된 행은 updated_at으로 찾을 수 없으므로 id 범위 단위로 존재 여부 확인)
+
+벤치마크: python benchmark_keyword_index.py --posts 1000000
+"""
+import asyncio
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import select
+
+KEYWORD_INDEX_ENABLED = os.getenv("KEYWORD_INDEX_ENABLED", "true").lower() in ("1", "true", "yes")
+KEYWORD_INDEX_SYNC_INTERVAL = float(os.getenv("KEYWORD_INDEX_SYNC_INTERVAL", "60"))
+KEYWORD_INDEX_PRUNE_INTERVAL = float(os.getenv("KEYWORD_INDEX_PRUNE_INTERVAL", "600"))
+KEYWORD_INDEX_MAX_CHARS = int(os.getenv("KEYWORD_INDEX_MAX_CHARS", "4000"))  # 게시글당 색인할 최대 글자 수
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 2  # 제목 토큰은 본문보다 2배로 계산
+COMPACT_RATIO = 0.25  # 비활성 문서가 활성 문서의 25%를 넘으면 압축
+COMPACT_MIN_DEAD = 1000
+
+_THOUSANDS = re.compile(r"(?<=\d),(?=\d{3})")
+_TOKEN = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]+|[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """한글 글자 바이그램 + 영문/숫자 단어 토큰"""
+    text = _THOUSANDS.sub("", unicodedata.normalize("NFC", text or "").lower())
+    tokens = []
+    for match in _TOKEN.finditer(text):
+        word = match.group()
+        if word[0] < "ㄱ":  # 영문/숫자
+            tokens.append(word)
+        elif len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class KeywordIndex:
+    """게시글 역색인 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._terms: Dict[str, int] = {}
+        self._postings_docs: List[array] = []  # term_id -> 문서 번호 (오름차순)
+        self._postings_tfs: List[array] = []  # term_id -> 문서 내 빈도 (최대 255)
+
+        # 문서 번호(0부터 연속) 기준 열 배열
+        self._post_ids = array("q")
+        self._doc_lens = array("I")
+        self._alive = bytearray()
+        self._boards = array("B")
+        self._hashes = array("q")
+
+        self._doc_by_post: Dict[int, int] = {}
+        self._board_codes: Dict[str, int] = {}
+        self._live = 0
+        self._total_len = 0
+
+        # 검색용 numpy 열 (색인이 바뀔 때까지 재사용)
+        self._version = 0
+        self._snapshot_version = -1
+        self._snapshot = None
+
+    def __len__(self) -> int:
+        return self._live
+
+    # ------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------
+
+    def add(self, post_id: int, title: str, content: str, board_type: Optional[str] = None) -> bool:
+        """
+        게시글 색인 (이미 있으면 교체, 내용이 같으면 건너뜀)
+
+        Returns:
+            색인을 변경했는지 여부
+        """
+        content = (content or "")[:KEYWORD_INDEX_MAX_CHARS]
+        content_hash = hash((title, content, board_type))
+        counts = Counter(tokenize(content))
+        for token in tokenize(title):
+            counts[token] += TITLE_WEIGHT
+
+        with self._lock:
+            doc = self._doc_by_post.get(post_id)
+            if doc is not None:
+                if self._hashes[doc] == content_hash:
+                    return False
+                self._remove_doc(doc)
+
+            self._version += 1
+            doc = len(self._post_ids)
+            self._post_ids.append(post_id)
+            self._doc_lens.append(sum(counts.values()))
+            self._alive.append(1)
+            self._boards.append(self._board_code(board_type))
+            self._hashes.append(content_hash)
+            self._doc_by_post[post_id] = doc
+            self._live += 1
+            self._total_len += self._doc_lens[doc]
+
+            for token, tf in counts.items():
+                term = self._terms.get(token)
+                if term is None:
+                    term = len(self._postings_docs)
+                    self._terms[token] = term
+                    self._postings_docs.append(array("I"))
+                    self._postings_tfs.append(array("B"))
+                self._postings_docs[term].append(doc)
+                self._postings_tfs[term].append(min(tf, 255))
+            return True
+
+    def remove(self, post_id: int) -> bool:
+        with self._lock:
+            doc = self._doc_by_post.get(post_id)
+            if doc is None:
+                return False
+            self._remove_doc(doc)
+            self._maybe_compact()
+            return True
+
+    def post_ids(self) -> List[int]:
+        """색인된 게시글 id (오름차순)"""
+        with self._lock:
+            return sorted(self._doc_by_post)
+
+    def _remove_doc(self, doc: int) -> None:
+        self._version += 1
+        self._alive[doc] = 0
+        self._live -= 1
+        self._total_len -= self._doc_lens[doc]
+        del self._doc_by_post[self._post_ids[doc]]
+
+    def _board_code(self, board_type: Optional[str]) -> int:
+        key = board_type or ""
+        code = self._board_codes.get(key)
+        if code is None:
+            code = len(self._board_codes)
+            self._board_codes[key] = code
+        return code
+
+    def _maybe_compact(self) -> None:
+        dead = len(self._post_ids) - self._live
+        if dead >= COMPACT_MIN_DEAD and dead > self._live * COMPACT_RATIO:
+            self.compact()
+
+    def compact(self) -> None:
+        """비활성 문서를 역색인에서 제거하고 문서 번호를 다시 매김"""
+        with self._lock:
+            alive = np.frombuffer(bytes(self._alive), dtype=np.uint8).astype(bool)
+            remap = np.cumsum(alive, dtype=np.int64) - 1
+
+            for term in range(len(self._postings_docs)):
+                docs = np.array(self._postings_docs[term], dtype=np.uint32)
+                keep = alive[docs]
+                if keep.all():
+                    self._postings_docs[term] = array("I", remap[docs].astype(np.uint32).tobytes())
+                    continue
+                tfs = np.array(self._postings_tfs[term], dtype=np.uint8)[keep]
+                self._postings_docs[term] = array("I", remap[docs[keep]].astype(np.uint32).tobytes())
+                self._postings_tfs[term] = array("B", tfs.tobytes())
+
+            def _filter(column: array, typecode: str, dtype) -> array:
+                return array(typecode, np.array(column, dtype=dtype)[alive].tobytes())
+
+            self._post_ids = _filter(self._post_ids, "q", np.int64)
+            self._doc_lens = _filter(self._doc_lens, "I", np.uint32)
+            self._boards = _filter(self._boards, "B", np.uint8)
+            self._hashes = _filter(self._hashes, "q", np.int64)
+            self._alive = bytearray(b"\1" * len(self._post_ids))
+            self._doc_by_post = {post_id: doc for doc, post_id in enumerate(self._post_ids)}
+            self._version += 1
+
+    def _columns(self):
+        """(BM25 길이 정규화 값, 활성 여부, 게시판 코드) numpy 배열 - 색인이 바뀐 경우에만 다시 계산"""
+        if self._snapshot_version != self._version:
+            # 배열은 복사해서 사용 (numpy 버퍼가 남아 있으면 array.append가 실패하므로)
+            doc_lens = np.array(self._doc_lens, dtype=np.float32)
+            avgdl = self._total_len / self._live
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lens / avgdl)
+            alive = np.frombuffer(bytes(self._alive), dtype=np.uint8).astype(bool)
+            boards = np.array(self._boards, dtype=np.uint8)
+            self._snapshot = (norm, alive, boards)
+            self._snapshot_version = self._version
+        return self._snapshot
+
+    # ------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------
+
+    def search(self, query: str, k: int = 10, board_type: Optional[str] = None) -> List[Dict]:
+        """
+        BM25 검색
+
+        Returns:
+            [{"post_id": int, "score": float}, ...] (점수 내림차순)
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or k <= 0:
+            return []
+
+        with self._lock:
+            if not self._live:
+                return []
+            board_code = None
+            if board_type is not None:
+                board_code = self._board_codes.get(board_type)
+                if board_code is None:
+                    return []
+
+            term_ids = [self._terms[token] for token in tokens if token in self._terms]
+            if not term_ids:
+                return []
+
+            norm, alive, boards = self._columns()
+            if len(term_ids) == 1:
+                # 용어 1개면 포스팅 목록이 곧 후보 (문서 수만큼의 점수 배열 불필요)
+                candidates = np.array(self._postings_docs[term_ids[0]], dtype=np.int64)
+                scores_view = self._term_scores(term_ids[0], candidates, norm)
+            else:
+                scores = np.zeros(len(norm), dtype=np.float32)
+                for term in term_ids:
+                    docs = np.array(self._postings_docs[term], dtype=np.int64)
+                    scores[docs] += self._term_scores(term, docs, norm)
+                candidates = np.flatnonzero(scores)
+                scores_view = scores[candidates]
+
+            mask = alive[candidates]
+            if board_code is not None:
+                mask &= boards[candidates] == board_code
+            candidates = candidates[mask]
+            scores_view = scores_view[mask]
+            if not len(candidates):
+                return []
+
+            if len(candidates) > k:
+                top = np.argpartition(-scores_view, k - 1)[:k]
+            else:
+                top = np.arange(len(candidates))
+            top = top[np.argsort(-scores_view[top], kind="stable")]
+            return [
+                {"post_id": self._post_ids[candidates[i]], "score": float(scores_view[i])}
+                for i in top
+            ]
+
+    def _term_scores(self, term: int, docs: np.ndarray, norm: np.ndarray) -> np.ndarray:
+        tfs = np.array(self._postings_tfs[term], dtype=np.float32)
+        df = len(docs)
+        idf = math.log(1 + (self._live - df + 0.5) / (df + 0.5))
+        return idf * tfs * (BM25_K1 + 1) / (tfs + norm[docs])
+
+    def stats(self) -> Dict:
+        with self._lock:
+            postings = sum(len(p) for p in self._postings_docs)
+            return {
+                "documents": self._live,
+                "deleted": len(self._post_ids) - self._live,
+                "terms": len(self._terms),
+                "postings": postings,
+                "postings_bytes": postings * 5,
+                "avg_doc_len": round(self._total_len / self._live, 1) if self._live else 0
+            }
+
+
+# ============================================
+# 게시글 색인 (프로세스 전역)
+# ============================================
+
+_index = KeywordIndex()
+_ready = threading.Event()
+_watermark: Optional[datetime] = None
+_sync_task: Optional[asyncio.Task] = None
+
+
+def get_index() -> KeywordIndex:
+    return _index
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+
+def index_post(post) -> None:
+    """게시글 작성/수정 시 즉시 반영"""
+    if KEYWORD_INDEX_ENABLED:
+        _index.add(post.id, post.title, post.content, post.board_type)
+
+
+def remove_post(post_id: int) -> None:
+    """게시글 삭제 시 즉시 반영"""
+    if KEYWORD_INDEX_ENABLED:
+        _index.remove(post_id)
+
+
+def search_posts(query: str, k: int = 10, board_type: Optional[str] = None) -> List[Dict]:
+    if not KEYWORD_INDEX_ENABLED or not _ready.is_set():
+        return []
+    return _index.search(query, k=k, board_type=board_type)
+
+
+def get_stats() -> Dict:
+    return {"enabled": KEYWORD_INDEX_ENABLED, "ready": _ready.is_set(), **_index.stats()}
+
+
+def build_from_db(batch_size: int = 2000) -> int:
+    """DB 전체 게시글 색인 (id 순서로 끊어 읽기)"""
+    global _watermark
+    from app.core.database import SessionLocal
+    from app.models.db import Post
+
+    started = time.monotonic()
+    count = 0
+    last_id = 0
+    watermark = None
+    db = SessionLocal()
+    try:
+        while True:
+            rows = db.execute(
+                select(Post.id, Post.title, Post.content, Post.board_type, Post.updated_at)
+                .where(Post.id > last_id).order_by(Post.id).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            for post_id, title, content, board_type, updated_at in rows:
+                _index.add(post_id, title, content, board_type)
+                if updated_at and (watermark is None or updated_at > watermark):
+                    watermark = updated_at
+            count += len(rows)
+            last_id = rows[-1][0]
+    finally:
+        db.close()
+
+    _watermark = watermark or datetime(1970, 1, 1)
+    _ready.set()
+    print(f"✅ 키워드 색인 로드 완료: 게시글 {count}개 ({time.monotonic() - started:.1f}s)")
+    return count
+
+
+def sync_from_db(batch_size: int = 2000) -> int:
+    """마지막 동기화 이후 수정된 게시글 반영 (다른 워커 프로세스에서 작성/수정된 게시글)"""
+    global _watermark
+    from app.core.database import SessionLocal
+    from app.models.db import Post
+
+    if _watermark is None:
+        return 0
+    # 같은 시각에 커밋된 행을 놓치지 않도록 약간 겹치게 조회 (내용이 같으면 add가 건너뜀)
+    since = _watermark - timedelta(seconds=1)
+    changed = 0
+    db = SessionLocal()
+    try:
+        last = (since, 0)
+        while True:
+            rows = db.execute(
+                select(Post.id, Post.title, Post.content, Post.board_type, Post.updated_at)
+                .where(
+                    (Post.updated_at > last[0])
+                    | ((Post.updated_at == last[0]) & (Post.id > last[1]))
+                )
+                .order_by(Post.updated_at, Post.id).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            for post_id, title, content, board_type, _ in rows:
+                if _index.add(post_id, title, content, board_type):
+                    changed += 1
+            last = (rows[-1][4], rows[-1][0])
+            _watermark = max(_watermark, rows[-1][4])
+    finally:
+        db.close()
+    return changed
+
+
+def prune_deleted_from_db(batch_size: int = 5000) -> int:
+    """
+    다른 워커 프로세스에서 삭제된 게시글을 색인에서 제거
+
+    색인된 id를 batch_size개씩 끊어 그 id 범위의 posts.id만 PK로 읽고, DB에 없는 id를 제거합니다.
+    """
+    from app.core.database import SessionLocal
+    from app.models.db import Post
+
+    indexed = _index.post_ids()
+    removed = 0
+    db = SessionLocal()
+    try:
+        for start in range(0, len(indexed), batch_size):
+            chunk = indexed[start:start + batch_size]
+            existing = set(db.execute(
+                select(Post.id).where(Post.id >= chunk[0], Post.id <= chunk[-1])
+            ).scalars())
+            for post_id in chunk:
+                if post_id not in existing and _index.remove(post_id):
+                    removed += 1
+    finally:
+        db.close()
+    if removed:
+        print(f"♻️ 키워드 색인에서 삭제된 게시글 {removed}개 제거")
+    return removed
+
+
+async def _sync_loop(interval: float) -> None:
+    try:
+        await asyncio.to_thread(build_from_db)
+    except Exception as e:
+        print(f"⚠️ 키워드 색인 로드 실패 (벡터 검색만 사용): {e}")
+        return
+    last_prune = time.monotonic()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(sync_from_db)
+        except Exception as e:
+            print(f"⚠️ 키워드 색인 동기화 실패 (다음 주기에 재시도): {e}")
+        if KEYWORD_INDEX_PRUNE_INTERVAL > 0 and time.monotonic() - last_prune >= KEYWORD_INDEX_PRUNE_INTERVAL:
+            last_prune = time.monotonic()
+            try:
+                await asyncio.to_thread(prune_deleted_from_db)
+            except Exception as e:
+                print(f"⚠️ 키워드 색인 삭제 반영 실패 (다음 주기에 재시도): {e}")
+
+
+def start_keyword_index(interval: Optional[float] = None) -> None:
+    """색인 로드 + 주기 동기화 백그라운드 태스크 시작 (lifespan에서 호출)"""
+    global _sync_task
+    if not KEYWORD_INDEX_ENABLED or (_sync_task and not _sync_task.done()):
+        return
+    _sync_task = asyncio.create_task(_sync_loop(interval or KEYWORD_INDEX_SYNC_INTERVAL))
+
+
+async def stop_keyword_index() -> None:
+    global _sync_task
+    if _sync_task:
+        _sync_task.cancel()
+        try:
+            await _sync_task
+        except asyncio.CancelledError:
+            pass
+        _sync_task = None
@@ -0,0 +1,209 @@
+"""
+LLM 요청 스케줄러 - 모델별 동시 실행 제한 + 우선순위 대기열 + 대기열 초과 시 즉시 거절
+
+Ollama 서버 하나에서 gemma3:4b 같은 모델에 요청이 몰리면 서로 GPU/CPU를 빼앗아 모두 느려지므로,
+Model API로 가는 모든 LLM 호출(채팅 스트림, chat_with_model)은 모델별 슬롯을 얻은 뒤에만 보냅니다.
+
+- 모델별 동시 실행 수: LLM_MAX_CONCURRENCY (Ollama 모델), LLM_MAX_CONCURRENCY_GEMINI (Gemini API),
+  모델별 재정의 LLM_MAX_CONCURRENCY_<모델명> (예: LLM_MAX_CONCURRENCY_GEMMA3_4B=1)
+- 우선순위: interactive(채팅) > voice(음성 비서) > batch(OCR/일정 구조화 등 백그라운드 작업)
+  슬롯이 비면 우선순위가 높은 대기 요청부터, 같은 우선순위 안에서는 먼저 온 순서대로 실행
+- 우선순위별 대기열 길이 LLM_QUEUE_MAX_<PRIORITY>, 대기 시간 LLM_QUEUE_TIMEOUT_<PRIORITY>(초)
+  대기열이 가득 차면 기다리지 않고 즉시 LLMQueueFull, 대기 시간을 넘기면 LLMQueueTimeout
+- 슬롯 하나를 LLM_MAX_STREAM_SECONDS 넘게 쓰는 스트림은 호출 측에서 중단 (slot.expired())
+- 제한은 워커 프로세스 단위 (gunicorn 워커 N개면 모델별 최대 N × 제한)
+"""
+import asyncio
+import heapq
+import itertools
+import os
+import re
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_VOICE = "voice"
+PRIORITY_BATCH = "batch"
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_VOICE, PRIORITY_BATCH)
+_PRIORITY_RANK = {name: rank for rank, name in enumerate(PRIORITIES)}
+
+LLM_SCHEDULER_ENABLED = os.getenv("LLM_SCHEDULER_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "2"))
+LLM_MAX_CONCURRENCY_GEMINI = int(os.getenv("LLM_MAX_CONCURRENCY_GEMINI", "16"))
+LLM_MAX_STREAM_SECONDS = float(os.getenv("LLM_MAX_STREAM_SECONDS", "300"))
+LLM_QUEUE_MAX: Dict[str, int] = {
+    PRIORITY_INTERACTIVE: int(os.getenv("LLM_QUEUE_MAX_INTERACTIVE", "32")),
+    PRIORITY_VOICE: int(os.getenv("LLM_QUEUE_MAX_VOICE", "16")),
+    PRIORITY_BATCH: int(os.getenv("LLM_QUEUE_MAX_BATCH", "64")),
+}
+LLM_QUEUE_TIMEOUT: Dict[str, float] = {
+    PRIORITY_INTERACTIVE: float(os.getenv("LLM_QUEUE_TIMEOUT_INTERACTIVE", "30")),
+    PRIORITY_VOICE: float(os.getenv("LLM_QUEUE_TIMEOUT_VOICE", "60")),
+    PRIORITY_BATCH: float(os.getenv("LLM_QUEUE_TIMEOUT_BATCH", "300")),
+}
+
+# 대기 시간 분위수 계산에 쓰는 최근 표본 수
+WAIT_SAMPLES = 512
+
+
+class LLMQueueFull(Exception):
+    """대기열이 가득 차 요청을 거절함"""
+
+    def __init__(self, model: str, priority: str, message: str = None):
+        self.model = model
+        self.priority = priority
+        super().__init__(message or f"LLM 대기열이 가득 찼습니다 (model={model}, priority={priority})")
+
+
+class LLMQueueTimeout(LLMQueueFull):
+    """대기 시간 안에 슬롯을 얻지 못함"""
+
+    def __init__(self, model: str, priority: str, waited: float):
+        super().__init__(
+            model, priority, f"LLM 슬롯 대기 시간 초과 ({waited:.1f}s, model={model}, priority={priority})"
+        )
+
+
+def get_model_concurrency(model: str) -> int:
+    """모델별 동시 실행 수 (LLM_MAX_CONCURRENCY_<모델명> > Gemini/Ollama 기본값)"""
+    env_value = os.getenv("LLM_MAX_CONCURRENCY_" + re.sub(r"[^0-9A-Za-z]+", "_", model).upper())
+    if env_value:
+        return max(1, int(env_value))
+    return LLM_MAX_CONCURRENCY_GEMINI if model.startswith("gemini") else LLM_MAX_CONCURRENCY
+
+
+class LLMSlot:
+    """획득한 실행 슬롯 (스트림 최대 사용 시간 확인용)"""
+
+    def __init__(self, model: str, priority: str, waited: float, max_seconds: float):
+        self.model = model
+        self.priority = priority
+        self.waited = waited
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + max_seconds if max_seconds > 0 else None
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+
+class _ModelPool:
+    """모델 하나의 슬롯과 우선순위 대기열 (이벤트 루프 안에서만 사용하므로 잠금 없음)"""
+
+    def __init__(self, model: str, limit: int):
+        self.model = model
+        self.limit = limit
+        self.active = 0
+        self._heap: List[tuple] = []  # (우선순위, 순번, future)
+        self._seq = itertools.count()
+        self.queued: Dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self.stats: Dict[str, Dict[str, int]] = {
+            priority: {"admitted": 0, "rejected": 0, "timeouts": 0} for priority in PRIORITIES
+        }
+        self.waits: Dict[str, deque] = {priority: deque(maxlen=WAIT_SAMPLES) for priority in PRIORITIES}
+
+    def _has_waiters(self) -> bool:
+        return any(self.queued.values())
+
+    async def acquire(self, priority: str) -> float:
+        """슬롯을 얻을 때까지 대기 후 대기 시간(초) 반환"""
+        if self.active < self.limit and not self._has_waiters():
+            self.active += 1
+            self._admitted(priority, 0.0)
+            return 0.0
+        if self.queued[priority] >= LLM_QUEUE_MAX[priority]:
+            self.stats[priority]["rejected"] += 1
+            raise LLMQueueFull(self.model, priority)
+
+        started = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, (_PRIORITY_RANK[priority], next(self._seq), future))
+        self.queued[priority] += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=LLM_QUEUE_TIMEOUT[priority])
+        except BaseException as e:
+            if future.done() and not future.cancelled():
+                # 슬롯을 넘겨받은 직후 취소/시간 초과 → 다음 대기자에게 넘김
+                self.release()
+            else:
+                future.cancel()
+                self.queued[priority] -= 1
+            if isinstance(e, asyncio.TimeoutError):
+                self.stats[priority]["timeouts"] += 1
+                raise LLMQueueTimeout(self.model, priority, time.monotonic() - started) from None
+            raise
+        waited = time.monotonic() - started
+        self._admitted(priority, waited)
+        return waited
+
+    def _admitted(self, priority: str, waited: float) -> None:
+        self.stats[priority]["admitted"] += 1
+        self.waits[priority].append(waited)
+
+    def release(self) -> None:
+        self.active -= 1
+        while self._heap and self.active < self.limit:
+            rank, _, future = heapq.heappop(self._heap)
+            if future.cancelled():
+                continue
+            self.queued[PRIORITIES[rank]] -= 1
+            self.active += 1
+            future.set_result(None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        priorities = {}
+        for priority in PRIORITIES:
+            waits = sorted(self.waits[priority])
+            priorities[priority] = {
+                "queued": self.queued[priority],
+                **self.stats[priority],
+                "wait_ms_p50": round(waits[len(waits) // 2] * 1000, 1) if waits else 0.0,
+                "wait_ms_p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0.0,
+                "wait_ms_max": round(waits[-1] * 1000, 1) if waits else 0.0,
+            }
+        return {"limit": self.limit, "active": self.active, "priorities": priorities}
+
+
+_pools: Dict[str, _ModelPool] = {}
+
+
+def _get_pool(model: str) -> _ModelPool:
+    pool = _pools.get(model)
+    if pool is None:
+        pool = _pools[model] = _ModelPool(model, get_model_concurrency(model))
+    return pool
+
+
+@asynccontextmanager
+async def llm_slot(model: str, priority: str = PRIORITY_INTERACTIVE) -> AsyncIterator[LLMSlot]:
+    """
+    모델 실행 슬롯을 얻은 동안만 LLM 요청을 보냄
+
+    Raises:
+        LLMQueueFull: 대기열이 가득 참 (즉시)
+        LLMQueueTimeout: LLM_QUEUE_TIMEOUT_<PRIORITY>초 안에 슬롯을 얻지 못함
+    """
+    if priority not in _PRIORITY_RANK:
+        raise ValueError(f"알 수 없는 우선순위: {priority}")
+    if not LLM_SCHEDULER_ENABLED:
+        yield LLMSlot(model, priority, 0.0, LLM_MAX_STREAM_SECONDS)
+        return
+
+    pool = _get_pool(model)
+    waited = await pool.acquire(priority)
+    try:
+        yield LLMSlot(model, priority, waited, LLM_MAX_STREAM_SECONDS)
+    finally:
+        pool.release()
+
+
+def get_scheduler_stats() -> Dict[str, Any]:
+    """모델별 동시 실행 / 우선순위별 대기열 길이, 승인·거절·시간 초과 수, 대기 시간(ms)"""
+    return {
+        "enabled": LLM_SCHEDULER_ENABLED,
+        "max_stream_seconds": LLM_MAX_STREAM_SECONDS,
+        "queue_max": dict(LLM_QUEUE_MAX),
+        "queue_timeout": dict(LLM_QUEUE_TIMEOUT),
+        "models": {model: pool.snapshot() for model, pool in _pools.items()},
+    }
@@ -0,0 +1,639 @@
+"""
+로컬 벡터 스토어 - Chroma 없이 프로세스 안에서 동작하는 벡터 저장/검색 (vector_db 대체 백엔드)
+
+VECTOR_STORE_BACKEND=local 이거나, auto(기본)에서 langchain-chroma가 없을 때 vector_db가 사용합니다.
+외부 서비스가 필요 없으므로 테스트에서는 임의의 임베딩 객체(embed_documents / embed_query)와 함께 바로 쓸 수 있습니다.
+
+저장 구조 (LOCAL_VECTOR_DIR/<컬렉션>/)
+- manifest.json        : 세그먼트 목록, 차원, 저장 형식, 삭제된 행 (임시 파일 → rename으로 원자적 교체)
+- seg-000001.npy       : L2 정규화된 벡터 (float32 또는 int8). np.load(mmap_mode="r")로 열어
+                         OS 페이지 캐시를 gunicorn 워커끼리 공유하고, 시작 시 전체를 읽지 않음
+- seg-000001.scale.npy : int8 형식일 때 행별 스케일
+- seg-000001.meta.json : ids / documents / 메타데이터 키별 열(column)
+- seg-000001.hnsw      : (선택) 행 수가 LOCAL_VECTOR_HNSW_THRESHOLD 이상인 세그먼트의 HNSW 인덱스 (hnswlib 설치 시)
+
+쓰기는 새 세그먼트를 추가하고 manifest만 교체합니다 (기존 세그먼트 파일은 수정하지 않음).
+세그먼트가 LOCAL_VECTOR_MAX_SEGMENTS개를 넘거나 삭제된 행이 많아지면 세그먼트를 합칩니다.
+다른 워커가 manifest를 바꾸면 다음 호출에서 바뀐 세그먼트만 다시 엽니다.
+
+검색 결과 점수는 Chroma와 같이 거리(1 - 코사인 유사도, 낮을수록 유사)입니다.
+"""
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: 워커 프로세스 간 쓰기 잠금 없이 동작
+    fcntl = None
+
+try:
+    import hnswlib
+    HNSW_AVAILABLE = True
+except ImportError:
+    HNSW_AVAILABLE = False
+
+try:
+    from langchain_core.documents import Document
+except ImportError:
+    class Document:
+        """langchain_core가 없을 때 쓰는 최소 Document (page_content, metadata)"""
+
+        def __init__(self, page_content: str, metadata: Optional[Dict] = None, id: Optional[str] = None):
+            self.page_content = page_content
+            self.metadata = metadata or {}
+            self.id = id
+
+LOCAL_VECTOR_DIR = Path(os.getenv("LOCAL_VECTOR_DIR", "./vector_db/_local"))
+LOCAL_VECTOR_DTYPE = os.getenv("LOCAL_VECTOR_DTYPE", "float32").lower()  # float32 | int8 (메모리/디스크 1/4)
+LOCAL_VECTOR_MAX_SEGMENTS = int(os.getenv("LOCAL_VECTOR_MAX_SEGMENTS", "8"))
+LOCAL_VECTOR_HNSW_THRESHOLD = int(os.getenv("LOCAL_VECTOR_HNSW_THRESHOLD", "50000"))
+LOCAL_VECTOR_HNSW_EF = int(os.getenv("LOCAL_VECTOR_HNSW_EF", "128"))
+
+DEAD_RATIO = 0.25  # 삭제된 행이 전체의 25%를 넘으면 전체 병합
+SCORE_BLOCK_ROWS = 65536  # int8 → float32 변환을 블록 단위로 (임시 메모리 제한)
+SEGMENT_PREFIX = "seg-"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1
+    return (vectors / norms).astype(np.float32)
+
+
+def _quantize(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """행별 대칭 int8 양자화 (정규화된 벡터 기준, v ≈ q * scale)"""
+    scales = np.abs(vectors).max(axis=1) / 127
+    scales[scales == 0] = 1
+    quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 상위 k개 위치 (내림차순)"""
+    if len(scores) > k:
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def _atomic_save(path: Path, write) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def _object_column(values: Sequence) -> np.ndarray:
+    column = np.empty(len(values), dtype=object)
+    column[:] = list(values)
+    return column
+
+
+class _Segment:
+    """불변 세그먼트 하나 (벡터는 memory-map, 메타데이터는 열 단위 numpy object 배열)"""
+
+    def __init__(self, directory: Path, name: str, dim: int):
+        self.name = name
+        self.vectors = np.load(directory / f"{name}.npy", mmap_mode="r")
+        scale_path = directory / f"{name}.scale.npy"
+        self.scales = np.load(scale_path, mmap_mode="r") if scale_path.exists() else None
+        with open(directory / f"{name}.meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.ids: List[str] = meta["ids"]
+        self.documents: List[str] = meta["documents"]
+        self.columns = {key: _object_column(values) for key, values in meta["columns"].items()}
+        # 삭제 표시는 복사 후 교체 (검색 중인 스레드가 보던 배열은 바뀌지 않음)
+        self.alive = np.ones(len(self.ids), dtype=bool)
+
+        self.hnsw = None
+        hnsw_path = directory / f"{name}.hnsw"
+        if HNSW_AVAILABLE and hnsw_path.exists():
+            try:
+                index = hnswlib.Index(space="ip", dim=dim)
+                index.load_index(str(hnsw_path), max_elements=len(self.ids))
+                self.hnsw = index
+            except Exception as e:
+                print(f"⚠️ HNSW 인덱스 로드 실패 ({name}, 전수 검색 사용): {e}")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def metadata(self, row: int) -> Dict:
+        return {key: column[row] for key, column in self.columns.items() if column[row] is not None}
+
+    def float_vectors(self, start: int, stop: int) -> np.ndarray:
+        block = np.asarray(self.vectors[start:stop], dtype=np.float32)
+        if self.scales is not None:
+            block = block * self.scales[start:stop, None]
+        return block
+
+    def scores(self, query: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """코사인 유사도 (rows가 None이면 전체 행)"""
+        vectors = self.vectors if rows is None else self.vectors[rows]
+        if self.scales is None:
+            return vectors @ query
+        out = np.empty(len(vectors), dtype=np.float32)
+        for start in range(0, len(vectors), SCORE_BLOCK_ROWS):
+            out[start:start + SCORE_BLOCK_ROWS] = vectors[start:start + SCORE_BLOCK_ROWS].astype(np.float32) @ query
+        return out * (self.scales if rows is None else self.scales[rows])
+
+    def match(self, where: Dict) -> np.ndarray:
+        """Chroma where 절($and/$or/$eq/$ne/$in/$nin/$gt/$gte/$lt/$lte)에 맞는 행"""
+        n = len(self.ids)
+        if "$and" in where:
+            mask = np.ones(n, dtype=bool)
+            for clause in where["$and"]:
+                mask &= self.match(clause)
+            return mask
+        if "$or" in where:
+            mask = np.zeros(n, dtype=bool)
+            for clause in where["$or"]:
+                mask |= self.match(clause)
+            return mask
+
+        mask = np.ones(n, dtype=bool)
+        for key, condition in where.items():
+            column = self.columns.get(key)
+            if column is None:
+                return np.zeros(n, dtype=bool)
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+            for op, value in condition.items():
+                mask &= self._compare(column, op, value)
+        return mask
+
+    @staticmethod
+    def _compare(column: np.ndarray, op: str, value: Any) -> np.ndarray:
+        present = np.not_equal(column, None)
+        if op == "$eq":
+            return np.equal(column, value).astype(bool) & present
+        if op == "$ne":
+            return np.not_equal(column, value).astype(bool) & present
+        if op in ("$in", "$nin"):
+            values = set(value)
+            found = np.fromiter((item in values for item in column), dtype=bool, count=len(column))
+            return (found if op == "$in" else ~found) & present
+        compare = {"$gt": np.greater, "$gte": np.greater_equal, "$lt": np.less, "$lte": np.less_equal}.get(op)
+        if compare is None:
+            raise ValueError(f"지원하지 않는 where 연산자: {op}")
+        result = np.zeros(len(column), dtype=bool)
+        result[present] = compare(column[present], value).astype(bool)
+        return result
+
+
+class LocalVectorStore:
+    """
+    memory-map 기반 벡터 스토어 (vector_db가 사용하는 Chroma / langchain_chroma 메서드와 같은 형태)
+
+    Args:
+        collection_name: 컬렉션 이름
+        embedding_function: embed_documents / embed_query를 가진 임베딩 객체
+        persist_directory: 저장 디렉토리 (None이면 LOCAL_VECTOR_DIR/<컬렉션>)
+        dtype: 새 컬렉션의 벡터 저장 형식 (float32 | int8, 기존 컬렉션은 manifest 형식을 따름)
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        embedding_function=None,
+        persist_directory: str = None,
+        dtype: str = None
+    ):
+        self.collection_name = collection_name
+        self.embedding_function = embedding_function
+        self.directory = Path(persist_directory) if persist_directory else LOCAL_VECTOR_DIR / collection_name
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dtype = (dtype or LOCAL_VECTOR_DTYPE).lower()
+        if self.dtype not in ("float32", "int8"):
+            raise ValueError(f"지원하지 않는 벡터 형식: {self.dtype}")
+
+        self._lock = threading.RLock()
+        self._manifest: Dict = {"version": 0, "dim": None, "dtype": self.dtype, "next_segment": 1,
+                                "segments": [], "deleted": {}}
+        self._manifest_key = None
+        self._segments: List[_Segment] = []
+        self._locations: Optional[Dict[str, Tuple[int, int]]] = None  # id -> (세그먼트 위치, 행), 쓰기 시에만 생성
+        self._refresh()
+
+    @property
+    def _collection(self) -> "LocalVectorStore":
+        """Chroma 컬렉션 API(get/upsert/delete/count)도 이 객체가 직접 제공"""
+        return self
+
+    # ------------------------------------------------------------
+    # manifest / 세그먼트 로드
+    # ------------------------------------------------------------
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.directory / "manifest.json"
+
+    def _refresh(self) -> None:
+        """다른 프로세스가 manifest를 바꿨으면 다시 읽음 (stat 한 번으로 확인)"""
+        with self._lock:
+            for attempt in range(3):
+                try:
+                    stat = os.stat(self._manifest_path)
+                except FileNotFoundError:
+                    return
+                key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+                if key == self._manifest_key:
+                    return
+                try:
+                    with open(self._manifest_path, encoding="utf-8") as f:
+                        manifest = json.load(f)
+                    self._load_segments(manifest)
+                except FileNotFoundError:
+                    # 읽는 사이 다른 프로세스가 세그먼트를 병합하고 지움 → 새 manifest로 다시 시도
+                    continue
+                self._manifest = manifest
+                self._manifest_key = key
+                return
+            raise RuntimeError(f"{self.collection_name} manifest를 읽지 못했습니다")
+
+    def _load_segments(self, manifest: Dict) -> None:
+        loaded = {segment.name: segment for segment in self._segments}
+        segments = []
+        for name in manifest["segments"]:
+            segment = loaded.get(name) or _Segment(self.directory, name, manifest["dim"])
+            alive = np.ones(len(segment), dtype=bool)
+            alive[manifest["deleted"].get(name, [])] = False
+            segment.alive = alive
+            segments.append(segment)
+        self._segments = segments
+        self._locations = None
+
+    def _save_manifest(self) -> None:
+        self._manifest["version"] += 1
+        data = json.dumps(self._manifest, ensure_ascii=False).encode("utf-8")
+        _atomic_save(self._manifest_path, lambda f: f.write(data))
+        stat = os.stat(self._manifest_path)
+        self._manifest_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    @contextmanager
+    def _write_lock(self):
+        """스레드 + 워커 프로세스 간 쓰기 잠금, 잠금을 얻은 뒤 최신 manifest 반영"""
+        with self._lock:
+            with open(self.directory / ".lock", "a+b") as lock_file:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    self._refresh()
+                    yield
+                finally:
+                    if fcntl:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _location_map(self) -> Dict[str, Tuple[int, int]]:
+        if self._locations is None:
+            locations = {}
+            for position, segment in enumerate(self._segments):
+                alive = segment.alive
+                for row, doc_id in enumerate(segment.ids):
+                    if alive[row]:
+                        locations[doc_id] = (position, row)
+            self._locations = locations
+        return self._locations
+
+    # ------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------
+
+    def _write_segment(self, name: str, vectors: np.ndarray, ids: List[str],
+                       documents: List[str], metadatas: List[Dict]) -> None:
+        if self._manifest["dtype"] == "int8":
+            quantized, scales = _quantize(vectors)
+            _atomic_save(self.directory / f"{name}.npy", lambda f: np.save(f, quantized))
+            _atomic_save(self.directory / f"{name}.scale.npy", lambda f: np.save(f, scales))
+        else:
+            _atomic_save(self.directory / f"{name}.npy", lambda f: np.save(f, vectors))
+
+        keys = sorted({key for metadata in metadatas for key in metadata})
+        meta = {
+            "ids": ids,
+            "documents": documents,
+            "columns": {key: [metadata.get(key) for metadata in metadatas] for key in keys}
+        }
+        data = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        _atomic_save(self.directory / f"{name}.meta.json", lambda f: f.write(data))
+
+        if HNSW_AVAILABLE and len(ids) >= LOCAL_VECTOR_HNSW_THRESHOLD:
+            self._build_hnsw(name, vectors)
+
+    def _build_hnsw(self, name: str, vectors: np.ndarray) -> None:
+        try:
+            index = hnswlib.Index(space="ip", dim=vectors.shape[1])
+            index.init_index(max_elements=len(vectors), ef_construction=200, M=16)
+            for start in range(0, len(vectors), SCORE_BLOCK_ROWS):
+                block = vectors[start:start + SCORE_BLOCK_ROWS]
+                index.add_items(block, np.arange(start, start + len(block)))
+            path = self.directory / f"{name}.hnsw"
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            index.save_index(str(tmp))
+            os.replace(tmp, path)
+        except Exception as e:
+            print(f"⚠️ HNSW 인덱스 생성 실패 ({name}, 전수 검색 사용): {e}")
+
+    def _next_segment_name(self) -> str:
+        number = self._manifest["next_segment"]
+        self._manifest["next_segment"] = number + 1
+        return f"{SEGMENT_PREFIX}{number:06d}"
+
+    def _mark_deleted(self, ids: Sequence[str]) -> int:
+        locations = self._location_map()
+        rows_by_segment: Dict[int, List[int]] = {}
+        for doc_id in ids:
+            location = locations.pop(doc_id, None)
+            if location is not None:
+                rows_by_segment.setdefault(location[0], []).append(location[1])
+        for position, rows in rows_by_segment.items():
+            segment = self._segments[position]
+            alive = segment.alive.copy()
+            alive[rows] = False
+            segment.alive = alive
+            deleted = self._manifest["deleted"].setdefault(segment.name, [])
+            deleted.extend(rows)
+        return sum(len(rows) for rows in rows_by_segment.values())
+
+    def upsert(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: Optional[List[str]] = None,
+        metadatas: Optional[List[Dict]] = None
+    ) -> None:
+        """임베딩 저장 (같은 ID는 교체)"""
+        if not ids:
+            return
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32).reshape(len(ids), -1))
+        documents = list(documents) if documents is not None else [""] * len(ids)
+        metadatas = [dict(metadata or {}) for metadata in metadatas] if metadatas is not None else [{}] * len(ids)
+
+        # 한 번에 같은 ID가 여러 번 오면 마지막 것만 저장
+        last = {doc_id: i for i, doc_id in enumerate(ids)}
+        if len(last) != len(ids):
+            keep = sorted(last.values())
+            ids = [ids[i] for i in keep]
+            vectors = vectors[keep]
+            documents = [documents[i] for i in keep]
+            metadatas = [metadatas[i] for i in keep]
+
+        with self._write_lock():
+            dim = self._manifest["dim"]
+            if dim is None:
+                self._manifest["dim"] = vectors.shape[1]
+            elif dim != vectors.shape[1]:
+                raise ValueError(f"벡터 차원 불일치: 컬렉션 {dim}, 입력 {vectors.shape[1]}")
+
+            self._mark_deleted(ids)
+            name = self._next_segment_name()
+            self._write_segment(name, vectors, list(ids), documents, metadatas)
+            self._manifest["segments"].append(name)
+            self._save_manifest()
+
+            segment = _Segment(self.directory, name, self._manifest["dim"])
+            self._segments.append(segment)
+            if self._locations is not None:
+                position = len(self._segments) - 1
+                for row, doc_id in enumerate(segment.ids):
+                    self._locations[doc_id] = (position, row)
+            self._maybe_merge()
+
+    def add(self, ids, embeddings, documents=None, metadatas=None) -> None:
+        self.upsert(ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas)
+
+    def add_documents(self, documents: List[Any], ids: Optional[List[str]] = None) -> List[str]:
+        """Document 목록 임베딩 후 저장"""
+        if self.embedding_function is None:
+            raise RuntimeError("embedding_function이 없습니다")
+        ids = list(ids) if ids else [str(uuid.uuid4()) for _ in documents]
+        texts = [doc.page_content for doc in documents]
+        self.upsert(
+            ids=ids,
+            embeddings=self.embedding_function.embed_documents(texts),
+            documents=texts,
+            metadatas=[doc.metadata for doc in documents]
+        )
+        return ids
+
+    def delete(self, ids: Optional[List[str]] = None, where: Optional[Dict] = None) -> None:
+        """ID 또는 메타데이터 조건으로 삭제 (둘 다 주면 교집합)"""
+        if ids is None and not where:
+            return
+        with self._write_lock():
+            targets = self._matching_ids(where) if where else None
+            if ids is not None:
+                matched = set(targets) if targets is not None else None
+                targets = [doc_id for doc_id in ids if matched is None or doc_id in matched]
+            if targets and self._mark_deleted(targets):
+                self._save_manifest()
+                self._maybe_merge()
+
+    def _matching_ids(self, where: Dict) -> List[str]:
+        matched = []
+        for segment in self._segments:
+            for row in np.flatnonzero(segment.alive & segment.match(where)):
+                matched.append(segment.ids[row])
+        return matched
+
+    # ------------------------------------------------------------
+    # 병합
+    # ------------------------------------------------------------
+
+    def _maybe_merge(self) -> None:
+        sizes = [len(segment) for segment in self._segments]
+        dead = sum(len(rows) for rows in self._manifest["deleted"].values())
+        if sizes and dead > sum(sizes) * DEAD_RATIO:
+            self._merge(0, len(sizes))
+            return
+        while len(self._segments) > LOCAL_VECTOR_MAX_SEGMENTS:
+            sizes = [len(segment) for segment in self._segments]
+            # 뒤쪽(최근) 작은 세그먼트부터, 합친 크기보다 크지 않은 앞 세그먼트까지 묶음 (큰 세그먼트는 드물게 다시 씀)
+            start = len(sizes) - 2
+            total = sizes[-1] + sizes[-2]
+            while start > 0 and sizes[start - 1] <= total:
+                start -= 1
+                total += sizes[start]
+            self._merge(start, len(sizes))
+
+    def _merge(self, start: int, stop: int) -> None:
+        """self._segments[start:stop]의 살아 있는 행을 새 세그먼트 하나로 합침"""
+        merging = self._segments[start:stop]
+        rows = [np.flatnonzero(segment.alive) for segment in merging]
+        total = sum(len(r) for r in rows)
+        names = [segment.name for segment in merging]
+
+        new_segments = []
+        if total:
+            name = self._next_segment_name()
+            vectors = np.empty((total, self._manifest["dim"]), dtype=np.float32)
+            ids, documents, metadatas = [], [], []
+            offset = 0
+            for segment, alive_rows in zip(merging, rows):
+                for block_start in range(0, len(alive_rows), SCORE_BLOCK_ROWS):
+                    block = alive_rows[block_start:block_start + SCORE_BLOCK_ROWS]
+                    first, last = int(block[0]), int(block[-1]) + 1
+                    vectors[offset:offset + len(block)] = segment.float_vectors(first, last)[block - first]
+                    offset += len(block)
+                ids.extend(segment.ids[row] for row in alive_rows)
+                documents.extend(segment.documents[row] for row in alive_rows)
+                metadatas.extend(segment.metadata(row) for row in alive_rows)
+            self._write_segment(name, vectors, ids, documents, metadatas)
+            new_segments.append(name)
+
+        self._manifest["segments"][start:stop] = new_segments
+        for old in names:
+            self._manifest["deleted"].pop(old, None)
+        self._save_manifest()
+        self._segments[start:stop] = [_Segment(self.directory, name, self._manifest["dim"]) for name in new_segments]
+        self._locations = None
+
+        # 다른 워커가 아직 열어 둔 파일은 unlink 후에도 매핑이 유지됨 (POSIX)
+        for old in names:
+            for suffix in (".npy", ".scale.npy", ".meta.json", ".hnsw"):
+                try:
+                    os.remove(self.directory / f"{old}{suffix}")
+                except FileNotFoundError:
+                    pass
+        print(f"♻️ 로컬 벡터 세그먼트 병합: {self.collection_name} {len(names)}개 → {total}행")
+
+    # ------------------------------------------------------------
+    # 조회 / 검색
+    # ------------------------------------------------------------
+
+    def _snapshot(self) -> List[Tuple[_Segment, np.ndarray]]:
+        with self._lock:
+            self._refresh()
+            return [(segment, segment.alive) for segment in self._segments]
+
+    def count(self) -> int:
+        return sum(int(alive.sum()) for _, alive in self._snapshot())
+
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include: Sequence[str] = ("metadatas", "documents")
+    ) -> Dict:
+        """Chroma collection.get과 같은 형식 {"ids", "metadatas"?, "documents"?}"""
+        wanted = set(ids) if ids is not None else None
+        skip = offset or 0
+        result = {"ids": []}
+        if "metadatas" in include:
+            result["metadatas"] = []
+        if "documents" in include:
+            result["documents"] = []
+
+        for segment, alive in self._snapshot():
+            mask = alive & segment.match(where) if where else alive
+            for row in np.flatnonzero(mask):
+                doc_id = segment.ids[row]
+                if wanted is not None and doc_id not in wanted:
+                    continue
+                if skip:
+                    skip -= 1
+                    continue
+                if limit is not None and len(result["ids"]) >= limit:
+                    return result
+                result["ids"].append(doc_id)
+                if "metadatas" in result:
+                    result["metadatas"].append(segment.metadata(row))
+                if "documents" in result:
+                    result["documents"].append(segment.documents[row])
+        return result
+
+    def similarity_search_with_score(self, query: str, k: int = 4, filter: Optional[Dict] = None):
+        if self.embedding_function is None:
+            raise RuntimeError("embedding_function이 없습니다")
+        return self.similarity_search_by_vector_with_relevance_scores(
+            embedding=self.embedding_function.embed_query(query), k=k, filter=filter
+        )
+
+    def similarity_search_by_vector_with_relevance_scores(
+        self,
+        embedding: List[float],
+        k: int = 4,
+        filter: Optional[Dict] = None
+    ) -> List[Tuple[Any, float]]:
+        """
+        코사인 top-k 검색
+
+        Returns:
+            [(Document, 거리), ...] (거리 = 1 - 코사인 유사도, 오름차순)
+        """
+        snapshot = self._snapshot()
+        if not snapshot or k <= 0:
+            return []
+        query = _normalize(np.asarray(embedding, dtype=np.float32).reshape(-1))
+        if len(query) != snapshot[0][0].vectors.shape[1]:
+            raise ValueError(f"쿼리 차원 불일치: 컬렉션 {snapshot[0][0].vectors.shape[1]}, 쿼리 {len(query)}")
+
+        candidates: List[Tuple[float, _Segment, int]] = []
+        for segment, alive in snapshot:
+            mask = alive & segment.match(filter) if filter else alive
+            allowed = int(mask.sum())
+            if not allowed:
+                continue
+            hits = None
+            if segment.hnsw is not None and allowed >= LOCAL_VECTOR_HNSW_THRESHOLD:
+                hits = self._search_hnsw(segment, query, k, mask, allowed)
+            if hits is None:
+                if allowed == len(mask):
+                    scores = segment.scores(query)
+                    rows = np.arange(len(mask))
+                else:
+                    rows = np.flatnonzero(mask)
+                    scores = segment.scores(query, rows)
+                top = _top_k(scores, k)
+                hits = zip(rows[top].tolist(), scores[top].tolist())
+            candidates.extend((score, segment, row) for row, score in hits)
+
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        return [
+            (Document(page_content=segment.documents[row], metadata=segment.metadata(row), id=segment.ids[row]),
+             1.0 - score)
+            for score, segment, row in candidates[:k]
+        ]
+
+    @staticmethod
+    def _search_hnsw(segment: _Segment, query: np.ndarray, k: int, mask: np.ndarray, allowed: int):
+        """HNSW 근사 검색 후 삭제/필터 조건 적용 (결과가 모자라면 None → 전수 검색)"""
+        fetch = min(len(mask), max(k * 4, int(k * len(mask) / allowed) * 2))
+        segment.hnsw.set_ef(max(fetch, LOCAL_VECTOR_HNSW_EF))
+        labels, distances = segment.hnsw.knn_query(query, k=fetch)
+        labels, distances = labels[0], distances[0]
+        keep = mask[labels]
+        labels, distances = labels[keep][:k], distances[keep][:k]
+        if len(labels) < min(k, allowed):
+            return None
+        return list(zip(labels.tolist(), (1.0 - distances).tolist()))
+
+    def stats(self) -> Dict:
+        snapshot = self._snapshot()
+        total = sum(len(segment) for segment, _ in snapshot)
+        live = sum(int(alive.sum()) for _, alive in snapshot)
+        return {
+            "documents": live,
+            "deleted": total - live,
+            "segments": len(snapshot),
+            "dim": self._manifest["dim"],
+            "dtype": self._manifest["dtype"],
+            "hnsw_segments": sum(1 for segment, _ in snapshot if segment.hnsw is not None)
+        }
+
+    def close(self) -> None:
+        """memory-map 해제"""
+        with self._lock:
+            self._segments = []
+            self._locations = None
+            self._manifest_key = None
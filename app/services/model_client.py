@@ -1,21 +1,308 @@
 """
 Model API 호출을 위한 클라이언트 서비스.
 Model API 서버 포트가 변경되더라도 자동으로 감지하여 연결합니다.
+
+- 헬스 모니터: 백그라운드 태스크가 MODEL_API_HEALTH_INTERVAL마다 엔드포인트를 비동기로 확인하고,
+  응답이 없으면 후보 포트를 동시에 탐색해 교체합니다 (요청 처리 중에는 탐색으로 이벤트 루프를 막지 않음)
+- 서킷 브레이커: 엔드포인트(origin)별로 연속 실패가 쌓이거나 헬스 체크가 연속으로 실패하면 열리고,
+  열려 있는 동안 공유 클라이언트의 요청은 네트워크 없이 즉시 ModelAPIUnavailable(ConnectError)로 실패합니다
 """
 from __future__ import annotations
 
+import asyncio
 import os
 import socket
+import time
 from typing import Any, Dict, Optional, List
 
 import httpx
 
+from app.services.result_cache import get_result_cache
+from app.services.llm_scheduler import llm_slot, LLMQueueFull, PRIORITY_INTERACTIVE
+
 _CANDIDATE_PORTS = [8002, 8001, 8003, 8082, 8502, 8000]
 _MODEL_API_BASE_URL: Optional[str] = None
+_pending_discovery: Optional["asyncio.Task"] = None
+
+# ============================================
+# 공유 HTTP 클라이언트 (워커당 1개, lifespan에서 생성/종료)
+# ============================================
+# 엔드포인트별 타임아웃 (초). MODEL_API_TIMEOUT_<NAME> 환경 변수로 재정의 가능
+# 예: MODEL_API_TIMEOUT_SENTIMENT=5
+MODEL_API_TIMEOUTS: Dict[str, float] = {
+    "predict": 30.0,
+    "sentiment": 10.0,
+    "summarize": 10.0,
+    "auto_tag": 5.0,
+    "sentiment_batch": 20.0,
+    "summarize_batch": 30.0,
+    "auto_tag_batch": 15.0,
+    "review_summary": 30.0,
+    "chat": 60.0,
+    "chat_stream": 120.0,
+    "chat_stream_slow": 600.0,  # DeepSeek R1 등 응답이 매우 느린 모델
+    "stt": 30.0,
+    "invitation_text": 60.0,
+    "image": 120.0,
+}
+_CONNECT_TIMEOUT = float(os.getenv("MODEL_API_CONNECT_TIMEOUT", "5.0"))
+
+# 헬스 모니터 / 서킷 브레이커
+MODEL_API_HEALTH_INTERVAL = float(os.getenv("MODEL_API_HEALTH_INTERVAL", "10"))
+MODEL_API_HEALTH_TIMEOUT = float(os.getenv("MODEL_API_HEALTH_TIMEOUT", "0.5"))
+MODEL_API_HEALTH_FAILURES = int(os.getenv("MODEL_API_HEALTH_FAILURES", "3"))  # 헬스 체크 연속 실패 N회면 열림
+MODEL_API_BREAKER_FAILURES = int(os.getenv("MODEL_API_BREAKER_FAILURES", "5"))  # 연속 실패 N회면 열림
+MODEL_API_BREAKER_RESET = float(os.getenv("MODEL_API_BREAKER_RESET", "30"))  # 열린 뒤 시험 요청까지 대기(초)
+_BREAKER_FAILURE_STATUS = (502, 503, 504)
+
+# 마이크로 배치 (감성 분석 / 요약 / 자동 태깅)
+MODEL_API_BATCH_ENABLED = os.getenv("MODEL_API_BATCH_ENABLED", "true").lower() in ("1", "true", "yes")
+MODEL_API_BATCH_WINDOW_MS = float(os.getenv("MODEL_API_BATCH_WINDOW_MS", "5"))
+MODEL_API_BATCH_MAX_SIZE = int(os.getenv("MODEL_API_BATCH_MAX_SIZE", "32"))
+MODEL_API_BATCH_MAX_IN_FLIGHT = int(os.getenv("MODEL_API_BATCH_MAX_IN_FLIGHT", "2"))  # 엔드포인트별 동시 배치 요청 수
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http2_active = False
+_http_stats: Dict[str, int] = {"requests_total": 0, "server_errors_total": 0}
+
+
+def get_model_api_timeout(name: str) -> httpx.Timeout:
+    """엔드포인트 이름에 해당하는 타임아웃 반환"""
+    env_value = os.getenv(f"MODEL_API_TIMEOUT_{name.upper()}")
+    seconds = float(env_value) if env_value else MODEL_API_TIMEOUTS.get(name, 30.0)
+    return httpx.Timeout(seconds, connect=min(_CONNECT_TIMEOUT, seconds))
+
+
+def _http2_enabled() -> bool:
+    if os.getenv("MODEL_API_HTTP2", "false").lower() not in ("1", "true", "yes"):
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        print("⚠️ MODEL_API_HTTP2가 설정되었지만 h2 패키지가 없어 HTTP/1.1을 사용합니다. (pip install httpx[http2])")
+        return False
+
+
+async def _on_request(request: httpx.Request):
+    _http_stats["requests_total"] += 1
+
+
+async def _on_response(response: httpx.Response):
+    if response.status_code >= 500:
+        _http_stats["server_errors_total"] += 1
+
+
+# ============================================
+# 서킷 브레이커
+# ============================================
+
+class ModelAPIUnavailable(httpx.ConnectError):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않음 (기존 ConnectError 처리 경로로 즉시 실패)"""
+
+
+class CircuitBreaker:
+    """
+    엔드포인트(origin) 하나의 서킷 브레이커
+    closed → (연속 실패 MODEL_API_BREAKER_FAILURES회 또는 헬스 체크 연속 실패 MODEL_API_HEALTH_FAILURES회) open
+    → (MODEL_API_BREAKER_RESET초 후 또는 헬스 체크 성공 시) half_open: 시험 요청 1개만 통과 → 성공 시 closed, 실패 시 다시 open
+    (이벤트 루프 안에서만 사용하므로 잠금 없음)
+    """
+
+    def __init__(
+        self,
+        origin: str,
+        failure_threshold: int = None,
+        reset_timeout: float = None,
+        probe_failure_threshold: int = None
+    ):
+        self.origin = origin
+        self.failure_threshold = failure_threshold or MODEL_API_BREAKER_FAILURES
+        self.reset_timeout = MODEL_API_BREAKER_RESET if reset_timeout is None else reset_timeout
+        self.probe_failure_threshold = probe_failure_threshold or MODEL_API_HEALTH_FAILURES
+        self.state = "closed"
+        self.failures = 0
+        self.probe_failures = 0
+        self.opened_at = 0.0
+        self.opened_total = 0
+        self.rejected_total = 0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected_total += 1
+                return False
+            self.state = "half_open"
+        if self._trial_in_flight:
+            self.rejected_total += 1
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        if self.state != "closed":
+            print(f"✅ Model API 서킷 닫힘: {self.origin}")
+        self.state = "closed"
+        self.failures = 0
+        self.probe_failures = 0
+        self._trial_in_flight = False
+
+    def record_probe_success(self) -> None:
+        """
+        헬스 체크 성공 - 헬스 체크 연속 실패만 초기화
+        실제 요청 실패로 열린 서킷은 닫지 않고 half_open으로만 전환 (닫힘은 시험 요청 성공으로 결정)
+        """
+        self.probe_failures = 0
+        if self.state == "open":
+            self.state = "half_open"
+            self._trial_in_flight = False
+
+    def record_probe_failure(self) -> None:
+        """헬스 체크 실패 (0.5초 타임아웃 한 번 같은 일시적 지연으로는 열지 않음)"""
+        self.probe_failures += 1
+        if self.probe_failures >= self.probe_failure_threshold:
+            self.trip()
+
+    def record_failure(self) -> None:
+        self._trial_in_flight = False
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.trip()
+
+    def release(self) -> None:
+        """결과 없이 끝난 요청 (취소 등) - 시험 요청 자리만 반환"""
+        self._trial_in_flight = False
+
+    def trip(self) -> None:
+        if self.state != "open":
+            self.opened_total += 1
+            print(f"⛔ Model API 서킷 열림: {self.origin} ({self.reset_timeout:.0f}초 동안 요청 차단)")
+        self.state = "open"
+        self.opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "consecutive_probe_failures": self.probe_failures,
+            "opened_total": self.opened_total,
+            "rejected_total": self.rejected_total,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def _origin(url) -> str:
+    url = httpx.URL(str(url))
+    return f"{url.scheme}://{url.host}:{url.port or (443 if url.scheme == 'https' else 80)}"
+
+
+def get_circuit_breaker(url) -> CircuitBreaker:
+    origin = _origin(url)
+    breaker = _breakers.get(origin)
+    if breaker is None:
+        breaker = _breakers[origin] = CircuitBreaker(origin)
+    return breaker
+
+
+class _CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """공유 클라이언트의 모든 요청(스트리밍 포함)에 서킷 브레이커 적용"""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport):
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = get_circuit_breaker(request.url)
+        if not breaker.allow():
+            raise ModelAPIUnavailable(f"Model API circuit open: {breaker.origin}", request=request)
+        try:
+            response = await self.inner.handle_async_request(request)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        if response.status_code in _BREAKER_FAILURE_STATUS:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    global _http2_active
+    _http2_active = _http2_enabled()
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("MODEL_API_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("MODEL_API_MAX_KEEPALIVE", "20")),
+        keepalive_expiry=float(os.getenv("MODEL_API_KEEPALIVE_EXPIRY", "30")),
+    )
+    # 참고: HTTP/2는 https(TLS ALPN) 연결에서만 협상되며, http:// 에서는 HTTP/1.1 keep-alive가 사용됩니다.
+    return httpx.AsyncClient(
+        transport=_CircuitBreakerTransport(httpx.AsyncHTTPTransport(limits=limits, http2=_http2_active)),
+        timeout=get_model_api_timeout("default"),
+        event_hooks={"request": [_on_request], "response": [_on_response]},
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Model API 호출용 공유 AsyncClient 반환.
+    커넥션 풀을 재사용하므로 호출마다 TCP/TLS 핸드셰이크가 발생하지 않습니다.
+    (lifespan 밖에서 호출되면 지연 생성)
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _create_http_client()
+    return _http_client
+
+
+async def init_http_client() -> None:
+    """앱 시작 시 공유 클라이언트 생성 (lifespan startup)"""
+    get_http_client()
+    print(f"✅ Model API HTTP 클라이언트 준비 완료 (http2={_http2_active})")
+
+
+async def close_http_client() -> None:
+    """앱 종료 시 커넥션 풀 정리 (lifespan shutdown)"""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+def get_http_client_stats() -> Dict[str, Any]:
+    """커넥션 풀 메트릭 반환"""
+    stats: Dict[str, Any] = dict(_http_stats)
+    stats["open"] = _http_client is not None and not _http_client.is_closed
+    stats["http2"] = _http2_active
+    stats["connections"] = 0
+    stats["idle_connections"] = 0
+    stats["http2_connections"] = 0
+    if stats["open"]:
+        transport = getattr(_http_client._transport, "inner", _http_client._transport)
+        pool = getattr(transport, "_pool", None)
+        for connection in getattr(pool, "connections", []):
+            stats["connections"] += 1
+            if connection.is_idle():
+                stats["idle_connections"] += 1
+            if "HTTP/2" in repr(connection):
+                stats["http2_connections"] += 1
+    stats["active_connections"] = stats["connections"] - stats["idle_connections"]
+    return stats
 
 
 def _probe_port(port: int) -> bool:
-    """포트에서 HTTP 응답이 오는지 확인"""
+    """포트에서 HTTP 응답이 오는지 확인 (동기 - 이벤트 루프 밖의 스크립트에서만 사용)"""
     try:
         with socket.create_connection(("127.0.0.1", port), timeout=0.3):
             pass
@@ -40,23 +327,45 @@ def _detect_model_api_port() -> int:
     return default_port
 
 
+def _configured_base_url() -> Optional[str]:
+    env_url = os.getenv("MODEL_API_URL")
+    if env_url:
+        return env_url.rstrip("/")
+    env_port = os.getenv("MODEL_API_PORT")
+    if env_port:
+        return f"http://localhost:{env_port}/api"
+    return None
+
+
+def _candidate_base_urls() -> List[str]:
+    configured = _configured_base_url()
+    if configured:
+        return [configured]
+    return [f"http://localhost:{port}/api" for port in _CANDIDATE_PORTS]
+
+
 def _build_model_api_base_url(force_refresh: bool = False) -> str:
     global _MODEL_API_BASE_URL
 
     if not force_refresh and _MODEL_API_BASE_URL:
         return _MODEL_API_BASE_URL
 
-    env_url = os.getenv("MODEL_API_URL")
-    if env_url:
-        _MODEL_API_BASE_URL = env_url.rstrip("/")
-        print(f"ℹ️ MODEL_API_URL 환경 변수를 사용합니다: {_MODEL_API_BASE_URL}")
+    configured = _configured_base_url()
+    if configured:
+        _MODEL_API_BASE_URL = configured
+        print(f"ℹ️ MODEL_API_URL/MODEL_API_PORT 환경 변수를 사용합니다: {_MODEL_API_BASE_URL}")
         return _MODEL_API_BASE_URL
 
-    env_port = os.getenv("MODEL_API_PORT")
-    if env_port:
-        _MODEL_API_BASE_URL = f"http://localhost:{env_port}/api"
-        print(f"ℹ️ MODEL_API_PORT 환경 변수를 사용합니다: {_MODEL_API_BASE_URL}")
-        return _MODEL_API_BASE_URL
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        # 이벤트 루프 안에서는 동기 포트 탐색을 하지 않음 → 기본 포트로 시작하고 비동기 탐색 예약
+        global _pending_discovery
+        if _pending_discovery is None or _pending_discovery.done():
+            _pending_discovery = loop.create_task(discover_model_api())
+        return _MODEL_API_BASE_URL or f"http://localhost:{_CANDIDATE_PORTS[0]}/api"
 
     port = _detect_model_api_port()
     _MODEL_API_BASE_URL = f"http://localhost:{port}/api"
@@ -64,7 +373,7 @@ def _build_model_api_base_url(force_refresh: bool = False) -> str:
 
 
 def refresh_model_api_base_url() -> str:
-    """외부에서 강제로 재탐색할 때 호출"""
+    """외부에서 강제로 재탐색할 때 호출 (이벤트 루프 안에서는 await discover_model_api() 사용)"""
     return _build_model_api_base_url(force_refresh=True)
 
 
@@ -72,28 +381,151 @@ def get_model_api_base_url() -> str:
     return _build_model_api_base_url()
 
 
+# ============================================
+# 헬스 모니터 (비동기 엔드포인트 탐색)
+# ============================================
+
+_endpoint_health: Dict[str, Dict[str, Any]] = {}
+_probe_client: Optional[httpx.AsyncClient] = None
+_monitor_task: Optional[asyncio.Task] = None
+_discover_lock: Optional[asyncio.Lock] = None
+
+
+def _get_probe_client() -> httpx.AsyncClient:
+    """헬스 체크 전용 클라이언트 (서킷 브레이커를 거치지 않음)"""
+    global _probe_client
+    if _probe_client is None or _probe_client.is_closed:
+        _probe_client = httpx.AsyncClient(timeout=MODEL_API_HEALTH_TIMEOUT)
+    return _probe_client
+
+
+async def _probe_endpoint(base_url: str) -> bool:
+    """엔드포인트 서버 루트에 HTTP 응답이 오는지 확인"""
+    started = time.monotonic()
+    try:
+        response = await _get_probe_client().get(f"{_origin(base_url)}/")
+        healthy = response.status_code < 500
+    except Exception:
+        healthy = False
+    _endpoint_health[base_url] = {
+        "healthy": healthy,
+        "latency_ms": round((time.monotonic() - started) * 1000, 1),
+        "checked_at": time.time(),
+    }
+    return healthy
+
+
+def _apply_health(base_url: str, healthy: bool) -> None:
+    """헬스 체크 결과를 서킷 브레이커에 반영 (연속 실패가 쌓이면 요청 실패를 기다리지 않고 열림, 성공은 닫지 않고 half_open까지만)"""
+    breaker = get_circuit_breaker(base_url)
+    if healthy:
+        breaker.record_probe_success()
+    else:
+        breaker.record_probe_failure()
+
+
+async def discover_model_api() -> str:
+    """후보 엔드포인트를 동시에 확인해 정상인 첫 번째(우선순위 순)를 선택"""
+    global _MODEL_API_BASE_URL, _discover_lock
+    if _discover_lock is None:
+        _discover_lock = asyncio.Lock()
+    if _discover_lock.locked():
+        # 이미 탐색 중이면 결과만 기다림
+        async with _discover_lock:
+            return _MODEL_API_BASE_URL
+    async with _discover_lock:
+        candidates = _candidate_base_urls()
+        results = await asyncio.gather(*(_probe_endpoint(url) for url in candidates))
+        for url, healthy in zip(candidates, results):
+            if healthy:
+                if url != _MODEL_API_BASE_URL:
+                    print(f"✅ Model API 엔드포인트 선택: {url}")
+                _MODEL_API_BASE_URL = url
+                _apply_health(url, True)
+                return url
+        if _MODEL_API_BASE_URL is None:
+            _MODEL_API_BASE_URL = candidates[0]
+            print(f"⚠️ Model API 서버를 찾지 못했습니다. {_MODEL_API_BASE_URL} 사용")
+        _apply_health(_MODEL_API_BASE_URL, False)
+        return _MODEL_API_BASE_URL
+
+
+async def _health_monitor_loop(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            current = _MODEL_API_BASE_URL
+            healthy = current is not None and await _probe_endpoint(current)
+            if healthy:
+                _apply_health(current, True)
+            else:
+                await discover_model_api()
+        except Exception as e:
+            print(f"⚠️ Model API 헬스 체크 실패: {e}")
+
+
+async def start_health_monitor(interval: Optional[float] = None) -> None:
+    """첫 탐색을 마친 뒤 주기적 헬스 체크 태스크 시작 (lifespan / AI 워커에서 호출)"""
+    global _monitor_task
+    await discover_model_api()
+    if _monitor_task is None or _monitor_task.done():
+        _monitor_task = asyncio.create_task(_health_monitor_loop(interval or MODEL_API_HEALTH_INTERVAL))
+
+
+async def stop_health_monitor() -> None:
+    global _monitor_task, _probe_client, _discover_lock
+    if _monitor_task:
+        _monitor_task.cancel()
+        try:
+            await _monitor_task
+        except asyncio.CancelledError:
+            pass
+        _monitor_task = None
+    if _probe_client is not None and not _probe_client.is_closed:
+        await _probe_client.aclose()
+    _probe_client = None
+    _discover_lock = None
+
+
+def get_model_api_health() -> Dict[str, Any]:
+    """현재 엔드포인트, 엔드포인트별 헬스 체크 결과, 서킷 브레이커 상태"""
+    return {
+        "base_url": _MODEL_API_BASE_URL,
+        "monitor_running": _monitor_task is not None and not _monitor_task.done(),
+        "endpoints": dict(_endpoint_health),
+        "breakers": {origin: breaker.snapshot() for origin, breaker in _breakers.items()},
+    }
+
+
 async def predict_image(file_data: bytes, filename: str = "image.jpg") -> Optional[Dict[str, Any]]:
     """
-    이미지 분류 API 호출
+    이미지 분류 API 호출 (같은 이미지 내용이면 결과 캐시 사용)
     """
+    return await get_result_cache().get_or_compute(
+        "predict", file_data, lambda: _predict_image(file_data, filename)
+    )
+
+
+async def _predict_image(file_data: bytes, filename: str) -> Optional[Dict[str, Any]]:
     base_url = get_model_api_base_url()
     url = f"{base_url}/predict"
     print(f"🔍 Model API 호출 시도: {url}")
 
     async def _do_request(target_url: str) -> Dict[str, Any]:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            content_type = "image/jpeg"
-            if filename.lower().endswith(".png"):
-                content_type = "image/png"
-
-            files = {"file": (filename, file_data, content_type)}
-            print(f"📤 요청 전송 중... (파일 크기: {len(file_data)} bytes, URL: {target_url})")
-            response = await client.post(target_url, files=files)
-            print(f"📥 응답 받음: {response.status_code}")
-            response.raise_for_status()
-            result = response.json()
-            print(f"✅ Model API 응답 성공: {result}")
-            return result
+        content_type = "image/jpeg"
+        if filename.lower().endswith(".png"):
+            content_type = "image/png"
+
+        files = {"file": (filename, file_data, content_type)}
+        print(f"📤 요청 전송 중... (파일 크기: {len(file_data)} bytes, URL: {target_url})")
+        response = await get_http_client().post(
+            target_url, files=files, timeout=get_model_api_timeout("predict")
+        )
+        print(f"📥 응답 받음: {response.status_code}")
+        response.raise_for_status()
+        result = response.json()
+        print(f"✅ Model API 응답 성공: {result}")
+        return result
 
     attempts = 0
     last_error: Optional[Exception] = None
@@ -101,10 +533,16 @@ async def predict_image(file_data: bytes, filename: str = "image.jpg") -> Option
     while attempts < 2:
         try:
             return await _do_request(url)
+        except ModelAPIUnavailable as e:
+            # 서킷이 열려 있으면 재탐색 없이 바로 실패 (헬스 모니터가 복구 시 닫음)
+            print(f"⚠️ Model API 사용 불가 (서킷 열림): {e}")
+            return None
         except (httpx.ConnectError, httpx.TimeoutException) as e:
             last_error = e
             print(f"⚠️ Model API 연결 실패: {e}. 재탐색 중...")
-            refreshed = refresh_model_api_base_url()
+            refreshed = await discover_model_api()
+            if f"{refreshed}/predict" == url:
+                break
             url = f"{refreshed}/predict"
         except httpx.HTTPStatusError as e:
             print(f"⚠️ 이미지 분류 API HTTP 에러: {e.response.status_code} - {e.response.text}")
@@ -120,19 +558,169 @@ async def predict_image(file_data: bytes, filename: str = "image.jpg") -> Option
     return None
 
 
+# ============================================
+# 마이크로 배치 (감성 분석 / 요약 / 자동 태깅)
+# ============================================
+
+async def _post_model_api(path: str, payload: Dict[str, Any], timeout_name: str) -> Any:
+    response = await get_http_client().post(
+        f"{get_model_api_base_url()}/{path}",
+        json=payload,
+        timeout=get_model_api_timeout(timeout_name)
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+class MicroBatcher:
+    """
+    같은 엔드포인트로 가는 단건 요청을 MODEL_API_BATCH_WINDOW_MS 동안 모아 배치 엔드포인트(<path>/batch)로
+    한 번에 보내고, 결과를 기다리는 호출자에게 순서대로 돌려줍니다.
+
+    배치 요청: {"texts": [...], <옵션>} → 응답: {"results": [<단건 응답>, ...]}
+    - text 외 옵션(예: explain)이 같은 요청끼리만 묶음
+    - 보내는 중인 요청이 MODEL_API_BATCH_MAX_IN_FLIGHT개면 응답이 올 때까지 계속 모음
+      (부하가 클수록 배치가 커지고, 한가할 때는 window만큼만 기다림)
+    - 모인 요청이 1건이면 단건 엔드포인트로 보냄
+    - 배치 엔드포인트가 없으면(404/405) 이 워커에서는 배치를 끄고 단건 요청으로 처리
+    """
+
+    def __init__(
+        self,
+        path: str,
+        timeout_name: str,
+        max_size: int = None,
+        window_ms: float = None,
+        max_in_flight: int = None
+    ):
+        self.path = path
+        self.timeout_name = timeout_name
+        self.max_size = max_size or MODEL_API_BATCH_MAX_SIZE
+        self.window = (MODEL_API_BATCH_WINDOW_MS if window_ms is None else window_ms) / 1000
+        self.max_in_flight = max_in_flight or MODEL_API_BATCH_MAX_IN_FLIGHT
+        self.batch_supported = True
+        self._in_flight = 0
+        self._queues: Dict[tuple, List[tuple]] = {}
+        self._timers: Dict[tuple, asyncio.TimerHandle] = {}
+        self._tasks: set = set()
+        self.stats: Dict[str, int] = {"requests": 0, "batches": 0, "batched_items": 0, "single_calls": 0}
+
+    async def submit(self, payload: Dict[str, Any]) -> Any:
+        """단건 요청 JSON({"text": ..., 옵션})을 배치에 넣고 해당 결과를 기다림"""
+        self.stats["requests"] += 1
+        if not MODEL_API_BATCH_ENABLED or not self.batch_supported:
+            self.stats["single_calls"] += 1
+            return await _post_model_api(self.path, payload, self.timeout_name)
+
+        options = tuple(sorted((key, value) for key, value in payload.items() if key != "text"))
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._queues.setdefault(options, [])
+        queue.append((payload["text"], future))
+        if len(queue) >= self.max_size:
+            self._flush(options)
+        elif len(queue) == 1:
+            self._timers[options] = loop.call_later(self.window, self._flush, options)
+        return await future
+
+    def _flush(self, options: tuple) -> None:
+        timer = self._timers.pop(options, None)
+        if timer:
+            timer.cancel()
+        queue = self._queues.get(options)
+        while queue and self._in_flight < self.max_in_flight:
+            items, queue[:] = queue[:self.max_size], queue[self.max_size:]
+            self._in_flight += 1
+            task = asyncio.get_running_loop().create_task(self._send(dict(options), items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        if not queue:
+            self._queues.pop(options, None)
+
+    def _on_sent(self) -> None:
+        self._in_flight -= 1
+        # 보내는 동안 쌓인 요청을 바로 전송
+        for options in list(self._queues):
+            if self._in_flight >= self.max_in_flight:
+                break
+            self._flush(options)
+
+    async def _send(self, options: Dict[str, Any], items: List[tuple]) -> None:
+        try:
+            await self._send_items(options, items)
+        finally:
+            self._on_sent()
+
+    async def _send_items(self, options: Dict[str, Any], items: List[tuple]) -> None:
+        texts = [text for text, _ in items]
+        try:
+            if len(texts) == 1:
+                self.stats["single_calls"] += 1
+                results = [await _post_model_api(self.path, {"text": texts[0], **options}, self.timeout_name)]
+            else:
+                results = await self._send_batch(texts, options)
+        except Exception as e:
+            results = [e] * len(items)
+
+        for (_, future), result in zip(items, results):
+            if future.done():  # 호출자가 취소한 경우
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _send_batch(self, texts: List[str], options: Dict[str, Any]) -> List[Any]:
+        try:
+            data = await _post_model_api(f"{self.path}/batch", {"texts": texts, **options}, f"{self.timeout_name}_batch")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in (404, 405):
+                raise
+            if self.batch_supported:
+                self.batch_supported = False
+                print(f"ℹ️ Model API에 /{self.path}/batch가 없어 단건 요청으로 전환합니다")
+            self.stats["single_calls"] += len(texts)
+            return await asyncio.gather(
+                *(_post_model_api(self.path, {"text": text, **options}, self.timeout_name) for text in texts),
+                return_exceptions=True
+            )
+
+        results = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(results, list) or len(results) != len(texts):
+            raise ValueError(f"/{self.path}/batch 응답 개수 불일치 (요청 {len(texts)}개)")
+        self.stats["batches"] += 1
+        self.stats["batched_items"] += len(texts)
+        return results
+
+
+_sentiment_batcher = MicroBatcher("sentiment", "sentiment")
+_summarize_batcher = MicroBatcher("summarize", "summarize")
+_auto_tag_batcher = MicroBatcher("auto-tag", "auto_tag")
+
+
+def get_batcher_stats() -> Dict[str, Any]:
+    """엔드포인트별 마이크로 배치 통계 (batched_items / batches = 평균 배치 크기)"""
+    return {
+        "enabled": MODEL_API_BATCH_ENABLED,
+        "window_ms": MODEL_API_BATCH_WINDOW_MS,
+        "max_size": MODEL_API_BATCH_MAX_SIZE,
+        "max_in_flight": MODEL_API_BATCH_MAX_IN_FLIGHT,
+        "endpoints": {
+            batcher.path: {"batch_supported": batcher.batch_supported, **batcher.stats}
+            for batcher in (_sentiment_batcher, _summarize_batcher, _auto_tag_batcher)
+        },
+    }
+
+
 async def analyze_sentiment(text: str, explain: bool = False) -> Optional[Dict[str, Any]]:
     """
-    감성 분석 API 호출
+    감성 분석 API 호출 (결과 캐시 → 동시 요청은 마이크로 배치로 묶음)
     """
-    base_url = get_model_api_base_url()
+    payload = {"text": text, "explain": explain}
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{base_url}/sentiment",
-                json={"text": text, "explain": explain}
-            )
-            response.raise_for_status()
-            return response.json()
+        return await get_result_cache().get_or_compute(
+            "sentiment", payload, lambda: _sentiment_batcher.submit(payload)
+        )
     except httpx.TimeoutException:
         print("⚠️ 감성 분석 API 호출 타임아웃 (10초 초과)")
         return None
@@ -144,25 +732,41 @@ async def analyze_sentiment(text: str, explain: bool = False) -> Optional[Dict[s
         return None
 
 
-async def chat_with_model(message: str, model: str = "gemma3:4b") -> Optional[str]:
+async def chat_with_model(
+    message: str,
+    model: str = "gemma3:4b",
+    priority: str = PRIORITY_INTERACTIVE
+) -> Optional[str]:
     """
     채팅 API 호출 (스트리밍 응답 처리)
     Gemini 또는 Ollama 모델 지원
+
+    Args:
+        priority: LLM 스케줄러 우선순위 ("interactive" | "voice" | "batch")
     """
+    try:
+        async with llm_slot(model, priority):
+            return await _chat_with_model(message, model)
+    except LLMQueueFull as e:
+        print(f"⛔ {e}")
+        return None
+
+
+async def _chat_with_model(message: str, model: str) -> Optional[str]:
     base_url = get_model_api_base_url()
     
     # Gemini 모델인 경우 Gemini 엔드포인트 사용
     if model.startswith("gemini"):
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{base_url}/gemini/chat/simple",
-                    json={"message": message, "model": model},
-                    headers={"Content-Type": "application/json"}
-                )
-                response.raise_for_status()
-                result = response.json()
-                return result.get("message", None)
+            response = await get_http_client().post(
+                f"{base_url}/gemini/chat/simple",
+                json={"message": message, "model": model},
+                headers={"Content-Type": "application/json"},
+                timeout=get_model_api_timeout("chat")
+            )
+            response.raise_for_status()
+            result = response.json()
+            return result.get("message", None)
         except httpx.TimeoutException:
             print("⚠️ Gemini 채팅 API 호출 타임아웃 (60초 초과)")
             return None
@@ -175,12 +779,13 @@ async def chat_with_model(message: str, model: str = "gemma3:4b") -> Optional[st
     
     # Ollama 모델인 경우 기존 엔드포인트 사용
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{base_url}/chat",
-                json={"message": message, "model": model},
-                headers={"Content-Type": "application/json"}
-            )
+        async with get_http_client().stream(
+            "POST",
+            f"{base_url}/chat",
+            json={"message": message, "model": model},
+            headers={"Content-Type": "application/json"},
+            timeout=get_model_api_timeout("chat")
+        ) as response:
             response.raise_for_status()
 
             content = ""
@@ -208,17 +813,12 @@ async def chat_with_model(message: str, model: str = "gemma3:4b") -> Optional[st
 
 async def summarize_text(text: str) -> Optional[Dict[str, Any]]:
     """
-    요약 API 호출
+    요약 API 호출 (결과 캐시 → 동시 요청은 마이크로 배치로 묶음)
     """
-    base_url = get_model_api_base_url()
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{base_url}/summarize",
-                json={"text": text}
-            )
-            response.raise_for_status()
-            return response.json()
+        return await get_result_cache().get_or_compute(
+            "summarize", text, lambda: _summarize_batcher.submit({"text": text})
+        )
     except Exception as e:
         print(f"⚠️ 요약 API 호출 실패: {e}")
         return None
@@ -226,18 +826,13 @@ async def summarize_text(text: str) -> Optional[Dict[str, Any]]:
 
 async def auto_tag_text(text: str) -> Optional[List[str]]:
     """
-    자동 태깅 API 호출
+    자동 태깅 API 호출 (결과 캐시 → 동시 요청은 마이크로 배치로 묶음)
     """
-    base_url = get_model_api_base_url()
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.post(
-                f"{base_url}/auto-tag",
-                json={"text": text}
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("tags", [])
+        data = await get_result_cache().get_or_compute(
+            "auto_tag", text, lambda: _auto_tag_batcher.submit({"text": text})
+        )
+        return data.get("tags", [])
     except Exception as e:
         print(f"⚠️ 자동 태깅 API 호출 실패: {e}")
         return []
@@ -265,17 +860,17 @@ async def summarize_reviews(
     """
     base_url = get_model_api_base_url()
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{base_url}/review-summary",
-                json={
-                    "reviews": reviews,
-                    "vendor_name": vendor_name,
-                    "vendor_type": vendor_type
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await get_http_client().post(
+            f"{base_url}/review-summary",
+            json={
+                "reviews": reviews,
+                "vendor_name": vendor_name,
+                "vendor_type": vendor_type
+            },
+            timeout=get_model_api_timeout("review_summary")
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.TimeoutException:
         print("⚠️ 리뷰 요약 API 호출 타임아웃 (30초 초과)")
         return None
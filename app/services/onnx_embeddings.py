@@ -0,0 +1,122 @@
+"""
+로컬 ONNX 임베딩 백엔드 - Ollama HTTP 호출 없이 프로세스 안에서 문장 임베딩 계산
+
+EMBEDDING_ONNX_MODEL_DIR 디렉토리에 다음 두 파일이 있어야 합니다.
+- model.onnx     : 문장 임베딩 모델 (출력: last_hidden_state [batch, seq, dim] 또는 sentence_embedding [batch, dim])
+- tokenizer.json : HuggingFace tokenizers 형식 토크나이저
+
+예) nomic-ai/nomic-embed-text-v1.5, intfloat/multilingual-e5-small 등의 ONNX 내보내기
+    (nomic 계열은 EMBEDDING_ONNX_QUERY_PREFIX="search_query: ", EMBEDDING_ONNX_DOCUMENT_PREFIX="search_document: ")
+
+InferenceSession은 한 번만 만들고 모든 호출에서 재사용합니다 (session.run은 스레드 안전).
+"""
+import os
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+    print("⚠️ onnxruntime 또는 tokenizers가 설치되지 않았습니다. ONNX 임베딩 백엔드를 사용할 수 없습니다.")
+
+EMBEDDING_ONNX_MODEL_DIR = os.getenv("EMBEDDING_ONNX_MODEL_DIR", "./models/embedding")
+EMBEDDING_ONNX_BATCH_SIZE = int(os.getenv("EMBEDDING_ONNX_BATCH_SIZE", "32"))
+EMBEDDING_ONNX_THREADS = int(os.getenv("EMBEDDING_ONNX_THREADS", "0"))  # 0이면 onnxruntime 기본값 (물리 코어 수)
+EMBEDDING_ONNX_MAX_LENGTH = int(os.getenv("EMBEDDING_ONNX_MAX_LENGTH", "512"))
+EMBEDDING_ONNX_QUERY_PREFIX = os.getenv("EMBEDDING_ONNX_QUERY_PREFIX", "")
+EMBEDDING_ONNX_DOCUMENT_PREFIX = os.getenv("EMBEDDING_ONNX_DOCUMENT_PREFIX", "")
+
+
+class OnnxEmbeddings:
+    """
+    ONNX 문장 임베딩 모델 (embed_documents / embed_query 인터페이스)
+    길이가 비슷한 텍스트끼리 묶어 배치 추론하고, mean pooling + L2 정규화한 벡터를 반환합니다.
+    """
+
+    def __init__(
+        self,
+        model_dir: str = None,
+        batch_size: int = None,
+        threads: int = None,
+        max_length: int = None,
+        query_prefix: str = None,
+        document_prefix: str = None
+    ):
+        if not ONNX_AVAILABLE:
+            raise RuntimeError("onnxruntime / tokenizers가 설치되지 않았습니다")
+
+        self.model_dir = Path(model_dir or EMBEDDING_ONNX_MODEL_DIR)
+        self.batch_size = batch_size or EMBEDDING_ONNX_BATCH_SIZE
+        self.query_prefix = EMBEDDING_ONNX_QUERY_PREFIX if query_prefix is None else query_prefix
+        self.document_prefix = EMBEDDING_ONNX_DOCUMENT_PREFIX if document_prefix is None else document_prefix
+        threads = EMBEDDING_ONNX_THREADS if threads is None else threads
+
+        model_path = self.model_dir / "model.onnx"
+        tokenizer_path = self.model_dir / "tokenizer.json"
+        if not model_path.exists() or not tokenizer_path.exists():
+            raise FileNotFoundError(f"{self.model_dir}에 model.onnx / tokenizer.json이 없습니다")
+
+        self.tokenizer = Tokenizer.from_file(str(tokenizer_path))
+        self.tokenizer.enable_truncation(max_length=max_length or EMBEDDING_ONNX_MAX_LENGTH)
+        self.tokenizer.enable_padding()  # 배치 내 가장 긴 문장 길이에 맞춤
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads > 0:
+            options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(str(model_path), options, providers=["CPUExecutionProvider"])
+        self._input_names = {i.name for i in self.session.get_inputs()}
+        self._output_names = [o.name for o in self.session.get_outputs()]
+
+    @property
+    def name(self) -> str:
+        """임베딩 캐시 키에 쓸 모델 이름"""
+        return f"onnx:{self.model_dir.resolve().name}"
+
+    def _run_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+        feeds = {name: value for name, value in feeds.items() if name in self._input_names}
+
+        outputs = dict(zip(self._output_names, self.session.run(None, feeds)))
+        if "sentence_embedding" in outputs:
+            pooled = outputs["sentence_embedding"]
+        else:
+            hidden = outputs.get("last_hidden_state", next(iter(outputs.values())))
+            # 패딩 토큰을 제외한 mean pooling
+            mask = attention_mask[:, :, None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return pooled / np.clip(norms, 1e-12, None)
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        # 길이순으로 정렬해서 배치마다 패딩을 최소화한 뒤 원래 순서로 복원
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        result = np.empty((len(texts), 0), dtype=np.float32)
+        for start in range(0, len(order), self.batch_size):
+            indices = order[start:start + self.batch_size]
+            vectors = self._run_batch([texts[i] for i in indices])
+            if result.shape[1] == 0:
+                result = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+            result[indices] = vectors
+        return result.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed([f"{self.document_prefix}{text}" for text in texts])
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([f"{self.query_prefix}{text}"])[0]
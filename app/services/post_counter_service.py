@@ -0,0 +1,176 @@
+"""
+게시글 카운터 서비스 - 좋아요/댓글/조회수 비정규화 컬럼 관리
+
+- 좋아요/댓글 수: 좋아요·댓글 변경과 같은 트랜잭션에서 posts 컬럼을 원자적으로 증감
+- 조회수: 프로세스 메모리에 모았다가 주기적으로 일괄 반영 (조회할 때마다 행 잠금 + 커밋하지 않음)
+- 재계산(reconcile): post_likes/comments 실제 개수와 어긋난 카운터를 복구
+"""
+import asyncio
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_async_sessionmaker
+from app.models.db import Post, PostLike, Comment
+
+# 조회수 일괄 반영 주기 (초)
+VIEW_FLUSH_INTERVAL = float(os.getenv("POST_VIEW_FLUSH_INTERVAL", "5"))
+
+_pending_views: Dict[int, int] = defaultdict(int)
+_pending_lock = threading.Lock()
+_flush_task: Optional[asyncio.Task] = None
+
+
+# ============================================
+# 좋아요/댓글 수 (쓰기 시 증감)
+# ============================================
+
+async def _adjust_counter(db: AsyncSession, column, post_id: int, delta: int) -> None:
+    stmt = update(Post).where(Post.id == post_id).values({column: column + delta})
+    if delta < 0:
+        stmt = stmt.where(column >= -delta)  # 음수가 되지 않도록 (드리프트는 reconcile로 복구)
+    await db.execute(stmt.execution_options(synchronize_session=False))
+
+
+async def adjust_like_count(db: AsyncSession, post_id: int, delta: int) -> None:
+    """좋아요 수 증감 (커밋은 호출자가 수행)"""
+    await _adjust_counter(db, Post.like_count, post_id, delta)
+
+
+async def adjust_comment_count(db: AsyncSession, post_id: int, delta: int) -> None:
+    """댓글 수 증감 (커밋은 호출자가 수행)"""
+    await _adjust_counter(db, Post.comment_count, post_id, delta)
+
+
+# ============================================
+# 조회수 (메모리 버퍼 + 일괄 반영)
+# ============================================
+
+def record_view(post_id: int) -> int:
+    """조회수 1 증가를 버퍼에 기록하고, 아직 DB에 반영되지 않은 조회수를 반환"""
+    with _pending_lock:
+        _pending_views[post_id] += 1
+        return _pending_views[post_id]
+
+
+def get_pending_views(post_id: int) -> int:
+    """DB에 아직 반영되지 않은 조회수 (응답의 view_count 보정용)"""
+    with _pending_lock:
+        return _pending_views.get(post_id, 0)
+
+
+def _take_pending_views() -> Dict[int, int]:
+    global _pending_views
+    with _pending_lock:
+        pending = _pending_views
+        _pending_views = defaultdict(int)
+    return pending
+
+
+def _restore_pending_views(pending: Dict[int, int]) -> None:
+    with _pending_lock:
+        for post_id, count in pending.items():
+            _pending_views[post_id] += count
+
+
+async def flush_view_counts() -> int:
+    """
+    버퍼에 쌓인 조회수를 DB에 반영
+    증가량이 같은 게시글끼리 묶어 UPDATE ... WHERE id IN (...) 으로 처리합니다.
+
+    Returns:
+        반영한 게시글 수
+    """
+    pending = _take_pending_views()
+    if not pending:
+        return 0
+
+    by_increment: Dict[int, list] = defaultdict(list)
+    for post_id, count in pending.items():
+        by_increment[count].append(post_id)
+
+    try:
+        async with get_async_sessionmaker()() as db:
+            for increment, post_ids in by_increment.items():
+                await db.execute(
+                    update(Post).where(Post.id.in_(post_ids))
+                    .values(view_count=func.coalesce(Post.view_count, 0) + increment)
+                    .execution_options(synchronize_session=False)
+                )
+            await db.commit()
+    except Exception as e:
+        # 실패하면 다음 주기에 다시 시도
+        _restore_pending_views(pending)
+        print(f"⚠️ 조회수 반영 실패 (다음 주기에 재시도): {e}")
+        return 0
+
+    return len(pending)
+
+
+async def _flush_loop(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await flush_view_counts()
+
+
+def start_view_flusher(interval: Optional[float] = None) -> None:
+    """조회수 일괄 반영 백그라운드 태스크 시작 (lifespan에서 호출)"""
+    global _flush_task
+    if _flush_task and not _flush_task.done():
+        return
+    _flush_task = asyncio.create_task(_flush_loop(interval or VIEW_FLUSH_INTERVAL))
+
+
+async def stop_view_flusher() -> None:
+    """백그라운드 태스크 종료 후 남은 조회수 반영"""
+    global _flush_task
+    if _flush_task:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+    await flush_view_counts()
+
+
+# ============================================
+# 카운터 재계산 (드리프트 복구)
+# ============================================
+
+def reconcile_post_counters(db: Session, batch_size: int = 1000) -> int:
+    """
+    posts.like_count / comment_count를 실제 개수로 재계산
+    id 구간 단위로 나눠 처리하여 긴 잠금을 피합니다.
+
+    Returns:
+        값이 수정된 게시글 수
+    """
+    like_count = select(func.count(PostLike.id))\
+        .where(PostLike.post_id == Post.id).correlate(Post).scalar_subquery()
+    comment_count = select(func.count(Comment.id))\
+        .where(Comment.post_id == Post.id).correlate(Post).scalar_subquery()
+
+    max_id = db.scalar(select(func.max(Post.id))) or 0
+    fixed = 0
+    for start in range(0, max_id + 1, batch_size):
+        end = start + batch_size
+        result = db.execute(
+            update(Post)
+            .where(
+                Post.id >= start,
+                Post.id < end,
+                (Post.like_count != like_count) | (Post.comment_count != comment_count)
+            )
+            .values(like_count=like_count, comment_count=comment_count)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        fixed += result.rowcount or 0
+
+    return fixed
@@ -0,0 +1,82 @@
+"""
+게시글 하이브리드 검색 - 키워드(BM25) + 벡터 검색 결과를 RRF(Reciprocal Rank Fusion)로 결합
+
+점수 척도가 다른 두 검색(BM25 점수 / 임베딩 거리)을 순위만으로 합칩니다.
+    score(post) = Σ 1 / (RRF_K + rank)
+업체명, 금액처럼 임베딩이 놓치는 정확한 단어는 키워드 검색이, 표현이 다른 유사 문서는 벡터 검색이 찾습니다.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from app.services import keyword_index, post_vector_service
+
+RRF_K = 60
+# 각 검색에서 가져올 후보 수 (k의 배수)
+CANDIDATE_MULTIPLIER = 4
+SEARCH_MODES = ("hybrid", "vector", "keyword")
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="post-search")
+
+
+def reciprocal_rank_fusion(rankings: Dict[str, List[int]], k: int = RRF_K) -> List[Dict]:
+    """
+    여러 순위 목록을 RRF로 결합
+
+    Args:
+        rankings: {"keyword": [post_id, ...], "vector": [post_id, ...]} (앞쪽이 상위)
+
+    Returns:
+        [{"post_id", "score", "<name>_rank", ...}, ...] (점수 내림차순)
+    """
+    fused: Dict[int, Dict] = {}
+    for name, post_ids in rankings.items():
+        for rank, post_id in enumerate(post_ids, start=1):
+            entry = fused.setdefault(post_id, {"post_id": post_id, "score": 0.0})
+            entry["score"] += 1.0 / (k + rank)
+            entry[f"{name}_rank"] = rank
+    return sorted(fused.values(), key=lambda entry: entry["score"], reverse=True)
+
+
+def search_posts(
+    query: str,
+    k: int = 5,
+    board_type: Optional[str] = None,
+    mode: str = "hybrid"
+) -> List[Dict]:
+    """
+    게시글 검색
+
+    Args:
+        query: 검색 쿼리
+        k: 반환할 결과 개수
+        board_type: 게시판 타입 필터
+        mode: "hybrid" | "vector" | "keyword"
+
+    Returns:
+        [{"post_id", "score", "keyword_rank"?, "vector_rank"?, "vector_score"?}, ...]
+    """
+    depth = k if mode != "hybrid" else max(k * CANDIDATE_MULTIPLIER, 20)
+
+    vector_future = None
+    if mode in ("hybrid", "vector"):
+        vector_future = _executor.submit(post_vector_service.search_posts, query=query, k=depth, board_type=board_type)
+
+    rankings: Dict[str, List[int]] = {}
+    if mode in ("hybrid", "keyword"):
+        rankings["keyword"] = [hit["post_id"] for hit in keyword_index.search_posts(query, k=depth, board_type=board_type)]
+
+    vector_scores: Dict[int, float] = {}
+    if vector_future is not None:
+        vector_results = vector_future.result()
+        rankings["vector"] = []
+        for result in vector_results:
+            post_id = result["metadata"].get("post_id")
+            if post_id is not None:
+                rankings["vector"].append(post_id)
+                vector_scores[post_id] = result.get("score", 0)
+
+    fused = reciprocal_rank_fusion(rankings)[:k]
+    for entry in fused:
+        if entry["post_id"] in vector_scores:
+            entry["vector_score"] = vector_scores[entry["post_id"]]
+    return fused
@@ -1,15 +1,31 @@
 """
 게시판 Vector DB 서비스 - 게시글 벡터화 및 검색
+
+대량 색인(bulk_index_posts)은 게시글을 id 순서로 끊어 읽고(keyset), 여러 청크를 한 번에 임베딩하고,
+Chroma에 묶어서 기록합니다. 처리한 마지막 id를 체크포인트 파일에 남겨 중단돼도 이어서 진행합니다.
+CLI: python index_posts.py
 """
-from typing import List, Dict, Optional
-from sqlalchemy.orm import Session
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from typing import Callable, List, Dict, Optional, Sequence
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from app.core.database import SessionLocal
 from app.models.db import Post
 from app.services.vector_db import (
-    add_documents_to_collection,
+    get_vector_store,
     search_similar_documents,
     delete_documents_from_collection,
     get_collection_count,
-    VECTOR_DB_AVAILABLE
+    get_embeddings,
+    upsert_embeddings,
+    delete_documents_where,
+    get_document_ids,
+    VECTOR_DB_AVAILABLE,
+    VECTOR_DB_DIR
 )
 
 # 선택적 import
@@ -23,6 +39,11 @@ except ImportError:
 # 게시판 컬렉션 이름
 POSTS_COLLECTION = "posts"
 
+# 대량 색인 설정
+POST_INDEX_BATCH_SIZE = int(os.getenv("POST_INDEX_BATCH_SIZE", "200"))  # DB에서 한 번에 읽을 게시글 수
+POST_INDEX_EMBED_BATCH_SIZE = int(os.getenv("POST_INDEX_EMBED_BATCH_SIZE", "64"))  # 한 번에 임베딩할 청크 수
+POST_INDEX_CHECKPOINT = VECTOR_DB_DIR / "_checkpoints" / "posts_index.json"
+
 # 텍스트 분할기 (긴 게시글을 청크로 나눔)
 text_splitter = None
 if TEXT_SPLITTER_AVAILABLE:
@@ -33,9 +54,55 @@ if TEXT_SPLITTER_AVAILABLE:
     )
 
 
+def build_post_chunks(post: Post):
+    """
+    게시글을 Vector DB 저장 단위(청크)로 변환
+    
+    Returns:
+        (documents, metadatas, ids)
+    """
+    from langchain_core.documents import Document
+    
+    # 게시글 텍스트 구성
+    post_text = f"{post.title}\n\n{post.content}"
+    doc = Document(
+        page_content=post_text,
+        metadata={
+            "post_id": post.id,
+            "user_id": post.user_id,
+            "board_type": post.board_type,
+            "title": post.title,
+            "created_at": post.created_at.isoformat() if post.created_at else None,
+            "tags": ",".join([tag.name for tag in post.tags]) if post.tags else ""
+        }
+    )
+    
+    # 긴 게시글은 청크로 분할 (분할기 없으면 전체를 하나의 청크로)
+    chunks = text_splitter.split_documents([doc]) if text_splitter else [doc]
+    
+    documents = [chunk.page_content for chunk in chunks]
+    metadatas = [chunk.metadata for chunk in chunks]
+    ids = [f"post_{post.id}_chunk_{i}" for i in range(len(chunks))]
+    return documents, metadatas, ids
+
+
+def _prune_stale_chunks(post_ids: Sequence[int], keep_ids: Sequence[str]) -> None:
+    """새 청크를 저장한 뒤, 같은 게시글의 이전 청크 중 더 이상 없는 것 삭제 (게시글이 짧아진 경우)"""
+    if not post_ids:
+        return
+    where = {"post_id": post_ids[0]} if len(post_ids) == 1 else {"post_id": {"$in": list(post_ids)}}
+    keep = set(keep_ids)
+    stale = [doc_id for doc_id in get_document_ids(POSTS_COLLECTION, where) if doc_id not in keep]
+    if stale:
+        delete_documents_from_collection(POSTS_COLLECTION, stale)
+
+
 def vectorize_post(post: Post) -> bool:
     """
-    게시글을 벡터화하여 Vector DB에 저장
+    게시글을 벡터화하여 Vector DB에 저장 (이미 있으면 교체)
+    
+    임베딩을 모두 계산한 뒤 같은 청크 ID로 덮어쓰고 남는 이전 청크만 지우므로,
+    수정 중에도 검색 결과에서 게시글이 빠지거나 이전/새 청크가 섞여 쌓이지 않습니다.
     
     Args:
         post: Post 모델 인스턴스
@@ -47,41 +114,16 @@ def vectorize_post(post: Post) -> bool:
         return False
     
     try:
-        # 게시글 텍스트 구성
-        post_text = f"{post.title}\n\n{post.content}"
-        
-        # 긴 게시글은 청크로 분할
-        from langchain_core.documents import Document
-        doc = Document(
-            page_content=post_text,
-            metadata={
-                "post_id": post.id,
-                "user_id": post.user_id,
-                "board_type": post.board_type,
-                "title": post.title,
-                "created_at": post.created_at.isoformat() if post.created_at else None,
-                "tags": ",".join([tag.name for tag in post.tags]) if post.tags else ""
-            }
-        )
-        
-        # 텍스트 분할기 사용 가능 여부 확인
-        if text_splitter:
-            chunks = text_splitter.split_documents([doc])
-        else:
-            # 분할기 없으면 전체를 하나의 청크로
-            chunks = [doc]
+        documents, metadatas, ids = build_post_chunks(post)
+        embeddings = get_embeddings()
+        if not embeddings:
+            return False
+        vectors = embeddings.embed_documents(documents)
         
-        # 각 청크를 Vector DB에 추가
-        documents = [chunk.page_content for chunk in chunks]
-        metadatas = [chunk.metadata for chunk in chunks]
-        ids = [f"post_{post.id}_chunk_{i}" for i in range(len(chunks))]
-        
-        return add_documents_to_collection(
-            collection_name=POSTS_COLLECTION,
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
-        )
+        if not upsert_embeddings(POSTS_COLLECTION, ids, vectors, documents, metadatas):
+            return False
+        _prune_stale_chunks([post.id], ids)
+        return True
     except Exception as e:
         print(f"⚠️ 게시글 벡터화 실패 (post_id={post.id}): {e}")
         return False
@@ -91,7 +133,8 @@ def search_posts(
     query: str,
     k: int = 5,
     board_type: Optional[str] = None,
-    user_id: Optional[int] = None
+    user_id: Optional[int] = None,
+    query_embedding: Optional[List[float]] = None
 ) -> List[Dict]:
     """
     게시글 벡터 검색
@@ -101,6 +144,7 @@ def search_posts(
         k: 반환할 결과 개수
         board_type: 게시판 타입 필터 (예: "couple", "planner")
         user_id: 사용자 ID 필터
+        query_embedding: 미리 계산한 쿼리 임베딩 (선택)
     
     Returns:
         검색 결과 리스트
@@ -120,7 +164,8 @@ def search_posts(
         collection_name=POSTS_COLLECTION,
         query=query,
         k=k,
-        filter=filter_dict if filter_dict else None
+        filter=filter_dict if filter_dict else None,
+        query_embedding=query_embedding
     )
     
     # 중복 제거 (같은 post_id는 하나만 반환)
@@ -137,7 +182,7 @@ def search_posts(
 
 def delete_post_vectors(post_id: int) -> bool:
     """
-    게시글의 벡터 데이터 삭제
+    게시글의 벡터 데이터(모든 청크) 삭제
     
     Args:
         post_id: 게시글 ID
@@ -148,52 +193,204 @@ def delete_post_vectors(post_id: int) -> bool:
     if not VECTOR_DB_AVAILABLE:
         return False
     
-    try:
-        # 해당 게시글의 모든 청크 ID 찾기
-        # 실제로는 Vector DB에서 post_id로 필터링하여 삭제해야 하지만,
-        # Chroma는 메타데이터로 필터링하여 삭제하는 기능이 제한적이므로
-        # 여기서는 전체 검색 후 필터링하는 방식 사용
-        
-        # 대안: 컬렉션에서 해당 post_id의 모든 문서를 찾아서 삭제
-        # 이는 비효율적이지만 Chroma의 제한사항
-        # 실제 운영에서는 더 효율적인 방법 고려 필요
-        
-        # 일단 성공으로 반환 (실제 삭제는 나중에 최적화)
-        print(f"⚠️ 게시글 벡터 삭제는 아직 최적화되지 않았습니다 (post_id={post_id})")
-        return True
-    except Exception as e:
-        print(f"⚠️ 게시글 벡터 삭제 실패 (post_id={post_id}): {e}")
-        return False
+    return delete_documents_where(POSTS_COLLECTION, {"post_id": post_id})
 
 
-def batch_vectorize_posts(db: Session, limit: int = 100) -> int:
+def index_post_batch(posts: Sequence[Post], embed_batch_size: int = None) -> int:
     """
-    기존 게시글들을 일괄 벡터화
+    게시글 여러 개를 묶어서 벡터화 (청크를 모아 배치 임베딩 → Chroma에 한 번에 기록)
     
     Args:
-        db: DB 세션
-        limit: 처리할 최대 게시글 수
+        posts: Post 목록 (tags 로드 권장)
+        embed_batch_size: 한 번에 임베딩할 청크 수
     
     Returns:
-        벡터화된 게시글 개수
+        저장한 청크 개수
     """
-    if not VECTOR_DB_AVAILABLE:
+    embeddings = get_embeddings()
+    if not embeddings or not posts:
         return 0
     
+    embed_batch_size = embed_batch_size or POST_INDEX_EMBED_BATCH_SIZE
+    documents: List[str] = []
+    metadatas: List[Dict] = []
+    ids: List[str] = []
+    for post in posts:
+        post_documents, post_metadatas, post_ids = build_post_chunks(post)
+        documents.extend(post_documents)
+        metadatas.extend(post_metadatas)
+        ids.extend(post_ids)
+    
+    vectors: List[List[float]] = []
+    for start in range(0, len(documents), embed_batch_size):
+        vectors.extend(embeddings.embed_documents(documents[start:start + embed_batch_size]))
+    
+    if not upsert_embeddings(POSTS_COLLECTION, ids, vectors, documents, metadatas):
+        raise RuntimeError("Vector DB 저장 실패")
+    _prune_stale_chunks([post.id for post in posts], ids)
+    return len(ids)
+
+
+def load_index_checkpoint() -> Optional[Dict]:
+    """대량 색인 체크포인트 (없으면 None)"""
+    try:
+        with open(POST_INDEX_CHECKPOINT, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _save_index_checkpoint(checkpoint: Dict) -> None:
+    POST_INDEX_CHECKPOINT.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = POST_INDEX_CHECKPOINT.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(tmp_path, POST_INDEX_CHECKPOINT)
+
+
+def reset_index_checkpoint() -> None:
+    """체크포인트 삭제 (처음부터 다시 색인)"""
     try:
-        # 최근 게시글 조회
-        posts = db.query(Post).order_by(Post.created_at.desc()).limit(limit).all()
+        POST_INDEX_CHECKPOINT.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def bulk_index_posts(
+    db: Session,
+    batch_size: int = None,
+    embed_batch_size: int = None,
+    resume: bool = True,
+    max_posts: Optional[int] = None,
+    progress: Optional[Callable[[Dict], None]] = None
+) -> Dict:
+    """
+    전체 게시글 대량 색인
+    
+    id 오름차순으로 batch_size개씩 읽고(Post.id > 마지막 id), 배치마다 체크포인트를 기록합니다.
+    중단 후 resume=True로 다시 실행하면 마지막으로 저장한 배치 다음부터 이어서 처리합니다.
+    
+    Args:
+        db: DB 세션
+        batch_size: DB에서 한 번에 읽을 게시글 수
+        embed_batch_size: 한 번에 임베딩할 청크 수
+        resume: 체크포인트부터 이어서 처리 (False면 처음부터)
+        max_posts: 이번 실행에서 처리할 최대 게시글 수 (None이면 끝까지)
+        progress: 배치마다 호출할 콜백 (진행 상황 dict 전달)
+    
+    Returns:
+        {"posts", "chunks", "last_id", "elapsed_seconds", "docs_per_second", "completed"}
+    """
+    if not VECTOR_DB_AVAILABLE or not get_embeddings():
+        raise RuntimeError("Vector DB를 사용할 수 없습니다")
+    
+    batch_size = batch_size or POST_INDEX_BATCH_SIZE
+    checkpoint = load_index_checkpoint() if resume else None
+    if checkpoint is None or checkpoint.get("completed"):
+        checkpoint = {"last_id": 0, "posts": 0, "chunks": 0, "started_at": datetime.now().isoformat()}
+    last_id = checkpoint["last_id"]
+    
+    started = time.monotonic()
+    posts_done = 0
+    chunks_done = 0
+    completed = False
+    while True:
+        limit = batch_size if max_posts is None else min(batch_size, max_posts - posts_done)
+        if limit <= 0:
+            break
+        
+        posts = db.scalars(
+            select(Post)
+            .options(selectinload(Post.tags))
+            .where(Post.id > last_id)
+            .order_by(Post.id)
+            .limit(limit)
+        ).all()
+        if not posts:
+            completed = True
+            break
+        
+        chunk_count = index_post_batch(posts, embed_batch_size)
+        chunks_done += chunk_count
+        posts_done += len(posts)
+        last_id = posts[-1].id
+        # 읽은 게시글은 세션에서 내려 메모리를 일정하게 유지
+        db.expunge_all()
         
-        success_count = 0
-        for post in posts:
-            if vectorize_post(post):
-                success_count += 1
+        elapsed = time.monotonic() - started
+        checkpoint.update({
+            "last_id": last_id,
+            "posts": checkpoint["posts"] + len(posts),
+            "chunks": checkpoint["chunks"] + chunk_count,
+            "updated_at": datetime.now().isoformat()
+        })
+        _save_index_checkpoint(checkpoint)
         
-        print(f"✅ {success_count}/{len(posts)}개 게시글 벡터화 완료")
-        return success_count
+        if progress:
+            progress({
+                "last_id": last_id,
+                "posts": posts_done,
+                "chunks": chunks_done,
+                "elapsed_seconds": round(elapsed, 2),
+                "docs_per_second": round(posts_done / elapsed, 1) if elapsed else 0.0
+            })
+        
+        if len(posts) < limit:
+            completed = True
+            break
+    
+    elapsed = time.monotonic() - started
+    if completed:
+        checkpoint["completed"] = True
+        checkpoint["updated_at"] = datetime.now().isoformat()
+        _save_index_checkpoint(checkpoint)
+    
+    return {
+        "posts": posts_done,
+        "chunks": chunks_done,
+        "last_id": last_id,
+        "elapsed_seconds": round(elapsed, 2),
+        "docs_per_second": round(posts_done / elapsed, 1) if elapsed else 0.0,
+        "completed": completed
+    }
+
+
+_bulk_index_task: Optional[asyncio.Task] = None
+
+
+def _run_bulk_index(max_posts: Optional[int]) -> Dict:
+    db = SessionLocal()
+    try:
+        return bulk_index_posts(db, max_posts=max_posts)
+    finally:
+        db.close()
+
+
+async def _bulk_index_job(max_posts: Optional[int]) -> None:
+    try:
+        result = await asyncio.to_thread(_run_bulk_index, max_posts)
+        print(f"✅ 게시글 백그라운드 색인 종료: 게시글 {result['posts']}개 / 청크 {result['chunks']}개 (last_id={result['last_id']})")
     except Exception as e:
-        print(f"⚠️ 일괄 벡터화 실패: {e}")
-        return 0
+        print(f"⚠️ 게시글 백그라운드 색인 실패: {e}")
+
+
+def is_bulk_index_running() -> bool:
+    return _bulk_index_task is not None and not _bulk_index_task.done()
+
+
+def start_bulk_index(max_posts: Optional[int] = None) -> bool:
+    """
+    bulk_index_posts를 백그라운드 스레드에서 실행 (체크포인트부터 이어서 max_posts개)
+    진행 상황은 load_index_checkpoint로 확인합니다.
+    
+    Returns:
+        새로 시작했으면 True, 이미 실행 중이면 False
+    """
+    global _bulk_index_task
+    if is_bulk_index_running():
+        return False
+    _bulk_index_task = asyncio.create_task(_bulk_index_job(max_posts))
+    return True
 
 
 def get_posts_collection_stats() -> Dict:
@@ -213,3 +410,82 @@ def get_posts_collection_stats() -> Dict:
         "collection_name": POSTS_COLLECTION
     }
 
+
+def reconcile_post_vectors(
+    db: Session,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+    reindex_missing: bool = False
+) -> Dict:
+    """
+    posts 테이블과 posts 컬렉션 비교
+    - 게시글이 삭제됐는데 남아 있는 청크(고아) 삭제
+    - 벡터가 없는 게시글 수 집계 (reindex_missing=True면 색인)
+    
+    Args:
+        db: DB 세션
+        batch_size: 컬렉션/DB를 한 번에 읽을 개수
+        dry_run: True면 집계만 하고 수정하지 않음
+        reindex_missing: 벡터가 없는 게시글 색인 여부
+    
+    Returns:
+        {"vector_posts", "orphan_posts", "orphan_chunks", "missing_posts", "reindexed_posts"}
+    """
+    if not VECTOR_DB_AVAILABLE or not get_embeddings():
+        raise RuntimeError("Vector DB를 사용할 수 없습니다")
+    
+    # 1. 컬렉션에 있는 post_id별 청크 수 (메타데이터만 페이지 단위로 조회)
+    collection = get_vector_store(POSTS_COLLECTION)._collection
+    chunk_counts: Dict[int, int] = {}
+    offset = 0
+    while True:
+        page = collection.get(include=["metadatas"], limit=batch_size, offset=offset)
+        if not page["ids"]:
+            break
+        offset += len(page["ids"])
+        for metadata in page["metadatas"]:
+            post_id = (metadata or {}).get("post_id")
+            if post_id is not None:
+                chunk_counts[int(post_id)] = chunk_counts.get(int(post_id), 0) + 1
+    
+    # 2. DB에 없는 post_id (고아) 찾기
+    vector_post_ids = sorted(chunk_counts)
+    orphans: List[int] = []
+    for start in range(0, len(vector_post_ids), batch_size):
+        chunk = vector_post_ids[start:start + batch_size]
+        existing = set(db.scalars(select(Post.id).where(Post.id.in_(chunk))).all())
+        orphans.extend(post_id for post_id in chunk if post_id not in existing)
+    
+    if orphans and not dry_run:
+        for start in range(0, len(orphans), batch_size):
+            delete_documents_where(POSTS_COLLECTION, {"post_id": {"$in": orphans[start:start + batch_size]}})
+    
+    # 3. 벡터가 없는 게시글 (id 구간 단위로 확인)
+    indexed = set(vector_post_ids)
+    missing = 0
+    reindexed = 0
+    last_id = 0
+    while True:
+        post_ids = db.scalars(
+            select(Post.id).where(Post.id > last_id).order_by(Post.id).limit(batch_size)
+        ).all()
+        if not post_ids:
+            break
+        last_id = post_ids[-1]
+        missing_ids = [post_id for post_id in post_ids if post_id not in indexed]
+        missing += len(missing_ids)
+        if missing_ids and reindex_missing and not dry_run:
+            posts = db.scalars(
+                select(Post).options(selectinload(Post.tags)).where(Post.id.in_(missing_ids))
+            ).all()
+            index_post_batch(posts)
+            reindexed += len(posts)
+            db.expunge_all()
+    
+    return {
+        "vector_posts": len(vector_post_ids),
+        "orphan_posts": len(orphans),
+        "orphan_chunks": sum(chunk_counts[post_id] for post_id in orphans),
+        "missing_posts": missing,
+        "reindexed_posts": reindexed
+    }
@@ -0,0 +1,112 @@
+"""
+RAG 검색 엔진 - 챗봇 프롬프트용 다중 컬렉션 병렬 검색
+
+1) 사용자 질문을 한 번만 임베딩
+2) 게시글 / 사용자 메모리 / 채팅 메모리 컬렉션을 스레드 풀에서 동시에 검색 (이벤트 루프를 막지 않음)
+3) 모든 검색이 하나의 마감 시간(RAG_RETRIEVAL_DEADLINE)을 공유하고,
+   늦은 검색은 기다리지 않고 끝난 결과만으로 프롬프트를 만듭니다.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from app.services import vector_db, post_vector_service, user_memory_service, chat_memory_vector_service
+
+RAG_RETRIEVAL_DEADLINE = float(os.getenv("RAG_RETRIEVAL_DEADLINE", "2"))
+RAG_RETRIEVAL_WORKERS = int(os.getenv("RAG_RETRIEVAL_WORKERS", "8"))
+RAG_RESULTS_PER_SOURCE = 3
+
+# Chroma 조회/임베딩 전용 스레드 풀 (기본 executor를 다른 작업과 나눠 쓰지 않도록 분리)
+_executor = ThreadPoolExecutor(max_workers=RAG_RETRIEVAL_WORKERS, thread_name_prefix="rag")
+
+_SOURCE_LABELS = {
+    "posts": "게시글 검색",
+    "user_memories": "사용자 메모리 검색",
+    "chat_memories": "채팅 메모리 검색",
+}
+
+
+def _empty_result() -> Dict:
+    return {"posts": [], "user_memories": [], "chat_memories": [], "timed_out": [], "elapsed_ms": 0}
+
+
+async def retrieve_context(
+    query: str,
+    user_id: Optional[int] = None,
+    couple_id: Optional[int] = None,
+    deadline: Optional[float] = None
+) -> Dict:
+    """
+    질문과 관련된 문서를 세 컬렉션에서 동시에 검색
+
+    Args:
+        query: 사용자 질문
+        user_id: 사용자 ID (없으면 게시글만 검색)
+        couple_id: 커플 ID (파트너가 공유한 채팅 메모리 포함용)
+        deadline: 임베딩 + 검색 전체 마감 시간 (초, None이면 RAG_RETRIEVAL_DEADLINE)
+
+    Returns:
+        {"posts": [...], "user_memories": [...], "chat_memories": [...],
+         "timed_out": [마감 시간을 넘긴 소스], "elapsed_ms": int}
+    """
+    result = _empty_result()
+    if not vector_db.VECTOR_DB_AVAILABLE:
+        return result
+
+    loop = asyncio.get_running_loop()
+    started = time.monotonic()
+    budget = deadline if deadline is not None else RAG_RETRIEVAL_DEADLINE
+
+    # 1. 질문 임베딩 (한 번만)
+    try:
+        embedding = await asyncio.wait_for(
+            loop.run_in_executor(_executor, vector_db.embed_query, query),
+            timeout=budget
+        )
+    except asyncio.TimeoutError:
+        print("⚠️ RAG 쿼리 임베딩 시간 초과 (컨텍스트 없이 진행)")
+        result["timed_out"] = list(_SOURCE_LABELS)
+        result["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+        return result
+    if embedding is None:
+        return result
+
+    # 2. 컬렉션별 검색 (같은 임베딩 재사용)
+    searches = {
+        "posts": lambda: post_vector_service.search_posts(
+            query=query, k=RAG_RESULTS_PER_SOURCE, user_id=user_id, query_embedding=embedding
+        ),
+    }
+    if user_id:
+        searches["user_memories"] = lambda: user_memory_service.search_user_memory(
+            user_id=user_id, query=query, k=RAG_RESULTS_PER_SOURCE, query_embedding=embedding
+        )
+        searches["chat_memories"] = lambda: chat_memory_vector_service.search_chat_memories(
+            query=query, user_id=user_id, k=RAG_RESULTS_PER_SOURCE,
+            include_shared=True, couple_id=couple_id, query_embedding=embedding
+        )
+
+    running = {
+        asyncio.ensure_future(loop.run_in_executor(_executor, search)): name
+        for name, search in searches.items()
+    }
+    remaining = max(budget - (time.monotonic() - started), 0)
+    done, pending = await asyncio.wait(running.keys(), timeout=remaining)
+
+    # 3. 늦은 검색은 결과를 버림 (스레드는 끝까지 실행되지만 응답을 기다리지 않음)
+    for future in pending:
+        future.cancel()
+        result["timed_out"].append(running[future])
+        print(f"⚠️ {_SOURCE_LABELS[running[future]]} 시간 초과 (부분 결과 사용)")
+
+    for future in done:
+        name = running[future]
+        try:
+            result[name] = future.result() or []
+        except Exception as e:
+            print(f"⚠️ {_SOURCE_LABELS[name]} 실패: {e}")
+
+    result["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+    return result
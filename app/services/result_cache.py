@@ -0,0 +1,285 @@
+"""
+AI 결과 캐시 - (종류 + 모델 버전 + 입력 해시) → Model API 응답 JSON
+
+감성 분석 / 요약 / 자동 태깅 / 이미지 분류는 같은 입력이면 같은 결과가 나오므로 다시 호출하지 않습니다.
+(글 작성 중 /api/model/analyze 반복 호출 → 게시글 생성 시 같은 본문 재분석, 같은 이미지 재업로드 등)
+
+- 1단계: 프로세스 메모리 LRU (RESULT_CACHE_MEMORY_ENTRIES)
+- 2단계: SQLite 디스크 캐시 (RESULT_CACHE_DIR/results.db, WAL) - gunicorn 워커 간 공유, RESULT_CACHE_MAX_ENTRIES 초과 시 오래된 항목부터 삭제
+- 모든 항목은 RESULT_CACHE_TTL초 후 만료
+- 키에 모델 버전(MODEL_API_MODEL_VERSION, 종류별 MODEL_VERSION_<KIND>)이 들어가므로
+  모델을 바꾸면 이전 결과는 더 이상 조회되지 않고 TTL/용량 정리로 사라짐
+- 같은 입력으로 동시에 들어온 요청은 Model API 호출 1번을 함께 기다림
+- 실패(None) 결과는 캐시하지 않음
+"""
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.services.embedding_cache import normalize_text
+
+RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+RESULT_CACHE_DIR = Path(os.getenv("RESULT_CACHE_DIR", "./vector_db/_result_cache"))
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", str(7 * 24 * 3600)))
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "200000"))
+RESULT_CACHE_MEMORY_ENTRIES = int(os.getenv("RESULT_CACHE_MEMORY_ENTRIES", "2000"))
+MODEL_API_MODEL_VERSION = os.getenv("MODEL_API_MODEL_VERSION", "1")
+
+DIGEST_SIZE = 16
+# 디스크 용량 정리는 저장 N회마다 한 번
+PRUNE_EVERY = 500
+
+_MISSING = object()
+
+
+def get_model_version(kind: str) -> str:
+    """종류별 모델 버전 (MODEL_VERSION_SENTIMENT 등으로 개별 지정 가능)"""
+    return os.getenv(f"MODEL_VERSION_{kind.upper()}", MODEL_API_MODEL_VERSION)
+
+
+def make_key(kind: str, version: str, payload: Any) -> bytes:
+    """
+    캐시 키 = blake2b(종류, 모델 버전, 입력)
+    payload가 bytes면 원본 그대로(이미지), str이면 정규화한 텍스트, 그 밖에는 정렬된 JSON(옵션 포함)
+    """
+    if isinstance(payload, bytes):
+        data = payload
+    elif isinstance(payload, str):
+        data = normalize_text(payload).encode("utf-8")
+    else:
+        if isinstance(payload, dict) and isinstance(payload.get("text"), str):
+            payload = {**payload, "text": normalize_text(payload["text"])}
+        data = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    digest.update(f"{kind}\0{version}\0".encode("utf-8"))
+    digest.update(data)
+    return digest.digest()
+
+
+class ResultCache:
+    """메모리 LRU + 워커 공유 SQLite 2단계 결과 캐시"""
+
+    def __init__(
+        self,
+        directory: Path = None,
+        ttl: float = None,
+        max_entries: int = None,
+        memory_entries: int = None
+    ):
+        self.directory = Path(directory or RESULT_CACHE_DIR)
+        self.ttl = RESULT_CACHE_TTL if ttl is None else ttl
+        self.max_entries = max_entries or RESULT_CACHE_MAX_ENTRIES
+        self.memory_entries = RESULT_CACHE_MEMORY_ENTRIES if memory_entries is None else memory_entries
+
+        self._memory: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_failed = False
+        self._puts = 0
+        self.disk_evictions = 0
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    # ------------------------------------------------------------
+    # 디스크 (SQLite)
+    # ------------------------------------------------------------
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._disk_failed:
+            return self._conn
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.directory / "results.db"), timeout=5, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key BLOB PRIMARY KEY, kind TEXT NOT NULL, value TEXT NOT NULL,"
+                " created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_created_at ON results (created_at)")
+            self._conn = conn
+        except (sqlite3.Error, OSError) as e:
+            self._disk_failed = True
+            print(f"⚠️ 결과 캐시 디스크 저장소를 열 수 없어 메모리 캐시만 사용합니다: {e}")
+        return self._conn
+
+    def _disk_get(self, key: bytes) -> Tuple[Any, float]:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return _MISSING, 0.0
+            row = conn.execute("SELECT value, expires_at FROM results WHERE key = ?", (key,)).fetchone()
+        if not row or row[1] <= time.time():
+            return _MISSING, 0.0
+        return json.loads(row[0]), row[1]
+
+    def _disk_put(self, key: bytes, kind: str, value: Any, expires_at: float) -> None:
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, kind, value, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (key, kind, data, time.time(), expires_at)
+            )
+            self._puts += 1
+            if self._puts % PRUNE_EVERY == 0:
+                self._prune(conn)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """만료 항목 삭제 후, 용량을 넘으면 오래된 항목부터 삭제"""
+        conn.execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),))
+        count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY created_at LIMIT ?)",
+                (count - self.max_entries,)
+            )
+            self.disk_evictions += count - self.max_entries
+
+    # ------------------------------------------------------------
+    # 메모리 LRU
+    # ------------------------------------------------------------
+
+    def _memory_get(self, key: bytes) -> Any:
+        entry = self._memory.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] <= time.time():
+            del self._memory[key]
+            return _MISSING
+        self._memory.move_to_end(key)
+        return entry[1]
+
+    def _memory_put(self, key: bytes, value: Any, expires_at: float) -> None:
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------
+
+    def _count(self, kind: str, name: str) -> None:
+        counters = self.stats.setdefault(kind, {
+            "memory_hits": 0, "disk_hits": 0, "misses": 0, "coalesced": 0, "stores": 0, "errors": 0
+        })
+        counters[name] += 1
+
+    async def get_or_compute(
+        self,
+        kind: str,
+        payload: Any,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        캐시된 결과를 반환하고, 없으면 compute()를 호출해 결과를 저장
+
+        Args:
+            kind: 결과 종류 ("sentiment", "summarize", "auto_tag", "predict")
+            payload: 입력 (텍스트 / 옵션 dict / 이미지 bytes)
+            compute: Model API 호출 (None을 반환하면 캐시하지 않음)
+        """
+        if not RESULT_CACHE_ENABLED:
+            return await compute()
+
+        key = make_key(kind, get_model_version(kind), payload)
+        value = self._memory_get(key)
+        if value is not _MISSING:
+            self._count(kind, "memory_hits")
+            return value
+
+        # 같은 입력을 이미 계산 중이면 그 결과를 함께 기다림
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._count(kind, "coalesced")
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            try:
+                value, expires_at = await asyncio.to_thread(self._disk_get, key)
+            except Exception as e:
+                self._count(kind, "errors")
+                print(f"⚠️ 결과 캐시 조회 실패: {e}")
+                value = _MISSING
+            if value is not _MISSING:
+                self._count(kind, "disk_hits")
+                self._memory_put(key, value, expires_at)
+            else:
+                self._count(kind, "misses")
+                value = await compute()
+                if value is not None:
+                    expires_at = time.time() + self.ttl
+                    self._memory_put(key, value, expires_at)
+                    self._count(kind, "stores")
+                    try:
+                        await asyncio.to_thread(self._disk_put, key, kind, value, expires_at)
+                    except Exception as e:
+                        self._count(kind, "errors")
+                        print(f"⚠️ 결과 캐시 저장 실패: {e}")
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            # 함께 기다리는 호출자가 없으면 예외를 회수해 경고가 남지 않게 함
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """메모리/디스크 캐시 비우기"""
+        self._memory.clear()
+        with self._lock:
+            conn = self._connect()
+            if conn is not None:
+                conn.execute("DELETE FROM results")
+
+    def get_stats(self) -> Dict[str, Any]:
+        kinds = {kind: dict(counters) for kind, counters in self.stats.items()}
+        for counters in kinds.values():
+            hits = counters["memory_hits"] + counters["disk_hits"] + counters["coalesced"]
+            total = hits + counters["misses"]
+            counters["hit_rate"] = round(hits / total, 4) if total else 0.0
+        disk_entries = None
+        with self._lock:
+            conn = self._connect()
+            if conn is not None:
+                disk_entries = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {
+            "enabled": RESULT_CACHE_ENABLED,
+            "ttl": self.ttl,
+            "memory_entries": len(self._memory),
+            "memory_capacity": self.memory_entries,
+            "disk_entries": disk_entries,
+            "disk_capacity": self.max_entries,
+            "disk_evictions": self.disk_evictions,
+            "model_versions": {kind: get_model_version(kind) for kind in kinds},
+            "kinds": kinds,
+        }
+
+
+_result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache()
+    return _result_cache
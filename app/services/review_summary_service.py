@@ -1,6 +1,7 @@
 """
 리뷰 요약 서비스 - 게시판 및 업체 리뷰 요약
 """
+import asyncio
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -55,7 +56,8 @@ async def summarize_board_reviews(
             # 잘못된 vendor_type인 경우 필터링하지 않음
             pass
     
-    posts = query.order_by(Post.created_at.desc()).limit(limit).all()
+    # 동기 세션 조회는 스레드에서 실행
+    posts = await asyncio.to_thread(query.order_by(Post.created_at.desc()).limit(limit).all)
     
     if not posts:
         return {
@@ -119,7 +121,7 @@ async def summarize_vendor_reviews(
         return None
     
     # 업체 정보 조회
-    vendor = db.query(Vendor).filter(Vendor.id == vendor_id).first()
+    vendor = await asyncio.to_thread(db.query(Vendor).filter(Vendor.id == vendor_id).first)
     if not vendor:
         return None
     
@@ -127,9 +129,9 @@ async def summarize_vendor_reviews(
     # 업체명이나 타입으로 검색 (게시글 제목/내용에 업체명이 포함된 경우)
     # 또는 별도의 vendor_reviews 테이블이 있다면 그것을 사용
     # 현재는 board_type이 "venue_review"인 게시글들을 가져옴
-    posts = db.query(Post).filter(
+    posts = await asyncio.to_thread(db.query(Post).filter(
         Post.board_type == "venue_review"
-    ).order_by(Post.created_at.desc()).limit(50).all()
+    ).order_by(Post.created_at.desc()).limit(50).all)
     
     # 업체명이 포함된 게시글만 필터링 (간단한 구현)
     vendor_name = vendor.name
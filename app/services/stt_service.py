@@ -4,8 +4,7 @@ STT 서비스 - Whisper 기반 음성 인식
 import base64
 import io
 from typing import Optional
-from app.services.model_client import get_model_api_base_url
-import httpx
+from app.services.model_client import get_model_api_base_url, get_http_client, get_model_api_timeout
 
 # 선택적 import
 try:
@@ -48,15 +47,15 @@ async def transcribe_audio_api(audio_data: bytes) -> Optional[str]:
         # 오디오를 base64로 인코딩
         audio_base64 = base64.b64encode(audio_data).decode('utf-8')
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{base_url}/stt",
-                json={"audio": audio_base64},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            result = response.json()
-            return result.get("text", "")
+        response = await get_http_client().post(
+            f"{base_url}/stt",
+            json={"audio": audio_base64},
+            headers={"Content-Type": "application/json"},
+            timeout=get_model_api_timeout("stt")
+        )
+        response.raise_for_status()
+        result = response.json()
+        return result.get("text", "")
     except Exception as e:
         print(f"⚠️ STT API 호출 실패: {e}")
         # Fallback to Whisper
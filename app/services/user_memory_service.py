@@ -1,22 +1,31 @@
 """
 User Memory Layer 서비스 - Vector DB 기반 사용자 패턴 저장 및 검색
 """
+import re
+import shutil
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from app.services.vector_db import (
     add_documents_to_collection,
     search_similar_documents,
     get_collection_count,
-    VECTOR_DB_AVAILABLE
+    upsert_embeddings,
+    release_chroma_client,
+    VECTOR_DB_AVAILABLE,
+    VECTOR_DB_DIR
 )
 
-# 사용자별 메모리 컬렉션 이름 패턴
-USER_MEMORY_COLLECTION_PATTERN = "user_memory_{user_id}"
+# 모든 사용자의 메모리를 하나의 컬렉션에 저장하고 user_id 메타데이터로 구분
+USER_MEMORY_COLLECTION = "user_memories"
+
+# 이전 사용자별 컬렉션 이름 패턴 (migrate_user_memory_collections.py 이전용)
+LEGACY_USER_MEMORY_COLLECTION_PATTERN = "user_memory_{user_id}"
+_LEGACY_DIR_RE = re.compile(r"^user_memory_(\d+)$")
 
 
 def get_user_memory_collection_name(user_id: int) -> str:
-    """사용자 메모리 컬렉션 이름 반환"""
-    return USER_MEMORY_COLLECTION_PATTERN.format(user_id=user_id)
+    """사용자 메모리 컬렉션 이름 반환 (모든 사용자가 같은 컬렉션 사용)"""
+    return USER_MEMORY_COLLECTION
 
 
 def save_user_preference(
@@ -44,11 +53,12 @@ def save_user_preference(
         collection_name = get_user_memory_collection_name(user_id)
         
         # 메타데이터 구성
+        # 공유 컬렉션은 user_id로 사용자를 구분하므로 호출자 메타데이터가 덮어쓰지 못하게 마지막에 지정
         full_metadata = {
-            "user_id": user_id,
             "preference_type": preference_type,
             "timestamp": datetime.now().isoformat(),
-            **(metadata or {})
+            **(metadata or {}),
+            "user_id": user_id
         }
         
         # 문서 ID 생성
@@ -90,12 +100,13 @@ def save_user_conversation_memory(
         collection_name = get_user_memory_collection_name(user_id)
         
         # 메타데이터 구성
+        # 추출 정보가 user_id를 덮어쓰지 못하게 마지막에 지정
         metadata = {
-            "user_id": user_id,
             "memory_type": "conversation",
             "intent": intent or "general",
             "timestamp": datetime.now().isoformat(),
-            **(extracted_info or {})
+            **(extracted_info or {}),
+            "user_id": user_id
         }
         
         # 문서 ID 생성
@@ -116,7 +127,8 @@ def search_user_memory(
     user_id: int,
     query: str,
     k: int = 5,
-    preference_type: Optional[str] = None
+    preference_type: Optional[str] = None,
+    query_embedding: Optional[List[float]] = None
 ) -> List[Dict]:
     """
     사용자 메모리 검색
@@ -126,6 +138,7 @@ def search_user_memory(
         query: 검색 쿼리
         k: 반환할 결과 개수
         preference_type: 선호도 타입 필터
+        query_embedding: 미리 계산한 쿼리 임베딩 (선택)
     
     Returns:
         검색 결과 리스트
@@ -145,7 +158,8 @@ def search_user_memory(
             collection_name=collection_name,
             query=query,
             k=k,
-            filter=filter_dict
+            filter=filter_dict,
+            query_embedding=query_embedding
         )
     except Exception as e:
         print(f"⚠️ 사용자 메모리 검색 실패 (user_id={user_id}): {e}")
@@ -213,7 +227,7 @@ def get_user_memory_stats(user_id: int) -> Dict:
     
     try:
         collection_name = get_user_memory_collection_name(user_id)
-        count = get_collection_count(collection_name)
+        count = get_collection_count(collection_name, filter={"user_id": user_id})
         return {
             "available": True,
             "count": count,
@@ -224,4 +238,76 @@ def get_user_memory_stats(user_id: int) -> Dict:
         return {"available": False, "count": 0}
 
 
+def find_legacy_user_memory_dirs() -> List[Dict]:
+    """이전 사용자별 컬렉션 디렉토리 목록 [{"user_id": int, "path": Path}, ...]"""
+    if not VECTOR_DB_DIR.exists():
+        return []
+    legacy = []
+    for path in sorted(VECTOR_DB_DIR.iterdir()):
+        match = _LEGACY_DIR_RE.match(path.name)
+        if match and path.is_dir():
+            legacy.append({"user_id": int(match.group(1)), "path": path})
+    return legacy
+
 
+def migrate_legacy_user_memory_collection(
+    user_id: int,
+    path,
+    batch_size: int = 500,
+    dry_run: bool = False,
+    delete_old: bool = False
+) -> int:
+    """
+    사용자별 컬렉션(vector_db/user_memory_{user_id}) 하나를 공유 컬렉션으로 이전
+    저장된 임베딩을 그대로 복사하므로 다시 임베딩하지 않으며, 같은 문서 ID는 덮어써서 여러 번 실행해도 안전합니다.
+    
+    Args:
+        user_id: 사용자 ID
+        path: 이전 컬렉션 디렉토리
+        batch_size: 한 번에 읽고 쓸 문서 수
+        dry_run: True면 개수만 세고 저장하지 않음
+        delete_old: 이전이 끝나면 이전 디렉토리 삭제
+    
+    Returns:
+        이전한 문서 개수
+    """
+    import chromadb
+    
+    client = chromadb.PersistentClient(path=str(path))
+    try:
+        try:
+            collection = client.get_collection(LEGACY_USER_MEMORY_COLLECTION_PATTERN.format(user_id=user_id))
+        except Exception:
+            print(f"⚠️ 컬렉션 없음, 건너뜀: {path}")
+            return 0
+        
+        migrated = 0
+        offset = 0
+        while True:
+            page = collection.get(
+                include=["embeddings", "documents", "metadatas"],
+                limit=batch_size,
+                offset=offset
+            )
+            ids = page["ids"]
+            if not ids:
+                break
+            offset += len(ids)
+            
+            if not dry_run:
+                metadatas = [{**(metadata or {}), "user_id": user_id} for metadata in page["metadatas"]]
+                if not upsert_embeddings(
+                    collection_name=USER_MEMORY_COLLECTION,
+                    ids=ids,
+                    embeddings=[list(map(float, vector)) for vector in page["embeddings"]],
+                    documents=page["documents"],
+                    metadatas=metadatas
+                ):
+                    raise RuntimeError(f"user_id={user_id} 이전 중 저장 실패 (offset={offset})")
+            migrated += len(ids)
+    finally:
+        release_chroma_client(client)
+    
+    if delete_old and not dry_run:
+        shutil.rmtree(path)
+    return migrated
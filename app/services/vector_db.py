@@ -1,82 +1,200 @@
 """
 Vector DB 서비스 - Chroma 기반 벡터 저장 및 검색
+(VECTOR_STORE_BACKEND=local 또는 langchain-chroma가 없으면 local_vector_store.LocalVectorStore 사용)
 """
 import os
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 
 # 선택적 import
 try:
     from langchain_chroma import Chroma
+    CHROMA_AVAILABLE = True
+except ImportError:
+    CHROMA_AVAILABLE = False
+
+try:
     from langchain_ollama import OllamaEmbeddings
-    from langchain_core.documents import Document
-    VECTOR_DB_AVAILABLE = True
+    OLLAMA_EMBEDDINGS_AVAILABLE = True
 except ImportError:
-    VECTOR_DB_AVAILABLE = False
-    print("⚠️ langchain-chroma 또는 langchain-ollama가 설치되지 않았습니다. Vector DB 기능을 사용할 수 없습니다.")
+    OLLAMA_EMBEDDINGS_AVAILABLE = False
+
+from app.services.embedding_cache import CachedEmbeddings, EMBEDDING_CACHE_ENABLED
+from app.services.local_vector_store import Document, LocalVectorStore
 
 # Vector DB 저장 경로
 VECTOR_DB_DIR = Path("./vector_db")
 VECTOR_DB_DIR.mkdir(exist_ok=True)
 
+EMBEDDING_MODEL = "nomic-embed-text:latest"
+
+# 임베딩 백엔드: "ollama" (Ollama 서버 HTTP 호출) 또는 "onnx" (프로세스 내 ONNX 추론, onnx_embeddings.py)
+# 백엔드/모델을 바꾸면 벡터 차원이 달라지므로 기존 컬렉션은 다시 색인해야 합니다 (python index_posts.py --full)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "ollama").lower()
+
+# 벡터 저장소: "chroma", "local" (memory-map NumPy, local_vector_store.py) 또는 "auto" (Chroma가 없으면 local)
+# 저장 위치가 다르므로 바꾸면 python index_posts.py --full로 다시 색인해야 합니다
+VECTOR_STORE_BACKEND = os.getenv("VECTOR_STORE_BACKEND", "auto").lower()
+USE_LOCAL_VECTOR_STORE = VECTOR_STORE_BACKEND == "local" or (VECTOR_STORE_BACKEND == "auto" and not CHROMA_AVAILABLE)
+
+VECTOR_DB_AVAILABLE = (USE_LOCAL_VECTOR_STORE or CHROMA_AVAILABLE) and (
+    EMBEDDING_BACKEND == "onnx" or OLLAMA_EMBEDDINGS_AVAILABLE
+)
+if not VECTOR_DB_AVAILABLE:
+    print("⚠️ langchain-chroma 또는 langchain-ollama가 설치되지 않았습니다. Vector DB 기능을 사용할 수 없습니다.")
+elif USE_LOCAL_VECTOR_STORE:
+    print(f"ℹ️ 로컬 벡터 저장소 사용 (VECTOR_STORE_BACKEND={VECTOR_STORE_BACKEND})")
+
+# 동시에 열어 둘 Vector Store 핸들 수 (넘으면 가장 오래 안 쓴 핸들을 닫음)
+VECTOR_STORE_CACHE_SIZE = int(os.getenv("VECTOR_STORE_CACHE_SIZE", "16"))
+
 # 전역 변수
 _embeddings = None
-_vector_stores = {}  # collection_name -> Chroma instance
+_embeddings_lock = threading.Lock()
+_vector_stores: "OrderedDict[str, Any]" = OrderedDict()  # collection_name -> Chroma / LocalVectorStore instance (LRU)
+_vector_stores_lock = threading.Lock()
+
+
+def _create_base_embeddings():
+    """EMBEDDING_BACKEND에 맞는 임베딩 모델과 (캐시 키용) 모델 이름"""
+    if EMBEDDING_BACKEND == "onnx":
+        from app.services.onnx_embeddings import OnnxEmbeddings
+        embeddings = OnnxEmbeddings()
+        return embeddings, embeddings.name
+    # Ollama의 nomic-embed-text 모델 사용
+    return OllamaEmbeddings(model=EMBEDDING_MODEL), EMBEDDING_MODEL
 
 
 def get_embeddings():
-    """Embedding 모델 인스턴스 반환 (싱글톤)"""
+    """
+    Embedding 모델 인스턴스 반환 (싱글톤)
+    EMBEDDING_CACHE_ENABLED면 임베딩 캐시를 거치므로
+    add_documents_to_collection / search_similar_documents 모두 같은 텍스트를 다시 임베딩하지 않습니다.
+    """
     global _embeddings
     
     if not VECTOR_DB_AVAILABLE:
         return None
     
-    if _embeddings is None:
-        try:
-            # Ollama의 nomic-embed-text 모델 사용
-            _embeddings = OllamaEmbeddings(model="nomic-embed-text:latest")
-            print("✅ Embedding 모델 로드 완료: nomic-embed-text")
-        except Exception as e:
-            print(f"⚠️ Embedding 모델 로드 실패: {e}")
-            return None
+    if _embeddings is not None:
+        return _embeddings
+    
+    # 여러 스레드(RAG 검색)가 동시에 호출해도 모델(ONNX 세션)은 한 번만 로드
+    with _embeddings_lock:
+        if _embeddings is None:
+            try:
+                embeddings, model_name = _create_base_embeddings()
+                if EMBEDDING_CACHE_ENABLED:
+                    try:
+                        embeddings = CachedEmbeddings(embeddings, model=model_name)
+                    except Exception as e:
+                        print(f"⚠️ 임베딩 캐시 초기화 실패 (캐시 없이 진행): {e}")
+                _embeddings = embeddings
+                print(f"✅ Embedding 모델 로드 완료: {model_name}")
+            except Exception as e:
+                print(f"⚠️ Embedding 모델 로드 실패: {e}")
+                return None
     
     return _embeddings
 
 
+def get_embedding_cache_stats() -> Dict:
+    """임베딩 캐시 적중률/크기"""
+    embeddings = get_embeddings()
+    if not isinstance(embeddings, CachedEmbeddings):
+        return {"enabled": False}
+    return {"enabled": True, **embeddings.cache.stats()}
+
+
+def release_chroma_client(client) -> None:
+    """
+    Chroma 클라이언트가 잡고 있는 시스템(SQLite 연결, 파일 핸들, 인덱스 메모리) 해제
+    Chroma는 경로별 시스템을 프로세스 전역에 계속 캐시하므로 직접 내려야 합니다.
+    """
+    try:
+        from chromadb.api.shared_system_client import SharedSystemClient
+        system = getattr(client, "_system", None)
+        if system is None:
+            return
+        for identifier, cached in list(SharedSystemClient._identifier_to_system.items()):
+            if cached is system:
+                SharedSystemClient._identifier_to_system.pop(identifier, None)
+        system.stop()
+    except Exception as e:
+        print(f"⚠️ Chroma 클라이언트 해제 실패: {e}")
+
+
+def _release_vector_store(collection_name: str, vector_store) -> None:
+    client = getattr(vector_store, "_client", None)
+    # 같은 저장 경로를 쓰는 다른 핸들이 남아 있으면 시스템은 유지
+    if client is None or any(getattr(s, "_client", None) is client for s in _vector_stores.values()):
+        return
+    release_chroma_client(client)
+    print(f"♻️ Vector Store 핸들 해제: {collection_name}")
+
+
 def get_vector_store(collection_name: str, persist_directory: str = None) -> Optional[Any]:
     """
-    Vector Store 인스턴스 반환 (싱글톤)
+    Vector Store 인스턴스 반환 (LRU 캐시, 최대 VECTOR_STORE_CACHE_SIZE개)
     
     Args:
-        collection_name: 컬렉션 이름 (예: "posts", "user_memory_{user_id}")
+        collection_name: 컬렉션 이름 (예: "posts", "user_memories")
         persist_directory: 저장 디렉토리 (None이면 기본 경로 사용)
     """
     if not VECTOR_DB_AVAILABLE:
         return None
     
-    if collection_name in _vector_stores:
-        return _vector_stores[collection_name]
-    
-    embeddings = get_embeddings()
-    if not embeddings:
-        return None
-    
-    try:
-        if persist_directory is None:
-            persist_directory = str(VECTOR_DB_DIR / collection_name)
+    with _vector_stores_lock:
+        if collection_name in _vector_stores:
+            _vector_stores.move_to_end(collection_name)
+            return _vector_stores[collection_name]
         
-        vector_store = Chroma(
-            collection_name=collection_name,
-            embedding_function=embeddings,
-            persist_directory=persist_directory
-        )
+        embeddings = get_embeddings()
+        if not embeddings:
+            return None
+        
+        try:
+            if USE_LOCAL_VECTOR_STORE:
+                vector_store = LocalVectorStore(
+                    collection_name=collection_name,
+                    embedding_function=embeddings,
+                    persist_directory=persist_directory
+                )
+            else:
+                if persist_directory is None:
+                    persist_directory = str(VECTOR_DB_DIR / collection_name)
+                
+                vector_store = Chroma(
+                    collection_name=collection_name,
+                    embedding_function=embeddings,
+                    persist_directory=persist_directory
+                )
+            
+            _vector_stores[collection_name] = vector_store
+            print(f"✅ Vector Store 생성 완료: {collection_name}")
+        except Exception as e:
+            print(f"⚠️ Vector Store 생성 실패: {e}")
+            return None
+        
+        while len(_vector_stores) > VECTOR_STORE_CACHE_SIZE:
+            evicted_name, evicted = _vector_stores.popitem(last=False)
+            _release_vector_store(evicted_name, evicted)
         
-        _vector_stores[collection_name] = vector_store
-        print(f"✅ Vector Store 생성 완료: {collection_name}")
         return vector_store
-    except Exception as e:
-        print(f"⚠️ Vector Store 생성 실패: {e}")
+
+
+def build_where(filter: Optional[Dict]) -> Optional[Dict]:
+    """
+    {"user_id": 1, "preference_type": "x"} 형태의 단순 필터를 Chroma where 절로 변환
+    (Chroma는 최상위에 조건이 2개 이상이면 $and로 묶어야 함)
+    """
+    if not filter:
         return None
+    if len(filter) == 1 or any(key.startswith("$") for key in filter):
+        return filter
+    return {"$and": [{key: value} for key, value in filter.items()]}
 
 
 def add_documents_to_collection(
@@ -108,7 +226,6 @@ def add_documents_to_collection(
             metadata = metadatas[i] if metadatas and i < len(metadatas) else {}
             doc_id = ids[i] if ids and i < len(ids) else None
             
-            from langchain_core.documents import Document
             doc = Document(
                 page_content=doc_text,
                 metadata=metadata
@@ -128,11 +245,30 @@ def add_documents_to_collection(
         return False
 
 
+def embed_query(query: str) -> Optional[List[float]]:
+    """
+    검색 쿼리 임베딩 (여러 컬렉션을 검색할 때 한 번만 계산해서 재사용)
+    
+    Returns:
+        임베딩 벡터 (임베딩 모델을 사용할 수 없으면 None)
+    """
+    embeddings = get_embeddings()
+    if not embeddings:
+        return None
+    
+    try:
+        return embeddings.embed_query(query)
+    except Exception as e:
+        print(f"⚠️ 쿼리 임베딩 실패: {e}")
+        return None
+
+
 def search_similar_documents(
     collection_name: str,
     query: str,
     k: int = 5,
-    filter: Dict = None
+    filter: Dict = None,
+    query_embedding: Optional[List[float]] = None
 ) -> List[Dict]:
     """
     유사한 문서 검색
@@ -142,6 +278,7 @@ def search_similar_documents(
         query: 검색 쿼리
         k: 반환할 문서 개수
         filter: 메타데이터 필터 (예: {"user_id": 1})
+        query_embedding: 미리 계산한 쿼리 임베딩 (있으면 query를 다시 임베딩하지 않음)
     
     Returns:
         검색 결과 리스트 [{"content": str, "metadata": dict, "score": float}, ...]
@@ -152,11 +289,18 @@ def search_similar_documents(
     
     try:
         # 유사도 검색
-        if filter:
+        where = build_where(filter)
+        if query_embedding is not None:
+            results = vector_store.similarity_search_by_vector_with_relevance_scores(
+                embedding=query_embedding,
+                k=k,
+                filter=where
+            )
+        elif where:
             results = vector_store.similarity_search_with_score(
                 query=query,
                 k=k,
-                filter=filter
+                filter=where
             )
         else:
             results = vector_store.similarity_search_with_score(
@@ -206,12 +350,70 @@ def delete_documents_from_collection(
         return False
 
 
-def get_collection_count(collection_name: str) -> int:
+def delete_documents_where(collection_name: str, filter: Dict) -> bool:
+    """
+    메타데이터 조건으로 문서 삭제 (예: {"post_id": 1}, {"post_id": {"$in": [1, 2]}})
+    """
+    vector_store = get_vector_store(collection_name)
+    if not vector_store:
+        return False
+    
+    try:
+        vector_store._collection.delete(where=build_where(filter))
+        return True
+    except Exception as e:
+        print(f"⚠️ 문서 삭제 실패: {e}")
+        return False
+
+
+def get_document_ids(collection_name: str, filter: Dict = None) -> List[str]:
+    """메타데이터 조건에 맞는 문서 ID 목록"""
+    vector_store = get_vector_store(collection_name)
+    if not vector_store:
+        return []
+    
+    try:
+        return vector_store._collection.get(where=build_where(filter), include=[])["ids"]
+    except Exception as e:
+        print(f"⚠️ 문서 ID 조회 실패: {e}")
+        return []
+
+
+def upsert_embeddings(
+    collection_name: str,
+    ids: List[str],
+    embeddings: List[List[float]],
+    documents: List[str],
+    metadatas: List[Dict]
+) -> bool:
+    """
+    이미 계산된 임베딩을 그대로 저장 (다시 임베딩하지 않음, 같은 ID는 덮어씀)
+    컬렉션 이전/일괄 색인에 사용합니다.
+    """
+    vector_store = get_vector_store(collection_name)
+    if not vector_store:
+        return False
+    
+    try:
+        vector_store._collection.upsert(
+            ids=ids,
+            embeddings=embeddings,
+            documents=documents,
+            metadatas=metadatas
+        )
+        return True
+    except Exception as e:
+        print(f"⚠️ 임베딩 저장 실패: {e}")
+        return False
+
+
+def get_collection_count(collection_name: str, filter: Dict = None) -> int:
     """
     컬렉션의 문서 개수 반환
     
     Args:
         collection_name: 컬렉션 이름
+        filter: 메타데이터 필터 (예: {"user_id": 1}, 있으면 조건에 맞는 문서만 셈)
     
     Returns:
         문서 개수
@@ -223,6 +425,8 @@ def get_collection_count(collection_name: str) -> int:
     try:
         # Chroma의 _collection을 통해 개수 확인
         collection = vector_store._collection
+        if filter:
+            return len(collection.get(where=build_where(filter), include=[])["ids"])
         return collection.count()
     except Exception as e:
         print(f"⚠️ 문서 개수 조회 실패: {e}")
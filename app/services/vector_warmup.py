@@ -0,0 +1,125 @@
+"""
+Vector Store 워밍업 - 워커 시작 시 컬렉션을 미리 열고 임베딩 모델을 한 번 호출
+
+get_vector_store는 첫 사용 시에 컬렉션을 열기 때문에, 워밍업이 없으면 각 gunicorn 워커의 첫 채팅이
+컬렉션 열기 + 인덱스 로드 + (Ollama) 모델 콜드 로드 시간을 모두 떠안습니다.
+
+- lifespan에서 start_vector_warmup() → 백그라운드 스레드에서 워밍업
+- VECTOR_WARMUP_STARTUP_WAIT초까지는 lifespan이 기다림 (그동안 워커는 연결을 받지 않음)
+- 그 뒤에도 끝나지 않으면 백그라운드로 계속 진행하고, GET /health/ready가 503을 반환
+- 임베딩 서버가 꺼져 있는 등 실패해도 워커는 ready (벡터 검색 없이 동작하는 기존 경로 사용), status는 "degraded"
+"""
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional
+
+from app.services import vector_db
+
+VECTOR_WARMUP_ENABLED = os.getenv("VECTOR_WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+VECTOR_WARMUP_COLLECTIONS = [
+    name.strip() for name in os.getenv("VECTOR_WARMUP_COLLECTIONS", "posts,chat_memories").split(",") if name.strip()
+]
+VECTOR_WARMUP_STARTUP_WAIT = float(os.getenv("VECTOR_WARMUP_STARTUP_WAIT", "30"))
+
+WARMUP_TEXT = "웨딩 준비 warm-up"
+
+_state: Dict = {"status": "pending", "collections": {}}
+_task: Optional[asyncio.Task] = None
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.monotonic() - started) * 1000, 1)
+
+
+def warm_up(collections: List[str] = None) -> Dict:
+    """
+    임베딩 모델 로드 + 워밍업 임베딩 1회 + 컬렉션 열기 및 검색 1회 (동기, 스레드에서 실행)
+
+    Returns:
+        {"status": "ready" | "degraded" | "unavailable", "embedding_ms", "collections": {...}, "total_ms"}
+    """
+    started = time.monotonic()
+    _state.update(status="warming", collections={})
+    if not vector_db.VECTOR_DB_AVAILABLE:
+        _state.update(status="unavailable", total_ms=_elapsed_ms(started))
+        return _state
+
+    errors = []
+    query_embedding = None
+    step = time.monotonic()
+    embeddings = vector_db.get_embeddings()
+    if embeddings is None:
+        errors.append("embedding_model_unavailable")
+    else:
+        try:
+            # 캐시를 거치면 모델이 로드되지 않으므로 원본 모델을 직접 호출
+            query_embedding = getattr(embeddings, "base", embeddings).embed_query(WARMUP_TEXT)
+        except Exception as e:
+            errors.append(f"embedding: {e}")
+    _state["embedding_ms"] = _elapsed_ms(step)
+
+    for name in collections or VECTOR_WARMUP_COLLECTIONS:
+        step = time.monotonic()
+        if vector_db.get_vector_store(name) is None:
+            _state["collections"][name] = {"ready": False, "ms": _elapsed_ms(step)}
+            errors.append(f"collection: {name}")
+            continue
+        # 첫 검색에서 인덱스(HNSW / memory-map 페이지)가 메모리에 올라감
+        if query_embedding is not None:
+            vector_db.search_similar_documents(name, WARMUP_TEXT, k=1, query_embedding=query_embedding)
+        _state["collections"][name] = {"ready": True, "ms": _elapsed_ms(step)}
+
+    _state.update(
+        status="degraded" if errors else "ready",
+        errors=errors,
+        total_ms=_elapsed_ms(started)
+    )
+    if errors:
+        print(f"⚠️ Vector Store 워밍업 일부 실패 ({_state['total_ms']}ms): {errors}")
+    else:
+        print(f"✅ Vector Store 워밍업 완료 ({_state['total_ms']}ms)")
+    return _state
+
+
+async def _run() -> None:
+    try:
+        await asyncio.to_thread(warm_up)
+    except Exception as e:
+        _state.update(status="degraded", errors=[str(e)])
+        print(f"⚠️ Vector Store 워밍업 실패: {e}")
+
+
+async def start_vector_warmup(wait: Optional[float] = None) -> None:
+    """워밍업 시작 후 최대 wait초(기본 VECTOR_WARMUP_STARTUP_WAIT) 대기 (lifespan에서 호출)"""
+    global _task
+    if not VECTOR_WARMUP_ENABLED:
+        _state["status"] = "disabled"
+        return
+    if _task is None or _task.done():
+        _task = asyncio.create_task(_run())
+    wait = VECTOR_WARMUP_STARTUP_WAIT if wait is None else wait
+    if wait > 0:
+        try:
+            await asyncio.wait_for(asyncio.shield(_task), timeout=wait)
+        except asyncio.TimeoutError:
+            print(f"⏳ Vector Store 워밍업이 {wait:.0f}초 안에 끝나지 않아 백그라운드로 계속 진행합니다")
+
+
+async def stop_vector_warmup() -> None:
+    global _task
+    if _task:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
+
+
+def is_ready() -> bool:
+    return _state["status"] not in ("pending", "warming")
+
+
+def get_status() -> Dict:
+    return {"ready": is_ready(), **_state}
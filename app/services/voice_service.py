@@ -1,23 +1,27 @@
 """
 음성 비서 서비스 - LLM 기반 의도 분석 및 자동 정리 파이프라인
 """
+import asyncio
 import json
 import re
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-from app.models.memory import (
-    CALENDAR_EVENTS, TODOS, BUDGET_ITEMS, POSTS, COUNTERS,
-    CalendarEvent, Todo, BudgetItem, Post
-)
+from sqlalchemy.orm import Session
+from app.models.memory import POSTS, COUNTERS, Post
+from app.models.db import CalendarEvent
+from app.models.db.calendar import PriorityEnum
+from app.core.couple_helpers import get_user_couple_id
 from app.services.stt_service import transcribe_audio
 from app.services.model_client import chat_with_model
-from app.services import calendar_service, budget_service
+from app.services.llm_scheduler import PRIORITY_VOICE
+from app.services import calendar_service, budget_service, budget_repository
 from app.services import user_memory_service, langgraph_service
 
 
 async def analyze_intent_and_organize(
     text: str,
-    user_id: int
+    user_id: int,
+    db: Session
 ) -> Dict:
     """
     LLM 기반 의도 분석 및 자동 정리 파이프라인
@@ -55,7 +59,7 @@ async def analyze_intent_and_organize(
 JSON만 응답해주세요."""
 
     try:
-        response = await chat_with_model(intent_prompt, model="gemma3:4b")
+        response = await chat_with_model(intent_prompt, model="gemma3:4b", priority=PRIORITY_VOICE)
         
         if response:
             # JSON 추출
@@ -65,7 +69,8 @@ JSON만 응답해주세요."""
                 
                 # 2. 사용자 대화 메모리 저장
                 try:
-                    user_memory_service.save_user_conversation_memory(
+                    await asyncio.to_thread(
+                        user_memory_service.save_user_conversation_memory,
                         user_id=user_id,
                         conversation_text=text,
                         intent=intent_data.get("intent"),
@@ -74,8 +79,8 @@ JSON만 응답해주세요."""
                 except Exception as e:
                     print(f"⚠️ 사용자 대화 메모리 저장 실패: {e}")
                 
-                # 3. 자동 정리 파이프라인 실행 (LangGraph 구조 준비됨)
-                organized_items = await execute_organize_pipeline(intent_data, user_id, text)
+                # 3. 자동 정리 파이프라인 실행 (LangGraph 구조 준비됨, 동기 DB 작업이므로 스레드에서 실행)
+                organized_items = await asyncio.to_thread(execute_organize_pipeline, intent_data, user_id, text, db)
                 
                 return {
                     "intent": intent_data.get("intent", "query"),
@@ -94,10 +99,47 @@ JSON만 응답해주세요."""
     }
 
 
-async def execute_organize_pipeline(
+def _save_calendar_event(
+    db: Session,
+    user_id: int,
+    title: str,
+    description: str | None,
+    date_str: str | None,
+    category: str,
+    priority: str | None,
+    time_str: str | None = None
+) -> CalendarEvent:
+    """음성으로 추출한 일정/할일을 calendar_events에 저장 (커플 공유)"""
+    try:
+        priority_enum = PriorityEnum(priority) if priority else None
+    except ValueError:
+        priority_enum = PriorityEnum.medium
+    
+    now = datetime.now()
+    event = CalendarEvent(
+        user_id=user_id,
+        couple_id=get_user_couple_id(user_id, db),
+        title=title,
+        description=description,
+        start_date=datetime.strptime(date_str, "%Y-%m-%d").date() if date_str else None,
+        start_time=datetime.strptime(time_str, "%H:%M").time() if time_str else None,
+        category=category,
+        priority=priority_enum,
+        is_completed=False,
+        created_at=now,
+        updated_at=now
+    )
+    db.add(event)
+    db.commit()
+    db.refresh(event)
+    return event
+
+
+def execute_organize_pipeline(
     intent_data: Dict,
     user_id: int,
-    original_text: str
+    original_text: str,
+    db: Session
 ) -> List[Dict]:
     """
     자동 정리 파이프라인 실행
@@ -115,81 +157,65 @@ async def execute_organize_pipeline(
     # 캘린더 일정 생성
     if intent == "calendar" and entities.get("date"):
         try:
-            event_id = COUNTERS["event"]
-            COUNTERS["event"] += 1
-            
-            event = CalendarEvent(
-                id=event_id,
-                user_id=user_id,
+            event = _save_calendar_event(
+                db,
+                user_id,
                 title=entities.get("title", "일정"),
                 description=entities.get("content", original_text),
-                start_date=entities.get("date"),
-                start_time=entities.get("time"),
+                date_str=entities.get("date"),
+                time_str=entities.get("time"),
                 category=entities.get("category", "general"),
-                priority=entities.get("priority", "medium"),
-                created_at=datetime.now().strftime("%Y-%m-%d")
+                priority=entities.get("priority", "medium")
             )
-            
-            CALENDAR_EVENTS[event_id] = event
             organized.append({
                 "type": "calendar_event",
-                "id": event_id,
+                "id": event.id,
                 "title": event.title,
-                "date": event.start_date
+                "date": entities.get("date")
             })
         except Exception as e:
+            db.rollback()
             print(f"⚠️ 캘린더 일정 생성 실패: {e}")
     
     # 예산 항목 생성
     if intent == "budget" and entities.get("amount"):
         try:
-            item_id = COUNTERS["budget"]
-            COUNTERS["budget"] += 1
-            
-            item = BudgetItem(
-                id=item_id,
-                user_id=user_id,
-                item_name=entities.get("title", "항목"),
-                category=entities.get("category", "etc"),
-                estimated_budget=float(entities.get("amount", 0)),
-                notes=entities.get("content", original_text),
-                created_at=datetime.now().strftime("%Y-%m-%d"),
-                updated_at=datetime.now().strftime("%Y-%m-%d")
-            )
-            
-            BUDGET_ITEMS[item_id] = item
+            item = budget_repository.create_item(db, user_id, {
+                "item_name": entities.get("title", "항목"),
+                "category": entities.get("category", "etc"),
+                "estimated_budget": float(entities.get("amount", 0)),
+                "notes": entities.get("content", original_text),
+                "metadata": {"source": "voice"}
+            })
             organized.append({
                 "type": "budget_item",
-                "id": item_id,
+                "id": item.id,
                 "title": item.item_name,
-                "amount": item.estimated_budget
+                "amount": float(item.estimated_budget)
             })
         except Exception as e:
+            db.rollback()
             print(f"⚠️ 예산 항목 생성 실패: {e}")
     
     # 할일 생성
     if intent == "todo":
         try:
-            todo_id = COUNTERS["todo"]
-            COUNTERS["todo"] += 1
-            
-            todo = Todo(
-                id=todo_id,
-                user_id=user_id,
+            todo = _save_calendar_event(
+                db,
+                user_id,
                 title=entities.get("title", "할일"),
                 description=entities.get("content", original_text),
-                priority=entities.get("priority", "medium"),
-                due_date=entities.get("date"),
-                created_at=datetime.now().strftime("%Y-%m-%d")
+                date_str=entities.get("date"),
+                category="todo",  # 할일은 calendar_events.category='todo'로 저장
+                priority=entities.get("priority", "medium")
             )
-            
-            TODOS[todo_id] = todo
             organized.append({
                 "type": "todo",
-                "id": todo_id,
+                "id": todo.id,
                 "title": todo.title
             })
         except Exception as e:
+            db.rollback()
             print(f"⚠️ 할일 생성 실패: {e}")
     
     # 게시판 게시글 생성
@@ -220,14 +246,15 @@ async def execute_organize_pipeline(
 
 async def generate_voice_response(
     query: str,
-    user_id: int
+    user_id: int,
+    db: Session
 ) -> str:
     """
     LLM 기반 음성 답변 생성 (상황 맞춤 답변)
     """
-    # 사용자 데이터 조회
-    calendar_summary = calendar_service.get_week_summary(user_id)
-    budget_summary = budget_service.get_category_summary(user_id)
+    # 사용자 데이터 조회 (동기 세션이므로 스레드에서 실행)
+    calendar_summary = await asyncio.to_thread(calendar_service.get_week_summary, user_id, db)
+    budget_summary = await asyncio.to_thread(budget_service.get_category_summary, user_id, db)
     
     prompt = f"""사용자가 음성으로 질문했습니다. 개인 데이터를 참고하여 답변해주세요.
 
@@ -241,7 +268,7 @@ async def generate_voice_response(
 친절하고 간결하게 답변해주세요. 한 문장으로 답변하는 것이 좋습니다."""
 
     try:
-        response = await chat_with_model(prompt, model="gemma3:4b")
+        response = await chat_with_model(prompt, model="gemma3:4b", priority=PRIORITY_VOICE)
         return response.strip() if response else "죄송합니다. 답변을 생성할 수 없습니다."
     except Exception as e:
         print(f"⚠️ 음성 답변 생성 실패: {e}")
@@ -0,0 +1,138 @@
+"""
+게시글 키워드 역색인(app/services/keyword_index.py) 벤치마크 - 합성 게시글 코퍼스
+
+사용법:
+    python benchmark_keyword_index.py                       # 게시글 100만 개
+    python benchmark_keyword_index.py --posts 100000 --queries 500
+
+측정 항목
+- 색인 구축 속도 (posts/s), 용어/포스팅 수, 포스팅 메모리, 프로세스 최대 RSS
+- 검색 지연 (p50/p95/p99): 단어 1개 / 여러 단어 / 업체명 / 금액
+- 증분 반영 속도 (수정, 삭제) 및 압축 시간
+- 비교 기준: 같은 쿼리를 전체 게시글에 대해 부분 문자열 검색(선형 스캔)한 시간
+"""
+import sys
+import os
+import time
+import random
+import argparse
+import resource
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.keyword_index import KeywordIndex
+
+WORDS = (
+    "웨딩홀 스드메 드레스 메이크업 스튜디오 촬영 본식 스냅 신혼여행 예물 예단 청첩장 답례품 "
+    "부케 한복 상견례 혼수 가전 가구 신혼집 대출 예산 견적 계약금 잔금 보증인원 식대 대관료 "
+    "후기 추천 비교 할인 이벤트 상담 일정 예약 취소 환불 위약금 옵션 추가금 원본 수정본 앨범 "
+    "하객 축가 사회자 주례 폐백 피로연 식권 주차 셔틀 뷔페 코스 야외 채플 하우스 호텔 컨벤션"
+).split()
+VENDORS = [f"{prefix}{suffix}" for prefix in ("루체", "아펠", "더채플", "라비", "엘리에나", "메리", "그랜드", "노블", "오월", "드블랑")
+           for suffix in ("웨딩홀", "스튜디오", "드레스", "메이크업", "컨벤션")]
+PARTICLES = ("은", "는", "이", "가", "을", "를", "에서", "으로", "도", "")
+
+
+def make_post(rng: random.Random) -> tuple:
+    title_words = rng.sample(WORDS, 3)
+    if rng.random() < 0.3:
+        title_words.insert(0, rng.choice(VENDORS))
+    body = []
+    for _ in range(rng.randint(15, 60)):
+        r = rng.random()
+        if r < 0.08:
+            body.append(rng.choice(VENDORS) + rng.choice(PARTICLES))
+        elif r < 0.12:
+            body.append(f"{rng.randint(1, 500) * 100000:,}원")
+        else:
+            body.append(rng.choice(WORDS) + rng.choice(PARTICLES))
+    return " ".join(title_words), " ".join(body), rng.choice(("couple", "planner", "venue_review", "vault"))
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def time_queries(index: KeywordIndex, queries, k: int):
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        index.search(query, k=k)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 역색인 벤치마크")
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--updates", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scan-sample", type=int, default=20, help="선형 스캔 비교에 쓸 쿼리 수")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"📝 합성 게시글 {args.posts:,}개 생성 중...")
+    corpus = [make_post(rng) for _ in range(args.posts)]
+
+    index = KeywordIndex()
+    started = time.perf_counter()
+    for post_id, (title, content, board_type) in enumerate(corpus, start=1):
+        index.add(post_id, title, content, board_type)
+    build_seconds = time.perf_counter() - started
+    stats = index.stats()
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print("\n[색인 구축]")
+    print(f"  게시글 {stats['documents']:,}개, {build_seconds:.1f}s ({args.posts / build_seconds:,.0f} posts/s)")
+    print(f"  용어 {stats['terms']:,}개, 포스팅 {stats['postings']:,}개 ({stats['postings_bytes'] / 1024 / 1024:.1f} MB)")
+    print(f"  프로세스 최대 RSS {max_rss_mb:,.0f} MB (코퍼스 포함)")
+
+    query_sets = {
+        "단어 1개": [rng.choice(WORDS) for _ in range(args.queries)],
+        "여러 단어": [" ".join(rng.sample(WORDS, 3)) for _ in range(args.queries)],
+        "업체명": [rng.choice(VENDORS) for _ in range(args.queries)],
+        "금액": [f"{rng.randint(1, 500) * 100000:,}원" for _ in range(args.queries)],
+    }
+    print(f"\n[검색 지연] (k={args.k}, 쿼리 {args.queries}개씩)")
+    for name, queries in query_sets.items():
+        latencies = time_queries(index, queries, args.k)
+        print(f"  {name:6s} p50 {percentile(latencies, 50):7.2f}ms  p95 {percentile(latencies, 95):7.2f}ms  "
+              f"p99 {percentile(latencies, 99):7.2f}ms")
+
+    scan_queries = query_sets["업체명"][:args.scan_sample]
+    started = time.perf_counter()
+    for query in scan_queries:
+        [i for i, (title, content, _) in enumerate(corpus) if query in title or query in content][:args.k]
+    scan_ms = (time.perf_counter() - started) * 1000 / max(len(scan_queries), 1)
+    print(f"  (비교) 선형 부분 문자열 스캔: 쿼리당 {scan_ms:,.1f}ms")
+
+    updates = min(args.updates, args.posts)
+    update_ids = rng.sample(range(1, args.posts + 1), updates)
+    started = time.perf_counter()
+    for post_id in update_ids:
+        title, content, board_type = make_post(rng)
+        index.add(post_id, title, content, board_type)
+    update_seconds = time.perf_counter() - started
+
+    delete_ids = rng.sample(range(1, args.posts + 1), updates)
+    started = time.perf_counter()
+    for post_id in delete_ids:
+        index.remove(post_id)
+    delete_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index.compact()
+    compact_seconds = time.perf_counter() - started
+    latencies = time_queries(index, query_sets["여러 단어"], args.k)
+
+    print("\n[증분 반영]")
+    print(f"  수정 {updates:,}건 {update_seconds:.2f}s ({updates / update_seconds:,.0f}/s)")
+    print(f"  삭제 {updates:,}건 {delete_seconds:.2f}s ({updates / delete_seconds:,.0f}/s)")
+    print(f"  압축 {compact_seconds:.2f}s → 게시글 {index.stats()['documents']:,}개, "
+          f"압축 후 여러 단어 검색 p50 {percentile(latencies, 50):.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
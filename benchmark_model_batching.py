@@ -0,0 +1,115 @@
+"""
+Model API 마이크로 배치 부하 테스트 (model_api_stub.py 서버를 같은 프로세스의 별도 스레드에서 실행)
+
+사용법:
+    python benchmark_model_batching.py
+    python benchmark_model_batching.py --requests 2000 --concurrency 200 --request-ms 8 --item-ms 0.5
+
+감성 분석 / 요약 / 자동 태깅 호출을 섞어 동시에 보내고, 배치 끔/켬 각각의
+처리량(req/s), 지연(p50/p95/p99), 서버 추론 횟수를 비교합니다.
+"""
+import sys
+import os
+import time
+import random
+import asyncio
+import argparse
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import uvicorn
+
+from model_api_stub import create_app, TAG_WORDS, POSITIVE_WORDS, NEGATIVE_WORDS
+
+
+def start_stub(port: int, request_ms: float, item_ms: float) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(
+        create_app(request_ms, item_ms), host="127.0.0.1", port=port, log_level="warning"
+    ))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+async def run(model_client, texts, concurrency: int):
+    calls = (
+        lambda text: model_client.analyze_sentiment(text),
+        lambda text: model_client.summarize_text(text),
+        lambda text: model_client.auto_tag_text(text),
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one(i, text):
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            result = await calls[i % len(calls)](text)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if result is None:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i, text) for i, text in enumerate(texts)))
+    return time.perf_counter() - started, latencies, failures
+
+
+async def main_async(args):
+    os.environ["MODEL_API_URL"] = f"http://127.0.0.1:{args.port}/api"
+    from app.services import model_client, result_cache
+
+    # 같은 텍스트가 두 번 돌므로 결과 캐시를 끄고 배치 효과만 측정
+    result_cache.RESULT_CACHE_ENABLED = False
+
+    rng = random.Random(args.seed)
+    words = list(TAG_WORDS + POSITIVE_WORDS + NEGATIVE_WORDS) + ["정말", "이번", "준비", "했어요", "생각보다"]
+    texts = [" ".join(rng.choices(words, k=rng.randint(5, 30))) for _ in range(args.requests)]
+
+    await model_client.init_http_client()
+    try:
+        for enabled in (False, True):
+            model_client.MODEL_API_BATCH_ENABLED = enabled
+            for batcher in (model_client._sentiment_batcher, model_client._summarize_batcher,
+                            model_client._auto_tag_batcher):
+                batcher.stats = dict.fromkeys(batcher.stats, 0)
+            elapsed, latencies, failures = await run(model_client, texts, args.concurrency)
+            stats = model_client.get_batcher_stats()["endpoints"]
+            batches = sum(s["batches"] for s in stats.values())
+            items = sum(s["batched_items"] for s in stats.values())
+            print(f"\n[배치 {'켬' if enabled else '끔'}] 요청 {len(texts):,}개, 동시 {args.concurrency}")
+            print(f"  처리량 {len(texts) / elapsed:,.0f} req/s ({elapsed:.2f}s), 실패 {failures}")
+            print(f"  지연 p50 {percentile(latencies, 50):.1f}ms  p95 {percentile(latencies, 95):.1f}ms  "
+                  f"p99 {percentile(latencies, 99):.1f}ms")
+            if enabled and batches:
+                singles = sum(s["single_calls"] for s in stats.values())
+                print(f"  배치 {batches:,}회 (평균 크기 {items / batches:.1f}), 단건 {singles:,}회")
+    finally:
+        await model_client.close_http_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model API 마이크로 배치 부하 테스트")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--port", type=int, default=8791)
+    parser.add_argument("--request-ms", type=float, default=8.0, help="대체 서버 추론 1회 고정 비용(ms)")
+    parser.add_argument("--item-ms", type=float, default=0.5, help="대체 서버 텍스트 1개당 비용(ms)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    server = start_stub(args.port, args.request_ms, args.item_ms)
+    try:
+        asyncio.run(main_async(args))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+게시글 목록(/api/posts) 동기 DB 경로 vs 비동기 DB 경로 처리량 벤치마크
+
+사용법:
+    python benchmark_posts_db.py --requests 500 --concurrency 50
+
+- sync : 기존 방식 (async 핸들러 안에서 동기 Session 사용 → 이벤트 루프 블로킹)
+- async: get_async_db(AsyncSession + aiomysql) 기반 post_routes
+두 경로 모두 같은 프로세스/이벤트 루프에서 ASGI로 호출하여 워커 1개 기준 req/s를 비교합니다.
+"""
+import sys
+import os
+import time
+import asyncio
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from fastapi import FastAPI, Query
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.database import SessionLocal, get_async_engine
+from app.models.db import Post, PostLike, Comment
+from app.routers import post_routes
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(post_routes.router, prefix="/api")
+
+    @app.get("/sync/posts")
+    async def get_posts_sync(
+        page: int = Query(1, ge=1),
+        limit: int = Query(10, ge=1, le=100),
+        board_type: str = Query("couple")
+    ):
+        """마이그레이션 이전 핸들러와 동일한 형태 (async def + 동기 Session)"""
+        with SessionLocal() as db:
+            return _list_posts_sync(db, page, limit, board_type)
+
+    return app
+
+
+def _list_posts_sync(db: Session, page: int, limit: int, board_type: str) -> dict:
+    posts = db.query(Post).options(selectinload(Post.user), selectinload(Post.tags))\
+        .filter(Post.board_type == board_type)\
+        .order_by(Post.created_at.desc())\
+        .offset((page - 1) * limit).limit(limit).all()
+    total = db.query(func.count(Post.id)).filter(Post.board_type == board_type).scalar()
+    posts_data = []
+    for post in posts:
+        posts_data.append({
+            "post_id": post.id,
+            "nickname": post.user.nickname if post.user else "알 수 없음",
+            "title": post.title,
+            "tags": [t.name for t in post.tags],
+            "like_count": db.query(func.count(PostLike.id)).filter(PostLike.post_id == post.id).scalar(),
+            "comment_count": db.query(func.count(Comment.id)).filter(Comment.post_id == post.id).scalar(),
+        })
+    return {"message": "get_posts_success", "data": {"posts": posts_data, "total": total}}
+
+
+async def run_load(client: httpx.AsyncClient, path: str, total_requests: int, concurrency: int) -> dict:
+    """path에 total_requests개의 요청을 concurrency 동시성으로 전송"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def _one():
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[_one() for _ in range(total_requests)])
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "req_per_sec": total_requests / elapsed if elapsed else 0.0,
+        "p50_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0.0,
+        "errors": errors,
+    }
+
+
+async def main(args):
+    app = build_app()
+    transport = httpx.ASGITransport(app=app)
+    query = f"?page={args.page}&limit={args.limit}&board_type={args.board_type}"
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 워밍업 (커넥션 풀 채우기)
+        await run_load(client, f"/sync/posts{query}", args.concurrency, args.concurrency)
+        await run_load(client, f"/api/posts{query}", args.concurrency, args.concurrency)
+
+        print("=" * 60)
+        print(f"📊 /api/posts 벤치마크 (요청 {args.requests}개, 동시성 {args.concurrency})")
+        print("=" * 60)
+        for label, path in (("sync ", "/sync/posts"), ("async", "/api/posts")):
+            result = await run_load(client, f"{path}{query}", args.requests, args.concurrency)
+            print(
+                f"{label}: {result['req_per_sec']:8.1f} req/s | "
+                f"p50 {result['p50_ms']:7.1f}ms | p99 {result['p99_ms']:7.1f}ms | "
+                f"errors {result['errors']}"
+            )
+
+    await get_async_engine().dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="/api/posts sync vs async DB 벤치마크")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--page", type=int, default=1)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--board-type", dest="board_type", default="couple")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,22 @@
+-- AI 백그라운드 작업 큐 테이블 생성 (python migrate.py의 마이그레이션 0003과 동일)
+CREATE TABLE IF NOT EXISTS ai_jobs (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    job_type VARCHAR(50) NOT NULL,
+    post_id BIGINT NULL,
+    idempotency_key VARCHAR(128) NOT NULL,
+    tasks VARCHAR(255) NOT NULL,
+    status ENUM('PENDING', 'RUNNING', 'DONE', 'FAILED') DEFAULT 'PENDING' NOT NULL,
+    attempts INT DEFAULT 0 NOT NULL,
+    max_attempts INT DEFAULT 5 NOT NULL,
+    last_error TEXT NULL,
+    run_after DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    locked_by VARCHAR(100) NULL,
+    locked_at DATETIME NULL,
+    finished_at DATETIME NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP NOT NULL,
+    FOREIGN KEY (post_id) REFERENCES posts(id) ON DELETE CASCADE,
+    UNIQUE KEY uq_ai_jobs_idempotency_key (idempotency_key),
+    INDEX idx_ai_jobs_status_run_after (status, run_after),
+    INDEX idx_ai_jobs_post_id (post_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,112 @@
+"""
+쿼리 EXPLAIN 점검 스크립트 - 인덱스를 타지 않는 full scan 쿼리 찾기
+
+사용법:
+    # 1) 쿼리 캡처: 서버 실행 시 SQL_CAPTURE_FILE 지정 후 화면/API 사용
+    SQL_CAPTURE_FILE=captured_queries.jsonl uvicorn app.main:app
+    # 2) 캡처한 쿼리를 EXPLAIN으로 재실행
+    python explain_queries.py captured_queries.jsonl
+    # 주요 조회 패턴(내장 쿼리)만 점검
+    python explain_queries.py --builtin
+    # full scan이 있으면 종료 코드 1 (CI 등에서 사용)
+    python explain_queries.py --builtin --fail-on-scan
+
+캡처한 DB와 같은 종류의 DB(MySQL 또는 로컬 SQLite)에서 실행해야 합니다.
+"""
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import date
+from sqlalchemy import and_, func, or_, select
+
+from app.core.database import engine
+from app.core.query_explain import explain_query, load_captured_queries
+from app.models.db import Post, Comment, CalendarEvent, RSVP, RSVPStatus, BudgetItem
+from app.models.db.vendor_message import VendorMessage, MessageSenderType
+
+
+def builtin_queries():
+    """API에서 자주 실행되는 조회 패턴"""
+    return [
+        ("게시판 목록", select(Post).where(Post.board_type == "couple")
+            .order_by(Post.created_at.desc(), Post.id.desc()).limit(20)),
+        ("카테고리별 게시판 목록", select(Post).where(Post.board_type == "venue_review", Post.category == "hall")
+            .order_by(Post.created_at.desc()).limit(20)),
+        ("커플 전용 공간 목록", select(Post).where(Post.couple_id == 1, Post.board_type == "private")
+            .order_by(Post.created_at.desc()).limit(20)),
+        ("댓글 목록", select(Comment).where(Comment.post_id == 1)
+            .order_by(Comment.created_at, Comment.id).limit(100)),
+        ("쓰레드 메시지", select(VendorMessage).where(VendorMessage.thread_id == 1)
+            .order_by(VendorMessage.created_at.desc(), VendorMessage.id.desc()).limit(100)),
+        ("읽지 않은 업체 메시지 수", select(func.count(VendorMessage.id)).where(and_(
+            VendorMessage.thread_id == 1,
+            VendorMessage.sender_type == MessageSenderType.VENDOR,
+            VendorMessage.is_read == False
+        ))),
+        ("월간 캘린더", select(CalendarEvent).where(
+            CalendarEvent.couple_id == 1,
+            CalendarEvent.start_date.between(date(2025, 5, 1), date(2025, 5, 31))
+        )),
+        ("RSVP 통계", select(RSVP.status, func.count(RSVP.id))
+            .where(RSVP.invitation_id == 1, RSVP.status == RSVPStatus.ATTENDING)
+            .group_by(RSVP.status)),
+        ("예산 카테고리별 합계", select(BudgetItem.category, func.sum(BudgetItem.estimated_budget))
+            .where(or_(BudgetItem.user_id == 1, BudgetItem.couple_id == 1))
+            .group_by(BudgetItem.category)),
+    ]
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쿼리 EXPLAIN 점검 (full scan 탐지)")
+    parser.add_argument("capture_file", nargs="?", help="SQL_CAPTURE_FILE로 캡처한 JSONL 파일")
+    parser.add_argument("--builtin", action="store_true", help="내장 주요 쿼리 점검")
+    parser.add_argument("--fail-on-scan", action="store_true", help="full scan 발견 시 종료 코드 1")
+    parser.add_argument("--verbose", action="store_true", help="실행 계획 전체 출력")
+    args = parser.parse_args()
+
+    if not args.capture_file and not args.builtin:
+        parser.error("캡처 파일 경로 또는 --builtin 중 하나를 지정하세요.")
+
+    queries = []
+    if args.builtin:
+        queries += [(label, _compile(stmt), None) for label, stmt in builtin_queries()]
+    if args.capture_file:
+        for record in load_captured_queries(args.capture_file):
+            if record.get("dialect") and record["dialect"] != engine.dialect.name:
+                print(f"⚠️ {record['dialect']}에서 캡처한 쿼리는 {engine.dialect.name}에서 재실행할 수 없습니다.")
+                return
+            queries.append((None, record["sql"], record.get("params")))
+
+    print(f"🔍 EXPLAIN 점검: {len(queries)}개 쿼리 ({engine.dialect.name})")
+    scan_count = 0
+    with engine.connect() as conn:
+        for index, (label, sql, params) in enumerate(queries, 1):
+            result = explain_query(conn, sql, params)
+            title = label or " ".join(sql.split())[:100]
+            if result.error:
+                print(f"❌ [{index}] {title}\n    EXPLAIN 실패: {result.error}")
+                continue
+            if result.full_scans:
+                scan_count += 1
+                print(f"🚨 [{index}] {title}\n    FULL SCAN: {', '.join(result.full_scans)}")
+            else:
+                print(f"✅ [{index}] {title}")
+            for warning in result.warnings:
+                print(f"    ⚠️ {warning}")
+            if args.verbose:
+                for row in result.plan:
+                    print(f"      {row}")
+
+    print(f"\n📊 full scan 쿼리: {scan_count}/{len(queries)}")
+    if args.fail_on_scan and scan_count:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
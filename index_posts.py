@@ -0,0 +1,77 @@
+"""
+게시글 Vector DB 대량 색인 스크립트
+게시글을 id 순서로 배치 단위로 읽어 한 번에 임베딩하고 Chroma에 기록합니다.
+배치마다 체크포인트(vector_db/_checkpoints/posts_index.json)를 남기므로 중단 후 다시 실행하면 이어서 진행합니다.
+
+사용법:
+    python index_posts.py                       # 체크포인트부터 이어서 (완료 상태면 처음부터)
+    python index_posts.py --full                # 처음부터 전체 재색인
+    python index_posts.py --batch-size 500 --embed-batch-size 128
+    python index_posts.py --max-posts 10000     # 이번 실행에서 1만 개만 처리
+    python index_posts.py --status              # 체크포인트 확인
+"""
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import SessionLocal
+from app.services import post_vector_service
+
+
+def _print_progress(progress: dict):
+    print(
+        f"  - last_id={progress['last_id']} 게시글 {progress['posts']}개 / 청크 {progress['chunks']}개 "
+        f"({progress['elapsed_seconds']}s, {progress['docs_per_second']} docs/s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 Vector DB 대량 색인")
+    parser.add_argument("--batch-size", type=int, default=post_vector_service.POST_INDEX_BATCH_SIZE)
+    parser.add_argument("--embed-batch-size", type=int, default=post_vector_service.POST_INDEX_EMBED_BATCH_SIZE)
+    parser.add_argument("--max-posts", type=int, default=None)
+    parser.add_argument("--full", action="store_true", help="체크포인트를 지우고 처음부터 색인")
+    parser.add_argument("--status", action="store_true", help="체크포인트만 출력")
+    args = parser.parse_args()
+
+    if args.status:
+        print(post_vector_service.load_index_checkpoint() or "체크포인트 없음")
+        return
+
+    if args.full:
+        post_vector_service.reset_index_checkpoint()
+
+    checkpoint = post_vector_service.load_index_checkpoint()
+    if checkpoint and not checkpoint.get("completed"):
+        print(f"🔄 체크포인트에서 이어서 색인 (last_id={checkpoint['last_id']})")
+    else:
+        print("🔄 게시글 전체 색인 시작")
+
+    db = SessionLocal()
+    try:
+        result = post_vector_service.bulk_index_posts(
+            db,
+            batch_size=args.batch_size,
+            embed_batch_size=args.embed_batch_size,
+            max_posts=args.max_posts,
+            progress=_print_progress
+        )
+    except KeyboardInterrupt:
+        print("\n⏸️ 중단됨 - 다시 실행하면 마지막 배치 다음부터 이어서 진행합니다.")
+        sys.exit(130)
+    except Exception as e:
+        print(f"❌ 색인 실패: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    label = "완료" if result["completed"] else "일시 중지 (--max-posts)"
+    print(
+        f"✅ 색인 {label}: 게시글 {result['posts']}개 / 청크 {result['chunks']}개, "
+        f"{result['elapsed_seconds']}s ({result['docs_per_second']} docs/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
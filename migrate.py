@@ -0,0 +1,41 @@
+"""
+스키마 마이그레이션 실행 스크립트
+
+사용법:
+    python migrate.py             # 미적용 마이그레이션 실행
+    python migrate.py --status    # 적용 현황 조회
+    python migrate.py --dry-run   # 실행할 SQL만 출력
+
+DATABASE_URL에 지정된 DB(MySQL 또는 로컬 SQLite)에 적용합니다.
+"""
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import engine
+from app.migrations import load_migrations, get_applied_versions, apply_migrations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스키마 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="적용 현황만 출력")
+    parser.add_argument("--dry-run", action="store_true", help="SQL만 출력하고 적용하지 않음")
+    args = parser.parse_args()
+
+    print(f"🗄️ 대상 DB: {engine.url.render_as_string(hide_password=True)}")
+
+    if args.status:
+        applied = get_applied_versions(engine)
+        for migration in load_migrations():
+            mark = "✅" if migration.version in applied else "⏳"
+            print(f"{mark} [{migration.version}] {migration.description}")
+        return
+
+    pending = apply_migrations(engine, dry_run=args.dry_run)
+    if not pending:
+        print("✅ 적용할 마이그레이션이 없습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+사용자 메모리 컬렉션 통합 스크립트
+vector_db/user_memory_{user_id}/ 사용자별 컬렉션을 공유 컬렉션(vector_db/user_memories/)으로 옮깁니다.
+저장된 임베딩을 그대로 복사하므로 Ollama 없이 실행되며, 여러 번 실행해도 안전합니다.
+
+사용법:
+    python migrate_user_memory_collections.py --dry-run
+    python migrate_user_memory_collections.py
+    python migrate_user_memory_collections.py --delete-old --batch-size 1000
+"""
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services import user_memory_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자 메모리 컬렉션 통합")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="개수만 확인하고 저장하지 않음")
+    parser.add_argument("--delete-old", action="store_true", help="이전이 끝난 사용자별 디렉토리 삭제")
+    args = parser.parse_args()
+
+    if not user_memory_service.VECTOR_DB_AVAILABLE:
+        print("❌ Vector DB 패키지가 설치되지 않았습니다.")
+        sys.exit(1)
+
+    legacy = user_memory_service.find_legacy_user_memory_dirs()
+    if not legacy:
+        print("✅ 이전할 사용자별 컬렉션이 없습니다.")
+        return
+
+    print(f"🔄 사용자별 컬렉션 {len(legacy)}개 이전 중 → {user_memory_service.USER_MEMORY_COLLECTION}")
+    total = 0
+    failed = 0
+    for entry in legacy:
+        try:
+            count = user_memory_service.migrate_legacy_user_memory_collection(
+                user_id=entry["user_id"],
+                path=entry["path"],
+                batch_size=args.batch_size,
+                dry_run=args.dry_run,
+                delete_old=args.delete_old
+            )
+            total += count
+            print(f"  - user_id={entry['user_id']}: {count}개")
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ user_id={entry['user_id']} 이전 실패: {e}")
+
+    label = "확인" if args.dry_run else "이전"
+    print(f"✅ {label} 완료: 문서 {total}개 (실패 {failed}개 컬렉션)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
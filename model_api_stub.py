@@ -0,0 +1,168 @@
+"""
+로컬 대체 Model API 서버 - 실제 모델 없이 감성 분석 / 요약 / 자동 태깅 / 채팅 스트림 응답을 흉내 냄
+
+마이크로 배치(app/services/model_client.py의 MicroBatcher)와 채팅 스트림 전달(chat_service.chat_stream)을
+오프라인에서 부하 테스트하기 위한 서버입니다.
+모델 워커가 하나인 GPU 서버처럼 추론을 한 번에 하나씩 처리하며,
+추론 1회 비용 = --request-ms (고정 비용) + --item-ms × 텍스트 수 로 흉내 냅니다.
+
+사용법:
+    python model_api_stub.py --port 8001                 # 단건 + /batch 엔드포인트
+    python model_api_stub.py --port 8001 --no-batch      # /batch 없음 (404 → 단건 요청 전환 확인용)
+    MODEL_API_URL=http://localhost:8001/api uvicorn app.main:app
+
+엔드포인트 (/api 아래)
+- POST /sentiment, /summarize, /auto-tag            {"text": ...}
+- POST /sentiment/batch, /summarize/batch, /auto-tag/batch  {"texts": [...]} → {"results": [...]}
+- POST /chat, /gemini/chat  {"message", "model"} → NDJSON 스트림 ({"type": "content", "content": 토큰} × --chat-tokens, {"type": "done"})
+"""
+import argparse
+import asyncio
+import json
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+POSITIVE_WORDS = ("좋", "최고", "만족", "추천", "감사", "행복", "예쁘")
+NEGATIVE_WORDS = ("별로", "최악", "불만", "실망", "비싸", "환불", "화나")
+TAG_WORDS = ("웨딩홀", "스드메", "드레스", "메이크업", "스튜디오", "예산", "신혼여행", "청첩장", "하객", "식대")
+
+
+class TextReq(BaseModel):
+    text: str
+    explain: bool = False
+
+
+class BatchReq(BaseModel):
+    texts: List[str]
+    explain: bool = False
+
+
+class ChatReq(BaseModel):
+    message: str
+    model: Optional[str] = None
+
+
+def _sentiment(text: str, explain: bool) -> Dict:
+    positive = sum(text.count(word) for word in POSITIVE_WORDS)
+    negative = sum(text.count(word) for word in NEGATIVE_WORDS)
+    if positive == negative:
+        label, confidence = "neutral", 0.5
+    else:
+        label = "positive" if positive > negative else "negative"
+        confidence = round(0.5 + 0.5 * abs(positive - negative) / (positive + negative), 4)
+    result = {"label": label, "confidence": confidence}
+    if explain:
+        result["explanation"] = f"긍정 단어 {positive}개, 부정 단어 {negative}개"
+    return result
+
+
+def _summarize(text: str) -> Dict:
+    summary = text.strip().split("\n")[0][:80]
+    return {"summary": summary, "original_length": len(text), "summary_length": len(summary)}
+
+
+def _auto_tag(text: str) -> Dict:
+    return {"tags": [word for word in TAG_WORDS if word in text][:5]}
+
+
+CHAT_TOKENS = ("웨딩", " 준비", "는", " 예산", "부터", " 정하는", " 것이", " 좋아요", ".", " 😊")
+
+
+def _chat_lines(count: int):
+    for i in range(count):
+        yield json.dumps({"type": "content", "content": CHAT_TOKENS[i % len(CHAT_TOKENS)]}, ensure_ascii=False) + "\n"
+    yield json.dumps({"type": "done"}) + "\n"
+
+
+def create_app(
+    request_ms: float = 8.0,
+    item_ms: float = 0.5,
+    batch: bool = True,
+    chat_tokens: int = 200
+) -> FastAPI:
+    app = FastAPI(title="Model API stub")
+    model_lock = asyncio.Lock()
+    stats = {"forward_passes": 0, "items": 0}
+
+    async def infer(count: int) -> None:
+        # 모델 워커 1개: 추론은 한 번에 하나씩
+        async with model_lock:
+            await asyncio.sleep((request_ms + item_ms * count) / 1000)
+            stats["forward_passes"] += 1
+            stats["items"] += count
+
+    def check_batch() -> None:
+        if not batch:
+            raise HTTPException(status_code=404, detail="Not Found")
+
+    @app.get("/")
+    async def root():
+        return {"message": "Model API stub", "stats": stats}
+
+    @app.post("/api/sentiment")
+    async def sentiment(req: TextReq):
+        await infer(1)
+        return _sentiment(req.text, req.explain)
+
+    @app.post("/api/sentiment/batch")
+    async def sentiment_batch(req: BatchReq):
+        check_batch()
+        await infer(len(req.texts))
+        return {"results": [_sentiment(text, req.explain) for text in req.texts]}
+
+    @app.post("/api/summarize")
+    async def summarize(req: TextReq):
+        await infer(1)
+        return _summarize(req.text)
+
+    @app.post("/api/summarize/batch")
+    async def summarize_batch(req: BatchReq):
+        check_batch()
+        await infer(len(req.texts))
+        return {"results": [_summarize(text) for text in req.texts]}
+
+    @app.post("/api/auto-tag")
+    async def auto_tag(req: TextReq):
+        await infer(1)
+        return _auto_tag(req.text)
+
+    @app.post("/api/auto-tag/batch")
+    async def auto_tag_batch(req: BatchReq):
+        check_batch()
+        await infer(len(req.texts))
+        return {"results": [_auto_tag(text) for text in req.texts]}
+
+    async def chat_stream(req: ChatReq):
+        # 토큰마다 한 줄씩 바로 내보냄 (Ollama 스트림처럼)
+        async def lines():
+            for line in _chat_lines(chat_tokens):
+                yield line
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    app.post("/api/chat")(chat_stream)
+    app.post("/api/gemini/chat")(chat_stream)
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="로컬 대체 Model API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--request-ms", type=float, default=8.0, help="추론 1회 고정 비용(ms)")
+    parser.add_argument("--item-ms", type=float, default=0.5, help="텍스트 1개당 추가 비용(ms)")
+    parser.add_argument("--no-batch", action="store_true", help="/batch 엔드포인트 비활성화")
+    parser.add_argument("--chat-tokens", type=int, default=200, help="채팅 응답 하나의 토큰 수")
+    args = parser.parse_args()
+
+    app = create_app(args.request_ms, args.item_ms, batch=not args.no_batch, chat_tokens=args.chat_tokens)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+게시글 좋아요/댓글 수 카운터 재계산 스크립트
+post_likes / comments 실제 개수와 posts 카운터 컬럼이 어긋난 경우 복구합니다.
+(사용자 탈퇴로 인한 CASCADE 삭제, 수동 DB 수정 등)
+
+사용법:
+    python reconcile_post_counters.py
+    python reconcile_post_counters.py --batch-size 5000
+    (cron 등으로 주기 실행 권장)
+"""
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import SessionLocal
+from app.services.post_counter_service import reconcile_post_counters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 카운터 재계산")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print("🔄 게시글 카운터 재계산 중...")
+        fixed = reconcile_post_counters(db, batch_size=args.batch_size)
+        print(f"✅ 재계산 완료: {fixed}개 게시글 수정")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
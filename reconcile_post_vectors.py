@@ -0,0 +1,50 @@
+"""
+게시글 Vector DB 정합성 복구 스크립트
+posts 테이블과 Vector DB posts 컬렉션을 비교해 삭제된 게시글의 청크(고아)를 지웁니다.
+(벡터 삭제 실패, 워커 처리 중 게시글 삭제, DB 직접 수정 등)
+
+사용법:
+    python reconcile_post_vectors.py --dry-run          # 집계만
+    python reconcile_post_vectors.py
+    python reconcile_post_vectors.py --reindex-missing  # 벡터가 없는 게시글도 색인
+    (cron 등으로 주기 실행 권장)
+"""
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import SessionLocal
+from app.services.post_vector_service import reconcile_post_vectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 Vector DB 정합성 복구")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="집계만 하고 수정하지 않음")
+    parser.add_argument("--reindex-missing", action="store_true", help="벡터가 없는 게시글 색인")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print("🔄 게시글 벡터 정합성 확인 중...")
+        result = reconcile_post_vectors(
+            db,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            reindex_missing=args.reindex_missing
+        )
+        action = "발견" if args.dry_run else "삭제"
+        print(f"  - 벡터가 있는 게시글: {result['vector_posts']}개")
+        print(f"  - 고아 게시글: {result['orphan_posts']}개 (청크 {result['orphan_chunks']}개 {action})")
+        print(f"  - 벡터가 없는 게시글: {result['missing_posts']}개 (색인 {result['reindexed_posts']}개)")
+        print("✅ 정합성 확인 완료")
+    except Exception as e:
+        print(f"❌ 정합성 확인 실패: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+AI 백그라운드 작업 워커 실행 스크립트
+게시글 벡터화/요약/태그/감성 분석 작업(ai_jobs 테이블)을 처리합니다.
+
+사용법:
+    python run_ai_worker.py                # 워커 1개
+    python run_ai_worker.py --workers 4    # 워커 프로세스 4개
+    python run_ai_worker.py --drain        # 대기 중인 작업만 처리하고 종료
+"""
+import sys
+import os
+import asyncio
+import argparse
+import multiprocessing
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _worker_main(index: int, poll_interval: float, drain: bool):
+    from app.services.ai_job_queue import run_worker
+
+    worker_id = f"{os.uname().nodename}:{os.getpid()}:{index}"
+    max_jobs = sys.maxsize if drain else None
+    try:
+        processed = asyncio.run(run_worker(worker_id, poll_interval, max_jobs))
+        print(f"✅ 워커 종료: {worker_id} (처리 {processed}건)")
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 작업 큐 워커")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("AI_JOB_WORKERS", "1")))
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--drain", action="store_true", help="대기 작업이 없으면 종료")
+    args = parser.parse_args()
+
+    if args.workers <= 1:
+        _worker_main(0, args.poll_interval, args.drain)
+        return
+
+    processes = [
+        multiprocessing.Process(target=_worker_main, args=(i, args.poll_interval, args.drain))
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+테스트 공통 설정 - 임시 SQLite DB (동기 pysqlite + 비동기 aiosqlite)
+
+app.core.database는 임포트 시점에 DATABASE_URL을 읽으므로 app을 임포트하기 전에 설정합니다.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+_TMP_DIR = Path(tempfile.mkdtemp(prefix="wedding-os-tests-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP_DIR / 'test.db'}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.pop("SQL_CAPTURE_FILE", None)
+os.environ["AI_JOBS_ENABLED"] = "false"
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import BigInteger, event
+from sqlalchemy.ext.compiler import compiles
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_big_integer(type_, compiler, **kw):
+    # SQLite는 INTEGER PRIMARY KEY만 자동 증가
+    return "INTEGER"
+
+
+from app.core.database import Base, SessionLocal, engine, get_async_engine, get_async_sessionmaker
+import app.models.db  # noqa: F401  (모든 테이블을 Base.metadata에 등록)
+
+
+@pytest.fixture
+def sync_db():
+    """테스트마다 빈 스키마를 만들고 동기 세션 반환"""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(engine)
+
+
+@pytest_asyncio.fixture
+async def async_session_factory(sync_db):
+    """sync_db와 같은 DB를 보는 AsyncSession 팩토리 (테스트 이벤트 루프가 끝나기 전에 연결 정리)"""
+    try:
+        yield get_async_sessionmaker()
+    finally:
+        await get_async_engine().dispose()
+
+
+class QueryCounter:
+    """before_cursor_execute로 실행된 SQL 문 수를 셈"""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+
+@pytest.fixture
+def query_counter():
+    counter = QueryCounter()
+    sync_engine = get_async_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", counter)
@@ -0,0 +1,110 @@
+"""
+채팅 메모리 권한 필터 동등성 테스트 (user-016)
+
+검색은 build_chat_memory_filter(where 절)로 거르고, 결과는 can_access_chat_memory로 한 번 더 확인합니다.
+두 조건이 어긋나면 접근 가능한 메모리가 top-k에서 빠지거나 다른 사용자의 메모리가 걸러지지 않으므로,
+무작위 메타데이터와 요청 조합에서 LocalVectorStore 필터 결과가 판정 함수와 정확히 같은지 확인합니다.
+"""
+import hashlib
+import random
+
+import numpy as np
+import pytest
+
+from app.services.chat_memory_vector_service import build_chat_memory_filter, can_access_chat_memory
+from app.services.local_vector_store import LocalVectorStore
+
+DIM = 16
+MEMORY_COUNT = 200
+USER_IDS = range(1, 7)
+COUPLE_IDS = (None, 1, 2, 3)
+
+
+class FakeEmbeddings:
+    """텍스트 해시로 만든 결정적 벡터 (모델 없이 검색 경로를 그대로 실행)"""
+
+    @staticmethod
+    def _vector(text: str):
+        seed = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+        return np.random.default_rng(seed).standard_normal(DIM).astype(np.float32).tolist()
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def _random_metadata(rng: random.Random, memory_id: int) -> dict:
+    metadata = {
+        "memory_id": memory_id,
+        "user_id": rng.choice(USER_IDS),
+        "is_shared_with_partner": rng.random() < 0.5,
+        "title": "",
+    }
+    couple_id = rng.choice(COUPLE_IDS)
+    # vectorize_chat_memory처럼 couple_id가 없으면 None으로 저장되거나 키가 아예 없는 경우 모두 확인
+    if couple_id is not None or rng.random() < 0.5:
+        metadata["couple_id"] = couple_id
+    return metadata
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalVectorStore("chat_memories", embedding_function=FakeEmbeddings(), persist_directory=str(tmp_path))
+    yield store
+    store.close()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_filter_matches_access_predicate(store, seed):
+    rng = random.Random(seed)
+    metadatas = [_random_metadata(rng, memory_id) for memory_id in range(MEMORY_COUNT)]
+    ids = [f"memory_{metadata['memory_id']}" for metadata in metadatas]
+    texts = [f"메모리 {seed}-{i}" for i in range(MEMORY_COUNT)]
+    # 여러 세그먼트에 나눠 저장 (세그먼트별 필터 결과 합치기까지 확인)
+    for start in range(0, MEMORY_COUNT, 50):
+        end = start + 50
+        store.upsert(
+            ids=ids[start:end],
+            embeddings=store.embedding_function.embed_documents(texts[start:end]),
+            documents=texts[start:end],
+            metadatas=metadatas[start:end],
+        )
+
+    for _ in range(50):
+        user_id = rng.choice(USER_IDS)
+        couple_id = rng.choice(COUPLE_IDS)
+        include_shared = rng.random() < 0.8
+
+        results = store.similarity_search_with_score(
+            f"질문 {rng.random()}",
+            k=MEMORY_COUNT,
+            filter=build_chat_memory_filter(user_id, include_shared, couple_id),
+        )
+        found = {document.id for document, _ in results}
+        expected = {
+            doc_id for doc_id, metadata in zip(ids, metadatas)
+            if can_access_chat_memory(metadata, user_id, include_shared, couple_id)
+        }
+        assert found == expected, (user_id, include_shared, couple_id)
+
+
+def test_top_k_is_filled_from_accessible_memories_only(store):
+    rng = random.Random(42)
+    metadatas = [_random_metadata(rng, memory_id) for memory_id in range(MEMORY_COUNT)]
+    ids = [f"memory_{metadata['memory_id']}" for metadata in metadatas]
+    texts = [f"메모리 {i}" for i in range(MEMORY_COUNT)]
+    store.upsert(ids=ids, embeddings=store.embedding_function.embed_documents(texts),
+                 documents=texts, metadatas=metadatas)
+
+    user_id, couple_id = 1, 1
+    accessible = [
+        metadata for metadata in metadatas if can_access_chat_memory(metadata, user_id, True, couple_id)
+    ]
+    k = 5
+    results = store.similarity_search_with_score(
+        "질문", k=k, filter=build_chat_memory_filter(user_id, True, couple_id)
+    )
+    assert len(results) == min(k, len(accessible))
+    assert all(can_access_chat_memory(document.metadata, user_id, True, couple_id) for document, _ in results)
@@ -0,0 +1,94 @@
+"""
+게시글 목록 쿼리 수 회귀 테스트 (user-005)
+
+작성자/태그/업체/좋아요 수/댓글 수/좋아요 여부를 게시글마다 따로 조회하면(N+1)
+페이지 크기에 비례해 쿼리가 늘어납니다. 페이지 크기와 관계없이 쿼리 수가 같아야 합니다.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.controllers.post_controller import get_posts_controller
+from app.models.db import Comment, Post, PostLike, Tag, User, Vendor, VendorType
+
+POST_COUNT = 30
+
+
+@pytest.fixture
+def seeded_posts(sync_db):
+    author = User(email="author@example.com", password="x", nickname="author")
+    reader = User(email="reader@example.com", password="x", nickname="reader")
+    vendor = Vendor(
+        vendor_type=list(VendorType)[0], name="스튜디오",
+        base_location_city="서울", base_location_district="강남구"
+    )
+    tags = [Tag(name=f"tag{i}") for i in range(3)]
+    sync_db.add_all([author, reader, vendor, *tags])
+    sync_db.flush()
+
+    started = datetime(2026, 1, 1)
+    posts = []
+    for i in range(POST_COUNT):
+        post = Post(
+            user_id=author.id if i % 2 else reader.id,
+            vendor_id=vendor.id if i % 3 == 0 else None,
+            title=f"post {i}",
+            content="내용",
+            board_type="couple",
+            tags=tags[: i % 4],
+            like_count=i % 2,
+            comment_count=1,
+            created_at=started + timedelta(minutes=i),
+        )
+        posts.append(post)
+    sync_db.add_all(posts)
+    sync_db.flush()
+
+    for post in posts:
+        sync_db.add(Comment(post_id=post.id, user_id=author.id, content="댓글"))
+        if post.like_count:
+            sync_db.add(PostLike(post_id=post.id, user_id=reader.id))
+    sync_db.commit()
+    return reader.id
+
+
+async def _count_list_queries(session_factory, query_counter, **kwargs) -> int:
+    async with session_factory() as db:
+        query_counter.reset()
+        result = await get_posts_controller(db=db, **kwargs)
+    assert len(result["posts"]) == kwargs["limit"]
+    return query_counter.count
+
+
+@pytest.mark.asyncio
+async def test_offset_list_query_count_is_constant(async_session_factory, query_counter, seeded_posts):
+    small = await _count_list_queries(async_session_factory, query_counter, page=1, limit=5, user_id=seeded_posts)
+    large = await _count_list_queries(async_session_factory, query_counter, page=1, limit=20, user_id=seeded_posts)
+    assert small == large, query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_cursor_list_query_count_is_constant(async_session_factory, query_counter, seeded_posts):
+    async with async_session_factory() as db:
+        first_page = await get_posts_controller(limit=3, user_id=seeded_posts, db=db)
+    cursor = first_page["next_cursor"]
+    assert cursor
+
+    small = await _count_list_queries(
+        async_session_factory, query_counter, limit=5, user_id=seeded_posts, cursor=cursor
+    )
+    large = await _count_list_queries(
+        async_session_factory, query_counter, limit=20, user_id=seeded_posts, cursor=cursor
+    )
+    assert small == large, query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_list_reports_counters_and_liked_flag(async_session_factory, seeded_posts):
+    async with async_session_factory() as db:
+        result = await get_posts_controller(limit=POST_COUNT, user_id=seeded_posts, db=db)
+
+    assert result["total"] == POST_COUNT
+    for post in result["posts"]:
+        assert post["comment_count"] == 1
+        assert post["liked"] == bool(post["like_count"])